@@ -310,6 +310,125 @@ RESPONSE_PARSERS: dict[str, ResponseParser] = {
 }
 
 
+# ---------------------------------------------------------------------------
+# Token usage parsers — token and cache counts reported in the final JSON
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class TokenUsage:
+    """Token counts for one agent call (or a sum of calls).
+
+    ``input_tokens`` counts only uncached prompt tokens; tokens served from
+    or written to the provider's prompt cache are counted separately.
+    """
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    cost_usd: float = 0.0
+
+    @property
+    def prompt_tokens(self) -> int:
+        return self.input_tokens + self.cache_read_tokens + self.cache_write_tokens
+
+    @property
+    def cache_hit_ratio(self) -> float | None:
+        """Fraction of prompt tokens read from the cache, or None with no prompt tokens."""
+        if not self.prompt_tokens:
+            return None
+        return self.cache_read_tokens / self.prompt_tokens
+
+    def add(self, other: TokenUsage) -> None:
+        self.input_tokens += other.input_tokens
+        self.output_tokens += other.output_tokens
+        self.cache_read_tokens += other.cache_read_tokens
+        self.cache_write_tokens += other.cache_write_tokens
+        self.cost_usd += other.cost_usd
+
+
+def int_field(data: dict, *keys: str) -> int:
+    """First integer value found under *keys* (snake_case or camelCase variants), else 0."""
+    for key in keys:
+        value = data.get(key)
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+    return 0
+
+
+def json_events(stdout: str) -> list[dict]:
+    events = []
+    for line in stdout.strip().split("\n"):
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(event, dict):
+            events.append(event)
+    return events
+
+
+def parse_claude_usage(stdout: str) -> TokenUsage | None:
+    """Read usage from the claude ``result`` object (single JSON or final stream-json event)::
+
+    {"type": "result", "total_cost_usd": 0.0123,
+     "usage": {"input_tokens": 12, "cache_creation_input_tokens": 900,
+               "cache_read_input_tokens": 14000, "output_tokens": 350}}
+    """
+    for event in reversed(json_events(stdout)):
+        usage = event.get("usage")
+        if event.get("type", "result") != "result" or not isinstance(usage, dict):
+            continue
+        cost = event.get("total_cost_usd")
+        return TokenUsage(
+            input_tokens=int_field(usage, "input_tokens", "inputTokens"),
+            output_tokens=int_field(usage, "output_tokens", "outputTokens"),
+            cache_read_tokens=int_field(usage, "cache_read_input_tokens", "cacheReadTokens", "cacheReadInputTokens"),
+            cache_write_tokens=int_field(
+                usage, "cache_creation_input_tokens", "cacheWriteTokens", "cacheCreationInputTokens"
+            ),
+            cost_usd=float(cost) if isinstance(cost, int | float) else 0.0,
+        )
+    return None
+
+
+def parse_codex_usage(stdout: str) -> TokenUsage | None:
+    """Sum usage over codex ``turn.completed`` events::
+
+        {"type": "turn.completed",
+         "usage": {"input_tokens": 15000, "cached_input_tokens": 12000, "output_tokens": 400}}
+
+    Codex counts cached tokens inside ``input_tokens`` and reports no cache writes.
+    """
+    total = None
+    for event in json_events(stdout):
+        usage = event.get("usage")
+        if event.get("type") != "turn.completed" or not isinstance(usage, dict):
+            continue
+        cached = int_field(usage, "cached_input_tokens")
+        turn = TokenUsage(
+            input_tokens=max(int_field(usage, "input_tokens") - cached, 0),
+            output_tokens=int_field(usage, "output_tokens"),
+            cache_read_tokens=cached,
+        )
+        if total is None:
+            total = turn
+        else:
+            total.add(turn)
+    return total
+
+
+UsageParser = Callable[[str], TokenUsage | None]
+
+USAGE_PARSERS: dict[str, UsageParser] = {
+    "claude_code": parse_claude_usage,
+    "codex": parse_codex_usage,
+    # cursor's result object follows the claude layout when it reports usage
+    "cursor": parse_claude_usage,
+}
+
+
 # ---------------------------------------------------------------------------
 # Backend-specific command builders
 # ---------------------------------------------------------------------------
@@ -485,6 +604,18 @@ def parse_response(config: AgentConfig, stdout: str, stderr: str, code: int) ->
     return parser(stdout, stderr, code)
 
 
+def parse_usage(config: AgentConfig, stdout: str) -> TokenUsage | None:
+    """Parse token and cache usage from an agent's CLI output.
+
+    Returns None when the backend reported no usage (older CLIs, timeouts,
+    unknown backends).
+    """
+    parser = USAGE_PARSERS.get(config.backend)
+    if parser is None:
+        return None
+    return parser(stdout)
+
+
 # ---------------------------------------------------------------------------
 # Stream text extractors — extract text from individual NDJSON lines
 # ---------------------------------------------------------------------------
@@ -0,0 +1,331 @@
+"""Best-of-N speculative execution.
+
+``kd peasant start <ticket> --candidates N`` races N peasants on one ticket.
+Candidate ``c<k>`` runs as session ``peasant-<ticket>-c<k>`` in its own
+worktree on branch ``ticket/<ticket>-c<k>``.  Repeating ``--agent`` gives the
+candidates different agents, assigned in turn.
+
+Candidates share the ticket's title and body, but each works on its own copy
+of the ticket file.  That copy holds the candidate's worklog and status, so
+no candidate sees another's progress.  The first candidate whose DONE passes
+verification and council review wins (``approved``, or no council
+configured).  A candidate escalated to the king without approval (review
+timeout, bounce limit) does not win.  When a candidate wins:
+
+- The other candidates are stopped wherever they are (working, queued, or in
+  council review) and their queued review requests dropped.  Once a loser's
+  process is gone, its worktree and branch are removed; a worktree still in
+  use (e.g. by a review worker) is left for ``kd gc``.
+- The ticket moves to ``in_review``, and ``kd peasant review <ticket>``
+  reviews and merges the winning branch.
+- Every candidate's :class:`CandidateReport` is recorded for comparison.
+
+Layout under ``.kd/branches/<branch>/candidates/<ticket>/``::
+
+    race.json   candidates, winner and per-candidate reports
+    c<k>.md     candidate c<k>'s copy of the ticket
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import re
+import shutil
+import signal
+import time
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from kingdom.git import git_session
+from kingdom.session import get_agent_state, update_agent_state
+from kingdom.state import branch_root, locked_json_update, read_json, write_json
+from kingdom.ticket import find_ticket, read_ticket, write_ticket
+from kingdom.worktree import discard_worktree
+
+logger = logging.getLogger("kingdom.candidates")
+
+CANDIDATE_SESSION = re.compile(r"^peasant-(?P<ticket>.+)-(?P<name>c\d+)$")
+STOP_GRACE = 5.0  # seconds between SIGTERM and SIGKILL for a losing candidate
+LIVE_STATUSES = ("working", "queued", "awaiting_council")  # a candidate in these may still be running
+
+
+@dataclass
+class CandidateReport:
+    """How far a candidate got, captured when the race was decided."""
+
+    status: str
+    iterations: int = 0
+    review_bounces: int = 0
+    spent_seconds: float = 0.0
+    spent_output_tokens: int = 0
+    spent_cost_usd: float = 0.0
+    head: str | None = None
+    diffstat: str = ""  # git diff --shortstat of its commits
+
+
+@dataclass
+class Candidate:
+    """One of the peasants racing on a ticket."""
+
+    name: str  # "c1", "c2", ...
+    work_id: str  # "<ticket>-<name>": names the worktree, branch, session and thread
+    agent: str
+    worktree: str
+    outcome: str = "racing"  # racing | won | lost
+    report: CandidateReport | None = None
+
+    @property
+    def session_name(self) -> str:
+        return f"peasant-{self.work_id}"
+
+    @property
+    def thread_id(self) -> str:
+        return f"{self.work_id}-work"
+
+    @property
+    def branch(self) -> str:
+        return f"ticket/{self.work_id}"
+
+
+@dataclass
+class Race:
+    """Candidates racing on one ticket."""
+
+    ticket_id: str
+    candidates: list[Candidate]
+    started_at: str = ""
+    winner: str | None = None
+    decided_at: str = ""
+
+    def candidate(self, name: str) -> Candidate | None:
+        return next((c for c in self.candidates if c.name == name), None)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Race:
+        candidates = []
+        for entry in data.get("candidates", []):
+            report = entry.get("report")
+            candidates.append(Candidate(**{**entry, "report": CandidateReport(**report) if report else None}))
+        return cls(**{**data, "candidates": candidates})
+
+
+def race_root(base: Path, branch: str, ticket_id: str) -> Path:
+    return branch_root(base, branch) / "candidates" / ticket_id
+
+
+def race_path(base: Path, branch: str, ticket_id: str) -> Path:
+    return race_root(base, branch, ticket_id) / "race.json"
+
+
+def candidate_ticket_path(base: Path, branch: str, ticket_id: str, name: str) -> Path:
+    return race_root(base, branch, ticket_id) / f"{name}.md"
+
+
+def read_race(base: Path, branch: str, ticket_id: str) -> Race | None:
+    try:
+        return Race.from_dict(read_json(race_path(base, branch, ticket_id)))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def start_race(base: Path, branch: str, ticket_path: Path, race: Race) -> None:
+    """Record *race* and give each candidate its own copy of the ticket."""
+    root = race_root(base, branch, race.ticket_id)
+    root.mkdir(parents=True, exist_ok=True)
+    for candidate in race.candidates:
+        shutil.copyfile(ticket_path, candidate_ticket_path(base, branch, race.ticket_id, candidate.name))
+    write_json(race_path(base, branch, race.ticket_id), asdict(race))
+
+
+def find_candidate(base: Path, branch: str, session_name: str) -> tuple[Race, Candidate] | None:
+    """The race and candidate *session_name* runs as, or None for an ordinary peasant."""
+    match = CANDIDATE_SESSION.match(session_name)
+    if match is None:
+        return None
+    race = read_race(base, branch, match["ticket"])
+    candidate = race.candidate(match["name"]) if race is not None else None
+    if race is None or candidate is None:
+        return None
+    return race, candidate
+
+
+def work_ticket_path(base: Path, branch: str, session_name: str, ticket_path: Path) -> Path:
+    """The ticket file *session_name* works on: its own copy for a candidate, else *ticket_path*."""
+    found = find_candidate(base, branch, session_name)
+    if found is None:
+        return ticket_path
+    race, candidate = found
+    return candidate_ticket_path(base, branch, race.ticket_id, candidate.name)
+
+
+def lost_race(base: Path, branch: str, session_name: str) -> bool:
+    """True when *session_name* is a candidate and another candidate already won."""
+    found = find_candidate(base, branch, session_name)
+    return found is not None and found[0].winner not in (None, found[1].name)
+
+
+def declare_winner(base: Path, branch: str, ticket_id: str, name: str) -> bool:
+    """Make *name* the race's winner unless another candidate got there first."""
+    won = False
+
+    def claim(data: dict[str, Any]) -> dict[str, Any]:
+        nonlocal won
+        if data.get("winner") is None:
+            data["winner"] = name
+            data["decided_at"] = datetime.now(UTC).isoformat()
+        won = data["winner"] == name
+        return data
+
+    locked_json_update(race_path(base, branch, ticket_id), claim)
+    return won
+
+
+def wait_for_group_exit(pgid: int, timeout: float) -> bool:
+    """True once process group *pgid* is gone, False if it outlives *timeout* seconds."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            os.killpg(pgid, 0)
+        except OSError:
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.1)
+
+
+def stop_process_group(pgid: int, grace: float = STOP_GRACE) -> bool:
+    """SIGTERM a peasant's process group, then SIGKILL it if still alive after *grace* seconds.
+
+    Returns True once the group is confirmed gone.
+    """
+    try:
+        os.killpg(pgid, signal.SIGTERM)
+    except OSError:
+        return True
+    if wait_for_group_exit(pgid, grace):
+        return True
+    with contextlib.suppress(OSError):
+        os.killpg(pgid, signal.SIGKILL)
+    return wait_for_group_exit(pgid, 1.0)
+
+
+def candidate_report(base: Path, branch: str, candidate: Candidate) -> CandidateReport:
+    """Snapshot *candidate*'s session and branch (before its branch is deleted)."""
+    state = get_agent_state(base, branch, candidate.session_name)
+    git = git_session(base)
+    head = git.rev_parse(f"refs/heads/{candidate.branch}")
+    diffstat = ""
+    if head and state.start_sha:
+        result = git.run("diff", "--shortstat", f"{state.start_sha}..{head}")
+        if result.returncode == 0:
+            diffstat = result.stdout.strip()
+    return CandidateReport(
+        status=state.status,
+        iterations=state.iteration,
+        review_bounces=state.review_bounce_count,
+        spent_seconds=state.spent_seconds,
+        spent_output_tokens=state.spent_output_tokens,
+        spent_cost_usd=state.spent_cost_usd,
+        head=head,
+        diffstat=diffstat,
+    )
+
+
+def settle_race(base: Path, branch: str, ticket_id: str) -> Race | None:
+    """Stop and clean up the losers of a decided race and hand the ticket to the winner.
+
+    Safe to call again, e.g. when the winner passes review after a rejection:
+    candidates already settled are left alone.
+    """
+    from kingdom.harness import append_worklog
+    from kingdom.review_queue import withdraw_review
+
+    race = read_race(base, branch, ticket_id)
+    if race is None or race.winner is None:
+        return race
+    winner = race.candidate(race.winner)
+    if winner is None:
+        return race
+
+    now = datetime.now(UTC).isoformat()
+    for candidate in race.candidates:
+        if candidate is winner:
+            candidate.outcome = "won"
+            candidate.report = candidate_report(base, branch, candidate)
+        elif candidate.outcome == "racing":
+            state = get_agent_state(base, branch, candidate.session_name)
+            stopped = True
+            if state.pid and state.status in LIVE_STATUSES:
+                stopped = stop_process_group(state.pid)
+            reviewer = withdraw_review(base, branch, candidate.session_name)
+            update_agent_state(base, branch, candidate.session_name, status="stopped", last_activity=now)
+            candidate.report = candidate_report(base, branch, candidate)
+            candidate.outcome = "lost"
+            if not stopped:
+                logger.warning(
+                    "Candidate %s (pid %d) did not exit; leaving its worktree for kd gc", candidate.name, state.pid
+                )
+            elif reviewer is not None:
+                logger.info(
+                    "Candidate %s is under review by worker %d; leaving its worktree for kd gc",
+                    candidate.name,
+                    reviewer,
+                )
+            else:
+                discard_worktree(base, candidate.work_id)
+                logger.info("Candidate %s lost the race on %s — stopped and cleaned up", candidate.name, ticket_id)
+    locked_json_update(race_path(base, branch, ticket_id), lambda data: asdict(race))
+
+    found = find_ticket(base, ticket_id, branch=branch)
+    if found is not None:
+        _, ticket_path = found
+        ticket = read_ticket(ticket_path)
+        ticket.status = "in_review"
+        ticket.assignee = winner.session_name
+        write_ticket(ticket, ticket_path)
+        append_worklog(
+            ticket_path,
+            f"Candidate {winner.name} ({winner.agent}) won the race of {len(race.candidates)} — "
+            f"review {winner.branch}; report in {race_path(base, branch, ticket_id)}",
+        )
+    return race
+
+
+def win_race(base: Path, branch: str, session_name: str) -> bool:
+    """Claim the race for *session_name* after it passed review, and settle it.
+
+    Returns False when another candidate already won.  A session that is not
+    a candidate has nothing to race and always wins.
+    """
+    found = find_candidate(base, branch, session_name)
+    if found is None:
+        return True
+    race, candidate = found
+    if not declare_winner(base, branch, race.ticket_id, candidate.name):
+        logger.info("Candidate %s passed review, but the race on %s is already won", candidate.name, race.ticket_id)
+        return False
+    settle_race(base, branch, race.ticket_id)
+    return True
+
+
+def format_race(race: Race) -> str:
+    """Markdown table comparing the candidates of *race*."""
+    lines = [
+        "| Candidate | Agent | Outcome | Status | Iterations | Bounces | Spent | Diff |",
+        "|---|---|---|---|---|---|---|---|",
+    ]
+    for c in race.candidates:
+        r = c.report
+        if r is None:
+            lines.append(f"| {c.name} | {c.agent} | {c.outcome} | | | | | |")
+            continue
+        spent = f"{r.spent_seconds / 60:.0f}m, {r.spent_output_tokens} tokens, ${r.spent_cost_usd:.2f}"
+        lines.append(
+            f"| {c.name} | {c.agent} | {c.outcome} | {r.status} | {r.iterations} | {r.review_bounces} "
+            f"| {spent} | {r.diffstat or '-'} |"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,453 @@
+"""Garbage collection of stale runtime files under ``.kd/`` (``kd gc``).
+
+Candidates, by kind:
+
+- ``stream``: ``.stream-<member>.jsonl`` left in a thread by a crashed worker.
+- ``debug-stream``: ``.debug-stream-*.jsonl`` kept by ``kd chat --debug-streams``.
+- ``lock``: ``.<name>.lock`` files whose ``<name>`` no longer exists.  Review
+  locks (``sessions/.<session>.review.lock``) go with their session JSON, and
+  verify locks (``verify/.<tree>.lock``) once ``<tree>.json`` is written or
+  after ``older_than``.
+- ``tmp``: ``*.tmp`` files left by interrupted atomic writes.
+- ``session``: session JSONs whose recorded PID is dead.  Peasant and hand
+  sessions also need their ticket closed, since they hold its review state
+  and spent budget.
+- ``worktree``: ``.kd/worktrees/<ticket>`` (and race candidate
+  ``<ticket>-c<k>``) checkouts of closed tickets.
+- ``bundle``: legacy council run bundles (``logs/council/run-*``).
+- ``blob``: event-log blobs no longer referenced by any record.
+
+Everything is checked against live state so ``kd gc`` is safe while peasants
+and council workers run.  Files held by a live PID or an flock are skipped, as
+are files changed within ``GcPolicy.grace``.  Worktrees with uncommitted
+changes are skipped too.  Skipped candidates are reported with the reason.
+The scan runs in a thread pool.  It walks each top-level ``.kd/`` subtree,
+worktree and log directory separately, since sizing worktrees and reading
+event logs dominates.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import re
+import shutil
+import subprocess
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from kingdom.logstore import LogStore
+from kingdom.state import branches_root, runs_root, state_root, worktrees_root
+from kingdom.ticket import AmbiguousTicketMatch, find_ticket
+from kingdom.worktree import POOL_PREFIX, tree_size
+
+OLDER_THAN = timedelta(days=7)
+GRACE = timedelta(hours=1)
+SCAN_WORKERS = 8
+
+TMP_PID_RE = re.compile(r"\.(\d+)\.tmp$")
+CANDIDATE_SUFFIX_RE = re.compile(r"-c\d+$")  # race candidates work as <ticket>-c<k>
+TICKET_SESSION_PREFIXES = ("peasant-", "hand-")
+SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3}
+
+
+@dataclass
+class GcPolicy:
+    """What ``kd gc`` may remove."""
+
+    older_than: timedelta = OLDER_THAN  # sessions, debug streams and bundles untouched for this long
+    grace: timedelta = GRACE  # streams, tmp files and blobs changed within this are left alone
+    bundle_budget: int | None = None  # keep at most this many bytes of run bundles, newest first
+    worktrees: bool = True
+
+
+@dataclass
+class Candidate:
+    """One file or directory ``kd gc`` found."""
+
+    kind: str
+    path: Path
+    size: int
+    reason: str
+    skip: str | None = None  # why it is kept despite matching
+    ticket: str | None = None  # worktree candidates only
+
+
+@dataclass
+class GcReport:
+    removed: list[Candidate] = field(default_factory=list)
+    skipped: list[Candidate] = field(default_factory=list)
+    errors: list[tuple[Candidate, str]] = field(default_factory=list)
+
+    @property
+    def bytes_reclaimed(self) -> int:
+        return sum(c.size for c in self.removed)
+
+
+def parse_size(text: str) -> int:
+    """Parse ``500M``/``2G``/``4096``-style sizes into bytes.
+
+    Raises ValueError for anything else.
+    """
+    match = re.fullmatch(r"(\d+)\s*([KMG]?)B?", text.strip().upper())
+    if not match:
+        raise ValueError(f"expected a size like 500M or 2G, got {text!r}")
+    return int(match.group(1)) * SIZE_UNITS[match.group(2)]
+
+
+def pid_alive(pid: int | None) -> bool:
+    if not pid or pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def lock_held(path: Path) -> bool:
+    """True if another process holds an flock on *path*."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return False
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return True
+    else:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        return False
+    finally:
+        os.close(fd)
+
+
+def mtime(path: Path) -> datetime:
+    return datetime.fromtimestamp(path.stat().st_mtime, UTC)
+
+
+def file_size(path: Path) -> int:
+    try:
+        return path.lstat().st_size
+    except OSError:
+        return 0
+
+
+# ---------------------------------------------------------------------------
+# Live state
+# ---------------------------------------------------------------------------
+
+
+def session_dirs(base: Path) -> list[Path]:
+    """``sessions/`` directories of every branch and legacy run."""
+    dirs = []
+    for root in (branches_root(base), runs_root(base)):
+        if root.exists():
+            dirs.extend(d / "sessions" for d in sorted(root.iterdir()) if (d / "sessions").is_dir())
+    return dirs
+
+
+def read_session(path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def live_sessions(base: Path) -> set[tuple[Path, str]]:
+    """``(sessions dir, agent name)`` pairs whose recorded PID is alive."""
+    live = set()
+    for sdir in session_dirs(base):
+        for path in sdir.glob("*.json"):
+            if pid_alive(read_session(path).get("pid")):
+                live.add((sdir, path.stem))
+    return live
+
+
+# ---------------------------------------------------------------------------
+# Scanners
+# ---------------------------------------------------------------------------
+
+
+def stale_lock_reason(path: Path, policy: GcPolicy, age: timedelta) -> str | None:
+    """Why the lock file at *path* is no longer needed, or None while it may still be."""
+    stem = path.name[1 : -len(".lock")]
+    if path.parent.name == "sessions" and stem.endswith(".review"):
+        session = path.with_name(f"{stem.removesuffix('.review')}.json")
+        return None if session.exists() else f"{session.name} no longer exists"
+    if path.parent.name == "verify":
+        if path.with_name(f"{stem}.json").exists():
+            return "verification finished"
+        return "old verification lock" if age >= policy.older_than else None
+    target = path.with_name(stem)
+    return None if target.exists() else f"{target.name} no longer exists"
+
+
+def classify(path: Path, live: set[tuple[Path, str]], policy: GcPolicy, now: datetime) -> Candidate | None:
+    """Candidate for a stream, lock or tmp file at *path*, or None."""
+    name = path.name
+    try:
+        age = now - mtime(path)
+    except OSError:
+        return None
+
+    if name.startswith(".stream-") and name.endswith(".jsonl"):
+        member = name.removeprefix(".stream-").removesuffix(".jsonl")
+        candidate = Candidate("stream", path, file_size(path), "orphaned stream file")
+        # Thread dirs live in <branch>/threads/<id>/, sessions in <branch>/sessions/
+        if (path.parent.parent.parent / "sessions", member) in live:
+            candidate.skip = f"{member} is running"
+        elif age < policy.grace:
+            candidate.skip = "recently written"
+        return candidate
+
+    if name.startswith(".debug-stream-"):
+        if age < policy.older_than:
+            return None
+        return Candidate("debug-stream", path, file_size(path), "old debug stream")
+
+    if name.startswith(".") and name.endswith(".lock") and len(name) > len("..lock"):
+        reason = stale_lock_reason(path, policy, age)
+        if reason is None:
+            return None
+        candidate = Candidate("lock", path, file_size(path), reason)
+        if lock_held(path):
+            candidate.skip = "lock is held"
+        elif age < policy.grace:
+            # Its owner may have opened it without holding the flock yet
+            candidate.skip = "recently created"
+        return candidate
+
+    if name.endswith(".tmp"):
+        candidate = Candidate("tmp", path, file_size(path), "interrupted write")
+        match = TMP_PID_RE.search(name)
+        if match and pid_alive(int(match.group(1))):
+            candidate.skip = f"pid {match.group(1)} is alive"
+        elif age < policy.grace:
+            candidate.skip = "recently written"
+        return candidate
+
+    return None
+
+
+def scan_files(paths: list[Path], live: set[tuple[Path, str]], policy: GcPolicy, now: datetime) -> list[Candidate]:
+    return [c for path in paths if (c := classify(path, live, policy, now)) is not None]
+
+
+def scan_tree(root: Path, live: set[tuple[Path, str]], policy: GcPolicy, now: datetime) -> list[Candidate]:
+    """Stream, lock and tmp files anywhere under *root*."""
+    found: list[Candidate] = []
+    for dirpath, _, filenames in os.walk(root):
+        found.extend(scan_files([Path(dirpath) / name for name in filenames], live, policy, now))
+    return found
+
+
+def ticket_closed(base: Path, work_id: str) -> bool:
+    """True if the ticket worked on as *work_id* (a ticket or ``<ticket>-c<k>``) is closed."""
+    for ticket_id in dict.fromkeys((work_id, CANDIDATE_SUFFIX_RE.sub("", work_id))):
+        try:
+            result = find_ticket(base, ticket_id)
+        except AmbiguousTicketMatch:
+            return False
+        if result is not None:
+            return result[0].status == "closed"
+    return False
+
+
+def scan_sessions(base: Path, sdir: Path, policy: GcPolicy, now: datetime) -> list[Candidate]:
+    """Session JSONs whose PID is dead and that were idle for ``older_than``.
+
+    Peasant and hand sessions are only collected once their ticket is closed.
+    """
+    found = []
+    for path in sorted(sdir.glob("*.json")):
+        data = read_session(path)
+        pid = data.get("pid")
+        if not pid:
+            continue
+        prefix = next((p for p in TICKET_SESSION_PREFIXES if path.stem.startswith(p)), None)
+        if prefix is not None and not ticket_closed(base, path.stem.removeprefix(prefix)):
+            continue
+        try:
+            last = datetime.fromisoformat(data["last_activity"])
+        except (KeyError, TypeError, ValueError):
+            last = mtime(path)
+        if last.tzinfo is None:
+            last = last.replace(tzinfo=UTC)
+        if now - last < policy.older_than:
+            continue
+        candidate = Candidate("session", path, file_size(path), f"pid {pid} is gone ({data.get('status', 'idle')})")
+        if pid_alive(pid):
+            candidate.skip = f"pid {pid} is alive"
+        found.append(candidate)
+    return found
+
+
+def scan_worktree(base: Path, path: Path, live: set[tuple[Path, str]]) -> list[Candidate]:
+    """The worktree at *path*, if its ticket is closed."""
+    ticket_id = path.name
+    if not ticket_closed(base, ticket_id):
+        return []
+
+    candidate = Candidate("worktree", path, tree_size(path), "ticket is closed", ticket=ticket_id)
+    if any(name == f"peasant-{ticket_id}" for _, name in live):
+        candidate.skip = "peasant is running"
+    else:
+        status = subprocess.run(
+            ["git", "-C", str(path), "status", "--porcelain"],
+            capture_output=True,
+            text=True,
+        )
+        if status.returncode != 0:
+            candidate.skip = "not a git worktree"
+        elif status.stdout.strip():
+            candidate.skip = "uncommitted changes"
+    return [candidate]
+
+
+def logs_dirs(base: Path) -> list[Path]:
+    dirs = []
+    for root in (branches_root(base), runs_root(base)):
+        if root.exists():
+            dirs.extend(d / "logs" for d in sorted(root.iterdir()) if (d / "logs").is_dir())
+    return dirs
+
+
+def scan_bundles(base: Path, policy: GcPolicy, now: datetime) -> list[Candidate]:
+    """Council run bundles past ``older_than`` or beyond ``bundle_budget``."""
+    bundles = [run for logs in logs_dirs(base) for run in (logs / "council").glob("run-*") if run.is_dir()]
+    bundles.sort(key=mtime, reverse=True)
+    found = []
+    kept = 0
+    for run in bundles:
+        size = tree_size(run)
+        if now - mtime(run) >= policy.older_than:
+            found.append(Candidate("bundle", run, size, f"older than {policy.older_than.days}d"))
+        elif policy.bundle_budget is not None and kept + size > policy.bundle_budget:
+            found.append(Candidate("bundle", run, size, "over bundle budget"))
+        else:
+            kept += size
+    return found
+
+
+def referenced_blobs(store: LogStore) -> set[str]:
+    digests: set[str] = set()
+    for path in [*store.segments(), store.events_path]:
+        for line in store.read_segment(path):
+            if '"blobs"' not in line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            for value in record.values() if isinstance(record, dict) else []:
+                if isinstance(value, dict):
+                    digests.update(str(d) for d in value.get("blobs", []))
+    return digests
+
+
+def scan_blobs(logs: Path, policy: GcPolicy, now: datetime) -> list[Candidate]:
+    """Event-log blobs that no remaining record points to."""
+    store = LogStore(logs)
+    if not store.blobs_dir.exists():
+        return []
+    referenced = referenced_blobs(store)
+    found = []
+    for path in store.blobs_dir.glob("*/*.gz"):
+        if path.name.removesuffix(".gz") in referenced:
+            continue
+        try:
+            if now - mtime(path) < policy.grace:
+                continue  # its record may not be appended yet
+        except OSError:
+            continue
+        found.append(Candidate("blob", path, file_size(path), "no longer referenced"))
+    return found
+
+
+def scan(base: Path, policy: GcPolicy | None = None, now: datetime | None = None) -> list[Candidate]:
+    """Find everything ``kd gc`` would consider, in parallel."""
+    policy = policy or GcPolicy()
+    now = now or datetime.now(UTC)
+    root = state_root(base)
+    if not root.exists():
+        return []
+    live = live_sessions(base)
+
+    jobs: list[Callable[[], list[Candidate]]] = []
+    top_files = [p for p in root.iterdir() if p.is_file()]
+    jobs.append(lambda: scan_files(top_files, live, policy, now))
+    for child in sorted(p for p in root.iterdir() if p.is_dir()):
+        if child != worktrees_root(base):
+            jobs.append(lambda child=child: scan_tree(child, live, policy, now))
+            continue
+        # Only kd's own files here; the subdirectories are git checkouts.
+        files = [p for p in child.iterdir() if p.is_file()]
+        jobs.append(lambda files=files: scan_files(files, live, policy, now))
+        if policy.worktrees:
+            for path in sorted(child.iterdir()):
+                if path.is_dir() and not path.name.startswith(POOL_PREFIX):
+                    jobs.append(lambda path=path: scan_worktree(base, path, live))
+    jobs.extend(lambda sdir=sdir: scan_sessions(base, sdir, policy, now) for sdir in session_dirs(base))
+    jobs.extend(lambda logs=logs: scan_blobs(logs, policy, now) for logs in logs_dirs(base))
+    jobs.append(lambda: scan_bundles(base, policy, now))
+
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+        results = list(pool.map(lambda job: job(), jobs))
+    return sorted((c for found in results for c in found), key=lambda c: (c.kind, str(c.path)))
+
+
+# ---------------------------------------------------------------------------
+# Removal
+# ---------------------------------------------------------------------------
+
+
+def remove_candidate(base: Path, candidate: Candidate) -> None:
+    """Delete *candidate*.  Raises OSError or RuntimeError on failure."""
+    path = candidate.path
+    if candidate.kind == "worktree":
+        result = subprocess.run(
+            ["git", "worktree", "remove", "--force", str(path)],
+            capture_output=True,
+            text=True,
+            cwd=base,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or f"git worktree remove exited {result.returncode}")
+    elif candidate.kind == "lock":
+        # Unlink while holding the lock so nobody acquires it in between.
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            path.unlink(missing_ok=True)
+        finally:
+            os.close(fd)
+    elif path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    else:
+        path.unlink(missing_ok=True)
+
+
+def collect(base: Path, policy: GcPolicy | None = None, dry_run: bool = False, now: datetime | None = None) -> GcReport:
+    """Scan ``.kd/`` and, unless *dry_run*, remove every candidate not skipped."""
+    report = GcReport()
+    for candidate in scan(base, policy, now):
+        if candidate.skip:
+            report.skipped.append(candidate)
+            continue
+        if not dry_run:
+            try:
+                remove_candidate(base, candidate)
+            except (OSError, RuntimeError) as exc:
+                report.errors.append((candidate, str(exc)))
+                continue
+        report.removed.append(candidate)
+    return report
@@ -34,6 +34,8 @@ from rich.text import Text
 from kingdom.breakdown import build_breakdown_template
 from kingdom.council import Council
 from kingdom.design import build_design_template, ensure_design_initialized
+from kingdom.git import git_session
+from kingdom.logstore import EVENTS_FILE
 from kingdom.session import get_current_thread, set_current_thread
 from kingdom.state import (
     archive_root,
@@ -64,6 +66,20 @@ from kingdom.ticket import (
     read_ticket,
     write_ticket,
 )
+from kingdom.worktree import (
+    acquire_pool_worktree,
+    format_bytes,
+    init_script_path,
+    is_sparse_checkout,
+    pool_member_for,
+    read_pool,
+    release_pool_worktree,
+    run_init_script,
+    seed_dependencies,
+    sparse_checkout,
+    warm_pool,
+    widen_sparse_checkout,
+)
 
 error_console = Console(stderr=True)
 
@@ -349,6 +365,10 @@ def done(
         except OSError as e:
             typer.echo(f"Warning: Could not remove worktree directory: {e}")
 
+    # Hand pooled worktrees held by this branch's tickets back to the pool
+    for t in list_tickets(source_dir / "tickets"):
+        release_pool_worktree(base, t.id)
+
     # Clear current session pointer (only if this was the current session)
     current_path = state_root(base) / "current"
     session_cleared = False
@@ -373,18 +393,15 @@ def done(
 
     push_reminder = ""
     try:
-        rev_result = subprocess.run(
-            ["git", "rev-list", "--count", "@{u}..HEAD"],
-            capture_output=True,
-            text=True,
-        )
+        # rev-list only walks the unpushed commits; status would scan the whole worktree
+        rev_result = git_session(base).run("rev-list", "--count", "@{u}..HEAD")
         if rev_result.returncode == 0:
             ahead = int(rev_result.stdout.strip())
             if ahead > 0:
                 push_reminder = f"[yellow]{ahead} unpushed commit(s) — remember to push[/yellow]"
         else:
             push_reminder = "[yellow]No upstream branch — remember to push[/yellow]"
-    except (subprocess.SubprocessError, ValueError) as exc:
+    except (subprocess.SubprocessError, OSError, ValueError) as exc:
         push_reminder = f"[yellow]Could not check upstream status: {exc}[/yellow]"
 
     if push_reminder:
@@ -939,6 +956,84 @@ def council_ls() -> None:
     council_list()
 
 
+@council_app.command("stats", help="Show token usage and prompt-cache hit ratios.")
+def council_stats(
+    source: Annotated[str | None, typer.Option("--source", help="Only show one source (council or peasant).")] = None,
+    json_output: Annotated[bool, typer.Option("--json", help="Output JSON format.")] = False,
+) -> None:
+    """Summarize recorded token usage per source and agent.
+
+    Usage is logged to .kd/usage.jsonl for every council query and peasant
+    iteration whose backend reports token counts.
+    """
+    import dataclasses
+
+    from kingdom.agent import TokenUsage
+    from kingdom.usage import read_usage, summarize_usage, usage_path
+
+    base = Path.cwd()
+    totals = summarize_usage(read_usage(usage_path(base)), source=source)
+
+    if json_output:
+        output = [
+            {
+                "source": src,
+                "agent": agent,
+                "calls": group.calls,
+                **dataclasses.asdict(group.usage),
+                "cache_hit_ratio": group.usage.cache_hit_ratio,
+            }
+            for (src, agent), group in totals.items()
+        ]
+        typer.echo(json.dumps(output, indent=2))
+        return
+
+    if not totals:
+        typer.echo("No token usage recorded yet.")
+        return
+
+    def ratio(usage: TokenUsage) -> str:
+        hit = usage.cache_hit_ratio
+        return "-" if hit is None else f"{hit:.0%}"
+
+    table = Table(title="Token usage")
+    table.add_column("Source")
+    table.add_column("Agent", style="cyan")
+    for column in ("Calls", "Input", "Cache read", "Cache write", "Output", "Cache hit", "Cost"):
+        table.add_column(column, justify="right")
+
+    overall = TokenUsage()
+    calls = 0
+    for (src, agent), group in totals.items():
+        usage = group.usage
+        overall.add(usage)
+        calls += group.calls
+        table.add_row(
+            src,
+            agent,
+            str(group.calls),
+            f"{usage.input_tokens:,}",
+            f"{usage.cache_read_tokens:,}",
+            f"{usage.cache_write_tokens:,}",
+            f"{usage.output_tokens:,}",
+            ratio(usage),
+            f"${usage.cost_usd:.2f}",
+        )
+    if len(totals) > 1:
+        table.add_row(
+            "[bold]total[/bold]",
+            "",
+            str(calls),
+            f"{overall.input_tokens:,}",
+            f"{overall.cache_read_tokens:,}",
+            f"{overall.cache_write_tokens:,}",
+            f"{overall.output_tokens:,}",
+            ratio(overall),
+            f"${overall.cost_usd:.2f}",
+        )
+    Console().print(table)
+
+
 @council_app.command("status", help="Show response status for council threads.")
 def council_status(
     thread_id: Annotated[str | None, typer.Argument(help="Thread ID (defaults to current/most recent).")] = None,
@@ -1023,9 +1118,11 @@ def print_thread_status(status: ThreadStatus, base: Path, feature: str, verbose:
             line = f"  {name}: {'responded' if name in status.responded else 'pending'}"
 
         if verbose:
-            log_file = logs_root(base, feature) / f"council-{name}.log"
+            log_file = logs_root(base, feature) / f"council-{name}.log"  # written before the event log
             if log_file.exists():
                 line += f"  [dim]log={log_file.relative_to(base)}[/dim]"
+            elif (logs_root(base, feature) / EVENTS_FILE).exists():
+                line += f"  [dim]log=kd logs --member {name}[/dim]"
 
         console.print(line)
 
@@ -1536,19 +1633,35 @@ def breakdown() -> None:
             "## Instructions",
             "",
             f"1. Read the design doc: `{design_rel}`",
-            "2. For each work item, create a ticket:",
-            '   `kd tk create "<title>" -p <priority>` (1=critical, 2=normal, 3=low)',
-            "3. Edit each ticket file to add:",
-            "   - A clear **problem statement** or context",
-            "   - Specific **acceptance criteria** (checkboxes, not blank)",
-            "4. Set dependencies between tickets where one must finish before another:",
-            "   `kd tk dep <ticket-id> <depends-on-id>`",
-            "5. Review the result: `kd tk list`",
+            "2. Write every work item to one YAML spec file. Each ticket gets a short `ref`, and",
+            "   `deps` lists the refs (or existing ticket IDs) it must wait for:",
+            "",
+            "   ```yaml",
+            "   - ref: schema",
+            "     title: Add the users table",
+            "     priority: 1",
+            "     description: |",
+            "       Problem statement or context.",
+            "     acceptance:",
+            "       - Migration creates the table",
+            "   - ref: api",
+            "     title: Expose users over the API",
+            "     deps: [schema]",
+            "     acceptance:",
+            "       - GET /users returns the table contents",
+            "   ```",
+            "",
+            "3. Create all tickets in one call: `kd tk create --batch <file>`",
+            "   The whole file is validated first (unknown deps, cycles), so nothing is written on error.",
+            "4. Review the result: `kd tk list`",
+            "",
+            'Single tickets can still be added with `kd tk create "<title>" -p <priority>` and linked with',
+            "`kd tk dep <ticket-id> <depends-on-id>`.",
             "",
             "## Guidelines",
             "",
-            "- Set **priority** on every ticket (`-p 1` for blockers, `-p 2` for normal, `-p 3` for nice-to-have)",
-            "- Identify **dependencies** — if ticket B can't start until ticket A is done, set `kd tk dep B A`",
+            "- Set **priority** on every ticket (1 for blockers, 2 for normal, 3 for nice-to-have)",
+            "- Identify **dependencies** — if ticket B can't start until ticket A is done, list A in B's `deps`",
             "- Write **meaningful acceptance criteria** — not empty checkboxes. Each criterion should be verifiable.",
             "- Keep tickets small and focused — one logical change per ticket",
         ]
@@ -1562,17 +1675,123 @@ app.add_typer(peasant_app, name="peasant")
 
 
 def worktree_path_for(base: Path, full_ticket_id: str) -> Path:
-    """Return the canonical worktree path for a ticket (may not exist yet)."""
+    """Return the worktree path for a ticket (may not exist yet).
+
+    A pool member borrowed by the ticket takes precedence over the per-ticket
+    ``.kd/worktrees/<id>`` path.
+    """
+    pool_path = pool_member_for(base, full_ticket_id)
+    if pool_path is not None:
+        return pool_path
     return state_root(base) / "worktrees" / full_ticket_id
 
 
-def create_worktree(base: Path, full_ticket_id: str) -> Path:
-    """Create a git worktree for a ticket. Returns the worktree path."""
+def run_init_worktree(base: Path, worktree_path: Path) -> None:
+    """Run init-worktree.sh (if present) in *worktree_path* and echo its output."""
+    if init_script_path(base) is None:
+        return
+    typer.echo("Running init-worktree.sh...")
+    init_result = run_init_script(base, worktree_path)
+    if init_result is None:
+        return
+    if init_result.stdout.strip():
+        typer.echo(init_result.stdout.strip())
+    if init_result.returncode != 0:
+        typer.echo(f"Warning: init-worktree.sh failed (exit {init_result.returncode})")
+        if init_result.stderr.strip():
+            typer.echo(init_result.stderr.strip())
+
+
+def seed_worktree(base: Path, worktree_path: Path, seed_dirs: list[str], lockfiles: list[str]) -> None:
+    """Seed dependency directories from the base checkout and echo what was saved."""
+    if not seed_dirs:
+        return
+    results = seed_dependencies(base, worktree_path, seed_dirs, lockfiles)
+    for seeded in results:
+        if seeded.method == "skipped":
+            typer.echo(f"Seed {seeded.name}: skipped ({seeded.reason})")
+        else:
+            typer.echo(
+                f"Seeded {seeded.name} via {seeded.method} in {seeded.seconds:.1f}s "
+                f"({format_bytes(seeded.bytes_saved)} shared with base checkout)"
+            )
+    copied = [r for r in results if r.method != "skipped"]
+    if len(copied) > 1:
+        total_bytes = sum(r.bytes_saved for r in copied)
+        total_seconds = sum(r.seconds for r in copied)
+        typer.echo(f"Seeding saved {format_bytes(total_bytes)} in {total_seconds:.1f}s")
+
+
+def record_worktree(base: Path, full_ticket_id: str, worktree_path: Path | None) -> None:
+    """Record (or with None, forget) a ticket's worktree in the branch state.json."""
+    try:
+        feature = resolve_current_run(base)
+        _, state_path = get_design_paths(base, feature)
+        state = read_json(state_path) if state_path.exists() else {}
+        worktrees = state.get("worktrees", {})
+        if worktree_path is None:
+            worktrees.pop(full_ticket_id, None)
+        else:
+            worktrees[full_ticket_id] = str(worktree_path)
+        state["worktrees"] = worktrees
+        write_json(state_path, state)
+    except RuntimeError as exc:
+        typer.echo(f"Warning: could not update state.json worktree map: {exc}")
+
+
+def acquire_from_pool(base: Path, full_ticket_id: str, pool_size: int, lockfiles: list[str]) -> Path | None:
+    """Check out a ticket in a warm pool member, growing the pool up to *pool_size*.
+
+    Returns None when every member is busy and the pool is full, so the
+    caller can fall back to a dedicated worktree.
+    """
+    checkout = acquire_pool_worktree(base, full_ticket_id, lockfiles)
+    if checkout is None and len(read_pool(base)) < pool_size:
+        typer.echo("Growing worktree pool...")
+        for _, init_result in warm_pool(base, len(read_pool(base)) + 1, lockfiles):
+            if init_result is not None and init_result.returncode != 0:
+                typer.echo(f"Warning: init-worktree.sh failed (exit {init_result.returncode})")
+        checkout = acquire_pool_worktree(base, full_ticket_id, lockfiles)
+    if checkout is None:
+        return None
+
+    typer.echo(f"Using pooled worktree {checkout.name} for ticket/{full_ticket_id}")
+    if checkout.reinit and checkout.init_result is not None:
+        typer.echo("Lockfiles changed — re-ran init-worktree.sh")
+        if checkout.init_result.returncode != 0:
+            typer.echo(f"Warning: init-worktree.sh failed (exit {checkout.init_result.returncode})")
+            if checkout.init_result.stderr.strip():
+                typer.echo(checkout.init_result.stderr.strip())
+    return checkout.path
+
+
+def create_worktree(base: Path, full_ticket_id: str, paths: list[str] | None = None) -> Path:
+    """Create a git worktree for a ticket. Returns the worktree path.
+
+    With ``peasant.pool_size`` configured, an idle pool member is reused
+    instead of creating (and initializing) a fresh worktree.  With
+    ``peasant.sparse`` enabled, a dedicated worktree only materializes
+    *paths* (the ticket's ``paths:``), falling back to ``peasant.sparse_paths``.
+    """
+    from kingdom.config import load_config
+
     worktree_path = worktree_path_for(base, full_ticket_id)
 
     if worktree_path.exists():
         return worktree_path
 
+    try:
+        cfg = load_config(base)
+    except ValueError as exc:
+        raise RuntimeError(f"Error loading config: {exc}") from exc
+
+    if cfg.peasant.pool_size > 0:
+        pool_path = acquire_from_pool(base, full_ticket_id, cfg.peasant.pool_size, cfg.peasant.lockfiles)
+        if pool_path is not None:
+            record_worktree(base, full_ticket_id, pool_path)
+            return pool_path
+        typer.echo(f"Worktree pool is busy ({cfg.peasant.pool_size} members) — creating a dedicated worktree")
+
     worktrees_dir = worktree_path.parent
     worktrees_dir.mkdir(parents=True, exist_ok=True)
 
@@ -1585,17 +1804,21 @@ def create_worktree(base: Path, full_ticket_id: str) -> Path:
     )
     branch_exists = result.returncode == 0
 
+    add_cmd = ["git", "worktree", "add"]
+    if cfg.peasant.sparse:
+        add_cmd.append("--no-checkout")
+
     if branch_exists:
         typer.echo(f"Creating worktree from existing branch {branch_name}...")
         result = subprocess.run(
-            ["git", "worktree", "add", str(worktree_path), branch_name],
+            [*add_cmd, str(worktree_path), branch_name],
             capture_output=True,
             text=True,
         )
     else:
         typer.echo(f"Creating worktree with new branch {branch_name}...")
         result = subprocess.run(
-            ["git", "worktree", "add", "-b", branch_name, str(worktree_path)],
+            [*add_cmd, "-b", branch_name, str(worktree_path)],
             capture_output=True,
             text=True,
         )
@@ -1603,37 +1826,29 @@ def create_worktree(base: Path, full_ticket_id: str) -> Path:
     if result.returncode != 0:
         raise RuntimeError(f"Error creating worktree: {result.stderr.strip()}")
 
-    init_script = state_root(base) / "init-worktree.sh"
-    if init_script.exists() and os.access(init_script, os.X_OK):
-        typer.echo("Running init-worktree.sh...")
-        init_result = subprocess.run(
-            [str(init_script), str(worktree_path)],
-            capture_output=True,
-            text=True,
-        )
-        if init_result.stdout.strip():
-            typer.echo(init_result.stdout.strip())
-        if init_result.returncode != 0:
-            typer.echo(f"Warning: init-worktree.sh failed (exit {init_result.returncode})")
-            if init_result.stderr.strip():
-                typer.echo(init_result.stderr.strip())
+    if cfg.peasant.sparse:
+        sparse_paths = paths or cfg.peasant.sparse_paths
+        typer.echo(f"Sparse checkout: {', '.join(sparse_paths) if sparse_paths else 'top-level files only'}")
+        result = sparse_checkout(worktree_path, sparse_paths)
+        if result.returncode != 0:
+            raise RuntimeError(f"Error setting up sparse checkout: {result.stderr.strip()}")
 
-    try:
-        feature = resolve_current_run(base)
-        _, state_path = get_design_paths(base, feature)
-        state = read_json(state_path) if state_path.exists() else {}
-        worktrees = state.get("worktrees", {})
-        worktrees[full_ticket_id] = str(worktree_path)
-        state["worktrees"] = worktrees
-        write_json(state_path, state)
-    except RuntimeError as exc:
-        typer.echo(f"Warning: could not record worktree in state.json: {exc}")
+    seed_worktree(base, worktree_path, cfg.peasant.seed_dirs, cfg.peasant.lockfiles)
+    run_init_worktree(base, worktree_path)
+    record_worktree(base, full_ticket_id, worktree_path)
 
     return worktree_path
 
 
 def remove_worktree(base: Path, full_ticket_id: str) -> None:
-    """Remove a git worktree for a ticket."""
+    """Remove a git worktree for a ticket.
+
+    Pooled worktrees are reset and handed back to the pool instead.
+    """
+    if release_pool_worktree(base, full_ticket_id) is not None:
+        record_worktree(base, full_ticket_id, None)
+        return
+
     worktree_path = worktree_path_for(base, full_ticket_id)
 
     if not worktree_path.exists():
@@ -1647,16 +1862,7 @@ def remove_worktree(base: Path, full_ticket_id: str) -> None:
     if result.returncode != 0:
         raise RuntimeError(f"Error removing worktree: {result.stderr.strip()}")
 
-    try:
-        feature = resolve_current_run(base)
-        _, state_path = get_design_paths(base, feature)
-        state = read_json(state_path) if state_path.exists() else {}
-        worktrees = state.get("worktrees", {})
-        worktrees.pop(full_ticket_id, None)
-        state["worktrees"] = worktrees
-        write_json(state_path, state)
-    except RuntimeError as exc:
-        typer.echo(f"Warning: could not update state.json worktree map: {exc}")
+    record_worktree(base, full_ticket_id, None)
 
 
 class PeasantContext(NamedTuple):
@@ -1726,7 +1932,12 @@ def launch_work_background(
 
     Builds the command, opens log file descriptors, spawns via Popen, and
     returns the child PID.  Used by ``peasant start`` and ``peasant review --reject``.
+    The ``peasant.*`` resource limits are applied to the child before it execs.
     """
+    from kingdom.config import load_config
+    from kingdom.limits import ResourceLimits
+
+    limits = ResourceLimits.from_config(load_config(base).peasant)
     peasant_logs_dir = logs_root(base, feature) / session_name
     peasant_logs_dir.mkdir(parents=True, exist_ok=True)
     stdout_log = peasant_logs_dir / "stdout.log"
@@ -1759,6 +1970,7 @@ def launch_work_background(
         stderr=stderr_fd,
         stdin=subprocess.DEVNULL,
         start_new_session=True,
+        preexec_fn=limits.preexec_fn(),
     )
 
     os.close(stdout_fd)
@@ -1766,17 +1978,125 @@ def launch_work_background(
     return proc.pid
 
 
+def seed_work_thread(
+    base: Path, feature: str, thread_id: str, session_name: str, full_ticket_id: str, ticket: Ticket
+) -> None:
+    """Post the ticket as the first message of a new work thread (no-op once it has messages)."""
+    from kingdom.thread import add_message, thread_dir
+
+    tdir = thread_dir(base, feature, thread_id)
+    if list(tdir.glob("[0-9][0-9][0-9][0-9]-*.md")):
+        return
+    seed_body = f"# Starting work on {full_ticket_id}\n\n"
+    seed_body += f"**Title:** {ticket.title}\n\n"
+    seed_body += ticket.body
+    add_message(base, feature, thread_id, from_="king", to=session_name, body=seed_body)
+
+
+def start_candidates(ctx: PeasantContext, agents: list[str], count: int) -> None:
+    """Race *count* peasants on one ticket, each in its own worktree (``kd peasant start --candidates``).
+
+    Agents are assigned to candidates in turn.  See :mod:`kingdom.candidates`.
+    """
+    from kingdom.candidates import Candidate, Race, race_path, read_race, start_race
+    from kingdom.cleanup import pid_alive
+    from kingdom.config import load_config
+    from kingdom.limits import admission_wait_reason
+    from kingdom.session import get_agent_state, update_agent_state
+    from kingdom.thread import create_thread
+
+    base, ticket, full_ticket_id, feature = ctx.base, ctx.ticket, ctx.full_ticket_id, ctx.feature
+
+    previous = read_race(base, feature, full_ticket_id)
+    if previous is not None:
+        if previous.winner:
+            print_error(
+                f"Candidate {previous.winner} already won the race on {full_ticket_id}. "
+                f"Review it with `kd peasant review {full_ticket_id}`."
+            )
+            raise typer.Exit(code=1)
+        for candidate in previous.candidates:
+            state = get_agent_state(base, feature, candidate.session_name)
+            racing = state.status == "awaiting_council" or (
+                state.status in ("working", "queued") and pid_alive(state.pid)
+            )
+            if racing:
+                print_error(
+                    f"Candidates are already racing on {full_ticket_id} ({candidate.session_name} is {state.status})."
+                )
+                raise typer.Exit(code=1)
+
+    race = Race(ticket_id=full_ticket_id, candidates=[], started_at=datetime.now(UTC).isoformat())
+    for k in range(1, count + 1):
+        work_id = f"{full_ticket_id}-c{k}"
+        try:
+            worktree_path = create_worktree(base, work_id, ticket.paths)
+        except RuntimeError as exc:
+            typer.echo(str(exc))
+            raise typer.Exit(code=1) from None
+        agent = agents[(k - 1) % len(agents)]
+        race.candidates.append(Candidate(name=f"c{k}", work_id=work_id, agent=agent, worktree=str(worktree_path)))
+    start_race(base, feature, ctx.ticket_path, race)
+
+    peasant_cfg = load_config(base).peasant
+    typer.echo(f"Racing {count} candidates on {full_ticket_id}")
+    for candidate in race.candidates:
+        session_name, thread_id = candidate.session_name, candidate.thread_id
+        with contextlib.suppress(FileExistsError):
+            create_thread(base, feature, thread_id, [session_name, "king"], "work")
+        seed_work_thread(base, feature, thread_id, session_name, full_ticket_id, ticket)
+
+        queued_because = admission_wait_reason(base, feature, session_name, peasant_cfg)
+        pid = launch_work_background(
+            base, feature, full_ticket_id, candidate.agent, Path(candidate.worktree), thread_id, session_name
+        )
+        now = datetime.now(UTC).isoformat()
+        update_agent_state(
+            base,
+            feature,
+            session_name,
+            status="queued" if queued_because else "working",
+            pid=pid,
+            ticket=full_ticket_id,
+            thread=thread_id,
+            agent_backend=candidate.agent,
+            started_at=now,
+            last_activity=now,
+            hand_mode=False,
+        )
+        typer.echo(f"Started {session_name} (pid {pid})")
+        typer.echo(f"  Agent: {candidate.agent}")
+        typer.echo(f"  Branch: {candidate.branch}")
+        typer.echo(f"  Worktree: {candidate.worktree}")
+        if queued_because:
+            typer.echo(f"  Queued: {queued_because}")
+    typer.echo(f"Race: {race_path(base, feature, full_ticket_id)}")
+
+
 @peasant_app.command("start", help="Launch a peasant agent on a ticket.")
 def peasant_start(
     ticket_id: Annotated[str, typer.Argument(help="Ticket ID to work on.")],
-    agent: Annotated[str | None, typer.Option("--agent", help="Agent to use (default: from config).")] = None,
+    agents: Annotated[
+        list[str] | None,
+        typer.Option("--agent", help="Agent to use (default: from config). Repeat to mix agents across candidates."),
+    ] = None,
     hand: Annotated[bool, typer.Option("--hand", help="Run in current directory (serial mode).")] = False,
+    candidates: Annotated[
+        int, typer.Option("--candidates", min=1, help="Race N peasants on the ticket; the first to pass review wins.")
+    ] = 1,
 ) -> None:
     """Create worktree, session, thread, and launch agent harness in background."""
     from kingdom.config import load_config
     from kingdom.session import update_agent_state
     from kingdom.thread import create_thread
 
+    if candidates > 1 and hand:
+        print_error("--candidates needs a worktree per candidate and cannot be combined with --hand.")
+        raise typer.Exit(code=1)
+    if agents and len(agents) > 1 and candidates == 1:
+        print_error("Multiple --agent values need --candidates.")
+        raise typer.Exit(code=1)
+
     ctx = resolve_peasant_context(ticket_id, auto_pull=True)
     base, ticket, full_ticket_id, feature = ctx.base, ctx.ticket, ctx.full_ticket_id, ctx.feature
 
@@ -1791,9 +2111,12 @@ def peasant_start(
         write_ticket(ticket, ctx.ticket_path)
 
     # Default agent from config if not specified on CLI
-    if agent is None:
-        cfg = load_config(base)
-        agent = cfg.peasant.agent
+    cfg = load_config(base)
+    agents = agents or [cfg.peasant.agent]
+    if candidates > 1:
+        start_candidates(ctx, agents, candidates)
+        return
+    agent = agents[0]
 
     session_name = f"peasant-{full_ticket_id}"
     thread_id = f"{full_ticket_id}-work"
@@ -1802,7 +2125,7 @@ def peasant_start(
     from kingdom.session import get_agent_state
 
     existing = get_agent_state(base, feature, session_name)
-    if existing.status == "working" and existing.pid:
+    if existing.status in ("working", "queued") and existing.pid:
         # Check if process is actually alive
         try:
             os.kill(existing.pid, 0)
@@ -1819,7 +2142,7 @@ def peasant_start(
         for active in list_active_agents(base, feature):
             if active.name == session_name:
                 continue  # already handled above
-            if active.status == "working" and active.pid and active.name.startswith("peasant-"):
+            if active.status in ("working", "queued") and active.pid and active.name.startswith("peasant-"):
                 try:
                     os.kill(active.pid, 0)
                     typer.echo(
@@ -1833,7 +2156,7 @@ def peasant_start(
         typer.echo(f"Running in hand mode (serial) on {base}")
     else:
         try:
-            worktree_path = create_worktree(base, full_ticket_id)
+            worktree_path = create_worktree(base, full_ticket_id, ticket.paths)
         except RuntimeError as exc:
             typer.echo(str(exc))
             raise typer.Exit(code=1) from None
@@ -1847,18 +2170,12 @@ def peasant_start(
         create_thread(base, feature, thread_id, [session_name, "king"], "work")
 
     # 3. Seed thread with ticket_start message
-    from kingdom.thread import add_message, thread_dir
+    seed_work_thread(base, feature, thread_id, session_name, full_ticket_id, ticket)
 
-    tdir = thread_dir(base, feature, thread_id)
-    # Only seed if no messages yet
-    existing_msgs = list(tdir.glob("[0-9][0-9][0-9][0-9]-*.md"))
-    if not existing_msgs:
-        seed_body = f"# Starting work on {full_ticket_id}\n\n"
-        seed_body += f"**Title:** {ticket.title}\n\n"
-        seed_body += ticket.body
-        add_message(base, feature, thread_id, from_="king", to=session_name, body=seed_body)
-
-    # 4. Launch harness as background process
+    # 4. Launch harness as background process; it waits in "queued" while the machine is busy
+    from kingdom.limits import admission_wait_reason
+
+    queued_because = admission_wait_reason(base, feature, session_name, cfg.peasant)
     pid = launch_work_background(base, feature, full_ticket_id, agent, worktree_path, thread_id, session_name)
 
     # 5. Update session with pid and status
@@ -1867,7 +2184,7 @@ def peasant_start(
         base,
         feature,
         session_name,
-        status="working",
+        status="queued" if queued_because else "working",
         pid=pid,
         ticket=full_ticket_id,
         thread=thread_id,
@@ -1879,6 +2196,8 @@ def peasant_start(
 
     peasant_logs_dir = logs_root(base, feature) / session_name
     typer.echo(f"Started {session_name} (pid {pid})")
+    if queued_because:
+        typer.echo(f"  Queued: {queued_because}; work starts when the machine frees up")
     typer.echo(f"  Agent: {agent}")
     typer.echo(f"  Ticket: {full_ticket_id}")
     typer.echo(f"  Worktree: {worktree_path}")
@@ -1888,8 +2207,10 @@ def peasant_start(
 
 @peasant_app.command("status", help="Show active peasants.")
 def peasant_status() -> None:
-    """Show table of active peasants: ticket, agent, status, elapsed, last activity."""
+    """Show table of active peasants: ticket, agent, status, elapsed, last activity, budget use."""
 
+    from kingdom.config import PeasantConfig, load_config
+    from kingdom.limits import Budget, format_spent
     from kingdom.session import list_active_agents
 
     base = Path.cwd()
@@ -1910,15 +2231,38 @@ def peasant_status() -> None:
         return
 
     table = Table(title="Active Peasants")
-    table.add_column("Ticket", style="cyan")
+    table.add_column("Ticket", style="cyan", no_wrap=True)
     table.add_column("Agent")
-    table.add_column("Status", style="bold")
+    table.add_column("Status", style="bold", no_wrap=True)
     table.add_column("Elapsed")
     table.add_column("Last Activity")
+    table.add_column("Head")
+    table.add_column("Spent")
+
+    try:
+        peasant_cfg = load_config(base).peasant
+    except (OSError, ValueError):
+        peasant_cfg = PeasantConfig()
+
+    # Resolve every ticket branch head in one cat-file round-trip
+    # (keyed by session: racing candidates of one ticket each have their own branch)
+    branch_refs = {p.name: f"refs/heads/ticket/{p.name.removeprefix('peasant-')}" for p in peasants if not p.hand_mode}
+    heads = git_session(base).resolve(*branch_refs.values()) if branch_refs else {}
 
     now = datetime.now(UTC)
     for p in peasants:
         ticket = p.ticket or p.name.replace("peasant-", "")
+        try:
+            found = find_ticket(base, ticket, branch=feature)
+        except AmbiguousTicketMatch:
+            found = None
+        ticket_obj = found[0] if found else None
+
+        # Branch head, marked when nothing has been committed since start
+        head = ""
+        head_sha = heads.get(branch_refs.get(p.name, ""))
+        if head_sha:
+            head = head_sha[:7] if head_sha != p.start_sha else f"[dim]{head_sha[:7]}[/dim]"
 
         # Calculate elapsed
         elapsed = ""
@@ -1943,7 +2287,7 @@ def peasant_status() -> None:
 
         # Check if process is still alive
         display_status = p.status
-        if p.pid and p.status == "working":
+        if p.pid and p.status in ("working", "queued"):
             try:
                 os.kill(p.pid, 0)
             except OSError:
@@ -1952,11 +2296,13 @@ def peasant_status() -> None:
         # Color status
         status_style = {
             "working": "green",
+            "queued": "dim",
             "blocked": "yellow",
             "done": "blue",
             "failed": "red",
             "stopped": "dim",
             "dead": "red",
+            "budget_exhausted": "red",
             "awaiting_council": "magenta",
             "needs_king_review": "cyan",
         }.get(display_status, "")
@@ -1964,16 +2310,180 @@ def peasant_status() -> None:
         agent_display = p.agent_backend or "?"
 
         table.add_row(
-            ticket,
+            p.name.removeprefix("peasant-"),
             agent_display,
             f"[{status_style}]{display_status}[/{status_style}]" if status_style else display_status,
             elapsed,
             last,
+            head,
+            format_spent(p, Budget.for_ticket(peasant_cfg, ticket_obj)),
         )
 
     console.print(table)
 
 
+TOP_SORT_KEYS = {"cpu": "c", "mem": "m", "io": "i", "stream": "s", "ticket": "t"}
+
+
+@peasant_app.command("top", help="Live CPU, memory and I/O of running peasants.")
+def peasant_top(
+    sort: Annotated[str, typer.Option("--sort", help="Sort by cpu, mem, io, stream or ticket.")] = "cpu",
+    interval: Annotated[float, typer.Option("--interval", "-n", help="Seconds between refreshes.")] = 2.0,
+    once: Annotated[bool, typer.Option("--once", help="Print one table after one interval and exit.")] = False,
+) -> None:
+    """Show each peasant's process tree usage, refreshed every *interval* seconds.
+
+    Keys (in a terminal): c/m/i/s/t sort by CPU, memory, I/O, stream or
+    ticket; 1-9 select a row; k sends SIGTERM to the selected peasant;
+    q quits.
+    """
+    import select
+    import termios
+    import tty
+
+    from rich.live import Live
+
+    from kingdom.procstat import TreeSample, TreeUsage, process_table, sample_tree, terminate_group, usage
+    from kingdom.session import AgentState, list_active_agents
+
+    if sort not in TOP_SORT_KEYS:
+        print_error(f"Unknown sort {sort!r}; expected one of: {', '.join(TOP_SORT_KEYS)}")
+        raise typer.Exit(code=1)
+    if not Path("/proc/self/stat").exists():
+        print_error("kd peasant top needs /proc (Linux).")
+        raise typer.Exit(code=1)
+
+    base = Path.cwd()
+    try:
+        feature = resolve_current_run(base)
+    except RuntimeError as exc:
+        print_error(str(exc))
+        raise typer.Exit(code=1) from None
+
+    previous: dict[str, TreeSample] = {}
+
+    def collect() -> list[tuple[AgentState, TreeUsage | None]]:
+        table = process_table()
+        rows: list[tuple[AgentState, TreeUsage | None]] = []
+        for state in list_active_agents(base, feature):
+            if not state.name.startswith("peasant-") or state.status not in ("working", "queued") or not state.pid:
+                continue
+            sample = sample_tree(state.pid, table)
+            rows.append((state, usage(previous.get(state.name), sample) if sample else None))
+            if sample:
+                previous[state.name] = sample
+        sort_key = {
+            "cpu": lambda row: -(row[1].cpu_percent if row[1] else -1),
+            "mem": lambda row: -(row[1].sample.rss if row[1] else -1),
+            "io": lambda row: -(row[1].io_rate if row[1] else -1),
+            "stream": lambda row: -(row[1].stream_rate if row[1] else -1),
+        }.get(sort, lambda row: 0)
+        return sorted(rows, key=lambda row: (sort_key(row), row[0].ticket or row[0].name))
+
+    def render(rows: list[tuple[AgentState, TreeUsage | None]], selected: int | None, note: str) -> Table:
+        now = datetime.now(UTC)
+        table = Table(title=f"Peasants (sort: {sort}){f' - {note}' if note else ''}")
+        for name, justify in (
+            ("#", "right"),
+            ("Ticket", "left"),
+            ("PID", "right"),
+            ("Children", "right"),
+            ("CPU%", "right"),
+            ("RSS", "right"),
+            ("Disk r/w", "right"),
+            ("I/O/s", "right"),
+            ("Iter", "right"),
+            ("Stream/s", "right"),
+            ("Commands", "left"),
+        ):
+            table.add_column(
+                name,
+                justify=justify,
+                style="cyan" if name == "Ticket" else None,
+                no_wrap=name != "Commands",
+                overflow="ellipsis",
+            )
+        for index, (state, tree) in enumerate(rows, start=1):
+            iter_time = ""
+            if state.iteration_started_at:
+                with contextlib.suppress(ValueError):
+                    seconds = int((now - datetime.fromisoformat(state.iteration_started_at)).total_seconds())
+                    iter_time = f"{seconds // 60}m{seconds % 60:02d}s"
+            ticket = state.ticket or state.name.removeprefix("peasant-")
+            iteration = (
+                f"{state.iteration} ({iter_time})" if state.iteration and iter_time else str(state.iteration or "")
+            )
+            if tree is None:
+                cells = ["[red]dead[/red]", "", "", "", "", iteration, "", ""]
+            else:
+                sample = tree.sample
+                commands = sorted(set(sample.commands[1:]))
+                cells = [
+                    str(tree.children),
+                    f"{tree.cpu_percent:.0f}",
+                    format_bytes(sample.rss),
+                    f"{format_bytes(sample.read_bytes)} / {format_bytes(sample.write_bytes)}",
+                    format_bytes(int(tree.io_rate)),
+                    iteration,
+                    format_bytes(int(tree.stream_rate)),
+                    ", ".join(commands[:4]) + (", ..." if len(commands) > 4 else ""),
+                ]
+            table.add_row(str(index), ticket, str(state.pid), *cells, style="reverse" if selected == index else None)
+        return table
+
+    if once:
+        collect()
+        time.sleep(interval)
+        rows = collect()
+        if not rows:
+            typer.echo("No running peasants.")
+            return
+        Console().print(render(rows, None, ""))
+        return
+
+    interactive = sys.stdin.isatty()
+    keys = {key: name for name, key in TOP_SORT_KEYS.items()}
+    selected: int | None = None
+    note = ""
+    saved = termios.tcgetattr(sys.stdin) if interactive else None
+    try:
+        if interactive:
+            tty.setcbreak(sys.stdin)
+        rows = collect()
+        with Live(render(rows, selected, note), refresh_per_second=4, screen=False) as live:
+            deadline = time.monotonic() + interval
+            while True:
+                key = ""
+                wait = max(0.0, deadline - time.monotonic())
+                if interactive:
+                    ready, _, _ = select.select([sys.stdin], [], [], wait)
+                    if ready:
+                        key = sys.stdin.read(1)
+                else:
+                    time.sleep(wait)
+                if key == "q":
+                    break
+                if key in keys:
+                    sort = keys[key]
+                elif key.isdigit() and 0 < int(key) <= len(rows):
+                    selected = int(key)
+                elif key == "k" and selected is not None and selected <= len(rows):
+                    state = rows[selected - 1][0]
+                    ticket = state.ticket or state.name.removeprefix("peasant-")
+                    sent = state.pid is not None and terminate_group(state.pid)
+                    note = f"sent SIGTERM to {ticket}" if sent else f"{ticket} already exited"
+                    selected = None
+                if time.monotonic() >= deadline:
+                    rows = collect()
+                    deadline = time.monotonic() + interval
+                live.update(render(rows, selected, note))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if saved is not None:
+            termios.tcsetattr(sys.stdin, termios.TCSADRAIN, saved)
+
+
 @peasant_app.command("logs", help="Show peasant logs.")
 def peasant_logs(
     ticket_id: Annotated[str, typer.Argument(help="Ticket ID.")],
@@ -1992,13 +2502,22 @@ def peasant_logs(
         raise typer.Exit(code=1)
 
     if follow:
-        # Tail both stdout and stderr
+        from kingdom.watch import Watcher, open_notifier, run_watch
+
+        # Last lines of both logs, then follow them with the `kd watch` event loop
+        for log_file in (stdout_log, stderr_log):
+            if log_file.exists():
+                for line in log_file.read_text(encoding="utf-8", errors="replace").splitlines()[-10:]:
+                    typer.echo(line)
+
+        def emit(events: list[dict]) -> None:
+            for event in events:
+                if event["type"] == "log":
+                    typer.echo(event["line"], err=event["stream"] == "stderr")
+
+        watcher = Watcher(ctx.base, ctx.feature, threads={f"{ctx.full_ticket_id}-work"})
         with contextlib.suppress(KeyboardInterrupt):
-            files = [str(f) for f in [stdout_log, stderr_log] if f.exists()]
-            if files:
-                subprocess.run(["tail", "-f", *files])
-            else:
-                typer.echo("Log files are empty. The peasant may still be starting up.")
+            run_watch(watcher, open_notifier(), emit)
         return
 
     # Show both stdout and stderr
@@ -2029,7 +2548,7 @@ def peasant_stop(
     session_name = f"peasant-{full_ticket_id}"
     state = get_agent_state(base, feature, session_name)
 
-    if state.status != "working":
+    if state.status not in ("working", "queued"):
         typer.echo(f"Peasant {full_ticket_id} is not running (status: {state.status})")
         raise typer.Exit(code=1)
 
@@ -2093,11 +2612,64 @@ def peasant_clean(
         raise typer.Exit(code=1) from None
 
 
+pool_app = typer.Typer(name="pool", help="Manage the warm worktree pool.")
+peasant_app.add_typer(pool_app, name="pool")
+
+
+@pool_app.command("warm", help="Pre-create and initialize pool worktrees.")
+def pool_warm(
+    size: Annotated[int | None, typer.Option("--size", help="Pool size (default: peasant.pool_size).")] = None,
+) -> None:
+    """Create missing pool members so new tickets skip worktree setup."""
+    from kingdom.config import load_config
+
+    base = Path.cwd()
+    cfg = load_config(base)
+    if size is None:
+        size = cfg.peasant.pool_size
+    if size <= 0:
+        typer.echo("Worktree pool is disabled. Set peasant.pool_size in .kd/config.json or pass --size.")
+        raise typer.Exit(code=1)
+
+    try:
+        created = warm_pool(base, size, cfg.peasant.lockfiles)
+    except RuntimeError as exc:
+        print_error(str(exc))
+        raise typer.Exit(code=1) from None
+
+    for name, init_result in created:
+        typer.echo(f"Created {name}")
+        if init_result is not None and init_result.returncode != 0:
+            typer.echo(f"Warning: init-worktree.sh failed in {name} (exit {init_result.returncode})")
+    typer.echo(f"Worktree pool ready: {len(read_pool(base))} member(s)")
+
+
+@pool_app.command("status", help="Show pool members and their tickets.")
+def pool_status() -> None:
+    """Show which pool members are idle and which tickets hold the rest."""
+    base = Path.cwd()
+    pool = read_pool(base)
+    if not pool:
+        typer.echo("No worktree pool. Create one with `kd peasant pool warm`.")
+        return
+
+    table = Table(title="Worktree pool")
+    table.add_column("Member")
+    table.add_column("Ticket")
+    table.add_column("Lockfile hash")
+    for name in sorted(pool):
+        entry = pool[name]
+        ticket = entry.get("ticket") or "[dim]idle[/dim]"
+        table.add_row(name, ticket, (entry.get("lockfile_hash") or "")[:12])
+    Console().print(table)
+
+
 @peasant_app.command("sync", help="Pull parent branch changes into a peasant's worktree.")
 def peasant_sync(
     ticket_id: Annotated[str, typer.Argument(help="Ticket ID.")],
 ) -> None:
     """Merge the parent branch into the worktree's ticket branch, then refresh dependencies."""
+    from kingdom.config import load_config
     from kingdom.session import get_agent_state
 
     ctx = resolve_peasant_context(ticket_id)
@@ -2106,7 +2678,7 @@ def peasant_sync(
     # Refuse if peasant is actively running
     session_name = f"peasant-{full_ticket_id}"
     state = get_agent_state(base, feature, session_name)
-    if state.status == "working" and state.pid:
+    if state.status in ("working", "queued") and state.pid:
         try:
             os.kill(state.pid, 0)
             typer.echo(
@@ -2147,25 +2719,51 @@ def peasant_sync(
     if merge_result.stdout.strip():
         typer.echo(merge_result.stdout.strip())
 
+    # Re-seed dependencies if the merge brought the lockfiles back in line with base
+    try:
+        cfg = load_config(base)
+    except ValueError as exc:
+        typer.echo(f"Warning: skipping dependency seeding: {exc}")
+    else:
+        seed_worktree(base, worktree_path, cfg.peasant.seed_dirs, cfg.peasant.lockfiles)
+
     # Run init-worktree.sh to refresh dependencies
-    init_script = state_root(base) / "init-worktree.sh"
-    if init_script.exists() and os.access(init_script, os.X_OK):
-        typer.echo("Running init-worktree.sh...")
-        init_result = subprocess.run(
-            [str(init_script), str(worktree_path)],
-            capture_output=True,
-            text=True,
-        )
-        if init_result.stdout.strip():
-            typer.echo(init_result.stdout.strip())
-        if init_result.returncode != 0:
-            typer.echo(f"Warning: init-worktree.sh failed (exit {init_result.returncode})")
-            if init_result.stderr.strip():
-                typer.echo(init_result.stderr.strip())
+    run_init_worktree(base, worktree_path)
 
     typer.echo(f"{full_ticket_id}: sync complete")
 
 
+@peasant_app.command("widen", help="Add paths to a peasant's sparse checkout.")
+def peasant_widen(
+    ticket_id: Annotated[str, typer.Argument(help="Ticket ID.")],
+    paths: Annotated[list[str], typer.Argument(help="Directories to add to the checkout.")],
+) -> None:
+    """Widen a sparse worktree and record the new paths in the ticket."""
+    ctx = resolve_peasant_context(ticket_id)
+    base, ticket, full_ticket_id = ctx.base, ctx.ticket, ctx.full_ticket_id
+
+    worktree_path = worktree_path_for(base, full_ticket_id)
+    if not worktree_path.exists():
+        typer.echo(f"No worktree found for {full_ticket_id}. Has the peasant been started?")
+        raise typer.Exit(code=1)
+
+    if not is_sparse_checkout(worktree_path):
+        typer.echo(f"Worktree for {full_ticket_id} is a full checkout — nothing to widen.")
+        raise typer.Exit(code=1)
+
+    result = widen_sparse_checkout(worktree_path, paths)
+    if result.returncode != 0:
+        print_error(f"Failed to widen checkout: {result.stderr.strip()}")
+        raise typer.Exit(code=1)
+
+    added = [path for path in paths if path not in ticket.paths]
+    if added:
+        ticket.paths.extend(added)
+        write_ticket(ticket, ctx.ticket_path)
+
+    typer.echo(f"{full_ticket_id}: checkout widened to {', '.join(ticket.paths)}")
+
+
 @peasant_app.command("msg", help="Send a directive to a working peasant.")
 def peasant_msg(
     ticket_id: Annotated[str, typer.Argument(help="Ticket ID.")],
@@ -2193,7 +2791,7 @@ def peasant_msg(
     session_name = f"peasant-{full_ticket_id}"
     state = get_agent_state(base, feature, session_name)
     process_alive = False
-    if state.status == "working" and state.pid:
+    if state.status in ("working", "queued") and state.pid:
         try:
             os.kill(state.pid, 0)
             process_alive = True
@@ -2246,8 +2844,20 @@ def peasant_review(
     accept: Annotated[bool, typer.Option("--accept", help="Accept the work (close ticket).")] = False,
     reject: Annotated[str | None, typer.Option("--reject", help="Reject with feedback message.")] = None,
     no_resume: Annotated[bool, typer.Option("--no-resume", help="Don't auto-resume peasant on reject.")] = False,
+    full_review: Annotated[
+        bool, typer.Option("--full-review", help="Make the next council round review the full diff, not a delta.")
+    ] = False,
+    candidate: Annotated[
+        str | None,
+        typer.Option("--candidate", help="Candidate to review (e.g. c2) when no candidate has won the race yet."),
+    ] = None,
 ) -> None:
-    """Show diff, worklog, and council feedback. Accept or reject the work."""
+    """Show diff, worklog, and council feedback. Accept or reject the work.
+
+    For a ticket raced with ``kd peasant start --candidates``, this reviews the
+    winning candidate's branch.
+    """
+    from kingdom.candidates import candidate_ticket_path, declare_winner, format_race, read_race, settle_race
     from kingdom.harness import extract_worklog
     from kingdom.session import get_agent_state, update_agent_state
     from kingdom.thread import add_message
@@ -2256,9 +2866,35 @@ def peasant_review(
     base, ticket, ticket_path = ctx.base, ctx.ticket, ctx.ticket_path
     full_ticket_id, feature = ctx.full_ticket_id, ctx.feature
 
-    session_name = f"peasant-{full_ticket_id}"
-    thread_id = f"{full_ticket_id}-work"
-    branch_name = f"ticket/{full_ticket_id}"
+    # The worktree, branch, session and thread under review: the ticket's own,
+    # or those of a racing candidate
+    work_id = full_ticket_id
+    worklog_path = ticket_path
+    race = read_race(base, feature, full_ticket_id)
+    if race is None and candidate is not None:
+        print_error(f"No candidates were raced on {full_ticket_id}.")
+        raise typer.Exit(code=1)
+    if race is not None:
+        name = candidate or race.winner
+        if name is None:
+            print_error(
+                f"No candidate has won the race on {full_ticket_id} yet. "
+                f"Pick one with --candidate ({', '.join(c.name for c in race.candidates)})."
+            )
+            raise typer.Exit(code=1)
+        chosen = race.candidate(name)
+        if chosen is None:
+            print_error(f"No candidate {name} in the race on {full_ticket_id}.")
+            raise typer.Exit(code=1)
+        if race.winner not in (None, chosen.name) and (accept or reject is not None):
+            print_error(f"Candidate {chosen.name} lost the race on {full_ticket_id} to {race.winner}.")
+            raise typer.Exit(code=1)
+        work_id = chosen.work_id
+        worklog_path = candidate_ticket_path(base, feature, full_ticket_id, chosen.name)
+
+    session_name = f"peasant-{work_id}"
+    thread_id = f"{work_id}-work"
+    branch_name = f"ticket/{work_id}"
 
     console = Console()
 
@@ -2267,6 +2903,31 @@ def peasant_review(
         print_error("--accept and --reject are mutually exclusive.")
         raise typer.Exit(code=1)
 
+    if race is not None and race.winner is None:
+        if accept:
+            # The king accepts a candidate escalated without approval (review
+            # timeout, bounce limit): it wins, and the others are cleaned up
+            if get_agent_state(base, feature, session_name).status != "needs_king_review":
+                print_error(f"Cannot accept: {session_name} is not awaiting king review.")
+                raise typer.Exit(code=1)
+            declare_winner(base, feature, full_ticket_id, chosen.name)
+            settle_race(base, feature, full_ticket_id)
+            ticket = read_ticket(ticket_path)
+            typer.echo(f"{chosen.name} won the race on {full_ticket_id} — other candidates stopped and cleaned up")
+        else:
+            # Undecided race: the candidate's own copy of the ticket is the one in review
+            ticket_path = worklog_path
+            ticket = read_ticket(ticket_path)
+
+    if full_review:
+        if accept:
+            print_error("--full-review applies to the next council round and cannot be combined with --accept.")
+            raise typer.Exit(code=1)
+        update_agent_state(base, feature, session_name, full_review=True)
+        if reject is None:
+            typer.echo(f"{full_ticket_id}: next council review will cover the full diff")
+            return
+
     if accept:
         # Gate: ticket must be in_review
         if ticket.status != "in_review":
@@ -2280,12 +2941,8 @@ def peasant_review(
             raise typer.Exit(code=1)
 
         # Gate: must be on the feature branch
-        current_branch = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            capture_output=True,
-            text=True,
-            cwd=str(base),
-        ).stdout.strip()
+        git = git_session(base)
+        current_branch = git.run("rev-parse", "--abbrev-ref", "HEAD").stdout.strip()
         if normalize_branch_name(current_branch) != normalize_branch_name(feature):
             print_error(
                 f"Cannot accept: expected to be on '{feature}' but HEAD is on '{current_branch}'. "
@@ -2298,13 +2955,8 @@ def peasant_review(
             typer.echo(f"Hand mode — changes already on {feature}, skipping merge")
         else:
             # Worktree mode: merge ticket branch into feature branch
-            worktree_path = worktree_path_for(base, full_ticket_id)
-            merge_result = subprocess.run(
-                ["git", "merge", branch_name, "--no-edit"],
-                capture_output=True,
-                text=True,
-                cwd=str(base),
-            )
+            worktree_path = worktree_path_for(base, work_id)
+            merge_result = git.run("merge", branch_name, "--no-edit")
             if merge_result.returncode != 0:
                 # Integration failed — keep in_review, show recovery steps
                 merge_err = merge_result.stdout.strip()
@@ -2320,6 +2972,11 @@ def peasant_review(
 
             typer.echo(f"Integrated {branch_name} into {feature}")
 
+            pool_member = release_pool_worktree(base, work_id)
+            if pool_member is not None:
+                record_worktree(base, work_id, None)
+                typer.echo(f"Returned {pool_member} to the worktree pool")
+
         ticket.status = "closed"
         write_ticket(ticket, ticket_path)
         update_agent_state(
@@ -2373,6 +3030,7 @@ def peasant_review(
                 status="working",
                 pid=None,
                 review_bounce_count=0,
+                review_feedback=None,
                 last_activity=datetime.now(UTC).isoformat(),
             )
             typer.echo(f"{full_ticket_id}: rejected — feedback sent, ticket back to in_progress")
@@ -2388,7 +3046,7 @@ def peasant_review(
             for active in list_active_agents(base, feature):
                 if active.name == session_name:
                     continue
-                if active.status == "working" and active.pid and active.name.startswith("peasant-"):
+                if active.status in ("working", "queued") and active.pid and active.name.startswith("peasant-"):
                     try:
                         os.kill(active.pid, 0)
                         print_error(
@@ -2401,9 +3059,9 @@ def peasant_review(
             worktree_path = base
         else:
             # Worktree mode: use the ticket worktree
-            worktree_path = worktree_path_for(base, full_ticket_id)
+            worktree_path = worktree_path_for(base, work_id)
             if not worktree_path.exists():
-                print_error(f"worktree missing for {full_ticket_id}. Run `kd peasant start` to recreate.")
+                print_error(f"worktree missing for {work_id}. Run `kd peasant start` to recreate.")
                 raise typer.Exit(code=1)
 
         pid = launch_work_background(
@@ -2418,6 +3076,7 @@ def peasant_review(
             status="working",
             pid=pid,
             review_bounce_count=0,
+            review_feedback=None,
             last_activity=now,
         )
         typer.echo(f"{full_ticket_id}: rejected — feedback sent, peasant relaunched (pid {pid})")
@@ -2434,12 +3093,7 @@ def peasant_review(
             diff_spec = "HEAD"
     else:
         diff_spec = f"HEAD...{branch_name}"
-    diff_result = subprocess.run(
-        ["git", "diff", diff_spec, "--stat"],
-        capture_output=True,
-        text=True,
-        cwd=str(base),
-    )
+    diff_result = git_session(base).run("diff", diff_spec, "--stat")
     diff_output = diff_result.stdout.strip()
     diff_err = diff_result.stderr.strip()
     has_diff = False
@@ -2452,7 +3106,7 @@ def peasant_review(
         typer.echo("(no diff — branch may not have diverged yet)")
 
     # 4. Show worklog
-    worklog = extract_worklog(ticket_path)
+    worklog = extract_worklog(worklog_path)
     if worklog:
         console.print(Markdown(f"## Worklog\n\n{worklog}"))
     else:
@@ -2472,7 +3126,11 @@ def peasant_review(
     except FileNotFoundError:
         pass  # No work thread yet — skip council feedback
 
-    # 6. Show session status
+    # 6. Compare raced candidates
+    if race is not None:
+        console.print(Markdown(f"## Candidates\n\n{format_race(race)}"))
+
+    # 7. Show session status
     state = get_agent_state(base, feature, session_name)
     typer.echo(f"\nTicket status: {ticket.status}")
     typer.echo(f"Peasant status: {state.status}")
@@ -2524,8 +3182,8 @@ def work(
         raise typer.Exit(code=1) from None
 
     # Default agent from config if not specified on CLI
+    cfg = load_config(base)
     if agent is None:
-        cfg = load_config(base)
         agent = cfg.peasant.agent
 
     # Resolve ticket context if not provided (interactive mode)
@@ -2566,6 +3224,45 @@ def work(
         raise typer.Exit(code=1)
 
 
+@app.command("review-worker", help="Process queued council reviews (started automatically).", hidden=True)
+def review_worker(
+    branch: Annotated[str | None, typer.Option("--branch", help="Branch whose queue to process.")] = None,
+    base_dir: Annotated[str, typer.Option("--base", help="Project root.")] = ".",
+) -> None:
+    """Drain the branch's review queue (``council.review_workers``), then exit."""
+    import logging
+
+    from kingdom.review_queue import ReviewRequest, run_review_worker
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(process)d %(levelname)s] %(message)s",
+        stream=sys.stdout,
+    )
+
+    base = Path(base_dir).resolve()
+    if branch is None:
+        try:
+            branch = resolve_current_run(base)
+        except RuntimeError as exc:
+            typer.echo(str(exc))
+            raise typer.Exit(code=1) from None
+
+    def relaunch(request: ReviewRequest) -> int:
+        return launch_work_background(
+            base,
+            branch,
+            request.ticket_id,
+            request.agent,
+            Path(request.worktree),
+            request.thread_id,
+            request.session_name,
+        )
+
+    processed = run_review_worker(base, branch, relaunch)
+    typer.echo(f"Review worker finished: {processed} review(s)")
+
+
 @app.command(help="Reserved for broader develop phase (MVP stub).")
 def dev(ticket: str | None = typer.Argument(None, help="Optional ticket id.")) -> None:
     if ticket:
@@ -2798,6 +3495,244 @@ def check_config(base: Path) -> tuple[bool, str | None]:
         return False, str(e)
 
 
+@app.command("logs", help="Query council and peasant event logs.")
+def logs(
+    member: Annotated[str | None, typer.Option("--member", "-m", help="Only records for this agent.")] = None,
+    ticket: Annotated[str | None, typer.Option("--ticket", "-t", help="Only records for this ticket.")] = None,
+    kind: Annotated[
+        str | None, typer.Option("--kind", help="Only one record kind (council, council_retry, peasant).")
+    ] = None,
+    since: Annotated[str | None, typer.Option("--since", help="Only newer records (e.g. 30m, 2h, 1d, or ISO).")] = None,
+    limit: Annotated[int, typer.Option("--limit", "-n", help="Show at most N newest records (0 = all).")] = 20,
+    full: Annotated[bool, typer.Option("--full", help="Print prompts and outputs.")] = False,
+    json_output: Annotated[bool, typer.Option("--json", help="Output one JSON record per line.")] = False,
+) -> None:
+    """Show records from the current branch's event log, oldest first.
+
+    Council queries and peasant iterations are logged to
+    ``logs/events.jsonl`` with rotated, gzipped segments alongside it.
+    """
+    from kingdom.logstore import LogStore, parse_since, record_time
+
+    base = Path.cwd()
+    feature = resolve_current_run(base)
+
+    since_time = None
+    if since:
+        try:
+            since_time = parse_since(since)
+        except ValueError as exc:
+            print_error(f"--since: {exc}")
+            raise typer.Exit(code=1) from None
+
+    store = LogStore(logs_root(base, feature))
+    records = store.query(since=since_time, kind=kind, member=member, ticket=ticket, limit=limit or None)
+    text_fields = ("prompt", "response", "stdout", "stderr")
+
+    if json_output:
+        for record in records:
+            if full:
+                record = {**record, **dict(store.iter_texts(record, text_fields))}
+            typer.echo(json.dumps(record, sort_keys=True))
+        return
+
+    if not records:
+        typer.echo("No matching log records.")
+        return
+
+    for record in records:
+        ts = record_time(record)
+        parts = [
+            ts.astimezone().strftime("%Y-%m-%d %H:%M:%S") if ts else "?",
+            str(record.get("kind", "?")),
+            str(record.get("member", "?")),
+        ]
+        if record.get("ticket"):
+            parts.append(f"{record['ticket']}#{record.get('iteration', '?')}")
+        if "elapsed" in record:
+            parts.append(f"{record['elapsed']:.1f}s")
+        if record.get("kind") == "council_retry":
+            parts.append("retry with session reset" if record.get("reset_session") else "retry with same session")
+        if record.get("error"):
+            parts.append(f"error: {record['error']}")
+        elif "returncode" in record and record["returncode"] != 0:
+            parts.append(f"exit {record['returncode']}")
+        typer.echo("  ".join(parts))
+        if full:
+            for name, text in store.iter_texts(record, text_fields):
+                typer.echo(f"--- {name} ---")
+                typer.echo(text.rstrip())
+            typer.echo()
+
+
+@app.command("watch", help="Follow council threads, work threads and peasant logs live.")
+def watch(
+    thread_ids: Annotated[list[str] | None, typer.Argument(help="Thread IDs to follow.")] = None,
+    all_threads: Annotated[
+        bool, typer.Option("--all", "-a", help="Follow every council and work thread and all peasants.")
+    ] = False,
+    json_output: Annotated[bool, typer.Option("--json", help="Print one JSON event per line.")] = False,
+    timeout: Annotated[int, typer.Option("--timeout", help="Stop after this many seconds (0 = never).")] = 0,
+    poll: Annotated[bool, typer.Option("--poll", help="Poll for changes instead of using inotify.")] = False,
+) -> None:
+    """Follow several threads and peasants from one event loop.
+
+    New messages and peasant log lines are printed as they arrive, interleaved,
+    below a live status line per peasant and per streaming member.  Peasants
+    are followed along with their work threads, so ``kd watch <ticket>-work``
+    also shows that peasant's logs.
+    """
+    from rich.live import Live
+    from rich.markup import escape
+
+    from kingdom.agent import resolve_all_agents
+    from kingdom.config import load_config
+    from kingdom.watch import Dashboard, Watcher, open_notifier, run_watch
+
+    if not all_threads and not thread_ids:
+        print_error("Pass thread IDs to follow, or --all.")
+        raise typer.Exit(code=1)
+
+    base = Path.cwd()
+    try:
+        feature = resolve_current_run(base)
+    except RuntimeError as exc:
+        print_error(str(exc))
+        raise typer.Exit(code=1) from None
+
+    member_backends: dict[str, str] = {}
+    with contextlib.suppress(KeyError, OSError, TypeError, ValueError):
+        member_backends = {name: ac.backend for name, ac in resolve_all_agents(load_config(base).agents).items()}
+
+    watcher = Watcher(
+        base, feature, threads=None if all_threads else set(thread_ids or []), member_backends=member_backends
+    )
+    notifier = open_notifier(poll=poll)
+    limit = timeout or None
+
+    if json_output:
+
+        def emit_json(events: list[dict]) -> None:
+            for event in events:
+                typer.echo(json.dumps(event))
+
+        with contextlib.suppress(KeyboardInterrupt):
+            run_watch(watcher, notifier, emit_json, timeout=limit)
+        return
+
+    console = Console()
+    dashboard = Dashboard()
+
+    def line(event: dict) -> str | None:
+        kind = event["type"]
+        if kind == "message":
+            first = event["body"].strip().splitlines()[0] if event["body"].strip() else ""
+            return (
+                f"[cyan]{event['thread']}[/cyan] [bold]{event['from']}[/bold] → {event['to'] or '?'}: {escape(first)}"
+            )
+        if kind == "log":
+            style = "dim" if event["stream"] == "stderr" else ""
+            text = escape(event["line"])
+            return (
+                f"[cyan]{event['ticket']}[/cyan] [{style}]{text}[/{style}]"
+                if style
+                else f"[cyan]{event['ticket']}[/cyan] {text}"
+            )
+        if kind == "status":
+            return f"[cyan]{event['ticket']}[/cyan] [bold]{event['status']}[/bold]"
+        return None
+
+    try:
+        with Live(dashboard.render(), console=console, refresh_per_second=4) as live:
+
+            def emit(events: list[dict]) -> None:
+                for event in events:
+                    text = line(event)
+                    if text is not None:
+                        live.console.print(text, highlight=False)
+                dashboard.apply(events)
+                live.update(dashboard.render())
+
+            run_watch(watcher, notifier, emit, timeout=limit)
+    except KeyboardInterrupt:
+        console.print("\n[dim]Watch interrupted.[/dim]")
+
+
+@app.command("gc", help="Prune stale runtime files under .kd/.")
+def gc(
+    dry_run: Annotated[bool, typer.Option("--dry-run", "-n", help="Only report what would be removed.")] = False,
+    older_than: Annotated[
+        str, typer.Option("--older-than", help="Age for sessions, debug streams and run bundles (e.g. 7d, 12h).")
+    ] = "7d",
+    bundle_budget: Annotated[
+        str | None, typer.Option("--bundle-budget", help="Keep at most this much of run bundles (e.g. 200M).")
+    ] = None,
+    worktrees: Annotated[
+        bool, typer.Option("--worktrees/--no-worktrees", help="Remove worktrees of closed tickets.")
+    ] = True,
+    json_output: Annotated[bool, typer.Option("--json", help="Output JSON format.")] = False,
+) -> None:
+    """Remove orphaned stream, lock and tmp files, dead sessions, closed worktrees and old bundles.
+
+    Anything held by a live process or lock, or written within the last
+    hour, is kept.
+    """
+    from kingdom.cleanup import GcPolicy, collect, parse_size
+    from kingdom.logstore import parse_age
+
+    base = Path.cwd()
+    try:
+        policy = GcPolicy(
+            older_than=parse_age(older_than),
+            bundle_budget=parse_size(bundle_budget) if bundle_budget else None,
+            worktrees=worktrees,
+        )
+    except ValueError as exc:
+        print_error(str(exc))
+        raise typer.Exit(code=1) from None
+
+    report = collect(base, policy, dry_run=dry_run)
+    for candidate in report.removed:
+        if candidate.kind == "worktree" and candidate.ticket and not dry_run:
+            record_worktree(base, candidate.ticket, None)
+
+    def relative(path: Path) -> str:
+        return str(path.relative_to(base)) if path.is_relative_to(base) else str(path)
+
+    if json_output:
+        output = {
+            "dry_run": dry_run,
+            "bytes_reclaimed": report.bytes_reclaimed,
+            "removed": [
+                {"kind": c.kind, "path": relative(c.path), "size": c.size, "reason": c.reason} for c in report.removed
+            ],
+            "skipped": [{"kind": c.kind, "path": relative(c.path), "reason": c.skip} for c in report.skipped],
+            "errors": [{"kind": c.kind, "path": relative(c.path), "error": error} for c, error in report.errors],
+        }
+        typer.echo(json.dumps(output, indent=2))
+        return
+
+    if report.removed:
+        table = Table(title="Would remove" if dry_run else "Removed")
+        table.add_column("Kind")
+        table.add_column("Path", style="cyan")
+        table.add_column("Size", justify="right")
+        table.add_column("Reason")
+        for candidate in report.removed:
+            table.add_row(candidate.kind, relative(candidate.path), format_bytes(candidate.size), candidate.reason)
+        Console().print(table)
+
+    for candidate in report.skipped:
+        typer.echo(f"Kept {relative(candidate.path)}: {candidate.skip}")
+    for candidate, error in report.errors:
+        print_error(f"Could not remove {relative(candidate.path)}: {error}")
+
+    verb = "Would reclaim" if dry_run else "Reclaimed"
+    typer.echo(f"{verb} {format_bytes(report.bytes_reclaimed)} from {len(report.removed)} items")
+    if report.errors:
+        raise typer.Exit(code=1)
+
+
 @app.command(help="Check config and agent CLIs.")
 def doctor(
     output_json: Annotated[bool, typer.Option("--json", help="Output as JSON.")] = False,
@@ -3000,18 +3935,30 @@ def get_tickets_dir(base: Path, backlog: bool = False) -> Path:
 
 @ticket_app.command("create", help="Create a new ticket.")
 def ticket_create(
-    title: Annotated[str, typer.Argument(help="Ticket title.")],
+    title: Annotated[str | None, typer.Argument(help="Ticket title.")] = None,
     description: Annotated[str | None, typer.Option("-d", "--description", help="Ticket description.")] = None,
     priority: Annotated[int, typer.Option("-p", "--priority", help="Priority (1-3, 1 is highest).")] = 2,
     ticket_type: Annotated[str, typer.Option("-t", "--type", help="Ticket type (task, bug, feature).")] = "task",
     backlog: Annotated[bool, typer.Option("--backlog", help="Create in backlog instead of current branch.")] = False,
     dep: Annotated[list[str] | None, typer.Option("--dep", help="Ticket ID(s) this depends on.")] = None,
+    batch: Annotated[
+        str | None,
+        typer.Option("--batch", help="Create tickets from a JSONL or YAML spec file ('-' reads stdin)."),
+    ] = None,
 ) -> None:
     """Create a new ticket in the current branch or backlog."""
     from datetime import datetime
 
     base = Path.cwd()
 
+    if batch is not None:
+        if title is not None or description is not None or dep:
+            print_error("--batch takes titles, descriptions and deps from the spec file.")
+            raise typer.Exit(code=1)
+    elif title is None:
+        print_error('Missing ticket title. Usage: kd tk create "title" (or --batch <file>).')
+        raise typer.Exit(code=1)
+
     # Validate priority range (1-3)
     if priority < 1 or priority > 3:
         sys.stderr.write(f"Warning: Priority {priority} outside valid range (1-3), clamping.\n")
@@ -3023,6 +3970,10 @@ def ticket_create(
     tickets_dir = get_tickets_dir(base, backlog=backlog)
     tickets_dir.mkdir(parents=True, exist_ok=True)
 
+    if batch is not None:
+        create_ticket_batch(base, tickets_dir, batch, priority, ticket_type, backlog)
+        return
+
     # Resolve dependency IDs
     resolved_deps: list[str] = []
     if dep:
@@ -3067,6 +4018,49 @@ def ticket_create(
     typer.echo(str(ticket_path))
 
 
+def create_ticket_batch(
+    base: Path, tickets_dir: Path, source: str, priority: int, ticket_type: str, backlog: bool
+) -> None:
+    """Create every ticket in a spec file after validating the whole batch."""
+    from kingdom.ticket import parse_ticket_specs, plan_ticket_batch
+
+    if source == "-":
+        text, fmt = sys.stdin.read(), None
+    else:
+        spec_path = Path(source)
+        try:
+            text = spec_path.read_text(encoding="utf-8")
+        except OSError as exc:
+            print_error(f"Cannot read {source}: {exc.strerror}")
+            raise typer.Exit(code=1) from None
+        suffix = spec_path.suffix.lower()
+        fmt = "yaml" if suffix in (".yaml", ".yml") else "jsonl" if suffix in (".jsonl", ".json") else None
+
+    def resolve_dep(dep_id: str) -> str | None:
+        try:
+            found = find_ticket(base, dep_id)
+        except AmbiguousTicketMatch as e:
+            raise ValueError(str(e)) from None
+        return found[0].id if found else None
+
+    taken = {path.stem.removeprefix("kin-") for path in tickets_dir.glob("*.md")}
+    try:
+        specs = parse_ticket_specs(text, fmt)
+        planned = plan_ticket_batch(specs, taken, resolve_dep, priority, ticket_type)
+    except ValueError as exc:
+        print_error(f"{source}: {exc}")
+        raise typer.Exit(code=1) from None
+
+    for _, ticket in planned:
+        write_ticket(ticket, tickets_dir / f"{ticket.id}.md")
+
+    for ref, ticket in planned:
+        dep_suffix = f" (depends on: {', '.join(ticket.deps)})" if ticket.deps else ""
+        typer.echo(f"{ref} -> {ticket.id}: {ticket.title}{dep_suffix}")
+    location_label = " in backlog" if backlog else ""
+    typer.echo(f"Created {len(planned)} tickets{location_label}: {tickets_dir.relative_to(base)}")
+
+
 def format_ticket_summary(tickets: list) -> str:
     """Build a one-line summary of ticket counts by status.
 
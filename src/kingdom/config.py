@@ -39,6 +39,27 @@ class PromptsConfig:
     peasant: str = ""
 
 
+DEFAULT_REVIEW_IGNORE = [
+    "*.lock",
+    "package-lock.json",
+    "pnpm-lock.yaml",
+    "go.sum",
+    "*.snap",
+    "__snapshots__/*",
+]
+DEFAULT_REVIEW_COLLAPSE = [
+    "*.min.js",
+    "*.min.css",
+    "*.map",
+    "*_pb2.py",
+    "*_pb2_grpc.py",
+    "*.pb.go",
+    "*.generated.*",
+    "vendor/*",
+    "third_party/*",
+]
+
+
 @dataclass
 class CouncilConfig:
     """Council composition and settings."""
@@ -50,6 +71,30 @@ class CouncilConfig:
     preamble: str = ""
     thinking_visibility: str = "auto"
     writable: bool = False
+    review_mode: str = "full"  # "full" (one prompt per member) or "chunked" (diff shards fanned out)
+    review_shard_tokens: int = 12000  # estimated token budget per diff shard in chunked mode
+    review_ignore: list[str] = field(default_factory=lambda: list(DEFAULT_REVIEW_IGNORE))  # dropped from review diffs
+    review_collapse: list[str] = field(default_factory=lambda: list(DEFAULT_REVIEW_COLLAPSE))  # shown as stat lines
+    review_drop_whitespace: bool = False  # drop blank-line and trailing-whitespace hunks
+    review_huge_file_chars: int = 20000  # per-file diff size above which context is reduced; 0 = never
+    review_huge_file_context: int = 1  # context lines kept around changes in huge files
+    review_workers: int = 0  # queue DONE tickets for this many background reviewers; 0 = review inside the peasant
+    review_policy: str = "all"  # "all" (wait for every verdict) or "first_blocking" (bounce on the first BLOCKING)
+    chat_history_tokens: int = 32000  # chat history budget before older messages are summarized; 0 = unlimited
+    chat_history_keep: int = 8  # most recent chat messages always sent verbatim
+    chat_resume: bool = True  # chat members resume a per-thread session and receive only new messages
+
+
+DEFAULT_LOCKFILES = [
+    "uv.lock",
+    "poetry.lock",
+    "requirements.txt",
+    "package-lock.json",
+    "pnpm-lock.yaml",
+    "yarn.lock",
+    "Cargo.lock",
+    "go.sum",
+]
 
 
 @dataclass
@@ -59,6 +104,22 @@ class PeasantConfig:
     agent: str = "claude"
     timeout: int = 900
     max_iterations: int = 50
+    pool_size: int = 0  # 0 = no pool, one fresh worktree per ticket
+    lockfiles: list[str] = field(default_factory=lambda: list(DEFAULT_LOCKFILES))
+    seed_dirs: list[str] = field(default_factory=list)  # e.g. [".venv", "node_modules"]; empty = no seeding
+    sparse: bool = False  # cone-mode sparse checkout scoped to ticket paths
+    sparse_paths: list[str] = field(default_factory=list)  # used when a ticket has no paths
+    verify_command: str = ""  # run once per tree on DONE, summarized for reviewers; empty = disabled
+    worklog_keep: int = 10  # worklog entries sent verbatim each iteration, older ones summarized; 0 = all verbatim
+    max_idle_iterations: int = 5  # CONTINUE iterations without progress before blocking; 0 = never
+    nice: int = 0  # scheduling priority for the harness and its children (0-19); 0 = inherit
+    max_memory_mb: int = 0  # RLIMIT_AS per process; 0 = unlimited
+    max_processes: int = 0  # RLIMIT_NPROC (counted per user); 0 = unlimited
+    wall_clock_minutes: int = 0  # total harness time per ticket, across runs; 0 = unlimited
+    max_output_tokens: int = 0  # total agent output tokens per ticket; 0 = unlimited
+    max_cost_usd: float = 0.0  # total reported agent cost per ticket; 0 = unlimited
+    max_load: float = 0.0  # queue new peasants while the 1-min load per CPU is above this; 0 = never
+    min_free_memory_mb: int = 0  # queue new peasants while MemAvailable is below this; 0 = never
 
 
 @dataclass
@@ -99,8 +160,48 @@ def default_config() -> KingdomConfig:
 VALID_BACKENDS = {"claude_code", "codex", "cursor"}
 VALID_AGENT_KEYS = {"backend", "model", "prompt", "prompts", "extra_flags"}
 VALID_PROMPTS_KEYS = {"council", "design", "review", "peasant"}
-VALID_COUNCIL_KEYS = {"members", "timeout", "auto_messages", "mode", "preamble", "thinking_visibility", "writable"}
-VALID_PEASANT_KEYS = {"agent", "timeout", "max_iterations"}
+VALID_COUNCIL_KEYS = {
+    "members",
+    "timeout",
+    "auto_messages",
+    "mode",
+    "preamble",
+    "thinking_visibility",
+    "writable",
+    "review_mode",
+    "review_shard_tokens",
+    "review_ignore",
+    "review_collapse",
+    "review_drop_whitespace",
+    "review_huge_file_chars",
+    "review_huge_file_context",
+    "review_workers",
+    "review_policy",
+    "chat_history_tokens",
+    "chat_history_keep",
+    "chat_resume",
+}
+VALID_PEASANT_KEYS = {
+    "agent",
+    "timeout",
+    "max_iterations",
+    "pool_size",
+    "lockfiles",
+    "seed_dirs",
+    "sparse",
+    "sparse_paths",
+    "verify_command",
+    "worklog_keep",
+    "max_idle_iterations",
+    "nice",
+    "max_memory_mb",
+    "max_processes",
+    "wall_clock_minutes",
+    "max_output_tokens",
+    "max_cost_usd",
+    "max_load",
+    "min_free_memory_mb",
+}
 VALID_TOP_KEYS = {"agents", "prompts", "council", "peasant"}
 VALID_AGENT_PROMPT_PHASES = {"council", "design", "review", "peasant"}
 
@@ -226,6 +327,86 @@ def validate_council(data: dict) -> CouncilConfig:
     if not isinstance(writable, bool):
         raise ValueError(f"council.writable must be a boolean, got {type(writable).__name__}")
 
+    valid_review_modes = {"full", "chunked"}
+    review_mode = data.get("review_mode", "full")
+    if not isinstance(review_mode, str):
+        raise ValueError(f"council.review_mode must be a string, got {type(review_mode).__name__}")
+    if review_mode not in valid_review_modes:
+        raise ValueError(
+            f"council.review_mode must be one of {', '.join(sorted(valid_review_modes))}, got '{review_mode}'"
+        )
+
+    review_shard_tokens = data.get("review_shard_tokens", 12000)
+    if not isinstance(review_shard_tokens, int):
+        raise ValueError(f"council.review_shard_tokens must be an integer, got {type(review_shard_tokens).__name__}")
+    if review_shard_tokens <= 0:
+        raise ValueError(f"council.review_shard_tokens must be positive, got {review_shard_tokens}")
+
+    review_globs = {}
+    for key, default in (("review_ignore", DEFAULT_REVIEW_IGNORE), ("review_collapse", DEFAULT_REVIEW_COLLAPSE)):
+        globs = data.get(key, list(default))
+        if not isinstance(globs, list):
+            raise ValueError(f"council.{key} must be a list, got {type(globs).__name__}")
+        for i, pattern in enumerate(globs):
+            if not isinstance(pattern, str):
+                raise ValueError(f"council.{key}[{i}] must be a string, got {type(pattern).__name__}")
+        review_globs[key] = globs
+
+    review_drop_whitespace = data.get("review_drop_whitespace", False)
+    if not isinstance(review_drop_whitespace, bool):
+        raise ValueError(
+            f"council.review_drop_whitespace must be a boolean, got {type(review_drop_whitespace).__name__}"
+        )
+
+    review_huge_file_chars = data.get("review_huge_file_chars", 20000)
+    if not isinstance(review_huge_file_chars, int):
+        raise ValueError(
+            f"council.review_huge_file_chars must be an integer, got {type(review_huge_file_chars).__name__}"
+        )
+    if review_huge_file_chars < 0:
+        raise ValueError(
+            f"council.review_huge_file_chars must be 0 (disabled) or positive, got {review_huge_file_chars}"
+        )
+
+    review_huge_file_context = data.get("review_huge_file_context", 1)
+    if not isinstance(review_huge_file_context, int):
+        raise ValueError(
+            f"council.review_huge_file_context must be an integer, got {type(review_huge_file_context).__name__}"
+        )
+    if review_huge_file_context < 0:
+        raise ValueError(f"council.review_huge_file_context must not be negative, got {review_huge_file_context}")
+
+    review_workers = data.get("review_workers", 0)
+    if not isinstance(review_workers, int):
+        raise ValueError(f"council.review_workers must be an integer, got {type(review_workers).__name__}")
+    if review_workers < 0:
+        raise ValueError(f"council.review_workers must be 0 (review inline) or positive, got {review_workers}")
+
+    valid_review_policies = {"all", "first_blocking"}
+    review_policy = data.get("review_policy", "all")
+    if not isinstance(review_policy, str):
+        raise ValueError(f"council.review_policy must be a string, got {type(review_policy).__name__}")
+    if review_policy not in valid_review_policies:
+        raise ValueError(
+            f"council.review_policy must be one of {', '.join(sorted(valid_review_policies))}, got '{review_policy}'"
+        )
+
+    chat_history_tokens = data.get("chat_history_tokens", 32000)
+    if not isinstance(chat_history_tokens, int):
+        raise ValueError(f"council.chat_history_tokens must be an integer, got {type(chat_history_tokens).__name__}")
+    if chat_history_tokens < 0:
+        raise ValueError(f"council.chat_history_tokens must be 0 (unlimited) or positive, got {chat_history_tokens}")
+
+    chat_history_keep = data.get("chat_history_keep", 8)
+    if not isinstance(chat_history_keep, int):
+        raise ValueError(f"council.chat_history_keep must be an integer, got {type(chat_history_keep).__name__}")
+    if chat_history_keep < 0:
+        raise ValueError(f"council.chat_history_keep must not be negative, got {chat_history_keep}")
+
+    chat_resume = data.get("chat_resume", True)
+    if not isinstance(chat_resume, bool):
+        raise ValueError(f"council.chat_resume must be a boolean, got {type(chat_resume).__name__}")
+
     return CouncilConfig(
         members=members,
         timeout=timeout,
@@ -234,6 +415,18 @@ def validate_council(data: dict) -> CouncilConfig:
         preamble=preamble,
         thinking_visibility=thinking_visibility,
         writable=writable,
+        review_mode=review_mode,
+        review_shard_tokens=review_shard_tokens,
+        review_ignore=review_globs["review_ignore"],
+        review_collapse=review_globs["review_collapse"],
+        review_drop_whitespace=review_drop_whitespace,
+        review_huge_file_chars=review_huge_file_chars,
+        review_huge_file_context=review_huge_file_context,
+        review_workers=review_workers,
+        review_policy=review_policy,
+        chat_history_tokens=chat_history_tokens,
+        chat_history_keep=chat_history_keep,
+        chat_resume=chat_resume,
     )
 
 
@@ -257,7 +450,124 @@ def validate_peasant(data: dict) -> PeasantConfig:
     if max_iterations <= 0:
         raise ValueError(f"peasant.max_iterations must be positive, got {max_iterations}")
 
-    return PeasantConfig(agent=agent, timeout=timeout, max_iterations=max_iterations)
+    pool_size = data.get("pool_size", 0)
+    if not isinstance(pool_size, int):
+        raise ValueError(f"peasant.pool_size must be an integer, got {type(pool_size).__name__}")
+    if pool_size < 0:
+        raise ValueError(f"peasant.pool_size must be 0 (disabled) or positive, got {pool_size}")
+
+    lockfiles = data.get("lockfiles", list(DEFAULT_LOCKFILES))
+    if not isinstance(lockfiles, list):
+        raise ValueError(f"peasant.lockfiles must be a list, got {type(lockfiles).__name__}")
+    for i, name in enumerate(lockfiles):
+        if not isinstance(name, str):
+            raise ValueError(f"peasant.lockfiles[{i}] must be a string, got {type(name).__name__}")
+
+    seed_dirs = data.get("seed_dirs", [])
+    if not isinstance(seed_dirs, list):
+        raise ValueError(f"peasant.seed_dirs must be a list, got {type(seed_dirs).__name__}")
+    for i, name in enumerate(seed_dirs):
+        if not isinstance(name, str):
+            raise ValueError(f"peasant.seed_dirs[{i}] must be a string, got {type(name).__name__}")
+        if not name or Path(name).is_absolute() or ".." in Path(name).parts:
+            raise ValueError(f"peasant.seed_dirs[{i}] must be a relative path inside the repo, got {name!r}")
+
+    sparse = data.get("sparse", False)
+    if not isinstance(sparse, bool):
+        raise ValueError(f"peasant.sparse must be a boolean, got {type(sparse).__name__}")
+
+    sparse_paths = data.get("sparse_paths", [])
+    if not isinstance(sparse_paths, list):
+        raise ValueError(f"peasant.sparse_paths must be a list, got {type(sparse_paths).__name__}")
+    for i, name in enumerate(sparse_paths):
+        if not isinstance(name, str):
+            raise ValueError(f"peasant.sparse_paths[{i}] must be a string, got {type(name).__name__}")
+
+    verify_command = data.get("verify_command", "")
+    if not isinstance(verify_command, str):
+        raise ValueError(f"peasant.verify_command must be a string, got {type(verify_command).__name__}")
+
+    worklog_keep = data.get("worklog_keep", 10)
+    if not isinstance(worklog_keep, int):
+        raise ValueError(f"peasant.worklog_keep must be an integer, got {type(worklog_keep).__name__}")
+    if worklog_keep < 0:
+        raise ValueError(f"peasant.worklog_keep must be 0 (all verbatim) or positive, got {worklog_keep}")
+
+    max_idle_iterations = data.get("max_idle_iterations", 5)
+    if not isinstance(max_idle_iterations, int):
+        raise ValueError(f"peasant.max_idle_iterations must be an integer, got {type(max_idle_iterations).__name__}")
+    if max_idle_iterations < 0:
+        raise ValueError(f"peasant.max_idle_iterations must be 0 (never) or positive, got {max_idle_iterations}")
+
+    nice = data.get("nice", 0)
+    if not isinstance(nice, int):
+        raise ValueError(f"peasant.nice must be an integer, got {type(nice).__name__}")
+    if not 0 <= nice <= 19:
+        raise ValueError(f"peasant.nice must be between 0 and 19, got {nice}")
+
+    max_memory_mb = data.get("max_memory_mb", 0)
+    if not isinstance(max_memory_mb, int):
+        raise ValueError(f"peasant.max_memory_mb must be an integer, got {type(max_memory_mb).__name__}")
+    if max_memory_mb < 0:
+        raise ValueError(f"peasant.max_memory_mb must be 0 (unlimited) or positive, got {max_memory_mb}")
+
+    max_processes = data.get("max_processes", 0)
+    if not isinstance(max_processes, int):
+        raise ValueError(f"peasant.max_processes must be an integer, got {type(max_processes).__name__}")
+    if max_processes < 0:
+        raise ValueError(f"peasant.max_processes must be 0 (unlimited) or positive, got {max_processes}")
+
+    wall_clock_minutes = data.get("wall_clock_minutes", 0)
+    if not isinstance(wall_clock_minutes, int):
+        raise ValueError(f"peasant.wall_clock_minutes must be an integer, got {type(wall_clock_minutes).__name__}")
+    if wall_clock_minutes < 0:
+        raise ValueError(f"peasant.wall_clock_minutes must be 0 (unlimited) or positive, got {wall_clock_minutes}")
+
+    max_output_tokens = data.get("max_output_tokens", 0)
+    if not isinstance(max_output_tokens, int):
+        raise ValueError(f"peasant.max_output_tokens must be an integer, got {type(max_output_tokens).__name__}")
+    if max_output_tokens < 0:
+        raise ValueError(f"peasant.max_output_tokens must be 0 (unlimited) or positive, got {max_output_tokens}")
+
+    max_cost_usd = data.get("max_cost_usd", 0.0)
+    if not isinstance(max_cost_usd, int | float):
+        raise ValueError(f"peasant.max_cost_usd must be a number, got {type(max_cost_usd).__name__}")
+    if max_cost_usd < 0:
+        raise ValueError(f"peasant.max_cost_usd must be 0 (unlimited) or positive, got {max_cost_usd}")
+
+    min_free_memory_mb = data.get("min_free_memory_mb", 0)
+    if not isinstance(min_free_memory_mb, int):
+        raise ValueError(f"peasant.min_free_memory_mb must be an integer, got {type(min_free_memory_mb).__name__}")
+    if min_free_memory_mb < 0:
+        raise ValueError(f"peasant.min_free_memory_mb must be 0 (disabled) or positive, got {min_free_memory_mb}")
+
+    max_load = data.get("max_load", 0.0)
+    if not isinstance(max_load, int | float):
+        raise ValueError(f"peasant.max_load must be a number, got {type(max_load).__name__}")
+    if max_load < 0:
+        raise ValueError(f"peasant.max_load must be 0 (disabled) or positive, got {max_load}")
+
+    return PeasantConfig(
+        agent=agent,
+        timeout=timeout,
+        max_iterations=max_iterations,
+        pool_size=pool_size,
+        lockfiles=lockfiles,
+        seed_dirs=seed_dirs,
+        sparse=sparse,
+        sparse_paths=sparse_paths,
+        verify_command=verify_command.strip(),
+        worklog_keep=worklog_keep,
+        max_idle_iterations=max_idle_iterations,
+        nice=nice,
+        max_memory_mb=max_memory_mb,
+        max_processes=max_processes,
+        wall_clock_minutes=wall_clock_minutes,
+        max_output_tokens=max_output_tokens,
+        max_cost_usd=float(max_cost_usd),
+        max_load=float(max_load),
+        min_free_memory_mb=min_free_memory_mb,
+    )
 
 
 def validate_config(data: dict) -> KingdomConfig:
@@ -312,6 +622,18 @@ def validate_config(data: dict) -> KingdomConfig:
             preamble=council.preamble,
             thinking_visibility=council.thinking_visibility,
             writable=council.writable,
+            review_mode=council.review_mode,
+            review_shard_tokens=council.review_shard_tokens,
+            review_ignore=council.review_ignore,
+            review_collapse=council.review_collapse,
+            review_drop_whitespace=council.review_drop_whitespace,
+            review_huge_file_chars=council.review_huge_file_chars,
+            review_huge_file_context=council.review_huge_file_context,
+            review_workers=council.review_workers,
+            review_policy=council.review_policy,
+            chat_history_tokens=council.chat_history_tokens,
+            chat_history_keep=council.chat_history_keep,
+            chat_resume=council.chat_resume,
         )
 
     # Peasant
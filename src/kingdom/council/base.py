@@ -7,10 +7,15 @@ import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from kingdom.agent import AgentConfig, clean_agent_env
+from kingdom.agent import AgentConfig, TokenUsage, clean_agent_env
 from kingdom.agent import build_command as agent_build_command
 from kingdom.agent import parse_response as agent_parse_response
+from kingdom.agent import parse_usage as agent_parse_usage
+
+if TYPE_CHECKING:
+    from kingdom.logstore import LogStore
 
 
 @dataclass
@@ -22,6 +27,8 @@ class AgentResponse:
     error: str | None = None
     elapsed: float = 0.0
     raw: str = ""
+    session_id: str | None = None  # session that produced a successful response
+    usage: TokenUsage | None = None  # token and cache counts, when the backend reports them
 
     def thread_body(self) -> str:
         """Format response for writing to a thread message file.
@@ -49,7 +56,7 @@ class CouncilMember:
 
     config: AgentConfig
     session_id: str | None = None
-    log_path: Path | None = None
+    log_store: LogStore | None = None  # structured event log for queries and retries
     agent_prompt: str = ""  # agent.prompt from config (always additive)
     phase_prompt: str = ""  # resolved phase prompt (agent-specific or global)
     preamble: str = ""  # override for COUNCIL_PREAMBLE (empty = use default)
@@ -57,6 +64,7 @@ class CouncilMember:
     process: subprocess.Popen | None = None  # live Popen handle during query
     base: Path | None = None  # project root, for PID tracking in AgentState
     branch: str | None = None  # branch name, for PID tracking in AgentState
+    usage_path: Path | None = None  # usage.jsonl to append token counts to
 
     @property
     def name(self) -> str:
@@ -238,8 +246,11 @@ class CouncilMember:
                 error=error,
                 elapsed=elapsed,
                 raw=raw,
+                session_id=self.session_id if error is None else None,
+                usage=agent_parse_usage(self.config, stdout),
             )
             self.log(prompt, text, error, elapsed)
+            self.record_usage(response)
             return response
 
         except subprocess.TimeoutExpired:
@@ -309,26 +320,27 @@ class CouncilMember:
 
     def log_retry(self, prompt: str, failed: AgentResponse, reset_session: bool) -> None:
         """Log a retry attempt."""
-        if not self.log_path:
+        if not self.log_store:
             return
-        self.log_path.parent.mkdir(parents=True, exist_ok=True)
-        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-        action = "retry with session reset" if reset_session else "retry with same session"
-        with self.log_path.open("a", encoding="utf-8") as f:
-            f.write(f"\n[{timestamp}] RETRY ({action}) — previous error: {failed.error}\n")
+        self.log_store.append("council_retry", member=self.name, error=failed.error, reset_session=reset_session)
 
-    def log(self, prompt: str, text: str, error: str | None, elapsed: float) -> None:
-        """Log the interaction to the log file."""
-        if not self.log_path:
+    def record_usage(self, response: AgentResponse) -> None:
+        """Append the response's token usage to the usage log."""
+        if not self.usage_path or response.usage is None:
             return
+        from kingdom.usage import record_usage
+
+        record_usage(self.usage_path, "council", self.name, response.usage, response.elapsed)
 
-        self.log_path.parent.mkdir(parents=True, exist_ok=True)
-        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-        with self.log_path.open("a", encoding="utf-8") as f:
-            f.write(f"\n{'=' * 60}\n")
-            f.write(f"[{timestamp}] Query ({elapsed:.1f}s)\n")
-            f.write(f"{'=' * 60}\n")
-            f.write(f"PROMPT:\n{prompt}\n\n")
-            if error:
-                f.write(f"ERROR: {error}\n\n")
-            f.write(f"RESPONSE:\n{text}\n")
+    def log(self, prompt: str, text: str, error: str | None, elapsed: float) -> None:
+        """Log the interaction to the event log."""
+        if not self.log_store:
+            return
+        self.log_store.append(
+            "council",
+            member=self.name,
+            elapsed=round(elapsed, 2),
+            error=error,
+            prompt=self.log_store.pack(prompt, blocks=True),
+            response=self.log_store.pack(text),
+        )
@@ -4,12 +4,14 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 
 from kingdom.agent import resolve_all_agents
 from kingdom.config import default_config
+from kingdom.logstore import LogStore
 from kingdom.session import get_agent_state, update_agent_state
+from kingdom.usage import usage_path
 
 from .base import AgentResponse, CouncilMember
 
@@ -22,6 +24,9 @@ class Council:
     timeout: int = 600
     auto_messages: int = -1
     mode: str = "broadcast"
+    review_mode: str = "full"
+    review_shard_tokens: int = 12000
+    review_policy: str = "all"
 
     @classmethod
     def create(cls, logs_dir: Path | None = None, base: Path | None = None) -> Council:
@@ -55,14 +60,22 @@ class Council:
             )
 
         if logs_dir:
+            log_store = LogStore(logs_dir)
             for member in members:
-                member.log_path = logs_dir / f"council-{member.name}.log"
+                member.log_store = log_store
+
+        if base is not None:
+            for member in members:
+                member.usage_path = usage_path(base)
 
         return cls(
             members=members,
             timeout=cfg.council.timeout,
             auto_messages=cfg.council.auto_messages,
             mode=cfg.council.mode,
+            review_mode=cfg.council.review_mode,
+            review_shard_tokens=cfg.council.review_shard_tokens,
+            review_policy=cfg.council.review_policy,
         )
 
     def query(self, prompt: str) -> dict[str, AgentResponse]:
@@ -132,6 +145,37 @@ class Council:
 
         return responses
 
+    def query_assignments(self, assignments: list[tuple[str, str]]) -> list[AgentResponse]:
+        """Run independent (member name, prompt) queries in parallel.
+
+        Each query uses a fresh copy of the member without a resume session,
+        so one member can work on several prompts at once without clobbering
+        its conversation.  Responses are returned in assignment order.
+        """
+        responses: list[AgentResponse | None] = [None] * len(assignments)
+        if not assignments:
+            return []
+
+        with ThreadPoolExecutor(max_workers=len(assignments)) as executor:
+            futures = {}
+            for index, (name, prompt) in enumerate(assignments):
+                member = self.get_member(name)
+                if member is None:
+                    responses[index] = AgentResponse(name=name, text="", error=f"Unknown member: {name}")
+                    continue
+                worker = replace(member, session_id=None, process=None)
+                futures[executor.submit(worker.query, prompt, self.timeout)] = (index, name)
+
+            for future in as_completed(futures):
+                index, name = futures[future]
+                error = future.exception()
+                if error is not None:
+                    responses[index] = AgentResponse(name=name, text="", error=str(error), elapsed=0.0, raw="")
+                else:
+                    responses[index] = future.result()
+
+        return [response for response in responses if response is not None]
+
     def reset_sessions(self) -> None:
         for member in self.members:
             member.reset_session()
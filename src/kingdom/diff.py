@@ -0,0 +1,410 @@
+"""Unified diff helpers for council review.
+
+Splits ``git diff`` output into per-file sections and packs them into
+size-budgeted shards so a large change can be reviewed in parallel pieces
+instead of being truncated.  Budgets are in estimated tokens (about four
+characters per token).
+
+``compact_diff`` is the pre-processing stage between ``git diff`` and the
+review prompt.  It reads the diff one line at a time and, per file:
+
+- drops files matching an ignore glob (lockfiles, snapshots) entirely;
+- collapses binary files, generated files and files too large to buffer to
+  a one-line stat (``+12 -3 lines``);
+- drops hunks that only change whitespace;
+- trims context lines in very large file diffs.
+
+At most one file section is held in memory at a time, and output stops
+growing at the character budget.  ``CompactStats`` reports what was removed.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from pathlib import PurePosixPath
+
+CHARS_PER_TOKEN = 4
+
+FILE_HEADER = re.compile(r"^diff --git a/(.*?) b/(.*)$")
+HUNK_HEADER = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@(.*)$")
+
+FILE_BUFFER_LIMIT = 1_000_000  # chars of one file's diff held before it is collapsed to a stat line
+
+
+@dataclass
+class FileDiff:
+    """One file's section of a unified diff: header lines plus hunks."""
+
+    path: str
+    header: str
+    hunks: list[str] = field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        return "\n".join([self.header, *self.hunks])
+
+
+@dataclass
+class DiffShard:
+    """A group of file sections (or hunks of one file) reviewed together."""
+
+    paths: list[str] = field(default_factory=list)
+    parts: list[str] = field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.parts)
+
+    @property
+    def size(self) -> int:
+        return sum(len(part) + 1 for part in self.parts)
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN
+
+
+def split_diff(diff: str) -> list[FileDiff]:
+    """Split unified diff text into per-file sections.
+
+    Text before the first ``diff --git`` line (if any) becomes a section with
+    an empty path.
+    """
+    files: list[FileDiff] = []
+    current: FileDiff | None = None
+    lines: list[str] = []
+
+    def flush() -> None:
+        if current is None:
+            return
+        # Separate the header (everything before the first @@) from the hunks
+        header: list[str] = []
+        hunk: list[str] = []
+        for line in lines:
+            if line.startswith("@@"):
+                if hunk:
+                    current.hunks.append("\n".join(hunk))
+                hunk = [line]
+            elif hunk:
+                hunk.append(line)
+            else:
+                header.append(line)
+        if hunk:
+            current.hunks.append("\n".join(hunk))
+        current.header = "\n".join(header)
+
+    for line in diff.splitlines():
+        match = FILE_HEADER.match(line)
+        if match or current is None:
+            flush()
+            current = FileDiff(path=match.group(2) if match else "", header="")
+            files.append(current)
+            lines = []
+        lines.append(line)
+    flush()
+    return files
+
+
+def shard_diff(diff: str, max_tokens: int) -> list[DiffShard]:
+    """Pack a diff into shards of at most *max_tokens* (estimated).
+
+    Whole files are packed greedily in diff order.  A file that does not fit
+    in one shard on its own is split into groups of hunks, each repeating the
+    file header.  A single hunk larger than the budget is truncated — the
+    only case where content is dropped.
+    """
+    max_chars = max(max_tokens * CHARS_PER_TOKEN, 1)
+    shards: list[DiffShard] = []
+    current = DiffShard()
+
+    def close() -> None:
+        nonlocal current
+        if current.parts:
+            shards.append(current)
+        current = DiffShard()
+
+    for file in split_diff(diff):
+        text = file.text
+        if len(text) <= max_chars:
+            if current.size + len(text) + 1 > max_chars:
+                close()
+            current.paths.append(file.path)
+            current.parts.append(text)
+            continue
+
+        # Oversized file: its own run of shards, split at hunk boundaries
+        close()
+        group = [file.header]
+        group_size = len(file.header) + 1
+        for hunk in file.hunks:
+            if len(hunk) + len(file.header) + 2 > max_chars:
+                keep = max(max_chars - len(file.header) - 64, 0)
+                hunk = hunk[:keep] + "\n... (hunk truncated to fit review shard)"
+            if group_size + len(hunk) + 1 > max_chars and len(group) > 1:
+                shards.append(DiffShard(paths=[file.path], parts=group))
+                group = [file.header]
+                group_size = len(file.header) + 1
+            group.append(hunk)
+            group_size += len(hunk) + 1
+        shards.append(DiffShard(paths=[file.path], parts=group))
+
+    close()
+    return shards
+
+
+# ---------------------------------------------------------------------------
+# Compaction
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class CompactOptions:
+    """What ``compact_diff`` removes; see ``council.review_*`` in config."""
+
+    ignore: list[str] = field(default_factory=list)  # globs dropped entirely
+    collapse: list[str] = field(default_factory=list)  # globs reduced to a stat line
+    drop_whitespace: bool = False
+    huge_file_chars: int = 0  # file diffs larger than this get reduced context; 0 = never
+    huge_file_context: int = 1
+    max_chars: int | None = None  # output budget; None = unbounded
+
+
+@dataclass
+class CompactStats:
+    """What ``compact_diff`` removed from a diff."""
+
+    files: int = 0
+    ignored: list[str] = field(default_factory=list)
+    collapsed: list[str] = field(default_factory=list)
+    whitespace_hunks: int = 0
+    reduced_context: list[str] = field(default_factory=list)
+    truncated: bool = False
+    chars_in: int = 0
+    chars_out: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.ignored or self.collapsed or self.whitespace_hunks or self.reduced_context or self.truncated)
+
+    def summary(self) -> str:
+        """One-line report, e.g. ``2 ignored, 1 collapsed, 120.0k → 31.5k chars``."""
+        parts = []
+        if self.ignored:
+            parts.append(f"{len(self.ignored)} ignored")
+        if self.collapsed:
+            parts.append(f"{len(self.collapsed)} collapsed")
+        if self.whitespace_hunks:
+            parts.append(f"{self.whitespace_hunks} whitespace-only hunks dropped")
+        if self.reduced_context:
+            parts.append(f"context reduced in {len(self.reduced_context)}")
+        if self.truncated:
+            parts.append("truncated")
+        parts.append(f"{self.chars_in / 1000:.1f}k → {self.chars_out / 1000:.1f}k chars")
+        return f"{self.files} files: " + ", ".join(parts)
+
+
+def matches_any(path: str, globs: list[str]) -> bool:
+    """Match *path* or its basename against shell-style globs (``*`` also crosses ``/``)."""
+    name = PurePosixPath(path).name
+    return any(fnmatch(path, pattern) or fnmatch(name, pattern) for pattern in globs)
+
+
+def is_whitespace_only(hunk: str) -> bool:
+    """True if a hunk only adds or removes blank lines or trailing whitespace.
+
+    Lines are compared after stripping trailing whitespace only, so a change
+    in indentation (control flow in Python or YAML) or inside a line is kept.
+    """
+    removed: list[str] = []
+    added: list[str] = []
+    for line in hunk.splitlines()[1:]:
+        if line.startswith("-"):
+            removed.append(line[1:])
+        elif line.startswith("+"):
+            added.append(line[1:])
+    if not removed and not added:
+        return False
+    return [r.rstrip() for r in removed if r.strip()] == [a.rstrip() for a in added if a.strip()]
+
+
+def reduce_context(hunk: str, context: int) -> list[str]:
+    """Split a hunk into smaller hunks keeping *context* lines around each change.
+
+    Hunk headers are recomputed so line numbers stay correct.
+    """
+    lines = hunk.splitlines()
+    match = HUNK_HEADER.match(lines[0]) if lines else None
+    if match is None:
+        return [hunk]
+    old_no, new_no = int(match.group(1)), int(match.group(3))
+    section = match.group(5)
+
+    # Number every body line with the old/new position it starts at
+    body: list[tuple[str, int, int]] = []
+    for line in lines[1:]:
+        body.append((line, old_no, new_no))
+        if line.startswith("-"):
+            old_no += 1
+        elif line.startswith("+"):
+            new_no += 1
+        elif not line.startswith("\\"):
+            old_no += 1
+            new_no += 1
+
+    changes = [i for i, (line, _, _) in enumerate(body) if line[:1] in ("-", "+")]
+    keep = set()
+    for i in changes:
+        keep.update(range(max(i - context, 0), min(i + context + 1, len(body))))
+    for i, (line, _, _) in enumerate(body):
+        # "\ No newline at end of file" belongs to the line before it
+        if line.startswith("\\") and i - 1 in keep:
+            keep.add(i)
+
+    hunks: list[str] = []
+    group: list[tuple[str, int, int]] = []
+    for i, entry in enumerate(body):
+        if i in keep:
+            group.append(entry)
+            continue
+        if group:
+            hunks.append(format_hunk(group, section))
+            group = []
+    if group:
+        hunks.append(format_hunk(group, section))
+    return hunks
+
+
+def format_hunk(body: list[tuple[str, int, int]], section: str) -> str:
+    old_start, new_start = body[0][1], body[0][2]
+    old_len = sum(1 for line, _, _ in body if not line.startswith(("+", "\\")))
+    new_len = sum(1 for line, _, _ in body if not line.startswith(("-", "\\")))
+    # Empty sides point at the line before, as git does
+    if old_len == 0:
+        old_start -= 1
+    if new_len == 0:
+        new_start -= 1
+    header = f"@@ -{old_start},{old_len} +{new_start},{new_len} @@{section}"
+    return "\n".join([header, *(line for line, _, _ in body)])
+
+
+class FileSection:
+    """One file of a streamed diff, buffered up to ``FILE_BUFFER_LIMIT``."""
+
+    def __init__(self, path: str, ignored: bool) -> None:
+        self.path = path
+        self.ignored = ignored
+        self.lines: list[str] = []
+        self.size = 0
+        self.added = 0
+        self.removed = 0
+        self.binary = False
+        self.overflow = False
+        self.in_hunks = False
+
+    def add(self, line: str) -> None:
+        if line.startswith("@@"):
+            self.in_hunks = True
+        elif self.in_hunks:
+            if line.startswith("+"):
+                self.added += 1
+            elif line.startswith("-"):
+                self.removed += 1
+        elif line.startswith(("Binary files ", "GIT binary patch")):
+            self.binary = True
+        if self.ignored or self.overflow:
+            return
+        self.size += len(line) + 1
+        if self.size > FILE_BUFFER_LIMIT:
+            self.overflow = True
+            self.lines = self.lines[:1]
+            return
+        self.lines.append(line)
+
+    def stat_line(self, reason: str) -> str:
+        first = self.lines[0] if self.lines else f"diff --git a/{self.path} b/{self.path}"
+        changes = "binary" if self.binary else f"+{self.added} -{self.removed} lines"
+        return f"{first}\n({reason}: {changes}, diff omitted)"
+
+
+def compact_section(section: FileSection, options: CompactOptions, stats: CompactStats) -> str | None:
+    """Render one file section after compaction, or None if it is dropped."""
+    if section.ignored:
+        stats.ignored.append(section.path)
+        return None
+    if section.binary:
+        stats.collapsed.append(section.path)
+        return section.stat_line("binary file")
+    if section.overflow:
+        stats.collapsed.append(section.path)
+        return section.stat_line("file diff too large")
+    if section.path and matches_any(section.path, options.collapse):
+        stats.collapsed.append(section.path)
+        return section.stat_line("generated file")
+
+    (file,) = split_diff("\n".join(section.lines)) or [FileDiff(path=section.path, header="")]
+    hunks = file.hunks
+    if options.drop_whitespace:
+        kept = [hunk for hunk in hunks if not is_whitespace_only(hunk)]
+        stats.whitespace_hunks += len(hunks) - len(kept)
+        if hunks and not kept:
+            return f"{file.header}\n(whitespace-only changes omitted)"
+        hunks = kept
+    if options.huge_file_chars and section.size > options.huge_file_chars:
+        stats.reduced_context.append(section.path)
+        hunks = [part for hunk in hunks for part in reduce_context(hunk, options.huge_file_context)]
+    return "\n".join([file.header, *hunks])
+
+
+def compact_diff(lines: Iterable[str], options: CompactOptions) -> tuple[str, CompactStats]:
+    """Compact a unified diff read line by line; returns (text, stats).
+
+    Once the output reaches ``options.max_chars`` later files are only
+    counted, and the text ends with a truncation note.
+    """
+    stats = CompactStats()
+    out: list[str] = []
+    out_size = 0
+    section: FileSection | None = None
+
+    def flush() -> None:
+        nonlocal out_size
+        if section is None:
+            return
+        stats.files += 1 if section.path else 0
+        text = compact_section(section, options, stats)
+        if text is None:
+            return
+        if options.max_chars is not None and out_size + len(text) > options.max_chars:
+            if not stats.truncated and out_size < options.max_chars:
+                # Fill the rest of the budget rather than leaving it unused
+                out.append(text[: options.max_chars - out_size])
+                out_size = options.max_chars
+            stats.truncated = True
+            return
+        out.append(text)
+        out_size += len(text) + 1
+
+    for raw in lines:
+        line = raw.rstrip("\n")
+        stats.chars_in += len(line) + 1
+        match = FILE_HEADER.match(line)
+        if match or section is None:
+            flush()
+            path = match.group(2) if match else ""
+            section = FileSection(path, ignored=bool(path) and matches_any(path, options.ignore))
+        section.add(line)
+    flush()
+
+    text = "\n".join(out).strip()
+    if stats.truncated and options.max_chars is not None:
+        text += f"\n\n... (diff truncated at {options.max_chars // 1000}k chars)"
+    if stats.ignored:
+        shown = ", ".join(stats.ignored[:10])
+        more = f" (+{len(stats.ignored) - 10} more)" if len(stats.ignored) > 10 else ""
+        text += f"\n\n(ignored for review: {shown}{more})"
+    text = text.strip()
+    stats.chars_out = len(text)
+    return text, stats
@@ -0,0 +1,295 @@
+"""Shared git plumbing for the harness and peasant commands.
+
+The harness and CLI ask git the same handful of questions over and over
+(what is HEAD, is the tree dirty, how far ahead is this branch).  A
+``GitSession`` answers them with as few processes as possible:
+
+- ref lookups go through one long-lived ``git cat-file --batch-check``
+  process per worktree, so resolving N refs costs one round-trip each
+  instead of N process spawns and repository discoveries;
+- ``status()`` reads HEAD, branch, upstream, ahead/behind and dirty state
+  from a single ``git status --porcelain=v2 --branch``;
+- everything else goes through ``run()``, which is a plain ``git`` call.
+
+Every call is counted and timed per command; ``git_stats()`` returns the
+totals across all sessions in this process.
+
+Sessions are cached per worktree (``git_session()``) and closed at exit.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import subprocess
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+
+logger = logging.getLogger("kingdom.git")
+
+
+@dataclass
+class CommandStats:
+    """Call count and cumulative wall time for one git command."""
+
+    calls: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class GitStatus:
+    """Parsed ``git status --porcelain=v2 --branch`` output."""
+
+    head_sha: str | None = None  # None on an unborn branch
+    branch: str | None = None  # None when detached
+    upstream: str | None = None
+    ahead: int = 0
+    behind: int = 0
+    entries: list[str] = field(default_factory=list)
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self.entries)
+
+
+def parse_status(output: str) -> GitStatus:
+    """Parse porcelain v2 status; non-header lines are kept as change entries."""
+    status = GitStatus()
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        if not line.startswith("# "):
+            status.entries.append(line)
+            continue
+        key, _, value = line[2:].partition(" ")
+        if key == "branch.oid" and value != "(initial)":
+            status.head_sha = value
+        elif key == "branch.head" and value != "(detached)":
+            status.branch = value
+        elif key == "branch.upstream":
+            status.upstream = value
+        elif key == "branch.ab":
+            ahead, _, behind = value.partition(" ")
+            try:
+                status.ahead = int(ahead.lstrip("+"))
+                status.behind = int(behind.lstrip("-"))
+            except ValueError:
+                pass
+    return status
+
+
+class GitSession:
+    """Git access for one worktree, with a persistent ``cat-file --batch-check``."""
+
+    def __init__(self, worktree: Path) -> None:
+        self.worktree = worktree
+        self.stats: dict[str, CommandStats] = {}
+        self._batch: subprocess.Popen | None = None
+        self._lock = threading.Lock()  # guards the batch process
+        self._stats_lock = threading.Lock()  # guards stats (calls may come from several threads)
+
+    def _record(self, command: str, started: float) -> None:
+        elapsed = time.monotonic() - started
+        with self._stats_lock:
+            entry = self.stats.setdefault(command, CommandStats())
+            entry.calls += 1
+            entry.seconds += elapsed
+
+    def snapshot_stats(self) -> dict[str, CommandStats]:
+        """A consistent copy of this session's per-command stats."""
+        with self._stats_lock:
+            return {command: replace(entry) for command, entry in self.stats.items()}
+
+    def run(
+        self, *args: str, timeout: float | None = None, env: dict[str, str] | None = None
+    ) -> subprocess.CompletedProcess:
+        """Run a one-shot ``git <args>`` in the worktree (counted and timed).
+
+        *env* entries are added to the inherited environment.
+        """
+        started = time.monotonic()
+        kwargs = {"env": {**os.environ, **env}} if env else {}
+        try:
+            return subprocess.run(
+                ["git", *args],
+                capture_output=True,
+                text=True,
+                cwd=self.worktree,
+                timeout=timeout,
+                **kwargs,
+            )
+        finally:
+            self._record(args[0] if args else "git", started)
+
+    @contextmanager
+    def stream(self, *args: str, timeout: float | None = None) -> Iterator[subprocess.Popen]:
+        """Run ``git <args>`` with stdout readable line by line (counted and timed).
+
+        The process is killed if it outlives *timeout*; leaving the block
+        before EOF stops it.  ``returncode`` is set once the block ends.
+        """
+        started = time.monotonic()
+        proc = subprocess.Popen(
+            ["git", *args],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            errors="replace",
+            cwd=self.worktree,
+        )
+        timer = threading.Timer(timeout, proc.kill) if timeout else None
+        if timer is not None:
+            timer.start()
+        try:
+            yield proc
+        finally:
+            if timer is not None:
+                timer.cancel()
+            # Closing the pipe ends a process the caller stopped reading early (SIGPIPE)
+            if proc.stdout:
+                proc.stdout.close()
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+            self._record(args[0] if args else "git", started)
+
+    def status(self, untracked: bool = True, timeout: float | None = 10) -> GitStatus:
+        """HEAD, branch, upstream, ahead/behind and changes from one ``git status``.
+
+        Raises:
+            RuntimeError: If git status fails.
+        """
+        args = ["status", "--porcelain=v2", "--branch"]
+        if not untracked:
+            args.append("--untracked-files=no")
+        result = self.run(*args, timeout=timeout)
+        if result.returncode != 0:
+            raise RuntimeError(f"git status failed: {result.stderr.strip()}")
+        return parse_status(result.stdout)
+
+    def _batch_process(self) -> subprocess.Popen:
+        if self._batch is None or self._batch.poll() is not None:
+            self._batch = subprocess.Popen(
+                ["git", "cat-file", "--batch-check"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                cwd=self.worktree,
+            )
+        return self._batch
+
+    def resolve(self, *revs: str) -> dict[str, str | None]:
+        """Resolve revisions to object names through the batch process.
+
+        Missing revisions map to None.  Only plain revision syntax is supported
+        (``HEAD``, ``refs/heads/x``, ``<sha>^{tree}``); ``@{u}`` and friends make
+        ``cat-file`` exit, so use ``status()`` for upstream information.
+        """
+        resolved: dict[str, str | None] = {}
+        started = time.monotonic()
+        with self._lock:
+            for rev in revs:
+                if not rev or "\n" in rev:
+                    resolved[rev] = None
+                    continue
+                try:
+                    proc = self._batch_process()
+                    assert proc.stdin is not None and proc.stdout is not None
+                    proc.stdin.write(f"{rev}\n")
+                    proc.stdin.flush()
+                    line = proc.stdout.readline()
+                except (OSError, ValueError):
+                    line = ""
+                if not line:
+                    # Process died (not a repository, or git bailed on the input)
+                    self._close_batch()
+                    resolved[rev] = None
+                    continue
+                sha, _, kind = line.strip().partition(" ")
+                resolved[rev] = None if kind.startswith("missing") or kind.startswith("ambiguous") else sha
+        self._record("cat-file", started)
+        return resolved
+
+    def rev_parse(self, rev: str) -> str | None:
+        return self.resolve(rev)[rev]
+
+    def _close_batch(self) -> None:
+        proc, self._batch = self._batch, None
+        if proc is None:
+            return
+        try:
+            if proc.stdin:
+                proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+        finally:
+            if proc.stdout:
+                proc.stdout.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_batch()
+
+
+_sessions: dict[Path, GitSession] = {}
+_sessions_lock = threading.Lock()
+
+
+def git_session(worktree: Path) -> GitSession:
+    """Return the shared session for *worktree*, creating it on first use."""
+    key = Path(worktree).resolve()
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = GitSession(key)
+            _sessions[key] = session
+        return session
+
+
+def git_stats() -> dict[str, CommandStats]:
+    """Per-command call counts and wall time summed over every session."""
+    totals: dict[str, CommandStats] = {}
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+    for session in sessions:
+        for command, entry in session.snapshot_stats().items():
+            total = totals.setdefault(command, CommandStats())
+            total.calls += entry.calls
+            total.seconds += entry.seconds
+    return totals
+
+
+def format_git_stats() -> str:
+    """One-line summary of ``git_stats()``, e.g. ``status 3x 0.04s, cat-file 5x 0.01s``."""
+    stats = git_stats()
+    if not stats:
+        return "no git calls"
+    return ", ".join(
+        f"{command} {entry.calls}x {entry.seconds:.2f}s"
+        for command, entry in sorted(stats.items(), key=lambda item: -item[1].seconds)
+    )
+
+
+def close_sessions() -> None:
+    """Close every session's batch process."""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+    if sessions:
+        logger.debug(
+            "git: %s", ", ".join(f"{s.worktree}: {sum(e.calls for e in s.snapshot_stats().values())}" for s in sessions)
+        )
+
+
+atexit.register(close_sessions)
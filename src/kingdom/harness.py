@@ -7,7 +7,7 @@ The harness runs an autonomous loop:
   4. Append to worklog in ticket
   5. Update session file (status, resume_id, last_activity)
   6. Write response as message to work thread
-  7. Check stop conditions: done, blocked, stopped, failed
+  7. Check stop conditions: done, blocked, stopped, failed, no progress
 
 Called in-process by ``kd work <ticket>``.
 """
@@ -18,17 +18,48 @@ import logging
 import re
 import signal
 import subprocess
+import threading
 import time
+from dataclasses import replace
 from datetime import UTC, datetime
 from pathlib import Path
-
-from kingdom.agent import build_command, clean_agent_env, parse_response, resolve_agent
-from kingdom.session import get_agent_state, update_agent_state
+from typing import TYPE_CHECKING
+
+from kingdom.agent import build_command, clean_agent_env, parse_response, parse_usage, resolve_agent
+from kingdom.candidates import lost_race, win_race, work_ticket_path
+from kingdom.diff import CompactOptions, DiffShard, compact_diff, shard_diff
+from kingdom.git import GitSession, format_git_stats, git_session
+from kingdom.limits import ADMISSION_POLL, Budget, ResourceLimits, admission_wait_reason
+from kingdom.logstore import LogStore
+from kingdom.progress import ProgressTracker, take_snapshot
+from kingdom.review_queue import ReviewRequest, enqueue_review, ensure_review_workers
+from kingdom.session import AgentState, get_agent_state, session_path, update_agent_state
+from kingdom.state import flock, logs_root, state_root
+from kingdom.summary import cached_summary
 from kingdom.thread import add_message, list_messages
-from kingdom.ticket import append_worklog_entry, find_ticket, read_ticket, write_ticket
+from kingdom.ticket import Ticket, append_worklog_entry, find_ticket, read_ticket, write_ticket
+from kingdom.usage import record_usage, usage_path
+from kingdom.verify import format_verification, run_verification
+
+if TYPE_CHECKING:
+    from kingdom.config import CouncilConfig
+    from kingdom.council.base import AgentResponse
+    from kingdom.council.council import Council
 
 logger = logging.getLogger("kingdom.harness")
 
+# Lines of agent output echoed to the peasant's stdout.log; the full output is
+# in the branch event log (`kd logs --ticket <id> --full`).
+AGENT_LOG_TAIL_LINES = 40
+
+
+def output_tail(text: str, max_lines: int = AGENT_LOG_TAIL_LINES) -> str:
+    """Last *max_lines* lines of *text*, noting how many were cut."""
+    lines = text.strip().splitlines()
+    if len(lines) <= max_lines:
+        return "\n".join(lines)
+    return "\n".join([f"[{len(lines) - max_lines} earlier lines in the event log]", *lines[-max_lines:]])
+
 
 def build_prompt(
     ticket_path: Path,
@@ -42,6 +73,10 @@ def build_prompt(
 
     References the ticket file by path (so the agent can read it directly)
     and includes existing worklog and any new directives from the work thread.
+
+    Content that is identical on every iteration (phase prompt, ticket
+    reference, instructions) comes first so providers can serve it from their
+    prompt cache; the worklog, directives and iteration counter come last.
     """
     parts = []
 
@@ -53,21 +88,8 @@ def build_prompt(
     parts.append("")
     parts.append("## Ticket")
     parts.append(f"Read the ticket file at: {ticket_path}")
-
-    if worklog:
-        parts.append("")
-        parts.append("## Current Worklog")
-        parts.append(worklog)
-
-    if directives:
-        parts.append("")
-        parts.append("## Directives from Lead")
-        for d in directives:
-            parts.append(f"- {d}")
-
     parts.append("")
     parts.append("## Instructions")
-    parts.append(f"This is iteration {iteration} of {max_iterations}.")
     parts.append("Work on the ticket. Commit your changes as you go with descriptive commit messages.")
     parts.append(
         "Before reporting DONE, run the project's tests, linter, and pre-commit hooks to make sure everything passes."
@@ -83,6 +105,20 @@ def build_prompt(
     parts.append("STATUS: BLOCKED")
     parts.append("STATUS: CONTINUE")
 
+    if worklog:
+        parts.append("")
+        parts.append("## Current Worklog")
+        parts.append(worklog)
+
+    if directives:
+        parts.append("")
+        parts.append("## Directives from Lead")
+        for d in directives:
+            parts.append(f"- {d}")
+
+    parts.append("")
+    parts.append(f"This is iteration {iteration} of {max_iterations}.")
+
     return "\n".join(parts)
 
 
@@ -153,6 +189,53 @@ def extract_worklog(ticket_path: Path) -> str:
     return "\n".join(result).strip()
 
 
+WORKLOG_SPAN = 10  # older worklog entries per cached summary block
+WORKLOG_GIST_CHARS = 100  # max characters kept per summarized worklog entry
+
+
+def split_worklog_entries(worklog: str) -> list[str]:
+    """Split worklog text into entries, one per ``- `` bullet (continuation lines stay attached)."""
+    entries: list[str] = []
+    for line in worklog.splitlines():
+        if line.startswith("- "):
+            entries.append(line)
+        elif entries and line.strip():
+            entries[-1] += "\n" + line
+    return entries
+
+
+def worklog_summary_path(base: Path, ticket_id: str, first: int, last: int) -> Path:
+    return state_root(base) / "worklog" / ticket_id / f"{first:04d}-{last:04d}.json"
+
+
+def window_worklog(base: Path, ticket_id: str, ticket_path: Path, worklog: str, keep: int) -> str:
+    """Keep the latest worklog entries verbatim and replace older ones with cached summaries.
+
+    Older entries are summarized in fixed blocks of ``WORKLOG_SPAN`` and each
+    block is cached under ``.kd/worklog/<ticket>/``, so a summary is only
+    built once a block fills up and the summarized part of the prompt stays
+    the same between block boundaries.  Between *keep* and
+    ``keep + WORKLOG_SPAN - 1`` entries are sent verbatim.  *keep* of 0
+    returns the worklog unchanged.
+    """
+    entries = split_worklog_entries(worklog)
+    if keep <= 0 or len(entries) <= keep:
+        return worklog
+    summarized = (len(entries) - keep) // WORKLOG_SPAN * WORKLOG_SPAN
+    if summarized == 0:
+        return worklog
+
+    lines = [f"(Entries 1-{summarized} are summarized; the full worklog is in {ticket_path})"]
+    for start in range(0, summarized, WORKLOG_SPAN):
+        block = entries[start : start + WORKLOG_SPAN]
+        cache = worklog_summary_path(base, ticket_id, start + 1, start + len(block))
+        lines.append(cached_summary(cache, [("", entry) for entry in block], WORKLOG_GIST_CHARS))
+    lines.append("")
+    lines.append("Latest entries:")
+    lines.extend(entries[summarized:])
+    return "\n".join(lines)
+
+
 def get_new_directives(base: Path, branch: str, thread_id: str, last_seen_seq: int) -> tuple[list[str], int]:
     """Get new directive messages from the work thread since last_seen_seq.
 
@@ -174,39 +257,39 @@ def get_new_directives(base: Path, branch: str, thread_id: str, last_seen_seq: i
 
 def has_code_changes(worktree: Path, start_sha: str | None) -> bool:
     """Check whether the worktree has any changes (committed or uncommitted) since start_sha."""
+    git = git_session(worktree)
     try:
-        # Uncommitted changes (staged + unstaged)
-        result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            capture_output=True,
-            text=True,
-            cwd=worktree,
-            timeout=10,
-        )
-        if result.returncode == 0 and result.stdout.strip():
+        # Uncommitted changes (staged + unstaged) and the current HEAD in one call
+        try:
+            status = git.status()
+        except RuntimeError:
+            status = None
+        if status is not None and status.dirty:
             return True
-        # Committed changes since start_sha
-        if start_sha:
-            result = subprocess.run(
-                ["git", "log", "--oneline", f"{start_sha}..HEAD"],
-                capture_output=True,
-                text=True,
-                cwd=worktree,
-                timeout=10,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                return True
-        else:
+        if not start_sha:
             # No baseline — can't determine whether committed changes exist.
             # Assume they do to avoid rejecting valid work.
             return True
+        # HEAD still at the baseline: nothing committed, no need to walk history
+        if status is not None and status.head_sha == start_sha:
+            return False
+        # Committed changes since start_sha
+        result = git.run("log", "--oneline", "-1", f"{start_sha}..HEAD", timeout=10)
+        if result.returncode == 0 and result.stdout.strip():
+            return True
     except (subprocess.TimeoutExpired, FileNotFoundError):
         # Can't determine — assume there might be changes
         return True
     return False
 
 
-def get_diff(worktree: Path, start_sha: str | None, feature_branch: str | None = None) -> str:
+def get_diff(
+    worktree: Path,
+    start_sha: str | None,
+    feature_branch: str | None = None,
+    max_chars: int | None = 50000,
+    compaction: CompactOptions | None = None,
+) -> str:
     """Get the diff of changes for council review.
 
     For worktree mode (feature_branch set): uses feature_branch...HEAD (three-dot
@@ -215,56 +298,89 @@ def get_diff(worktree: Path, start_sha: str | None, feature_branch: str | None =
 
     For hand mode (feature_branch=None): uses start_sha..HEAD (two-dot).
     Falls back to showing all uncommitted + recent committed changes.
+
+    Diffs longer than *max_chars* are truncated (None disables truncation,
+    for chunked review which shards the full diff instead).
+
+    With *compaction*, the diff is streamed through ``compact_diff`` instead
+    of being read whole, and what it removed is logged and noted in the diff.
     """
+    if feature_branch:
+        # Worktree mode: three-dot merge-base diff against feature branch.
+        # Fall back to two-dot if three-dot fails (e.g. detached HEAD, missing ref)
+        specs = [f"{feature_branch}...HEAD"] + ([f"{start_sha}..HEAD"] if start_sha else [])
+    elif start_sha:
+        specs = [f"{start_sha}..HEAD"]
+    else:
+        # No start_sha — show diff of staged + unstaged changes
+        specs = ["HEAD"]
+
+    git = git_session(worktree)
     try:
-        if feature_branch:
-            # Worktree mode: three-dot merge-base diff against feature branch
-            result = subprocess.run(
-                ["git", "diff", f"{feature_branch}...HEAD"],
-                capture_output=True,
-                text=True,
-                cwd=worktree,
-                timeout=30,
-            )
-            # Fall back to two-dot if three-dot fails (e.g. detached HEAD, missing ref)
-            if result.returncode != 0 and start_sha:
-                result = subprocess.run(
-                    ["git", "diff", f"{start_sha}..HEAD"],
-                    capture_output=True,
-                    text=True,
-                    cwd=worktree,
-                    timeout=30,
-                )
-        elif start_sha:
-            result = subprocess.run(
-                ["git", "diff", f"{start_sha}..HEAD"],
-                capture_output=True,
-                text=True,
-                cwd=worktree,
-                timeout=30,
-            )
-        else:
-            # No start_sha — show diff of staged + unstaged changes
-            result = subprocess.run(
-                ["git", "diff", "HEAD"],
-                capture_output=True,
-                text=True,
-                cwd=worktree,
-                timeout=30,
-            )
+        if compaction is not None:
+            return get_compacted_diff(git, specs, replace(compaction, max_chars=max_chars))
+        for spec in specs:
+            result = git.run("diff", spec, timeout=30)
+            if result.returncode == 0:
+                break
         if result.returncode == 0 and result.stdout.strip():
             diff = result.stdout.strip()
             # Truncate very large diffs to avoid overwhelming the council
-            if len(diff) > 50000:
-                diff = diff[:50000] + "\n\n... (diff truncated at 50k chars)"
+            if max_chars is not None and len(diff) > max_chars:
+                diff = diff[:max_chars] + f"\n\n... (diff truncated at {max_chars // 1000}k chars)"
             return diff
         return "(no changes detected)"
     except (subprocess.TimeoutExpired, FileNotFoundError):
         return "(could not generate diff)"
 
 
-def build_review_prompt(ticket_title: str, ticket_body: str, diff: str, worklog: str) -> str:
-    """Build the prompt sent to council members for review."""
+def get_compacted_diff(git: GitSession, specs: list[str], options: CompactOptions) -> str:
+    """Stream ``git diff <spec>`` through ``compact_diff``, trying *specs* in order."""
+    for spec in specs:
+        with git.stream("diff", spec, timeout=30) as proc:
+            assert proc.stdout is not None
+            diff, stats = compact_diff(proc.stdout, options)
+        if proc.returncode is not None and proc.returncode < 0:
+            # Killed by the stream timeout: the diff is incomplete, not empty
+            return "(could not generate diff)"
+        if proc.returncode == 0:
+            break
+    else:
+        return "(no changes detected)"
+    if not diff:
+        return "(no changes detected)"
+    if stats.changed:
+        logger.info("Compacted review diff: %s", stats.summary())
+        diff += f"\n\n(review diff compacted — {stats.summary()})"
+    return diff
+
+
+TESTS_INSTRUCTION = "Run the project's test suite and linter to verify the changes."
+TESTS_WITH_VERIFICATION = (
+    "The verification above already ran on this exact tree; re-run it only if you need more detail."
+)
+VERDICT_INSTRUCTIONS = [
+    "End your review with exactly one of these verdict lines:",
+    "VERDICT: APPROVED",
+    "VERDICT: BLOCKING",
+    "",
+    "Use BLOCKING only for issues that must be fixed before merge.",
+    "Use APPROVED if the changes are acceptable (minor suggestions are fine with APPROVED).",
+]
+
+
+def build_review_prompt(
+    ticket_title: str, ticket_body: str, diff: str, worklog: str, scope: str = "", verification: str = ""
+) -> str:
+    """Build the prompt sent to council members for review.
+
+    *scope* describes which part of a sharded diff this prompt covers.
+    *verification* is the harness's verification summary for the reviewed tree.
+
+    The ticket and review instructions form a prefix shared by every member,
+    shard and round, so providers can serve it from their prompt cache; the
+    diff, worklog and verification follow.
+    """
     parts = [
         "## Code Review Request",
         "",
@@ -273,12 +389,29 @@ def build_review_prompt(ticket_title: str, ticket_body: str, diff: str, worklog:
         "### Ticket Description",
         ticket_body.split("## Worklog")[0].strip() if "## Worklog" in ticket_body else ticket_body.strip(),
         "",
-        "### Changes (diff)",
-        "```diff",
-        diff,
-        "```",
+        "### Instructions",
+        "Review the code change below. Consider:",
+        "- Correctness: does it do what the ticket asks?",
+        "- Edge cases: are there unhandled scenarios?",
+        "- Code quality: is it readable, maintainable, and well-structured?",
+        "- Tests: are the changes adequately tested?",
+        "",
+        *VERDICT_INSTRUCTIONS,
+        "",
     ]
 
+    if scope:
+        parts.extend(["### Review Scope", scope, ""])
+
+    parts.extend(
+        [
+            "### Changes (diff)",
+            "```diff",
+            diff,
+            "```",
+        ]
+    )
+
     if worklog:
         parts.extend(
             [
@@ -288,25 +421,54 @@ def build_review_prompt(ticket_title: str, ticket_body: str, diff: str, worklog:
             ]
         )
 
+    if verification:
+        parts.extend(["", "### Verification", verification])
+
+    parts.extend(["", TESTS_WITH_VERIFICATION if verification else TESTS_INSTRUCTION])
+
+    return "\n".join(parts)
+
+
+def build_delta_review_prompt(
+    ticket_title: str, diff: str, previous_feedback: list[str], verification: str = ""
+) -> str:
+    """Build the follow-up prompt for a review round after a BLOCKING bounce.
+
+    Sent on each member's session from the previous round, so it carries only
+    the changes since that round and the feedback they are meant to address.
+    """
+    parts = [
+        "## Follow-up Code Review Request",
+        "",
+        f"**Ticket:** {ticket_title}",
+        "",
+        "You reviewed this ticket in the previous round and the council blocked it. "
+        "The diff below shows only what changed since then; everything else is as you last saw it.",
+        "",
+        "### Previous Blocking Feedback",
+        "\n\n---\n\n".join(previous_feedback),
+        "",
+        "### Changes Since Last Review (diff)",
+        "```diff",
+        diff,
+        "```",
+        "",
+    ]
+    if verification:
+        parts.extend(["### Verification", verification, ""])
     parts.extend(
         [
-            "",
             "### Instructions",
-            "Review this code change. Consider:",
-            "- Correctness: does it do what the ticket asks?",
-            "- Edge cases: are there unhandled scenarios?",
-            "- Code quality: is it readable, maintainable, and well-structured?",
-            "- Tests: are the changes adequately tested? Run the project's test suite and linter to verify.",
-            "",
-            "End your review with exactly one of these verdict lines:",
-            "VERDICT: APPROVED",
-            "VERDICT: BLOCKING",
+            "Check that the blocking feedback has been addressed and that the new changes do not introduce "
+            + (
+                "new problems. The verification above ran on this exact tree; re-run it only if you need more detail."
+                if verification
+                else "new problems. Run the project's test suite and linter to verify."
+            ),
             "",
-            "Use BLOCKING only for issues that must be fixed before merge.",
-            "Use APPROVED if the changes are acceptable (minor suggestions are fine with APPROVED).",
+            *VERDICT_INSTRUCTIONS,
         ]
     )
-
     return "\n".join(parts)
 
 
@@ -331,6 +493,193 @@ def parse_verdict(response_text: str) -> str:
     return "approved"
 
 
+def member_verdict(name: str, text: str) -> str:
+    """Parse a council member's verdict, warning when the VERDICT line is missing."""
+    verdict = parse_verdict(text)
+
+    # Check if verdict line was actually present
+    has_verdict_line = any(
+        re.match(r"^VERDICT:\s*(APPROVED|BLOCKING)$", strip_markdown_decoration(line), re.IGNORECASE)
+        for line in text.strip().splitlines()
+    )
+    if not has_verdict_line:
+        logger.warning("Council member %s did not include a VERDICT line — treating as APPROVED", name)
+    return verdict
+
+
+class ReviewVerdicts:
+    """Council verdicts, evaluated as each response lands.
+
+    ``add`` is idempotent per member, so responses seen by the
+    ``query_to_thread`` callback can be added again from its return value.
+    """
+
+    def __init__(self) -> None:
+        self.verdicts: dict[str, str] = {}
+        self.feedback: list[str] = []
+
+    def add(self, name: str, response: AgentResponse) -> str | None:
+        """Record *name*'s verdict; None for an error or a member already counted."""
+        if name in self.verdicts:
+            return None
+        if response.error:
+            logger.warning("Council member %s errored: %s", name, response.error)
+            self.verdicts[name] = "error"
+            return None
+        verdict = member_verdict(name, response.text)
+        self.verdicts[name] = verdict
+        if verdict == "blocking":
+            logger.info("Council member %s: BLOCKING", name)
+            self.feedback.append(f"[{name}] {response.text}")
+        else:
+            logger.info("Council member %s: APPROVED", name)
+        return verdict
+
+
+def post_late_feedback(base: Path, branch: str, thread_id: str, session_name: str, name: str, text: str) -> None:
+    """Send BLOCKING feedback that arrived after an early bounce to the peasant as a directive."""
+    body = f"## Council Review Feedback (BLOCKING, follow-up)\n\n[{name}] {text}"
+    try:
+        add_message(base, branch, thread_id, from_="king", to=session_name, body=body)
+    except FileNotFoundError:
+        logger.warning("Could not write follow-up council feedback to thread %s", thread_id)
+
+
+def run_sharded_review(
+    council: Council,
+    base: Path,
+    branch: str,
+    thread_id: str,
+    ticket: Ticket,
+    worklog: str,
+    shards: list[DiffShard],
+    council_timeout: int,
+    verification: str = "",
+) -> tuple[str, list[str]]:
+    """Map-reduce review: fan diff shards out across members, then combine verdicts.
+
+    Shards are assigned round-robin and all run in parallel on fresh sessions.
+    Any BLOCKING shard blocks the whole review; feedback is tagged with the
+    shard it came from.
+    """
+    names = [member.name for member in council.members]
+    total = len(shards)
+    assignments: list[tuple[str, str]] = []
+    labels: list[str] = []
+    for index, shard in enumerate(shards):
+        label = f"shard {index + 1}/{total}"
+        files = "\n".join(f"- {path}" for path in shard.paths if path)
+        scope = (
+            f"This is {label} of a large change; the other shards are reviewed separately in parallel. "
+            "Judge only the changes shown here and do not block on code outside this shard."
+        )
+        if files:
+            scope += f"\n\nFiles in this shard:\n{files}"
+        prompt = build_review_prompt(
+            ticket.title, ticket.body, shard.text, worklog, scope=scope, verification=verification
+        )
+        assignments.append((names[index % len(names)], prompt))
+        labels.append(label)
+
+    overview = [f"Chunked review: {total} diff shards across {len(names)} members.", ""]
+    for (name, _), label, shard in zip(assignments, labels, shards, strict=True):
+        shown = ", ".join(path for path in shard.paths[:5] if path)
+        more = f" (+{len(shard.paths) - 5} more)" if len(shard.paths) > 5 else ""
+        overview.append(f"- {label} → {name}: {shown}{more}")
+    add_message(base, branch, thread_id, from_="king", to="council", body="\n".join(overview))
+
+    logger.info(
+        "Chunked council review: %d shards across %d members (timeout: %ds)", total, len(names), council_timeout
+    )
+
+    start_time = time.monotonic()
+    responses = council.query_assignments(assignments)
+    elapsed = time.monotonic() - start_time
+
+    for label, response in zip(labels, responses, strict=True):
+        add_message(
+            base,
+            branch,
+            thread_id,
+            from_=response.name,
+            to="king",
+            body=f"**Review {label}**\n\n{response.thread_body()}",
+        )
+
+    if elapsed >= council_timeout:
+        logger.warning("Council review timed out after %.0fs", elapsed)
+        return "timeout", []
+
+    blocking_feedback = []
+    for label, response in zip(labels, responses, strict=True):
+        if response.error:
+            logger.warning("Council member %s errored on %s: %s", response.name, label, response.error)
+            continue
+        if member_verdict(response.name, response.text) == "blocking":
+            logger.info("Council member %s: BLOCKING (%s)", response.name, label)
+            blocking_feedback.append(f"[{response.name} · {label}] {response.text}")
+        else:
+            logger.info("Council member %s: APPROVED (%s)", response.name, label)
+
+    if blocking_feedback:
+        return "blocking", blocking_feedback
+    return "approved", []
+
+
+def delta_review_diff(
+    worktree: Path,
+    state: AgentState,
+    member_names: list[str],
+    head_sha: str | None,
+    compaction: CompactOptions | None = None,
+) -> str | None:
+    """Return the inter-round diff when this round can be a delta review, else None.
+
+    A delta review needs a previous BLOCKING round whose reviewed HEAD is still
+    an ancestor of HEAD, and a recorded session for every current member (so
+    each one still has the full change in context).  ``state.full_review``
+    forces a full review.
+    """
+    if state.full_review or not state.review_feedback or not state.reviewed_sha or not head_sha:
+        return None
+    sessions = state.review_sessions or {}
+    if not member_names or any(name not in sessions for name in member_names):
+        return None
+    try:
+        result = git_session(worktree).run("merge-base", "--is-ancestor", state.reviewed_sha, "HEAD", timeout=10)
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return None
+    if result.returncode != 0:
+        # History was rewritten since the last round — review everything again
+        return None
+    return get_diff(worktree, state.reviewed_sha, compaction=compaction)
+
+
+def record_review_round(
+    base: Path,
+    branch: str,
+    session_name: str,
+    head_sha: str | None,
+    feedback: list[str],
+    sessions: dict[str, str],
+) -> None:
+    """Remember what a review round saw, so a bounce-back can be reviewed as a delta."""
+    update_agent_state(
+        base,
+        branch,
+        session_name,
+        reviewed_sha=head_sha,
+        review_feedback=feedback or None,
+        review_sessions=sessions or None,
+        full_review=False,
+    )
+
+
+def review_lock_path(base: Path, branch: str, session_name: str) -> Path:
+    """Held while a review round for *session_name* is querying the council."""
+    return session_path(base, branch, session_name).with_name(f".{session_name}.review.lock")
+
+
 def run_council_review(
     base: Path,
     branch: str,
@@ -341,9 +690,26 @@ def run_council_review(
     start_sha: str | None,
     council_timeout: int,
     hand_mode: bool = False,
+    verification: str = "",
+    compaction: CompactOptions | None = None,
 ) -> tuple[str, list[str]]:
     """Run council review and return (outcome, feedback).
 
+    After a BLOCKING round, the next round only sends the changes since the
+    reviewed HEAD plus the previous feedback, on each member's session from
+    that round (see ``delta_review_diff``).  *verification* (from
+    ``format_verification``) is included so reviewers need not re-run the suite.
+    *compaction* is passed to ``get_diff`` for every diff sent to reviewers.
+
+    With ``council.review_policy`` set to ``first_blocking``, the round returns
+    'blocking' as soon as one member's BLOCKING verdict lands (full and delta
+    rounds; sharded rounds wait for every shard).  Members still reviewing
+    post any later BLOCKING feedback to *thread_id* as directives for
+    *session_name*; once they finish, their sessions are recorded like a
+    normal round's.  The next round waits for them first (on
+    ``review_lock_path``, across processes), so no member session is queried
+    twice at once.
+
     outcome: 'approved', 'blocking', 'timeout', 'no_council'
     feedback: list of blocking feedback strings from councillors.
     """
@@ -355,66 +721,212 @@ def run_council_review(
         logger.warning("No council members configured — skipping council review")
         return "no_council", []
 
+    # Wait for reviewers still running from an early-bounced previous round
+    review_lock = review_lock_path(base, branch, session_name)
+    with flock(review_lock):
+        pass
+
     council.load_sessions(base, branch)
 
     # Build review prompt — worktree mode uses three-dot diff against feature branch
     ticket = read_ticket(ticket_path)
     feature_branch = None if hand_mode else branch
-    diff = get_diff(worktree, start_sha, feature_branch=feature_branch)
-    worklog = extract_worklog(ticket_path)
-    prompt = build_review_prompt(ticket.title, ticket.body, diff, worklog)
+    state = get_agent_state(base, branch, session_name)
+    head_sha = git_session(worktree).rev_parse("HEAD")
+    delta = delta_review_diff(worktree, state, [member.name for member in council.members], head_sha, compaction)
+    if delta is not None:
+        sessions = state.review_sessions or {}
+        for member in council.members:
+            member.session_id = sessions[member.name]
+        prompt = build_delta_review_prompt(ticket.title, delta, state.review_feedback or [], verification)
+        logger.info("Delta council review: %s..%s", state.reviewed_sha[:8], head_sha[:8])
+    else:
+        worklog = extract_worklog(ticket_path)
+        if council.review_mode == "chunked":
+            # Shard the full diff instead of truncating it
+            diff = get_diff(worktree, start_sha, feature_branch=feature_branch, max_chars=None, compaction=compaction)
+            shards = shard_diff(diff, council.review_shard_tokens)
+            if len(shards) > 1:
+                outcome, feedback = run_sharded_review(
+                    council, base, branch, thread_id, ticket, worklog, shards, council_timeout, verification
+                )
+                # Shards run on throwaway sessions, so the next round is a full review
+                record_review_round(base, branch, session_name, head_sha, feedback, {})
+                return outcome, feedback
+        else:
+            diff = get_diff(worktree, start_sha, feature_branch=feature_branch, compaction=compaction)
+        prompt = build_review_prompt(ticket.title, ticket.body, diff, worklog, verification=verification)
 
     # Write king's review request to thread
     add_message(base, branch, thread_id, from_="king", to="council", body=prompt)
 
     logger.info("Council review dispatched to %d members (timeout: %ds)", len(council.members), council_timeout)
 
-    # Query council with timeout — this blocks until all respond or timeout
+    # Verdicts are evaluated as each response lands.  With review_policy
+    # "first_blocking" the first BLOCKING verdict ends the round; the other
+    # reviewers keep running and their BLOCKING feedback follows as directives.
+    verdicts = ReviewVerdicts()
+    responses: dict[str, AgentResponse] = {}
+    lock = threading.Lock()
+    decided = threading.Event()  # first BLOCKING, or every reviewer finished
+    finished = threading.Event()
+    bounced = threading.Event()
+    early_bounce = council.review_policy == "first_blocking"
+
+    def on_response(name: str, response: AgentResponse) -> None:
+        with lock:
+            if verdicts.add(name, response) != "blocking":
+                return
+            if bounced.is_set():
+                post_late_feedback(base, branch, thread_id, session_name, name, response.text)
+        if early_bounce:
+            decided.set()
+
+    def record_round() -> list[str]:
+        # Responses the callback did not see are evaluated now
+        for name, response in responses.items():
+            verdicts.add(name, response)
+        sessions = {name: response.session_id for name, response in responses.items() if response.session_id}
+        record_review_round(base, branch, session_name, head_sha, verdicts.feedback, sessions)
+        return verdicts.feedback
+
+    def query() -> None:
+        try:
+            with flock(review_lock):
+                responses.update(
+                    council.query_to_thread(
+                        prompt=prompt,
+                        base=base,
+                        branch=branch,
+                        thread_id=thread_id,
+                        callback=on_response,
+                    )
+                )
+                council.save_sessions(base, branch)
+                with lock:
+                    finished.set()
+                    late = bounced.is_set()
+                if late:
+                    # The round already bounced; record every member's session for the next one
+                    record_round()
+        finally:
+            finished.set()
+            decided.set()
+
     start_time = time.monotonic()
-    responses = council.query_to_thread(
-        prompt=prompt,
-        base=base,
-        branch=branch,
-        thread_id=thread_id,
-    )
+    if early_bounce:
+        # Not a daemon: late reviews finish even if the caller is done first
+        reviewing = threading.Thread(target=query, name=f"council-review-{session_name}")
+        reviewing.start()
+        decided.wait()
+        with lock:
+            bounced_early = not finished.is_set()
+            if bounced_early:
+                bounced.set()
+                feedback = list(verdicts.feedback)
+                # Recorded before the late reviewers can record their sessions over it
+                record_review_round(base, branch, session_name, head_sha, feedback, {})
+        if bounced_early:
+            logger.info(
+                "Council review: early BLOCKING, %d reviewer(s) still running",
+                len(council.members) - len(verdicts.verdicts),
+            )
+            return "blocking", feedback
+        reviewing.join()
+    else:
+        query()
     elapsed = time.monotonic() - start_time
 
-    council.save_sessions(base, branch)
-
     # Check for timeout (council.query_to_thread handles per-member timeouts,
     # but we also check wall-clock time)
     if elapsed >= council_timeout:
         logger.warning("Council review timed out after %.0fs", elapsed)
+        record_review_round(base, branch, session_name, head_sha, [], {})
         return "timeout", []
 
-    # Parse verdicts
-    blocking_feedback = []
-    for name, response in responses.items():
-        if response.error:
-            logger.warning("Council member %s errored: %s", name, response.error)
-            continue
-
-        verdict = parse_verdict(response.text)
-
-        # Check if verdict line was actually present
-        has_verdict_line = any(
-            re.match(r"^VERDICT:\s*(APPROVED|BLOCKING)$", strip_markdown_decoration(line), re.IGNORECASE)
-            for line in response.text.strip().splitlines()
-        )
-        if not has_verdict_line:
-            logger.warning("Council member %s did not include a VERDICT line — treating as APPROVED", name)
-
-        if verdict == "blocking":
-            logger.info("Council member %s: BLOCKING", name)
-            blocking_feedback.append(f"[{name}] {response.text}")
-        else:
-            logger.info("Council member %s: APPROVED", name)
+    blocking_feedback = record_round()
 
     if blocking_feedback:
         return "blocking", blocking_feedback
     return "approved", []
 
 
+def review_compaction(council_cfg: CouncilConfig) -> CompactOptions:
+    """Diff compaction options for council review prompts."""
+    return CompactOptions(
+        ignore=council_cfg.review_ignore,
+        collapse=council_cfg.review_collapse,
+        drop_whitespace=council_cfg.review_drop_whitespace,
+        huge_file_chars=council_cfg.review_huge_file_chars,
+        huge_file_context=council_cfg.review_huge_file_context,
+    )
+
+
+def record_review_outcome(
+    base: Path,
+    branch: str,
+    ticket_path: Path,
+    session_name: str,
+    thread_id: str,
+    outcome: str,
+    feedback: list[str],
+) -> str | None:
+    """Record a council review outcome in the worklog, ticket and work thread.
+
+    Returns the peasant's final status, or None when the ticket bounces back
+    to work: it is then ``in_progress`` again with the blocking feedback in
+    the work thread as a directive.  Shared by the inline review in
+    :func:`run_agent_loop` and the review workers (:mod:`kingdom.review_queue`).
+
+    A racing candidate (:mod:`kingdom.candidates`) that passes review wins
+    its race; one whose race another candidate already won ends ``stopped``.
+    """
+    if lost_race(base, branch, session_name):
+        append_worklog(ticket_path, "Another candidate already won the race — stopping")
+        return "stopped"
+
+    if outcome == "no_council":
+        # No council configured — go straight to needs_king_review
+        append_worklog(ticket_path, "No council configured — awaiting king review")
+        return "needs_king_review" if win_race(base, branch, session_name) else "stopped"
+
+    if outcome == "timeout":
+        # Council timed out — escalate to king
+        append_worklog(ticket_path, "Council review timed out — escalating to king")
+        return "needs_king_review"
+
+    if outcome == "approved":
+        append_worklog(ticket_path, "Council review: APPROVED — awaiting king review")
+        return "needs_king_review" if win_race(base, branch, session_name) else "stopped"
+
+    # Blocking feedback — check bounce limit
+    bounce_count = get_agent_state(base, branch, session_name).review_bounce_count + 1
+    update_agent_state(base, branch, session_name, review_bounce_count=bounce_count)
+
+    if bounce_count >= 3:
+        # Escalate after 3 bounces
+        append_worklog(ticket_path, f"Council review: BLOCKING (bounce {bounce_count}/3) — escalating to king")
+        logger.warning("Review bounce limit reached (%d), escalating to king", bounce_count)
+        return "needs_king_review"
+
+    # Bounce back to working — inject feedback as directives
+    logger.info("Council review: BLOCKING (bounce %d/3), returning to working", bounce_count)
+    append_worklog(ticket_path, f"Council review: BLOCKING (bounce {bounce_count}/3) — returning to working")
+
+    # Revert ticket to in_progress
+    ticket_obj = read_ticket(ticket_path)
+    ticket_obj.status = "in_progress"
+    write_ticket(ticket_obj, ticket_path)
+
+    # Add blocking feedback as a directive message in the thread
+    feedback_body = "## Council Review Feedback (BLOCKING)\n\n" + "\n\n---\n\n".join(feedback)
+    try:
+        add_message(base, branch, thread_id, from_="king", to=session_name, body=feedback_body)
+    except FileNotFoundError:
+        logger.warning("Could not write council feedback to thread %s", thread_id)
+    return None
+
+
 def run_agent_loop(
     base: Path,
     branch: str,
@@ -439,12 +951,20 @@ def run_agent_loop(
         session_name: Session name for the peasant (e.g., "peasant-kin-042").
 
     Returns:
-        Final status: "done", "blocked", "failed", or "stopped".
+        Final status: "done", "blocked", "failed", "stopped", "budget_exhausted",
+        "needs_king_review", or "awaiting_council" when the ticket was queued
+        for a review worker (``council.review_workers``).
     """
     # Load agent config from config system
     from kingdom.config import load_config
 
     cfg = load_config(base)
+
+    # Apply resource limits to the harness itself, before any thread starts
+    # (review and git timer threads make preexec_fn unsafe); agent calls
+    # inherit them.
+    ResourceLimits.from_config(cfg.peasant).apply()
+
     agent_def = cfg.agents.get(agent_name)
     if agent_def is None:
         logger.error("Unknown agent: %s", agent_name)
@@ -455,6 +975,9 @@ def run_agent_loop(
     max_iterations = cfg.peasant.max_iterations
     agent_timeout = cfg.peasant.timeout
 
+    # Diff compaction for council review prompts
+    compaction = review_compaction(cfg.council)
+
     # Resolve peasant phase prompt: agent-specific overrides global
     phase_prompt = agent_def.prompts.get("peasant", "") or cfg.prompts.peasant
 
@@ -463,7 +986,8 @@ def run_agent_loop(
     if result is None:
         logger.error("Ticket not found: %s", ticket_id)
         return "failed"
-    _, ticket_path = result
+    # A racing candidate works on its own copy of the ticket
+    ticket_path = work_ticket_path(base, branch, session_name, result[1])
 
     # Track whether we should stop
     stop_requested = False
@@ -475,10 +999,34 @@ def run_agent_loop(
 
     signal.signal(signal.SIGTERM, handle_signal)
 
+    # Admission control: wait in "queued" while the machine is too busy
+    waiting_for = None
+    while not stop_requested:
+        reason = admission_wait_reason(base, branch, session_name, cfg.peasant)
+        if reason is None:
+            break
+        if reason != waiting_for:
+            logger.info("Queued: %s", reason)
+            waiting_for = reason
+        update_agent_state(base, branch, session_name, status="queued", last_activity=datetime.now(UTC).isoformat())
+        time.sleep(ADMISSION_POLL)
+    if stop_requested:
+        update_agent_state(base, branch, session_name, status="stopped", last_activity=datetime.now(UTC).isoformat())
+        return "stopped"
+
     # Get agent session for resume_id
     agent_state = get_agent_state(base, branch, session_name)
     resume_id = agent_state.resume_id
 
+    # Budget totals carry over from earlier runs on this ticket
+    budget = Budget.for_ticket(cfg.peasant, read_ticket(ticket_path))
+    spent_tokens = agent_state.spent_output_tokens
+    spent_cost = agent_state.spent_cost_usd
+    run_started = time.monotonic()
+
+    def spent_seconds() -> float:
+        return round(agent_state.spent_seconds + time.monotonic() - run_started, 1)
+
     # Initialize last_seen_seq to the sequence of the last message sent by
     # this peasant, so that any king messages sent while we were down are
     # picked up as new directives on the first iteration.
@@ -495,13 +1043,7 @@ def run_agent_loop(
     # Record start_sha on first run (for diff scoping in council review).
     if not agent_state.start_sha:
         try:
-            sha_result = subprocess.run(
-                ["git", "rev-parse", "HEAD"],
-                capture_output=True,
-                text=True,
-                cwd=worktree,
-                timeout=10,
-            )
+            sha_result = git_session(worktree).run("rev-parse", "HEAD", timeout=10)
             if sha_result.returncode == 0:
                 start_sha = sha_result.stdout.strip()
                 update_agent_state(base, branch, session_name, start_sha=start_sha)
@@ -509,13 +1051,25 @@ def run_agent_loop(
         except (subprocess.TimeoutExpired, FileNotFoundError):
             logger.warning("Could not record start_sha")
 
+    # No-progress detection (peasant.max_idle_iterations; 0 = off)
+    idle_limit = cfg.peasant.max_idle_iterations
+    progress = ProgressTracker(idle_limit, split_worklog_entries(extract_worklog(ticket_path)))
+
+    log_store = LogStore(logs_root(base, branch))
     final_status = "failed"
+    review_request: ReviewRequest | None = None
 
     for iteration in range(1, max_iterations + 1):
         if stop_requested:
             final_status = "stopped"
             logger.info("Stopping at iteration %d (signal received)", iteration)
             break
+        exhausted = budget.exhausted(spent_seconds(), spent_tokens, spent_cost)
+        if exhausted:
+            logger.warning("Budget exhausted: %s", exhausted)
+            append_worklog(ticket_path, f"Budget exhausted: {exhausted}")
+            final_status = "budget_exhausted"
+            break
 
         # Update session: working
         now = datetime.now(UTC).isoformat()
@@ -525,12 +1079,16 @@ def run_agent_loop(
             session_name,
             status="working",
             last_activity=now,
+            iteration=iteration,
+            iteration_started_at=now,
         )
 
-        worklog = extract_worklog(ticket_path)
+        worklog = window_worklog(base, ticket_id, ticket_path, extract_worklog(ticket_path), cfg.peasant.worklog_keep)
 
         # Check for new directives from the lead
         directives, last_seen_seq = get_new_directives(base, branch, thread_id, last_seen_seq)
+        if directives:
+            progress.reset()
 
         # Build prompt
         prompt = build_prompt(ticket_path, worklog, directives, iteration, max_iterations, phase_prompt)
@@ -539,20 +1097,29 @@ def run_agent_loop(
         cmd = build_command(agent_config, prompt, resume_id)
         logger.info("Calling backend: %s", " ".join(cmd[:3]) + "...")
 
+        call_started = time.monotonic()
+        remaining = budget.remaining_seconds(spent_seconds())
+        call_timeout = agent_timeout if remaining is None else min(agent_timeout, max(1, remaining))
         try:
             proc = subprocess.run(
                 cmd,
                 capture_output=True,
                 text=True,
-                timeout=agent_timeout,
+                timeout=call_timeout,
                 cwd=worktree,
                 stdin=subprocess.DEVNULL,
                 env=clean_agent_env(role="peasant", agent_name=session_name),
             )
         except subprocess.TimeoutExpired:
-            logger.error("Backend timed out after %ds", agent_timeout)
-            append_worklog(ticket_path, "Backend call timed out")
-            final_status = "failed"
+            if call_timeout < agent_timeout:
+                exhausted = f"wall-clock budget of {budget.minutes} min used up"
+                logger.warning("Budget exhausted during backend call: %s", exhausted)
+                append_worklog(ticket_path, f"Budget exhausted: {exhausted}")
+                final_status = "budget_exhausted"
+            else:
+                logger.error("Backend timed out after %ds", agent_timeout)
+                append_worklog(ticket_path, "Backend call timed out")
+                final_status = "failed"
             break
         except FileNotFoundError:
             cmd_name = agent_config.cli.split()[0]
@@ -567,14 +1134,33 @@ def run_agent_loop(
             logger.info("Stopping after backend call (signal received)")
             break
 
-        # Log raw agent output so it appears in `kd peasant logs --follow`
+        # Keep the full output in the event log; echo its tail so it appears
+        # in `kd peasant logs --follow`
+        call_elapsed = time.monotonic() - call_started
+        log_store.append(
+            "peasant",
+            member=agent_name,
+            ticket=ticket_id,
+            session=session_name,
+            iteration=iteration,
+            returncode=proc.returncode,
+            elapsed=round(call_elapsed, 2),
+            prompt=log_store.pack(prompt, blocks=True),
+            stdout=log_store.pack(proc.stdout),
+            stderr=log_store.pack(proc.stderr),
+        )
         if proc.stdout.strip():
-            logger.info("--- Agent stdout ---\n%s\n--- End agent stdout ---", proc.stdout.strip())
+            logger.info("--- Agent stdout ---\n%s\n--- End agent stdout ---", output_tail(proc.stdout))
         if proc.stderr.strip():
-            logger.info("--- Agent stderr ---\n%s\n--- End agent stderr ---", proc.stderr.strip())
+            logger.info("--- Agent stderr ---\n%s\n--- End agent stderr ---", output_tail(proc.stderr))
 
         # Parse response
         text, new_session_id, _raw = parse_response(agent_config, proc.stdout, proc.stderr, proc.returncode)
+        usage = parse_usage(agent_config, proc.stdout)
+        if usage is not None:
+            record_usage(usage_path(base), "peasant", agent_name, usage, call_elapsed, ticket=ticket_id)
+            spent_tokens += usage.output_tokens
+            spent_cost += usage.cost_usd
         if new_session_id:
             resume_id = new_session_id
             update_agent_state(base, branch, session_name, resume_id=new_session_id)
@@ -594,6 +1180,10 @@ def run_agent_loop(
         worklog_entry = extract_worklog_entry(text)
         if worklog_entry:
             append_worklog(ticket_path, worklog_entry)
+        if idle_limit and status == "continue":
+            step = progress.observe(take_snapshot(worktree), worklog_entry)
+            if not step.made_progress:
+                logger.info("No progress this iteration (%d/%d idle)", progress.idle, idle_limit)
 
         # Write response to work thread
         try:
@@ -608,11 +1198,25 @@ def run_agent_loop(
         except FileNotFoundError:
             logger.warning("Could not write to thread %s", thread_id)
 
-        # Update session timestamp
+        # Update session timestamp and budget totals
         now = datetime.now(UTC).isoformat()
-        update_agent_state(base, branch, session_name, last_activity=now)
+        update_agent_state(
+            base,
+            branch,
+            session_name,
+            last_activity=now,
+            spent_seconds=spent_seconds(),
+            spent_output_tokens=spent_tokens,
+            spent_cost_usd=round(spent_cost, 6),
+        )
 
         # Check stop conditions
+        if status == "continue" and progress.stalled:
+            summary = progress.summary()
+            logger.warning("%s — escalating as blocked", summary)
+            append_worklog(ticket_path, f"{summary} — escalating as blocked")
+            final_status = "blocked"
+            break
         if status == "done":
             # Guard: reject DONE if the agent hasn't made any actual changes
             agent_state = get_agent_state(base, branch, session_name)
@@ -624,6 +1228,26 @@ def run_agent_loop(
                 )
                 continue
 
+            # Run the verification command once for this tree (cached across rounds and reviewers)
+            verification = ""
+            if cfg.peasant.verify_command:
+                verify_result = run_verification(base, worktree, cfg.peasant.verify_command, agent_timeout)
+                if verify_result is None:
+                    logger.warning("Could not compute tree SHA — skipping verification")
+                else:
+                    verification = format_verification(verify_result)
+                    logger.info("Verification: %s", verification.splitlines()[0])
+                    if not verify_result.passed:
+                        append_worklog(ticket_path, "DONE rejected — verification failed, see work thread for output")
+                        failure_body = (
+                            f"## Verification Failed\n\n{verification}\n\nFix the failures before reporting DONE."
+                        )
+                        try:
+                            add_message(base, branch, thread_id, from_="king", to=session_name, body=failure_body)
+                        except FileNotFoundError:
+                            logger.warning("Could not write verification output to thread %s", thread_id)
+                        continue
+
             # --- Council review phase ---
             # Transition ticket to in_review, session to awaiting_council
             ticket_obj = read_ticket(ticket_path)
@@ -639,6 +1263,21 @@ def run_agent_loop(
                 last_activity=now,
             )
 
+            if cfg.council.review_workers:
+                # Pipelined review: hand the ticket to a review worker and release this process
+                review_request = ReviewRequest(
+                    ticket_id=ticket_id,
+                    session_name=session_name,
+                    thread_id=thread_id,
+                    worktree=str(worktree),
+                    agent=agent_name,
+                    verification=verification,
+                    queued_at=now,
+                )
+                append_worklog(ticket_path, "Queued for council review")
+                final_status = "awaiting_council"
+                break
+
             agent_state = get_agent_state(base, branch, session_name)
             review_outcome, blocking_feedback = run_council_review(
                 base=base,
@@ -650,55 +1289,17 @@ def run_agent_loop(
                 start_sha=agent_state.start_sha,
                 council_timeout=cfg.council.timeout,
                 hand_mode=agent_state.hand_mode,
+                verification=verification,
+                compaction=compaction,
             )
 
-            if review_outcome == "no_council":
-                # No council configured — go straight to needs_king_review
-                final_status = "needs_king_review"
-                append_worklog(ticket_path, "No council configured — awaiting king review")
-                break
-
-            if review_outcome == "timeout":
-                # Council timed out — escalate to king
-                final_status = "needs_king_review"
-                append_worklog(ticket_path, "Council review timed out — escalating to king")
-                break
-
-            if review_outcome == "approved":
-                final_status = "needs_king_review"
-                append_worklog(ticket_path, "Council review: APPROVED — awaiting king review")
-                break
-
-            # Blocking feedback — check bounce limit
-            bounce_count = agent_state.review_bounce_count + 1
-            update_agent_state(base, branch, session_name, review_bounce_count=bounce_count)
-
-            if bounce_count >= 3:
-                # Escalate after 3 bounces
-                final_status = "needs_king_review"
-                append_worklog(
-                    ticket_path,
-                    f"Council review: BLOCKING (bounce {bounce_count}/3) — escalating to king",
-                )
-                logger.warning("Review bounce limit reached (%d), escalating to king", bounce_count)
+            outcome_status = record_review_outcome(
+                base, branch, ticket_path, session_name, thread_id, review_outcome, blocking_feedback
+            )
+            if outcome_status is not None:
+                final_status = outcome_status
                 break
 
-            # Bounce back to working — inject feedback as directives
-            logger.info("Council review: BLOCKING (bounce %d/3), returning to working", bounce_count)
-            append_worklog(ticket_path, f"Council review: BLOCKING (bounce {bounce_count}/3) — returning to working")
-
-            # Revert ticket to in_progress, session to working
-            ticket_obj = read_ticket(ticket_path)
-            ticket_obj.status = "in_progress"
-            write_ticket(ticket_obj, ticket_path)
-
-            # Add blocking feedback as a directive message in the thread
-            feedback_body = "## Council Review Feedback (BLOCKING)\n\n" + "\n\n---\n\n".join(blocking_feedback)
-            try:
-                add_message(base, branch, thread_id, from_="king", to=session_name, body=feedback_body)
-            except FileNotFoundError:
-                logger.warning("Could not write council feedback to thread %s", thread_id)
-
             # Continue the loop — agent will pick up feedback as directives
             continue
         elif status == "blocked":
@@ -721,7 +1322,17 @@ def run_agent_loop(
         session_name,
         status=final_status,
         last_activity=now,
+        spent_seconds=spent_seconds(),
+        spent_output_tokens=spent_tokens,
+        spent_cost_usd=round(spent_cost, 6),
     )
 
+    # Enqueue only after the final update, so a fast reviewer's status change isn't overwritten
+    if review_request is not None:
+        enqueue_review(base, branch, review_request)
+        started = ensure_review_workers(base, branch, cfg.council.review_workers)
+        logger.info("Queued for council review (%d review worker(s) started)", started)
+
     logger.info("Harness finished with status: %s", final_status)
+    logger.info("Git calls: %s", format_git_stats())
     return final_status
@@ -0,0 +1,200 @@
+"""Per-peasant resource limits, budgets and admission control.
+
+Limits come from ``peasant.*`` in ``.kd/config.json``:
+
+- ``nice``: scheduling priority for the harness and everything it runs.
+- ``max_memory_mb``: ``RLIMIT_AS`` (address space) per process.
+- ``max_processes``: ``RLIMIT_NPROC``.  The kernel counts this per user, not
+  per peasant, so it caps fork bombs rather than isolating peasants.
+
+``launch_work_background`` applies them in the harness's ``preexec_fn``, and
+they are inherited from there.  The harness applies them to itself again at
+startup, before it starts any thread, so ``kd work`` run by hand is limited
+too.  Agent calls inherit them rather than using ``preexec_fn``, which is
+unsafe once the harness runs review and git timer threads.
+
+Admission control: with ``max_load`` (1-minute load average per CPU) or
+``min_free_memory_mb`` set, a new peasant waits in status ``queued`` until the
+machine is below both thresholds.  It also waits until no peasant queued
+before it is still waiting.
+
+Budgets cap what one ticket may consume in total, across harness runs.  They
+are set by ``peasant.wall_clock_minutes``, ``peasant.max_output_tokens`` and
+``peasant.max_cost_usd``.  A ticket can override them with the
+``budget-minutes``, ``budget-output-tokens`` and ``budget-cost-usd``
+frontmatter keys.  Tokens and cost come from the usage each backend reports.
+:func:`kingdom.harness.run_agent_loop` keeps the running totals in the
+peasant's session and stops with status ``budget_exhausted`` when one is used
+up.
+"""
+
+from __future__ import annotations
+
+import os
+import resource
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from kingdom.config import PeasantConfig
+from kingdom.session import AgentState, list_active_agents
+from kingdom.ticket import Ticket
+
+ADMISSION_POLL = 15.0  # seconds between admission checks while queued
+MEMINFO = Path("/proc/meminfo")
+
+
+@dataclass
+class ResourceLimits:
+    """Limits applied to a peasant process before it execs."""
+
+    nice: int = 0  # 0 = inherit
+    max_memory_mb: int = 0  # 0 = unlimited
+    max_processes: int = 0  # 0 = unlimited
+
+    @classmethod
+    def from_config(cls, cfg: PeasantConfig) -> ResourceLimits:
+        return cls(nice=cfg.nice, max_memory_mb=cfg.max_memory_mb, max_processes=cfg.max_processes)
+
+    def apply(self) -> None:
+        """Apply the limits to the current process.
+
+        Runs in the launched harness between fork and exec, and again at
+        harness startup.  Limits are only ever
+        lowered: an unprivileged process can't raise its hard limits or its
+        priority.
+        """
+        if self.nice:
+            current = os.getpriority(os.PRIO_PROCESS, 0)
+            os.setpriority(os.PRIO_PROCESS, 0, max(current, self.nice))
+        if self.max_memory_mb:
+            lower_rlimit(resource.RLIMIT_AS, self.max_memory_mb * 1024 * 1024)
+        if self.max_processes:
+            lower_rlimit(resource.RLIMIT_NPROC, self.max_processes)
+
+    def preexec_fn(self) -> Callable[[], None] | None:
+        """``preexec_fn`` for Popen, or None when no limit is set."""
+        if not (self.nice or self.max_memory_mb or self.max_processes):
+            return None
+        return self.apply
+
+
+def lower_rlimit(which: int, value: int) -> None:
+    soft, hard = resource.getrlimit(which)
+    if hard != resource.RLIM_INFINITY:
+        value = min(value, hard)
+    if soft == resource.RLIM_INFINITY or value < soft:
+        resource.setrlimit(which, (value, hard))
+
+
+def available_memory_mb(meminfo: Path = MEMINFO) -> int | None:
+    """``MemAvailable`` from ``/proc/meminfo`` in MB, or None if unknown."""
+    try:
+        for line in meminfo.read_text().splitlines():
+            if line.startswith("MemAvailable:"):
+                return int(line.split()[1]) // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def load_per_cpu() -> float | None:
+    """1-minute load average divided by the CPU count, or None if unknown."""
+    try:
+        return os.getloadavg()[0] / (os.cpu_count() or 1)
+    except OSError:
+        return None
+
+
+def machine_busy(cfg: PeasantConfig, meminfo: Path = MEMINFO) -> str | None:
+    """Why the machine is too busy for another peasant, or None if it isn't."""
+    if cfg.max_load:
+        load = load_per_cpu()
+        if load is not None and load > cfg.max_load:
+            return f"load {load:.2f} per CPU is above peasant.max_load {cfg.max_load:g}"
+    if cfg.min_free_memory_mb:
+        free = available_memory_mb(meminfo)
+        if free is not None and free < cfg.min_free_memory_mb:
+            return f"{free} MB free is below peasant.min_free_memory_mb {cfg.min_free_memory_mb}"
+    return None
+
+
+def queued_ahead(base: Path, branch: str, session_name: str) -> int:
+    """Number of live queued peasants that were started before *session_name*."""
+    from kingdom.cleanup import pid_alive
+
+    queued = [
+        state
+        for state in list_active_agents(base, branch)
+        if state.name.startswith("peasant-") and state.status == "queued" and pid_alive(state.pid)
+    ]
+    order = sorted(queued, key=lambda state: (state.started_at or "", state.name))
+    names = [state.name for state in order]
+    return names.index(session_name) if session_name in names else len(names)
+
+
+def admission_wait_reason(base: Path, branch: str, session_name: str, cfg: PeasantConfig) -> str | None:
+    """Why *session_name* must keep waiting to start, or None to start now."""
+    if not (cfg.max_load or cfg.min_free_memory_mb):
+        return None
+    busy = machine_busy(cfg)
+    if busy:
+        return busy
+    ahead = queued_ahead(base, branch, session_name)
+    if ahead:
+        return f"{ahead} queued peasant(s) ahead"
+    return None
+
+
+@dataclass
+class Budget:
+    """Per-ticket totals a peasant may spend; 0 means unlimited."""
+
+    minutes: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+
+    @classmethod
+    def for_ticket(cls, cfg: PeasantConfig, ticket: Ticket | None = None) -> Budget:
+        """The config budget, with any limits set in *ticket*'s frontmatter taking precedence."""
+        budget = cls(minutes=cfg.wall_clock_minutes, output_tokens=cfg.max_output_tokens, cost_usd=cfg.max_cost_usd)
+        if ticket is not None:
+            if ticket.budget_minutes is not None:
+                budget.minutes = ticket.budget_minutes
+            if ticket.budget_output_tokens is not None:
+                budget.output_tokens = ticket.budget_output_tokens
+            if ticket.budget_cost_usd is not None:
+                budget.cost_usd = ticket.budget_cost_usd
+        return budget
+
+    def remaining_seconds(self, spent_seconds: float) -> float | None:
+        """Wall-clock seconds left, or None without a time budget."""
+        if not self.minutes:
+            return None
+        return self.minutes * 60 - spent_seconds
+
+    def exhausted(self, seconds: float, output_tokens: int, cost_usd: float) -> str | None:
+        """Which budget the given totals have used up, or None."""
+        if self.minutes and seconds >= self.minutes * 60:
+            return f"wall-clock budget of {self.minutes} min used up"
+        if self.output_tokens and output_tokens >= self.output_tokens:
+            return f"output-token budget of {self.output_tokens:,} used up ({output_tokens:,} tokens)"
+        if self.cost_usd and cost_usd >= self.cost_usd:
+            return f"cost budget of ${self.cost_usd:.2f} used up (${cost_usd:.2f})"
+        return None
+
+
+def format_spent(state: AgentState, budget: Budget) -> str:
+    """``42m/120m 18.2k/50.0k tok $1.20/$5.00``-style totals for ``kd peasant status``."""
+
+    def tokens(count: int) -> str:
+        return f"{count / 1000:.1f}k" if count >= 1000 else str(count)
+
+    parts = [f"{int(state.spent_seconds // 60)}m" + (f"/{budget.minutes}m" if budget.minutes else "")]
+    parts.append(
+        tokens(state.spent_output_tokens)
+        + (f"/{tokens(budget.output_tokens)}" if budget.output_tokens else "")
+        + " tok"
+    )
+    parts.append(f"${state.spent_cost_usd:.2f}" + (f"/${budget.cost_usd:.2f}" if budget.cost_usd else ""))
+    return " ".join(parts)
@@ -0,0 +1,294 @@
+"""Structured, rotated event log for council queries and peasant iterations.
+
+Each branch's ``logs/`` directory holds one append-only ``events.jsonl``::
+
+    {"kind": "council", "member": "claude", "ts": "2026-01-01T12:00:00+00:00",
+     "elapsed": 41.2, "error": null, "prompt": {"blobs": ["3f1c...", ...], "chars": 52310},
+     "response": "Looks good..."}
+
+Short texts are stored inline.  Longer ones are gzipped into
+``logs/blobs/<sha[:2]>/<sha>.gz`` and referenced by hash, so they are written
+only once.  Prompts are split into blocks at blank lines before hashing.  The
+stable prefix of a prompt (preamble, phase prompt, thread history) repeats
+across turns, so those blocks are shared between records.
+
+When ``events.jsonl`` grows past ``max_bytes`` it is rotated to
+``events-<rotation time>.jsonl.gz`` and only the newest ``keep`` segments are
+kept.  :meth:`LogStore.query` uses the rotation time in segment names to skip
+segments older than ``since``.  It also stops at older segments once it has
+``limit`` matches, and checks each raw line against the filters before parsing
+it.  ``kd logs`` is the CLI front end.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from kingdom.state import flock
+
+EVENTS_FILE = "events.jsonl"
+SEGMENT_PREFIX = "events-"
+SEGMENT_SUFFIX = ".jsonl.gz"
+SEGMENT_TIME_FORMAT = "%Y%m%dT%H%M%S%f"
+
+MAX_BYTES = 10_000_000
+KEEP_SEGMENTS = 10
+INLINE_CHARS = 2000  # texts up to this size are stored in the record itself
+BLOCK_CHARS = 4000  # prompts are hashed in blocks of at least this size
+
+
+def split_blocks(text: str, block_chars: int = BLOCK_CHARS) -> list[str]:
+    """Split *text* at blank lines into blocks of at least *block_chars*.
+
+    Joining the blocks gives back *text* exactly.
+    """
+    blocks: list[str] = []
+    current: str | None = None
+    for paragraph in text.split("\n\n"):
+        current = paragraph if current is None else f"{current}\n\n{paragraph}"
+        if len(current) >= block_chars:
+            blocks.append(current + "\n\n")
+            current = None
+    if current is not None or not blocks:
+        blocks.append(current or "")
+    else:
+        blocks[-1] = blocks[-1][:-2]
+    return blocks
+
+
+def segment_time(path: Path) -> datetime | None:
+    """Rotation time encoded in a segment name, or None for the active file."""
+    name = path.name
+    if not (name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX)):
+        return None
+    stamp = name[len(SEGMENT_PREFIX) : -len(SEGMENT_SUFFIX)]
+    try:
+        return datetime.strptime(stamp, SEGMENT_TIME_FORMAT).replace(tzinfo=UTC)
+    except ValueError:
+        return None
+
+
+def record_time(record: dict[str, Any]) -> datetime | None:
+    ts = record.get("ts")
+    if not isinstance(ts, str):
+        return None
+    try:
+        return datetime.fromisoformat(ts)
+    except ValueError:
+        return None
+
+
+@dataclass
+class LogStore:
+    """Event log rooted at a ``logs/`` directory."""
+
+    root: Path
+    max_bytes: int = MAX_BYTES
+    keep: int = KEEP_SEGMENTS  # rotated segments to keep; 0 keeps all
+
+    @property
+    def events_path(self) -> Path:
+        return self.root / EVENTS_FILE
+
+    @property
+    def blobs_dir(self) -> Path:
+        return self.root / "blobs"
+
+    @property
+    def lock_path(self) -> Path:
+        return self.root / f".{EVENTS_FILE}.lock"
+
+    # -- writing ----------------------------------------------------------
+
+    def put_blob(self, text: str) -> str:
+        """Store *text* by content hash and return the hash."""
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.blobs_dir / digest[:2] / f"{digest}.gz"
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp.write_bytes(gzip.compress(data))
+            os.replace(tmp, path)
+        return digest
+
+    def pack(self, text: str, blocks: bool = False) -> str | dict[str, Any]:
+        """Encode *text* for a record: inline when short, blob references otherwise.
+
+        With *blocks*, the text is hashed in blank-line separated blocks so
+        that prompts sharing a prefix share blobs.
+        """
+        if len(text) <= INLINE_CHARS:
+            return text
+        parts = split_blocks(text) if blocks else [text]
+        return {"blobs": [self.put_blob(part) for part in parts], "chars": len(text)}
+
+    def append(self, kind: str, **fields: Any) -> dict[str, Any]:
+        """Append one record of *kind* and return it."""
+        record = {"ts": datetime.now(UTC).isoformat(), "kind": kind, **fields}
+        line = json.dumps(record, sort_keys=True) + "\n"
+        self.root.mkdir(parents=True, exist_ok=True)
+        with flock(self.lock_path):
+            try:
+                size = self.events_path.stat().st_size
+            except FileNotFoundError:
+                size = 0
+            if size and size + len(line) > self.max_bytes:
+                self.rotate()
+            with self.events_path.open("a", encoding="utf-8") as handle:
+                handle.write(line)
+        return record
+
+    def rotate(self) -> Path | None:
+        """Compress the active file into a segment and prune old segments.
+
+        Callers must hold :attr:`lock_path`.
+        """
+        if not self.events_path.exists():
+            return None
+        stamp = datetime.now(UTC).strftime(SEGMENT_TIME_FORMAT)
+        segment = self.root / f"{SEGMENT_PREFIX}{stamp}{SEGMENT_SUFFIX}"
+        tmp = segment.with_name(f"{segment.name}.tmp")
+        with self.events_path.open("rb") as src, gzip.open(tmp, "wb") as dst:
+            dst.writelines(src)
+        os.replace(tmp, segment)
+        self.events_path.unlink()
+
+        if self.keep:
+            for old in self.segments()[: -self.keep]:
+                old.unlink(missing_ok=True)
+        return segment
+
+    # -- reading ----------------------------------------------------------
+
+    def segments(self) -> list[Path]:
+        """Rotated segments, oldest first."""
+        if not self.root.exists():
+            return []
+        found = [p for p in self.root.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}") if segment_time(p)]
+        return sorted(found, key=lambda p: p.name)
+
+    def read_blob(self, digest: str) -> str:
+        path = self.blobs_dir / digest[:2] / f"{digest}.gz"
+        try:
+            return gzip.decompress(path.read_bytes()).decode("utf-8")
+        except (OSError, EOFError):
+            return f"[missing blob {digest[:12]}]"
+
+    def unpack(self, value: Any) -> str:
+        """Inverse of :meth:`pack`."""
+        if isinstance(value, dict):
+            return "".join(self.read_blob(str(digest)) for digest in value.get("blobs", []))
+        return "" if value is None else str(value)
+
+    def read_segment(self, path: Path) -> list[str]:
+        try:
+            if path.name.endswith(".gz"):
+                with gzip.open(path, "rt", encoding="utf-8") as handle:
+                    return handle.read().splitlines()
+            return path.read_text(encoding="utf-8").splitlines()
+        except (OSError, EOFError):
+            return []
+
+    def query(
+        self,
+        *,
+        since: datetime | None = None,
+        kind: str | None = None,
+        member: str | None = None,
+        ticket: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return matching records, oldest first.
+
+        *ticket* matches any record whose ``ticket`` field contains it, so
+        partial IDs work.  With *limit*, only the newest *limit* matches are
+        returned and older segments are not read once enough were found.
+        """
+        needles = []
+        if kind:
+            needles.append(json.dumps({"kind": kind})[1:-1])
+        if member:
+            needles.append(json.dumps({"member": member})[1:-1])
+        if ticket:
+            needles.append(ticket)
+
+        def matches(record: dict[str, Any]) -> bool:
+            if kind and record.get("kind") != kind:
+                return False
+            if member and record.get("member") != member:
+                return False
+            if ticket and ticket not in str(record.get("ticket", "")):
+                return False
+            if since:
+                ts = record_time(record)
+                if ts is None or ts < since:
+                    return False
+            return True
+
+        results: list[dict[str, Any]] = []
+        for path in reversed([*self.segments(), self.events_path]):
+            rotated = segment_time(path)
+            if since and rotated is not None and rotated < since:
+                break  # this and every older segment ended before `since`
+            found = []
+            for line in self.read_segment(path):
+                if not all(needle in line for needle in needles):
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(record, dict) and matches(record):
+                    found.append(record)
+            results[:0] = found
+            if limit is not None and len(results) >= limit:
+                break
+        if limit is not None:
+            results = results[-limit:] if limit else []
+        return results
+
+    def iter_texts(self, record: dict[str, Any], fields: tuple[str, ...]) -> Iterator[tuple[str, str]]:
+        """Yield ``(field, text)`` for each of *fields* present in *record*."""
+        for name in fields:
+            if record.get(name):
+                yield name, self.unpack(record[name])
+
+
+SINCE_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def parse_age(text: str) -> timedelta:
+    """Parse a ``30m``/``2h``/``1d``/``2w``-style age.
+
+    Raises ValueError for anything else.
+    """
+    text = text.strip()
+    unit = SINCE_UNITS.get(text[-1:])
+    if unit is None or not text[:-1].isdigit():
+        raise ValueError(f"expected an age like 30m, 2h or 1d, got {text!r}")
+    return timedelta(seconds=int(text[:-1]) * unit)
+
+
+def parse_since(text: str, now: datetime | None = None) -> datetime:
+    """Parse ``30m``/``2h``/``1d``-style ages or an ISO timestamp.
+
+    Raises ValueError for anything else.
+    """
+    try:
+        return (now or datetime.now(UTC)) - parse_age(text)
+    except ValueError:
+        pass
+    try:
+        parsed = datetime.fromisoformat(text.strip())
+    except ValueError:
+        raise ValueError(f"expected an age like 30m, 2h, 1d or an ISO timestamp, got {text!r}") from None
+    return parsed if parsed.tzinfo else parsed.astimezone()
@@ -9,6 +9,7 @@ to duplicate the split + line-parse logic.
 from __future__ import annotations
 
 import re
+import textwrap
 
 
 def parse_yaml_value(value: str) -> str | int | list[str] | None:
@@ -100,3 +101,68 @@ def parse_frontmatter(content: str) -> tuple[FrontmatterDict, str]:
         fm[key.strip()] = parse_yaml_value(value)
 
     return fm, body
+
+
+def indent_of(line: str) -> int:
+    return len(line) - len(line.lstrip(" "))
+
+
+def parse_yaml_list(text: str) -> list[dict[str, str | int | list[str] | None]]:
+    """Parse a YAML block sequence of flat mappings.
+
+    Supports the subset ticket specs need: top-level ``- key: value`` items,
+    ``key: |`` block scalars, and ``key:`` followed by ``- item`` lists.
+    Scalars go through :func:`parse_yaml_value`.
+
+    Raises:
+        ValueError: On anything outside that subset, naming the line.
+    """
+    lines = text.splitlines()
+    items: list[FrontmatterDict] = []
+    current: FrontmatterDict | None = None
+    i = 0
+    while i < len(lines):
+        raw = lines[i]
+        i += 1
+        stripped = raw.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+
+        if indent_of(raw) == 0:
+            if stripped != "-" and not stripped.startswith("- "):
+                raise ValueError(f"line {i}: expected '- ' to start a list item")
+            current = {}
+            items.append(current)
+            rest = stripped[1:].strip()
+            key_indent = len(raw) - len(raw[1:].lstrip()) if rest else 0
+        elif current is None:
+            raise ValueError(f"line {i}: expected '- ' to start a list item")
+        else:
+            rest = stripped
+            key_indent = indent_of(raw)
+        if not rest:
+            continue
+        if ":" not in rest:
+            raise ValueError(f"line {i}: expected 'key: value'")
+
+        key, value = (part.strip() for part in rest.split(":", 1))
+        if value in ("|", "|-"):
+            block: list[str] = []
+            while i < len(lines) and (not lines[i].strip() or indent_of(lines[i]) > key_indent):
+                block.append(lines[i])
+                i += 1
+            current[key] = textwrap.dedent("\n".join(block)).strip("\n")
+        elif not value:
+            seq: list[str] = []
+            while i < len(lines) and (not lines[i].strip() or indent_of(lines[i]) > key_indent):
+                entry = lines[i].strip()
+                i += 1
+                if not entry:
+                    continue
+                if not entry.startswith("-"):
+                    raise ValueError(f"line {i}: expected '- ' list entry under '{key}'")
+                seq.append(str(parse_yaml_value(entry[1:]) or ""))
+            current[key] = seq or None
+        else:
+            current[key] = parse_yaml_value(value)
+    return items
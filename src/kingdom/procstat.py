@@ -0,0 +1,195 @@
+"""Resource usage of peasant process trees, read from ``/proc`` (``kd peasant top``).
+
+A peasant is a process tree rooted at its harness PID: the harness, the agent
+CLI it runs each iteration, and whatever that CLI spawns (test runners,
+linters, git).  :func:`sample_tree` sums one snapshot over the live tree:
+
+- CPU ticks.  A process's own ``utime + stime`` plus ``cutime + cstime``,
+  which covers children it has already reaped, so short-lived test
+  subprocesses are still counted.
+- RSS.
+- Storage I/O (``read_bytes``/``write_bytes`` from ``/proc/<pid>/io``).
+- The harness's own ``rchar``.  While an iteration runs, the harness is
+  blocked reading the agent's stdout and stderr pipes, so its growth is the
+  agent's output stream.
+
+:func:`usage` turns two snapshots into rates.  Linux only.  On other
+platforms the table is empty and ``kd peasant top`` says so.
+"""
+
+from __future__ import annotations
+
+import os
+import signal
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+PROC = Path("/proc")
+CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+@dataclass
+class ProcStat:
+    """The fields of ``/proc/<pid>/stat`` that ``kd peasant top`` uses."""
+
+    pid: int
+    ppid: int
+    comm: str
+    ticks: int  # utime + stime + cutime + cstime
+    start: int  # start time in ticks since boot, to detect PID reuse
+    rss: int  # bytes
+
+
+@dataclass
+class TreeSample:
+    """One snapshot of a process tree, summed over its live processes."""
+
+    pid: int
+    start: int
+    taken: float  # time.monotonic()
+    processes: int
+    ticks: int
+    rss: int
+    read_bytes: int
+    write_bytes: int
+    stream_chars: int  # rchar of the root process
+    commands: list[str] = field(default_factory=list)
+
+
+@dataclass
+class TreeUsage:
+    """A snapshot plus the rates since the previous one."""
+
+    sample: TreeSample
+    cpu_percent: float = 0.0
+    io_rate: float = 0.0  # storage bytes read + written per second
+    stream_rate: float = 0.0  # bytes per second
+
+    @property
+    def children(self) -> int:
+        return self.sample.processes - 1
+
+
+def read_stat(pid: int, proc: Path = PROC) -> ProcStat | None:
+    """Parse ``/proc/<pid>/stat``, or None if the process is gone."""
+    try:
+        raw = (proc / str(pid) / "stat").read_text()
+    except OSError:
+        return None
+    # comm is parenthesized and may contain spaces or parentheses
+    head, _, tail = raw.rpartition(")")
+    fields = tail.split()
+    try:
+        return ProcStat(
+            pid=pid,
+            ppid=int(fields[1]),
+            comm=head.partition("(")[2],
+            ticks=sum(int(f) for f in fields[11:15]),
+            start=int(fields[19]),
+            rss=int(fields[21]) * PAGE_SIZE,
+        )
+    except (IndexError, ValueError):
+        return None
+
+
+def read_io(pid: int, proc: Path = PROC) -> dict[str, int]:
+    """Parse ``/proc/<pid>/io``; empty if unreadable (other user, gone)."""
+    counters: dict[str, int] = {}
+    try:
+        text = (proc / str(pid) / "io").read_text()
+    except OSError:
+        return counters
+    for line in text.splitlines():
+        name, _, value = line.partition(":")
+        if value.strip().isdigit():
+            counters[name] = int(value)
+    return counters
+
+
+def process_table(proc: Path = PROC) -> dict[int, ProcStat]:
+    """Stat every process in *proc*."""
+    table: dict[int, ProcStat] = {}
+    try:
+        entries = os.listdir(proc)
+    except OSError:
+        return table
+    for name in entries:
+        if name.isdigit() and (stat := read_stat(int(name), proc)) is not None:
+            table[stat.pid] = stat
+    return table
+
+
+def descendants(pid: int, table: dict[int, ProcStat]) -> list[int]:
+    """*pid* followed by every live descendant, breadth first."""
+    children: dict[int, list[int]] = defaultdict(list)
+    for stat in table.values():
+        children[stat.ppid].append(stat.pid)
+    tree = [pid]
+    for current in tree:
+        tree.extend(sorted(children.get(current, [])))
+    return tree
+
+
+def sample_tree(pid: int, table: dict[int, ProcStat], proc: Path = PROC) -> TreeSample | None:
+    """Snapshot the tree rooted at *pid*, or None if *pid* is not running."""
+    root = table.get(pid)
+    if root is None:
+        return None
+    sample = TreeSample(
+        pid=pid,
+        start=root.start,
+        taken=time.monotonic(),
+        processes=0,
+        ticks=0,
+        rss=0,
+        read_bytes=0,
+        write_bytes=0,
+        stream_chars=read_io(pid, proc).get("rchar", 0),
+    )
+    for member in descendants(pid, table):
+        stat = table[member]
+        io = read_io(member, proc)
+        sample.processes += 1
+        sample.ticks += stat.ticks
+        sample.rss += stat.rss
+        sample.read_bytes += io.get("read_bytes", 0)
+        sample.write_bytes += io.get("write_bytes", 0)
+        sample.commands.append(stat.comm)
+    return sample
+
+
+def usage(previous: TreeSample | None, current: TreeSample) -> TreeUsage:
+    """Rates between two snapshots of the same tree.
+
+    The rates are zero when there is no comparable previous snapshot (first
+    sample, or the PID was reused).  Counters that went down because a
+    process exited are treated as zero growth.
+    """
+    result = TreeUsage(sample=current)
+    if previous is None or previous.pid != current.pid or previous.start != current.start:
+        return result
+    elapsed = current.taken - previous.taken
+    if elapsed <= 0:
+        return result
+    result.cpu_percent = max(0, current.ticks - previous.ticks) / CLK_TCK / elapsed * 100
+    io_now = current.read_bytes + current.write_bytes
+    io_before = previous.read_bytes + previous.write_bytes
+    result.io_rate = max(0, io_now - io_before) / elapsed
+    result.stream_rate = max(0, current.stream_chars - previous.stream_chars) / elapsed
+    return result
+
+
+def terminate_group(pgid: int) -> bool:
+    """Send SIGTERM to a peasant's process group; False if it is gone.
+
+    The harness is launched with ``start_new_session=True``, so its PID is
+    the process group ID.
+    """
+    try:
+        os.killpg(pgid, signal.SIGTERM)
+    except OSError:
+        return False
+    return True
@@ -0,0 +1,181 @@
+"""No-progress detection for the peasant loop.
+
+After each CONTINUE iteration the harness checks three signals:
+
+- New commits: HEAD moved since the previous iteration.
+- Diffstat delta: the uncommitted diff (``git diff --numstat HEAD`` plus
+  untracked files) changed.
+- Worklog novelty: the new worklog entry is not empty and not a
+  near-duplicate of an earlier one.  An entry is a near-duplicate when its
+  64-bit simhash is close to an earlier entry's in Hamming distance, or when
+  it mostly reuses that entry's words (a rewording: simhash also hashes word
+  pairs, so reordering alone moves it far).
+
+The first CONTINUE of a harness run has no earlier snapshot to compare
+against, so it only sets the baseline.  An iteration with none of the
+signals is idle.  After ``peasant.max_idle_iterations`` idle iterations in a
+row, :func:`kingdom.harness.run_agent_loop` stops with
+status ``blocked`` and a worklog summary instead of spinning until
+``max_iterations``.  A directive from the king (or council feedback) resets
+the count.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+from itertools import pairwise
+from pathlib import Path
+
+from kingdom.git import git_session
+
+SIMHASH_BITS = 64
+NEAR_DUPLICATE_BITS = 12  # simhashes at most this far apart are the same entry reworded
+REWORDED_OVERLAP = 0.6  # entries sharing this fraction of their words (Jaccard) are the same entry
+WORKLOG_HISTORY = 20  # earlier entries each new one is compared against
+GIT_TIMEOUT = 10
+
+
+def simhash(text: str) -> int:
+    """64-bit simhash of *text* over lowercased words and word pairs."""
+    words = re.findall(r"\w+", text.lower())
+    features = Counter(words + [f"{a} {b}" for a, b in pairwise(words)])
+    weights = [0] * SIMHASH_BITS
+    for feature, count in features.items():
+        value = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += count if value >> bit & 1 else -count
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def word_set(text: str) -> frozenset[str]:
+    return frozenset(re.findall(r"\w+", text.lower()))
+
+
+def word_overlap(a: frozenset[str], b: frozenset[str]) -> float:
+    """Jaccard similarity of two word sets."""
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+@dataclass(frozen=True)
+class EntryFingerprint:
+    """What a worklog entry is compared by."""
+
+    simhash: int
+    words: frozenset[str]
+
+    @classmethod
+    def of(cls, text: str) -> EntryFingerprint:
+        return cls(simhash=simhash(text), words=word_set(text))
+
+    def near_duplicate(self, other: EntryFingerprint) -> bool:
+        return (
+            hamming(self.simhash, other.simhash) <= NEAR_DUPLICATE_BITS
+            or word_overlap(self.words, other.words) >= REWORDED_OVERLAP
+        )
+
+
+def worklog_message(entry: str) -> str:
+    """Strip the ``- <timestamp> — `` prefix from a worklog entry."""
+    return entry.partition(" — ")[2] if entry.startswith("- ") and " — " in entry else entry
+
+
+@dataclass
+class WorkSnapshot:
+    """HEAD and the uncommitted diffstat of a worktree at one point in time."""
+
+    head: str | None
+    diffstat: str
+
+    @property
+    def changed_files(self) -> int:
+        return len(self.diffstat.splitlines())
+
+
+def take_snapshot(worktree: Path) -> WorkSnapshot:
+    """Snapshot *worktree*; an unreadable repository gives an empty snapshot."""
+    git = git_session(worktree)
+    lines: list[str] = []
+    try:
+        for args in (("diff", "--numstat", "HEAD"), ("ls-files", "--others", "--exclude-standard")):
+            with git.stream(*args, timeout=GIT_TIMEOUT) as proc:
+                assert proc.stdout is not None
+                lines.extend(line.rstrip("\n") for line in proc.stdout)
+    except OSError:
+        return WorkSnapshot(head=None, diffstat="")
+    return WorkSnapshot(head=git.rev_parse("HEAD"), diffstat="\n".join(lines))
+
+
+@dataclass
+class IterationProgress:
+    """Which progress signals one iteration showed."""
+
+    commits: bool
+    diff_changed: bool
+    novel_worklog: bool
+
+    @property
+    def made_progress(self) -> bool:
+        return self.commits or self.diff_changed or self.novel_worklog
+
+
+class ProgressTracker:
+    """Counts consecutive idle iterations."""
+
+    def __init__(self, limit: int, worklog: Iterable[str] = ()) -> None:
+        self.limit = limit  # 0 = never stalled
+        self.snapshot: WorkSnapshot | None = None
+        self.seen = [EntryFingerprint.of(worklog_message(entry)) for entry in worklog][-WORKLOG_HISTORY:]
+        self.idle = 0
+        self.worklog_reasons: set[str] = set()  # why the worklog showed no progress while idle
+
+    def observe(self, snapshot: WorkSnapshot, worklog_entry: str) -> IterationProgress:
+        """Compare one iteration's snapshot and worklog entry with what came before."""
+        novel = False
+        if worklog_entry.strip():
+            entry = EntryFingerprint.of(worklog_entry)
+            novel = not any(entry.near_duplicate(seen) for seen in self.seen)
+            self.seen = [*self.seen, entry][-WORKLOG_HISTORY:]
+            reason = "repeating"
+        else:
+            reason = "empty"
+        previous = self.snapshot
+        step = IterationProgress(
+            commits=previous is None or snapshot.head != previous.head,
+            diff_changed=previous is None or snapshot.diffstat != previous.diffstat,
+            novel_worklog=novel,
+        )
+        self.snapshot = snapshot
+        if step.made_progress:
+            self.reset()
+        else:
+            self.idle += 1
+            self.worklog_reasons.add(reason)
+        return step
+
+    def reset(self) -> None:
+        self.idle = 0
+        self.worklog_reasons = set()
+
+    @property
+    def stalled(self) -> bool:
+        return bool(self.limit) and self.idle >= self.limit
+
+    def summary(self) -> str:
+        snapshot = self.snapshot or WorkSnapshot(head=None, diffstat="")
+        head = snapshot.head[:8] if snapshot.head else "none"
+        worklog = {
+            frozenset({"empty"}): "no worklog entries",
+            frozenset({"repeating"}): "worklog repeating earlier entries",
+        }.get(frozenset(self.worklog_reasons), "worklog empty or repeating earlier entries")
+        return (
+            f"No progress in {self.idle} iterations: no new commits (HEAD {head}), "
+            f"uncommitted diff unchanged ({snapshot.changed_files} file(s)), {worklog}"
+        )
@@ -0,0 +1,256 @@
+"""Pipelined council review.
+
+By default a peasant that reports DONE runs the council review itself and
+waits for every reviewer, holding its process (and an admission slot) while
+nothing else runs.  With ``council.review_workers`` set, the harness instead
+queues a :class:`ReviewRequest` and exits with status ``awaiting_council``.
+Review workers (``kd review-worker``) take requests oldest first:
+
+- On BLOCKING the ticket goes back to ``in_progress`` with the feedback in its
+  work thread, and the worker relaunches the peasant on it.
+- Any other outcome is recorded the same way as an inline review
+  (:func:`kingdom.harness.record_review_outcome`).
+
+The worktree is kept while the ticket is in review, since reviewers read its
+diff.
+
+Layout under ``.kd/branches/<branch>/reviews/``::
+
+    <session>.json              queued request
+    active/<pid>-<session>.json request claimed by the worker with that PID
+    workers/<pid>.json          one file per live worker
+
+Workers start on demand.  Queueing a request starts one when fewer than
+``council.review_workers`` are alive, and a worker exits once the queue is
+empty.  A request claimed by a worker that died is queued again by the next
+worker.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import subprocess
+import sys
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+from kingdom.candidates import work_ticket_path
+from kingdom.session import get_agent_state, update_agent_state
+from kingdom.state import branch_root, logs_root, read_json, write_json
+from kingdom.ticket import find_ticket
+
+logger = logging.getLogger("kingdom.review_queue")
+
+
+@dataclass
+class ReviewRequest:
+    """A DONE ticket waiting for council review."""
+
+    ticket_id: str
+    session_name: str
+    thread_id: str
+    worktree: str
+    agent: str
+    verification: str = ""  # format_verification() output from the peasant's run
+    queued_at: str = ""
+
+
+def reviews_root(base: Path, branch: str) -> Path:
+    return branch_root(base, branch) / "reviews"
+
+
+def enqueue_review(base: Path, branch: str, request: ReviewRequest) -> Path:
+    """Queue *request*; a request already queued for the same session is replaced."""
+    path = reviews_root(base, branch) / f"{request.session_name}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_json(path, asdict(request))
+    return path
+
+
+def read_request(path: Path) -> ReviewRequest | None:
+    try:
+        return ReviewRequest(**read_json(path))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def queued_reviews(base: Path, branch: str) -> list[tuple[Path, ReviewRequest]]:
+    """Queued requests, oldest first."""
+    queued = []
+    for path in reviews_root(base, branch).glob("*.json"):
+        request = read_request(path)
+        if request is not None:
+            queued.append((path, request))
+    return sorted(queued, key=lambda item: (item[1].queued_at, item[1].session_name))
+
+
+def claim_review(base: Path, branch: str, pid: int) -> tuple[Path, ReviewRequest] | None:
+    """Move the oldest queued request to ``active/`` for worker *pid*, or None if the queue is empty."""
+    active = reviews_root(base, branch) / "active"
+    active.mkdir(parents=True, exist_ok=True)
+    for path, request in queued_reviews(base, branch):
+        claimed = active / f"{pid}-{path.name}"
+        try:
+            os.rename(path, claimed)  # atomic: only one worker wins
+        except FileNotFoundError:
+            continue
+        return claimed, request
+    return None
+
+
+def withdraw_review(base: Path, branch: str, session_name: str) -> int | None:
+    """Drop *session_name*'s queued request.
+
+    Returns the PID of a live worker that already claimed it, or None.
+    """
+    from kingdom.cleanup import pid_alive
+
+    root = reviews_root(base, branch)
+    (root / f"{session_name}.json").unlink(missing_ok=True)
+    for path in (root / "active").glob(f"*-{session_name}.json"):
+        pid, _, name = path.name.partition("-")
+        if name == f"{session_name}.json" and pid.isdigit() and pid_alive(int(pid)):
+            return int(pid)
+    return None
+
+
+def requeue_orphans(base: Path, branch: str) -> int:
+    """Queue requests claimed by workers that are no longer alive again."""
+    from kingdom.cleanup import pid_alive
+
+    root = reviews_root(base, branch)
+    requeued = 0
+    for path in (root / "active").glob("*-*.json"):
+        pid, _, name = path.name.partition("-")
+        if pid.isdigit() and not pid_alive(int(pid)) and not (root / name).exists():
+            try:
+                os.rename(path, root / name)
+            except FileNotFoundError:
+                continue
+            requeued += 1
+    return requeued
+
+
+def live_workers(base: Path, branch: str) -> list[int]:
+    """PIDs of running review workers; entries left by dead workers are removed."""
+    from kingdom.cleanup import pid_alive
+
+    alive = []
+    for path in (reviews_root(base, branch) / "workers").glob("*.json"):
+        if path.stem.isdigit() and pid_alive(int(path.stem)):
+            alive.append(int(path.stem))
+        else:
+            path.unlink(missing_ok=True)
+    return sorted(alive)
+
+
+def launch_review_worker(base: Path, branch: str) -> int:
+    """Start ``kd review-worker`` in the background and return its PID."""
+    log_dir = logs_root(base, branch) / "review-worker"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    cmd = [sys.executable, "-m", "kingdom.cli", "review-worker", "--branch", branch, "--base", str(base)]
+    with (log_dir / "stdout.log").open("ab") as stdout, (log_dir / "stderr.log").open("ab") as stderr:
+        proc = subprocess.Popen(cmd, stdout=stdout, stderr=stderr, stdin=subprocess.DEVNULL, start_new_session=True)
+    return proc.pid
+
+
+def ensure_review_workers(
+    base: Path,
+    branch: str,
+    limit: int,
+    launch: Callable[[Path, str], int] | None = None,
+) -> int:
+    """Start workers until *limit* are alive or there is one per queued request; returns how many were started."""
+    launch = launch or launch_review_worker
+    wanted = min(limit, len(queued_reviews(base, branch))) - len(live_workers(base, branch))
+    for _ in range(wanted):
+        launch(base, branch)
+    return max(0, wanted)
+
+
+def process_review(
+    base: Path,
+    branch: str,
+    request: ReviewRequest,
+    relaunch: Callable[[ReviewRequest], int],
+) -> str:
+    """Run the council review for *request* and act on its outcome; returns the peasant's new status.
+
+    *relaunch* starts the peasant again after a BLOCKING bounce and returns its PID.
+    """
+    from kingdom.config import load_config
+    from kingdom.harness import record_review_outcome, review_compaction, run_council_review
+
+    state = get_agent_state(base, branch, request.session_name)
+    if state.status != "awaiting_council":
+        # Stopped, restarted or reviewed by the king while queued
+        logger.info("Skipping review of %s: peasant is %s", request.ticket_id, state.status)
+        return state.status
+    found = find_ticket(base, request.ticket_id, branch=branch)
+    if found is None:
+        logger.error("Ticket not found: %s", request.ticket_id)
+        update_agent_state(base, branch, request.session_name, status="failed")
+        return "failed"
+    ticket_path = work_ticket_path(base, branch, request.session_name, found[1])
+
+    cfg = load_config(base)
+    outcome, feedback = run_council_review(
+        base=base,
+        branch=branch,
+        worktree=Path(request.worktree),
+        ticket_path=ticket_path,
+        session_name=request.session_name,
+        thread_id=request.thread_id,
+        start_sha=state.start_sha,
+        council_timeout=cfg.council.timeout,
+        hand_mode=state.hand_mode,
+        verification=request.verification,
+        compaction=review_compaction(cfg.council),
+    )
+    logger.info("Council review of %s: %s", request.ticket_id, outcome)
+    status = record_review_outcome(
+        base, branch, ticket_path, request.session_name, request.thread_id, outcome, feedback
+    )
+    now = datetime.now(UTC).isoformat()
+    if status is not None:
+        update_agent_state(base, branch, request.session_name, status=status, last_activity=now)
+        return status
+
+    pid = relaunch(request)
+    logger.info("Relaunched %s on %s (pid %d)", request.session_name, request.ticket_id, pid)
+    update_agent_state(base, branch, request.session_name, status="working", pid=pid, last_activity=now)
+    return "working"
+
+
+def run_review_worker(
+    base: Path,
+    branch: str,
+    relaunch: Callable[[ReviewRequest], int],
+    review: Callable[[Path, str, ReviewRequest, Callable[[ReviewRequest], int]], str] = process_review,
+) -> int:
+    """Process queued reviews until the queue is empty; returns how many were processed.
+
+    The worker deregisters before its final look at the queue.  A request
+    queued after that look finds no live worker and starts a new one, so no
+    request is left without a worker.
+    """
+    pid = os.getpid()
+    marker = reviews_root(base, branch) / "workers" / f"{pid}.json"
+    marker.parent.mkdir(parents=True, exist_ok=True)
+    requeue_orphans(base, branch)
+    processed = 0
+    while True:
+        write_json(marker, {"pid": pid, "started_at": datetime.now(UTC).isoformat()})
+        while (claimed := claim_review(base, branch, pid)) is not None:
+            path, request = claimed
+            try:
+                review(base, branch, request, relaunch)
+            finally:
+                path.unlink(missing_ok=True)
+            processed += 1
+        marker.unlink(missing_ok=True)
+        if not queued_reviews(base, branch):
+            return processed
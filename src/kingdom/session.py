@@ -58,6 +58,16 @@ class AgentState:
     start_sha: str | None = None
     review_bounce_count: int = 0
     hand_mode: bool = False
+    reviewed_sha: str | None = None  # HEAD reviewed by the last council round
+    review_feedback: list[str] | None = None  # blocking feedback from that round
+    review_sessions: dict[str, str] | None = None  # council member -> resume_id for that round
+    full_review: bool = False  # force the next council round to review the full diff
+    iteration: int = 0  # current harness iteration (1-based; 0 before the first)
+    iteration_started_at: str | None = None
+    # Running totals for the ticket's budgets, kept across harness runs
+    spent_seconds: float = 0.0
+    spent_output_tokens: int = 0
+    spent_cost_usd: float = 0.0
 
 
 # ---------------------------------------------------------------------------
@@ -93,6 +103,15 @@ def agent_state_from_dict(data: dict[str, Any], name: str) -> AgentState:
         start_sha=data.get("start_sha"),
         review_bounce_count=data.get("review_bounce_count", 0),
         hand_mode=data.get("hand_mode", False),
+        reviewed_sha=data.get("reviewed_sha"),
+        review_feedback=data.get("review_feedback"),
+        review_sessions=data.get("review_sessions"),
+        full_review=data.get("full_review", False),
+        iteration=data.get("iteration", 0),
+        iteration_started_at=data.get("iteration_started_at"),
+        spent_seconds=data.get("spent_seconds", 0.0),
+        spent_output_tokens=data.get("spent_output_tokens", 0),
+        spent_cost_usd=data.get("spent_cost_usd", 0.0),
     )
 
 
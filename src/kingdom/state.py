@@ -209,6 +209,7 @@ def ensure_base_layout(base: Path, create_gitignore: bool = True) -> dict[str, P
 *.session
 **/logs/
 **/sessions/
+**/candidates/
 worktrees/
 current
 
@@ -0,0 +1,83 @@
+"""Cached summaries of older conversation and worklog entries.
+
+Long-running threads and worklogs are re-sent to agents on every turn.  To
+keep prompts bounded, older entries are replaced by a short summary: one
+line per entry with its speaker and gist (the first sentence or two, code
+blocks elided).  Summaries are extractive, so building one costs no model
+call and always says the same thing for the same input.
+
+Each summary is cached as JSON next to the data it summarizes, together with
+a digest of the summarized entries; it is rebuilt only when those entries
+change::
+
+    {"digest": "9f86d0...", "entries": 10, "summary": "- king: ...\n- claude: ..."}
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from pathlib import Path
+
+from kingdom.state import flock, read_json, write_json
+
+GIST_CHARS = 200  # max characters kept per entry
+
+CODE_BLOCK = re.compile(r"```.*?(```|$)", re.DOTALL)
+SENTENCE_END = re.compile(r"(?<=[.!?])\s")
+
+
+def gist(text: str, max_chars: int = GIST_CHARS) -> str:
+    """Flatten *text* to one line and keep its opening sentences, up to *max_chars*."""
+    text = CODE_BLOCK.sub(" [code] ", text)
+    # Drop markdown heading, list and quote markers at line starts
+    text = re.sub(r"(?m)^\s*(?:#+|[-*>]|\d+\.)\s+", "", text)
+    text = " ".join(text.split())
+    if len(text) <= max_chars:
+        return text
+
+    cut = text[:max_chars]
+    # Prefer ending on a sentence boundary when one falls in the back half
+    ends = [m.start() for m in SENTENCE_END.finditer(cut)]
+    if ends and ends[-1] >= max_chars // 2:
+        return cut[: ends[-1]]
+    return cut.rstrip() + "…"
+
+
+def summarize_entries(entries: list[tuple[str, str]], max_chars: int = GIST_CHARS) -> str:
+    """One ``- speaker: gist`` line per (speaker, text) entry (``- gist`` when speaker is empty)."""
+    return "\n".join(
+        f"- {speaker}: {gist(text, max_chars)}" if speaker else f"- {gist(text, max_chars)}"
+        for speaker, text in entries
+    )
+
+
+def entries_digest(entries: list[tuple[str, str]]) -> str:
+    digest = hashlib.sha256()
+    for speaker, text in entries:
+        digest.update(speaker.encode())
+        digest.update(b"\0")
+        digest.update(text.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def cached_summary(cache_path: Path, entries: list[tuple[str, str]], max_chars: int = GIST_CHARS) -> str:
+    """Return the summary of *entries*, building and caching it at *cache_path* if stale.
+
+    Safe to call concurrently for the same path (e.g. several council members
+    building their prompts at once).
+    """
+    digest = entries_digest(entries)
+    with flock(cache_path.parent / f".{cache_path.name}.lock"):
+        try:
+            data = read_json(cache_path)
+        except (FileNotFoundError, json.JSONDecodeError):
+            data = {}
+        if data.get("digest") == digest and isinstance(data.get("summary"), str):
+            return data["summary"]
+
+        summary = summarize_entries(entries, max_chars)
+        write_json(cache_path, {"digest": digest, "entries": len(entries), "summary": summary})
+        return summary
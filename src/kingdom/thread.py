@@ -8,6 +8,8 @@ containing:
   - thread.json   — metadata (members, pattern, created_at) [gitignored]
   - 0001-king.md  — sequential message files [tracked]
   - 0002-claude.md
+  - .sessions.json — per-member chat session resume state [gitignored]
+  - .summaries/    — cached summaries of older messages [gitignored]
 
 Message files use YAML frontmatter + markdown body:
     ---
@@ -23,12 +25,22 @@ Message files use YAML frontmatter + markdown body:
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 
+from kingdom.diff import estimate_tokens
 from kingdom.parsing import parse_frontmatter, serialize_yaml_value
-from kingdom.state import branch_root, ensure_dir, normalize_branch_name, read_json, write_json
+from kingdom.state import (
+    branch_root,
+    ensure_dir,
+    locked_json_update,
+    normalize_branch_name,
+    read_json,
+    write_json,
+)
+from kingdom.summary import cached_summary
 
 
 class AmbiguousThreadMatch(Exception):
@@ -498,29 +510,86 @@ def thread_response_status(base: Path, branch: str, thread_id: str) -> ThreadSta
     )
 
 
-def format_thread_history(tdir: Path, target_member: str, suffix: str | None = None) -> str:
+HISTORY_SPAN = 10  # messages per cached summary block (aligned by sequence number)
+
+
+def summary_cache_path(tdir: Path, first: int, last: int) -> Path:
+    return tdir / ".summaries" / f"{first:04d}-{last:04d}.json"
+
+
+def history_speaker(msg: Message) -> str:
+    if msg.to not in ("all", "", "king"):
+        return f"{msg.from_} (to {msg.to})"
+    return msg.from_
+
+
+def summarize_older_messages(tdir: Path, messages: list[Message]) -> list[tuple[int, int, str]]:
+    """Summarize *messages* in blocks of ``HISTORY_SPAN`` sequence numbers.
+
+    Blocks are aligned to sequence numbers (1-10, 11-20, ...) so a finished
+    block keeps the same cache file on every turn and for every member.  A
+    partial last block gets a new cache file as it grows; the one it
+    supersedes is removed so ``.summaries/`` stays one file per block.
+    Returns (first_seq, last_seq, summary) per block, oldest first.
+    """
+    blocks: dict[int, list[Message]] = {}
+    for msg in messages:
+        blocks.setdefault((msg.sequence - 1) // HISTORY_SPAN, []).append(msg)
+
+    summaries = []
+    for block in blocks.values():
+        first, last = block[0].sequence, block[-1].sequence
+        entries = [(history_speaker(msg), msg.body) for msg in block]
+        cache = summary_cache_path(tdir, first, last)
+        summaries.append((first, last, cached_summary(cache, entries)))
+        for stale in cache.parent.glob(f"{first:04d}-*.json"):
+            if stale != cache:
+                stale.unlink(missing_ok=True)
+                (stale.parent / f".{stale.name}.lock").unlink(missing_ok=True)
+    return summaries
+
+
+def read_thread_messages(tdir: Path) -> list[Message]:
+    """Read all finalized messages in *tdir*, sorted by sequence number."""
+    messages: list[Message] = []
+    for path in sorted(tdir.glob("[0-9][0-9][0-9][0-9]-*.md")):
+        try:
+            messages.append(parse_message(path))
+        except (ValueError, FileNotFoundError):
+            continue
+    messages.sort(key=lambda m: m.sequence)
+    return messages
+
+
+def format_thread_history(
+    tdir: Path,
+    target_member: str,
+    suffix: str | None = None,
+    max_tokens: int | None = None,
+    keep_last: int = 8,
+) -> str:
     """Format thread messages as a multi-party conversation prompt.
 
     Reads all finalized messages from *tdir* in sequence order and returns
     a formatted transcript suitable for injecting into an agent prompt.
 
+    With *max_tokens* set and a transcript longer than that, only the last
+    *keep_last* messages are kept verbatim.  Older messages are replaced by
+    cached block summaries (see ``kingdom.summary``), and the oldest
+    summaries are dropped if they still do not fit.
+
     Args:
         tdir: Thread directory path containing NNNN-*.md message files.
         target_member: Name of the member who will receive this prompt.
         suffix: Custom instruction appended after the history block.
             Defaults to "You are {target_member}. Continue the discussion."
+        max_tokens: Estimated token budget for the history; None = unlimited.
+        keep_last: Messages always kept verbatim when the budget applies.
 
     Returns:
         Formatted string with conversation history and instruction suffix.
     """
-    messages: list[Message] = []
-    for path in sorted(tdir.glob("[0-9][0-9][0-9][0-9]-*.md")):
-        try:
-            messages.append(parse_message(path))
-        except (ValueError, FileNotFoundError):
-            continue
-    messages.sort(key=lambda m: m.sequence)
-
+    messages = read_thread_messages(tdir)
     tail = suffix or f"You are {target_member}. Continue the discussion."
 
     if not messages:
@@ -528,19 +597,124 @@ def format_thread_history(tdir: Path, target_member: str, suffix: str | None = N
 
     lines = ["[Previous conversation]", ""]
     for msg in messages:
-        if msg.to not in ("all", "", "king"):
-            header = f"{msg.from_} (to {msg.to}):"
-        else:
-            header = f"{msg.from_}:"
-        lines.append(f"{header} {msg.body}")
+        lines.append(f"{history_speaker(msg)}: {msg.body}")
         lines.append("")
 
     lines.append("---")
     lines.append(tail)
 
+    full = "\n".join(lines)
+    if max_tokens is None or estimate_tokens(full) <= max_tokens or len(messages) <= keep_last:
+        return full
+
+    recent = messages[-keep_last:] if keep_last > 0 else []
+    older = messages[: len(messages) - len(recent)]
+    summaries = summarize_older_messages(tdir, older)
+
+    recent_lines = ["[Recent conversation]", ""]
+    for msg in recent:
+        recent_lines.append(f"{history_speaker(msg)}: {msg.body}")
+        recent_lines.append("")
+    recent_lines.extend(["---", tail])
+
+    def assemble(dropped: int) -> str:
+        parts = ["[Summary of earlier conversation]", ""]
+        if dropped:
+            last_dropped = summaries[dropped - 1][1]
+            parts.extend([f"(Messages up to {last_dropped} omitted — full thread in {tdir})", ""])
+        for first, last, summary in summaries[dropped:]:
+            parts.extend([f"Messages {first}-{last}:", summary, ""])
+        return "\n".join(parts + recent_lines)
+
+    # Drop the oldest summaries until the history fits
+    dropped = 0
+    text = assemble(dropped)
+    while dropped < len(summaries) and estimate_tokens(text) > max_tokens:
+        dropped += 1
+        text = assemble(dropped)
+    return text
+
+
+def format_thread_delta(
+    tdir: Path,
+    target_member: str,
+    seen: int,
+    reply: int | None = None,
+    suffix: str | None = None,
+) -> str:
+    """Format only the thread messages a member has not seen yet.
+
+    Used when the member resumes its own backend session for this thread
+    (see ``member_sessions_path``): the session already holds everything up
+    to sequence *seen* plus the member's own reply at sequence *reply*.
+
+    Args:
+        tdir: Thread directory path containing NNNN-*.md message files.
+        target_member: Name of the member who will receive this prompt.
+        seen: Last sequence number included in the member's previous prompt.
+        reply: Sequence number of the member's previous reply, if any.
+        suffix: Custom instruction appended after the new messages.
+            Defaults to "You are {target_member}. Continue the discussion."
+
+    Returns:
+        Formatted string with the new messages and instruction suffix.
+    """
+    messages = [m for m in read_thread_messages(tdir) if m.sequence > seen and m.sequence != reply]
+    tail = suffix or f"You are {target_member}. Continue the discussion."
+
+    if not messages:
+        return f"---\n{tail}"
+
+    lines = ["[New messages since your last reply]", ""]
+    for msg in messages:
+        lines.append(f"{history_speaker(msg)}: {msg.body}")
+        lines.append("")
+    lines.extend(["---", tail])
     return "\n".join(lines)
 
 
+def member_sessions_path(tdir: Path) -> Path:
+    """Per-thread map of member -> resumable backend session.
+
+    Kept inside the thread directory (not ``sessions/<agent>.json``) so chat
+    sessions never leak into other threads or into peasant/council runs::
+
+        {"claude": {"session_id": "abc123", "seen": 12, "reply": 13}}
+    """
+    return tdir / ".sessions.json"
+
+
+def read_member_session(tdir: Path, member: str) -> dict | None:
+    """Return ``{"session_id", "seen", "reply"}`` for *member*, or None if it has no usable session."""
+    try:
+        entry = read_json(member_sessions_path(tdir)).get(member)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if not isinstance(entry, dict) or not entry.get("session_id") or not isinstance(entry.get("seen"), int):
+        return None
+    return entry
+
+
+def record_member_session(tdir: Path, member: str, session_id: str, seen: int, reply: int | None) -> None:
+    def update(data: dict) -> dict:
+        data[member] = {"session_id": session_id, "seen": seen, "reply": reply}
+        return data
+
+    locked_json_update(member_sessions_path(tdir), update)
+
+
+def clear_member_session(tdir: Path, member: str) -> None:
+    path = member_sessions_path(tdir)
+    if not path.exists():
+        return
+
+    def update(data: dict) -> dict:
+        data.pop(member, None)
+        return data
+
+    locked_json_update(path, update)
+
+
 def list_messages(base: Path, branch: str, thread_id: str) -> list[Message]:
     """List all messages in a thread, in sequential order.
 
@@ -23,13 +23,16 @@ Example ticket file format:
 from __future__ import annotations
 
 import hashlib
+import json
 import os
 import shutil
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
-from kingdom.parsing import parse_frontmatter, serialize_yaml_value
+from kingdom.parsing import parse_frontmatter, parse_yaml_list, serialize_yaml_value
 
 STATUSES = {"open", "in_progress", "in_review", "closed"}
 
@@ -50,9 +53,14 @@ class Ticket:
     body: str = ""
     # Optional fields that may be present in some tickets
     tags: list[str] = field(default_factory=list)
+    paths: list[str] = field(default_factory=list)  # sparse-checkout scope for peasant worktrees
     parent: str | None = None
     external_ref: str | None = None
     duplicate_of: str | None = None
+    # Per-ticket peasant budgets; override peasant.* in config (0 = unlimited)
+    budget_minutes: int | None = None
+    budget_output_tokens: int | None = None
+    budget_cost_usd: float | None = None
 
 
 def clamp_priority(value: int | str | None) -> int:
@@ -65,14 +73,20 @@ def clamp_priority(value: int | str | None) -> int:
     return max(1, min(3, p))
 
 
-def generate_ticket_id(tickets_dir: Path | None = None) -> str:
-    """Generate a unique 4-character hex ticket ID."""
+def generate_ticket_id(tickets_dir: Path | None = None, taken: set[str] | None = None) -> str:
+    """Generate a unique 4-character hex ticket ID.
+
+    IDs in *taken* are avoided too, so a batch can allocate many IDs before
+    any of their files exist.
+    """
     max_attempts = 100
 
     for _ in range(max_attempts):
         entropy = f"{os.getpid()}{datetime.now().timestamp()}{os.urandom(4).hex()}"
         ticket_id = hashlib.sha256(entropy.encode()).hexdigest()[:4]
 
+        if taken is not None and ticket_id in taken:
+            continue
         if tickets_dir is not None and (
             (tickets_dir / f"{ticket_id}.md").exists() or (tickets_dir / f"kin-{ticket_id}.md").exists()
         ):
@@ -91,6 +105,16 @@ def coerce_to_str_list(value: str | int | list[str] | None) -> list[str]:
     return [str(value)]
 
 
+def coerce_to_number(value: str | int | list[str] | None, kind: type[int] | type[float]) -> int | float | None:
+    if value is None or isinstance(value, list):
+        return None
+    try:
+        number = kind(value)
+    except ValueError:
+        return None
+    return number if number >= 0 else None
+
+
 def parse_ticket(content: str) -> Ticket:
     frontmatter_dict, body_content = parse_frontmatter(content)
 
@@ -116,6 +140,7 @@ def parse_ticket(content: str) -> Ticket:
     deps = coerce_to_str_list(frontmatter_dict.get("deps", []))
     links = coerce_to_str_list(frontmatter_dict.get("links", []))
     tags = coerce_to_str_list(frontmatter_dict.get("tags", []))
+    paths = coerce_to_str_list(frontmatter_dict.get("paths", []))
 
     return Ticket(
         id=str(frontmatter_dict.get("id", "")),
@@ -129,9 +154,13 @@ def parse_ticket(content: str) -> Ticket:
         title=title,
         body=body,
         tags=tags,
+        paths=paths,
         parent=str(frontmatter_dict.get("parent")) if frontmatter_dict.get("parent") else None,
         external_ref=(str(frontmatter_dict.get("external-ref")) if frontmatter_dict.get("external-ref") else None),
         duplicate_of=(str(frontmatter_dict.get("duplicate-of")) if frontmatter_dict.get("duplicate-of") else None),
+        budget_minutes=coerce_to_number(frontmatter_dict.get("budget-minutes"), int),
+        budget_output_tokens=coerce_to_number(frontmatter_dict.get("budget-output-tokens"), int),
+        budget_cost_usd=coerce_to_number(frontmatter_dict.get("budget-cost-usd"), float),
     )
 
 
@@ -157,8 +186,16 @@ def serialize_ticket(ticket: Ticket) -> str:
         lines.append(f"parent: {ticket.parent}")
     if ticket.tags:
         lines.append(f"tags: {serialize_yaml_value(ticket.tags)}")
+    if ticket.paths:
+        lines.append(f"paths: {serialize_yaml_value(ticket.paths)}")
     if ticket.duplicate_of:
         lines.append(f"duplicate-of: {ticket.duplicate_of}")
+    if ticket.budget_minutes is not None:
+        lines.append(f"budget-minutes: {ticket.budget_minutes}")
+    if ticket.budget_output_tokens is not None:
+        lines.append(f"budget-output-tokens: {ticket.budget_output_tokens}")
+    if ticket.budget_cost_usd is not None:
+        lines.append(f"budget-cost-usd: {ticket.budget_cost_usd:g}")
 
     lines.append("---")
 
@@ -419,3 +456,176 @@ def get_ticket_location(base: Path, ticket_id: str) -> Path | None:
     if result is None:
         return None
     return result[1]
+
+
+# ---------------------------------------------------------------------------
+# Batch creation
+# ---------------------------------------------------------------------------
+
+BATCH_FIELDS = frozenset(
+    {"ref", "title", "description", "priority", "type", "deps", "acceptance", "assignee", "tags", "paths"}
+)
+DEFAULT_BODY = "## Acceptance Criteria\n\n- [ ]"
+
+
+def parse_ticket_specs(text: str, fmt: str | None = None) -> list[dict[str, Any]]:
+    """Parse ticket specs from JSONL (one object per line) or a YAML list.
+
+    *fmt* is ``"jsonl"`` or ``"yaml"``; when None it is sniffed from the first
+    non-blank character.  A JSON array is accepted as well.
+    """
+    stripped = text.lstrip()
+    if fmt is None:
+        fmt = "jsonl" if stripped[:1] in ("{", "[") else "yaml"
+    if fmt == "yaml":
+        return parse_yaml_list(text)
+    if stripped.startswith("["):
+        try:
+            specs = json.loads(stripped)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"invalid JSON: {exc}") from None
+        if not isinstance(specs, list):
+            raise ValueError("expected a JSON array of ticket objects")
+        return specs
+    specs = []
+    for lineno, line in enumerate(text.splitlines(), 1):
+        if not line.strip():
+            continue
+        try:
+            specs.append(json.loads(line))
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"line {lineno}: invalid JSON: {exc.msg}") from None
+    return specs
+
+
+def find_dependency_cycle(graph: dict[str, list[str]]) -> list[str] | None:
+    """Return a cycle in *graph* as a path ending where it started, or None.
+
+    Edges to nodes outside *graph* are ignored.
+    """
+    state: dict[str, int] = {}  # 1 = on the current path, 2 = done
+    path: list[str] = []
+
+    def visit(node: str) -> list[str] | None:
+        state[node] = 1
+        path.append(node)
+        for dep in graph[node]:
+            if dep not in graph:
+                continue
+            if state.get(dep) == 1:
+                return [*path[path.index(dep) :], dep]
+            if dep not in state and (cycle := visit(dep)):
+                return cycle
+        path.pop()
+        state[node] = 2
+        return None
+
+    for node in graph:
+        if node not in state and (cycle := visit(node)):
+            return cycle
+    return None
+
+
+def batch_body(spec: dict[str, Any]) -> str:
+    """Ticket body from a spec's description and acceptance list."""
+    description = str(spec.get("description") or "").strip()
+    acceptance = coerce_to_str_list(spec.get("acceptance"))
+    if not acceptance:
+        return description or DEFAULT_BODY
+    criteria = []
+    for item in acceptance:
+        item = item.strip()
+        for prefix in ("- ", "[ ] ", "[x] "):
+            item = item.removeprefix(prefix)
+        criteria.append(f"- [ ] {item}")
+    section = "## Acceptance Criteria\n\n" + "\n".join(criteria)
+    return f"{description}\n\n{section}" if description else section
+
+
+def plan_ticket_batch(
+    specs: list[dict[str, Any]],
+    taken: set[str],
+    resolve_dep: Callable[[str], str | None],
+    default_priority: int = 2,
+    default_type: str = "task",
+) -> list[tuple[str, Ticket]]:
+    """Validate *specs* and build their tickets without writing anything.
+
+    Each spec needs a ``title``; ``ref`` names it for other specs' ``deps``
+    (default ``T1``, ``T2``, ... by position).  A dep that is not a ref is
+    looked up with *resolve_dep*, which returns the full ID of an existing
+    ticket or None.  IDs are allocated up front, avoiding *taken*.
+
+    Returns ``(ref, ticket)`` pairs in spec order.
+
+    Raises:
+        ValueError: For malformed specs, duplicate refs, unknown
+            dependencies, or a dependency cycle.
+    """
+    if not specs:
+        raise ValueError("no ticket specs given")
+
+    refs: list[str] = []
+    for n, spec in enumerate(specs, 1):
+        if not isinstance(spec, dict):
+            raise ValueError(f"ticket {n}: expected an object, got {type(spec).__name__}")
+        label = f"ticket {n}"
+        unknown = sorted(set(spec) - BATCH_FIELDS)
+        if unknown:
+            raise ValueError(f"{label}: unknown field(s) {', '.join(unknown)}")
+        if not isinstance(spec.get("title"), str) or not spec["title"].strip():
+            raise ValueError(f"{label}: title is required")
+        priority = spec.get("priority", default_priority)
+        if isinstance(priority, bool) or not isinstance(priority, int) or not 1 <= priority <= 3:
+            raise ValueError(f"{label}: priority must be 1, 2 or 3, got {priority!r}")
+        ref = str(spec.get("ref") or f"T{n}")
+        if ref in refs:
+            raise ValueError(f"{label}: duplicate ref {ref!r}")
+        refs.append(ref)
+
+    allocated: dict[str, str] = {}
+    for ref in refs:
+        ticket_id = generate_ticket_id(taken=taken | set(allocated.values()))
+        allocated[ref] = ticket_id
+
+    graph: dict[str, list[str]] = {}
+    resolved: dict[str, str] = {}
+    for ref, spec in zip(refs, specs, strict=True):
+        deps = []
+        for dep in coerce_to_str_list(spec.get("deps")):
+            if dep in allocated:
+                deps.append(allocated[dep])
+                continue
+            if dep not in resolved:
+                existing = resolve_dep(dep)
+                if existing is None:
+                    raise ValueError(
+                        f"{ref}: unknown dependency {dep!r} (not a ref in this batch or an existing ticket)"
+                    )
+                resolved[dep] = existing
+            deps.append(resolved[dep])
+        graph[ref] = deps
+
+    id_to_ref = {ticket_id: ref for ref, ticket_id in allocated.items()}
+    cycle = find_dependency_cycle({ref: [id_to_ref.get(d, d) for d in deps] for ref, deps in graph.items()})
+    if cycle:
+        raise ValueError(f"dependency cycle: {' -> '.join(cycle)}")
+
+    created = datetime.now(UTC)
+    planned = []
+    for ref, spec in zip(refs, specs, strict=True):
+        ticket = Ticket(
+            id=allocated[ref],
+            status="open",
+            deps=graph[ref],
+            created=created,
+            type=str(spec.get("type") or default_type),
+            priority=spec.get("priority", default_priority),
+            assignee=str(spec["assignee"]) if spec.get("assignee") else None,
+            title=spec["title"].strip(),
+            body=batch_body(spec),
+            tags=coerce_to_str_list(spec.get("tags")),
+            paths=coerce_to_str_list(spec.get("paths")),
+        )
+        planned.append((ref, ticket))
+    return planned
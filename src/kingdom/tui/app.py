@@ -14,27 +14,44 @@ from textual.binding import BindingType
 from textual.containers import VerticalScroll
 from textual.css.query import QueryError
 from textual.message import Message
+from textual.widget import Widget
 from textual.widgets import Static, TextArea
 
 from kingdom.agent import resolve_all_agents
 from kingdom.config import load_config
 from kingdom.council import Council
+from kingdom.council.base import CouncilMember
+from kingdom.thread import Message as ThreadMessage
 from kingdom.thread import (
     add_message,
+    clear_member_session,
+    format_thread_delta,
     format_thread_history,
     get_thread,
     is_error_response,
     is_interrupted_response,
     is_timeout_response,
     list_messages,
+    read_member_session,
+    read_thread_messages,
+    record_member_session,
     thread_dir,
 )
 
-from .poll import NewMessage, StreamDelta, StreamFinished, StreamStarted, ThinkingDelta, ThreadPoller
+from .poll import (
+    NewMessage,
+    StreamDelta,
+    StreamFinished,
+    StreamStarted,
+    ThinkingDelta,
+    ThreadPoller,
+    coalesce_deltas,
+)
 from .widgets import (
     CommandHintBar,
     ErrorPanel,
     MessagePanel,
+    RenderCache,
     StreamingPanel,
     ThinkingPanel,
     WaitingPanel,
@@ -86,6 +103,30 @@ def build_branch_context(base: Path, branch: str) -> str:
     return "\n".join(lines) + "\n\n"
 
 
+def message_panel(
+    sender: str,
+    body: str,
+    sequence: int,
+    member_names: list[str],
+    render_cache: RenderCache | None = None,
+    lazy: bool = False,
+) -> Static:
+    """Build the panel for a thread message: an ErrorPanel for failed responses, else a MessagePanel."""
+    if sender != "king" and is_error_response(body):
+        return ErrorPanel(sender=sender, error=body, timed_out=is_timeout_response(body), id=f"msg-{sequence}")
+    if sender != "king" and is_interrupted_response(body):
+        return ErrorPanel(sender=sender, error=body, timed_out=False, id=f"msg-{sequence}")
+    return MessagePanel(
+        sender=sender,
+        body=body,
+        member_names=member_names,
+        sequence=sequence,
+        render_cache=render_cache,
+        lazy=lazy,
+        id=f"msg-{sequence}",
+    )
+
+
 class MessageLog(VerticalScroll):
     """Scrollable container for chat messages.
 
@@ -95,9 +136,28 @@ class MessageLog(VerticalScroll):
 
     ``is_following`` — True when auto-scroll is active (user is near bottom).
     ``SCROLL_THRESHOLD`` — pixel distance from bottom that counts as "near".
+
+    Thread history is mounted a page at a time: ``load_history`` mounts the
+    newest ``HISTORY_PAGE`` messages and keeps the rest in ``pending``.
+    Scrolling to within ``PAGE_TRIGGER`` lines of the top mounts the previous
+    page above the current content without moving the view.  History panels
+    mount as plain text and render their Markdown only once they come within
+    ``RENDER_MARGIN`` viewport heights of the visible area.  Rendered lines
+    are shared through ``render_cache``, keyed by message sequence and width.
+
+    Message panels (``msg-<sequence>``) and each member's in-flight panels
+    (``wait-``, ``stream-``, ``thinking-`` and ``interrupted-<member>``) are
+    kept in ``panels``, so the poll handlers find them without a CSS query
+    over the whole log.  In-flight panels are added with ``add_panel`` and
+    have no DOM id, so a replacement can be mounted while the old panel is
+    still being removed.  Registered panels must be removed through
+    ``remove_panel`` or ``pop_panel`` to keep the registry in sync.
     """
 
     SCROLL_THRESHOLD: int = 5
+    HISTORY_PAGE: int = 50
+    PAGE_TRIGGER: int = 2
+    RENDER_MARGIN: int = 1
 
     DEFAULT_CSS = """
     MessageLog {
@@ -105,6 +165,14 @@ class MessageLog(VerticalScroll):
     }
     """
 
+    def __init__(self, member_names: list[str] | None = None, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.member_names: list[str] = member_names or []
+        self.render_cache = RenderCache()
+        self.pending: list[ThreadMessage] = []
+        self.loading_page = False
+        self.panels: dict[str, Widget] = {}
+
     @property
     def is_following(self) -> bool:
         """True when the viewport is at or near the bottom.
@@ -125,6 +193,96 @@ class MessageLog(VerticalScroll):
         if self.is_following:
             self.scroll_end(animate=False)
 
+    def panel(self, key: str) -> Widget | None:
+        """Return the panel registered under *key*, if any."""
+        return self.panels.get(key)
+
+    def add_panel(self, key: str, panel: Widget, before: Widget | None = None) -> None:
+        """Register *panel* under *key* and mount it (at the end, or before *before*)."""
+        self.panels[key] = panel
+        if before is not None:
+            self.mount(panel, before=before)
+        else:
+            self.mount(panel)
+
+    def rekey_panel(self, key: str, new_key: str) -> None:
+        """Move the panel registered under *key* to *new_key* (its DOM id is unchanged)."""
+        panel = self.panels.pop(key, None)
+        if panel is not None:
+            self.panels[new_key] = panel
+
+    def pop_panel(self, key: str) -> Widget | None:
+        """Unregister and return the panel under *key*; the caller removes it."""
+        return self.panels.pop(key, None)
+
+    def remove_panel(self, key: str) -> None:
+        panel = self.panels.pop(key, None)
+        if panel is not None:
+            panel.remove()
+
+    def history_panel(self, message: ThreadMessage) -> Static:
+        panel = message_panel(
+            message.from_, message.body, message.sequence, self.member_names, self.render_cache, lazy=True
+        )
+        self.panels[f"msg-{message.sequence}"] = panel
+        return panel
+
+    def load_history(self, messages: list[ThreadMessage]) -> None:
+        """Mount the newest page of *messages*; older ones wait in ``pending``."""
+        self.pending = list(messages[: -self.HISTORY_PAGE])
+        page = messages[-self.HISTORY_PAGE :]
+        self.mount_all([self.history_panel(m) for m in page])
+        self.scroll_end(animate=False)
+        self.call_after_refresh(self.page_loaded)
+
+    def load_older_page(self) -> None:
+        """Mount the previous page of history above the current content."""
+        if not self.pending or self.loading_page:
+            return
+        self.loading_page = True
+        page = self.pending[-self.HISTORY_PAGE :]
+        del self.pending[-self.HISTORY_PAGE :]
+        panels = [self.history_panel(m) for m in page]
+        old_height = self.virtual_size.height
+        if self.children:
+            self.mount_all(panels, before=self.children[0])
+        else:
+            self.mount_all(panels)
+        self.call_after_refresh(self.page_loaded, old_height)
+
+    def page_loaded(self, old_height: int | None = None) -> None:
+        """Keep the view on the same content after a page was mounted above it."""
+        if old_height is not None:
+            self.scroll_to(y=self.scroll_y + self.virtual_size.height - old_height, animate=False)
+        self.loading_page = False
+        self.render_visible()
+        # A page that doesn't fill the viewport can't be scrolled up from
+        if self.pending and self.max_scroll_y <= self.PAGE_TRIGGER:
+            self.load_older_page()
+
+    def render_visible(self) -> None:
+        """Render Markdown for lazy panels within RENDER_MARGIN viewports of the view."""
+        height = self.size.height
+        if not height:
+            return
+        top = self.scroll_offset.y - height * self.RENDER_MARGIN
+        bottom = self.scroll_offset.y + height * (self.RENDER_MARGIN + 1)
+        for child in self.children:
+            region = child.virtual_region
+            if region.y > bottom:
+                break
+            if isinstance(child, MessagePanel) and not child.rendered and region.height and region.bottom >= top:
+                child.render_markdown()
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        if self.loading_page:
+            return
+        if new_value <= self.PAGE_TRIGGER and self.pending:
+            self.load_older_page()
+        else:
+            self.render_visible()
+
 
 class StatusBar(Static):
     """Keybinding hints at the bottom."""
@@ -297,6 +455,10 @@ class ChatApp(App):
         self.muted: set[str] = set()
         self.generation: int = 0
         self.thinking_visibility: str = "auto"
+        self.history_tokens: int | None = None
+        self.history_keep: int = 8
+        self.resume_sessions: bool = True
+        self.status_following: bool | None = None
 
     def compose(self) -> ComposeResult:
         # Load thread metadata for header
@@ -311,7 +473,7 @@ class ChatApp(App):
             f"kd chat · {self.thread_id} · {members_str}",
             id="header-bar",
         )
-        yield MessageLog(id="message-log")
+        yield MessageLog(member_names=self.member_names, id="message-log")
         yield StatusBar("Esc: interrupt/quit · Enter: send · Tab: @complete · Ctrl+T: thinking")
         yield CommandHintBar(id="command-hints")
         yield InputArea(member_names=self.member_names, id="input-area")
@@ -328,6 +490,9 @@ class ChatApp(App):
         # Load config for backends and thinking visibility
         cfg = load_config(self.base)
         self.thinking_visibility = cfg.council.thinking_visibility
+        self.history_tokens = cfg.council.chat_history_tokens or None
+        self.history_keep = cfg.council.chat_history_keep
+        self.resume_sessions = cfg.council.chat_resume
         agent_configs = resolve_all_agents(cfg.agents)
         member_backends = {}
         for name in self.member_names:
@@ -340,9 +505,10 @@ class ChatApp(App):
             member_backends=member_backends,
         )
 
-        # Create Council for direct query dispatch.  Chat is stateless: no
-        # load_sessions, no base/branch on members (prevents PID writes to
-        # shared session files).  Context comes from thread history injection.
+        # Create Council for direct query dispatch.  No load_sessions and no
+        # base/branch on members (prevents PID writes to shared session
+        # files).  Each member resumes its own per-thread session instead
+        # (see run_query).
         self.council = Council.create(base=self.base)
         branch_context = build_branch_context(self.base, self.branch)
         preamble_template = WRITABLE_CHAT_PREAMBLE if self.writable else CHAT_PREAMBLE
@@ -405,11 +571,15 @@ class ChatApp(App):
                 panel.display = True
 
     def update_status_bar(self, log: MessageLog | None = None) -> None:
-        """Update status bar to show scroll state."""
+        """Update status bar to show scroll state (only when it changed)."""
         if log is None:
             log = self.query_one("#message-log", MessageLog)
+        following = log.is_following
+        if following == self.status_following:
+            return
+        self.status_following = following
         bar = self.query_one(StatusBar)
-        if not log.is_following:
+        if not following:
             bar.update("Esc: interrupt/quit · Enter: send · End: jump to bottom · Ctrl+T: thinking")
         else:
             bar.update("Esc: interrupt/quit · Enter: send · Ctrl+T: thinking")
@@ -457,19 +627,14 @@ class ChatApp(App):
             replaced = False
             for prefix in ("wait", "stream", "thinking"):
                 panel_id = f"{prefix}-{member.name}"
-                try:
-                    panel = log.query_one(f"#{panel_id}")
-                    if not replaced:
-                        error_panel = ErrorPanel(
-                            sender=member.name,
-                            error="*Interrupted*",
-                            id=f"interrupted-{member.name}",
-                        )
-                        log.mount(error_panel, before=panel)
-                        replaced = True
-                    panel.remove()
-                except QueryError:
-                    pass
+                panel = log.panel(panel_id)
+                if panel is None:
+                    continue
+                if not replaced:
+                    error_panel = ErrorPanel(sender=member.name, error="*Interrupted*")
+                    log.add_panel(f"interrupted-{member.name}", error_panel, before=panel)
+                    replaced = True
+                log.remove_panel(panel_id)
 
     def load_history(self) -> None:
         """Load existing messages and render them in the message log."""
@@ -482,38 +647,12 @@ class ChatApp(App):
             return
 
         log = self.query_one("#message-log", MessageLog)
-
-        for msg in messages:
-            if msg.from_ != "king" and is_error_response(msg.body):
-                timed_out = is_timeout_response(msg.body)
-                panel = ErrorPanel(
-                    sender=msg.from_,
-                    error=msg.body,
-                    timed_out=timed_out,
-                    id=f"msg-{msg.sequence}",
-                )
-            elif msg.from_ != "king" and is_interrupted_response(msg.body):
-                panel = ErrorPanel(
-                    sender=msg.from_,
-                    error=msg.body,
-                    timed_out=False,
-                    id=f"msg-{msg.sequence}",
-                )
-            else:
-                panel = MessagePanel(
-                    sender=msg.from_,
-                    body=msg.body,
-                    member_names=self.member_names,
-                    id=f"msg-{msg.sequence}",
-                )
-            log.mount(panel)
+        log.load_history(messages)
 
         # Update poller so it doesn't re-report these messages
         if self.poller and messages:
             self.poller.last_sequence = messages[-1].sequence
 
-        log.scroll_end(animate=False)
-
     def on_key(self, event) -> None:
         """Handle Enter to send, let Shift+Enter pass through for newline."""
         if event.key == "enter":
@@ -597,13 +736,13 @@ class ChatApp(App):
             # Broadcast: always query all targets in parallel, then optionally
             # run auto-turn follow-ups (sequential round-robin).
             for name in targets:
-                log.mount(WaitingPanel(sender=name, id=f"wait-{name}"))
+                log.add_panel(f"wait-{name}", WaitingPanel(sender=name))
             prior_messages = list_messages(self.base, self.branch, self.thread_id)
             is_first_exchange = not any(m.from_ != "king" for m in prior_messages)
             self.run_worker(self.run_chat_round(targets, gen, tdir, is_first_exchange), exclusive=False)
         else:
             # Directed: single query, no auto-turns
-            log.mount(WaitingPanel(sender=targets[0], id=f"wait-{targets[0]}"))
+            log.add_panel(f"wait-{targets[0]}", WaitingPanel(sender=targets[0]))
             member = self.council.get_member(targets[0]) if self.council else None
             if member:
                 stream_path = tdir / f".stream-{targets[0]}.jsonl"
@@ -611,23 +750,66 @@ class ChatApp(App):
 
         log.scroll_if_following()
 
+    def build_prompt(self, tdir: Path, member) -> tuple[str, int, str | None]:
+        """Build the next prompt for *member*.
+
+        Returns (prompt, seen, session_id).  With a recorded session for this
+        thread, the prompt holds only the messages the member has not seen and
+        *session_id* is the session to resume; otherwise it is the full
+        (budgeted) thread history and *session_id* is None.  *seen* is the last
+        message sequence covered by the prompt.
+        """
+        messages = read_thread_messages(tdir)
+        seen = messages[-1].sequence if messages else 0
+        session = read_member_session(tdir, member.name) if self.resume_sessions else None
+        if session is not None and session["seen"] <= seen:
+            prompt = format_thread_delta(tdir, member.name, session["seen"], reply=session.get("reply"))
+            return prompt, seen, session["session_id"]
+        prompt = format_thread_history(tdir, member.name, max_tokens=self.history_tokens, keep_last=self.history_keep)
+        return prompt, seen, None
+
     async def run_query(self, member, stream_path: Path, generation: int | None = None) -> None:
-        """Run a member query with full thread context, then persist and clean up.
+        """Run a member query with thread context, then persist and clean up.
+
+        Members resume their own session for this thread and receive only new
+        messages.  If the resumed session fails (expired, deleted, or from an
+        incompatible backend), the query is retried once in a fresh session
+        with the full thread history.
 
         When *generation* is passed, the response is discarded if ``self.generation``
         has moved on (meaning the user sent a new message while this query was in flight).
         """
+        tdir = thread_dir(self.base, self.branch, self.thread_id)
         try:
             timeout = self.council.timeout if self.council else 600
-            tdir = thread_dir(self.base, self.branch, self.thread_id)
-            prompt_with_history = format_thread_history(tdir, member.name)
-            response = await asyncio.to_thread(member.query, prompt_with_history, timeout, stream_path, max_retries=0)
+            prompt, seen, session_id = self.build_prompt(tdir, member)
+            member.session_id = session_id
+            response = await asyncio.to_thread(member.query, prompt, timeout, stream_path, max_retries=0)
+
+            if (
+                session_id is not None
+                and response.error
+                and not self.interrupted
+                and (generation is None or self.generation == generation)
+                and not response.error.startswith(CouncilMember.NON_RETRIABLE_PREFIXES)
+            ):
+                logger.info(
+                    "Resumed session failed for %s, retrying with full history: %s", member.name, response.error
+                )
+                clear_member_session(tdir, member.name)
+                if stream_path.exists():
+                    stream_path.unlink()
+                member.session_id = None
+                prompt, seen, _ = self.build_prompt(tdir, member)
+                response = await asyncio.to_thread(member.query, prompt, timeout, stream_path, max_retries=0)
 
             # Discard stale results when the user has already sent a new message.
             if generation is not None and self.generation != generation:
                 logger.debug(
                     "Discarding stale response from %s (gen %d != %d)", member.name, generation, self.generation
                 )
+                # The backend session holds a reply the thread does not
+                clear_member_session(tdir, member.name)
                 return
 
             # Use cleaner message for interrupted queries with no useful text
@@ -639,17 +821,23 @@ class ChatApp(App):
                 body = response.thread_body()
 
             # Always persist response to thread files (source of truth)
-            add_message(self.base, self.branch, self.thread_id, from_=member.name, to="king", body=body)
+            msg = add_message(self.base, self.branch, self.thread_id, from_=member.name, to="king", body=body)
+
+            if self.resume_sessions and response.session_id and not self.interrupted:
+                record_member_session(tdir, member.name, response.session_id, seen, msg.sequence)
+            else:
+                clear_member_session(tdir, member.name)
 
         except (OSError, RuntimeError, ValueError) as exc:
             # Persist the exception as an error message
             logger.exception("Member query failed for %s", member.name)
             error_body = f"*Error: {exc}*"
             add_message(self.base, self.branch, self.thread_id, from_=member.name, to="king", body=error_body)
+            clear_member_session(tdir, member.name)
         finally:
-            # Chat is stateless — clear session_id so the next query doesn't
-            # pass --resume to the agent.  Thread history injection provides
-            # full context; accumulating session_id causes cross-talk (0f27).
+            # The session to resume lives in the thread's session map, not on
+            # the member — never carry a session_id into another query, which
+            # caused cross-talk through shared session state (0f27).
             member.session_id = None
 
             # Optionally preserve raw stream events for debugging.
@@ -729,7 +917,7 @@ class ChatApp(App):
                 # Mount WaitingPanel for this member's turn
                 log = self.query_one("#message-log", MessageLog)
                 self.remove_member_panels(log, name)
-                log.mount(WaitingPanel(sender=name, id=f"wait-{name}"))
+                log.add_panel(f"wait-{name}", WaitingPanel(sender=name))
                 log.scroll_if_following()
                 stream_path = tdir / f".stream-{name}.jsonl"
                 await self.run_query(member, stream_path, generation=generation)
@@ -738,8 +926,7 @@ class ChatApp(App):
     def remove_member_panels(self, log: MessageLog, name: str) -> None:
         """Remove any existing wait/stream/thinking/interrupted panels for a member."""
         for prefix in ("wait", "stream", "thinking", "interrupted"):
-            for panel in list(log.query(f"#{prefix}-{name}")):
-                panel.remove()
+            log.remove_panel(f"{prefix}-{name}")
 
     def parse_targets(self, text: str) -> list[str]:
         """Parse @mentions from text to determine query targets.
@@ -864,7 +1051,13 @@ class ChatApp(App):
     # -- Polling ----------------------------------------------------------
 
     def poll_updates(self) -> None:
-        """Called every 100ms to check for new data."""
+        """Called every 100ms to check for new data.
+
+        All events from one poll are applied inside a single batch update, so
+        the screen is laid out and repainted once per poll rather than once
+        per event.  Stream and thinking deltas carry the full text so far, so
+        only the last delta of each kind per member is applied.
+        """
         if self.poller is None:
             return
 
@@ -874,130 +1067,82 @@ class ChatApp(App):
 
         log = self.query_one("#message-log", MessageLog)
 
-        for event in events:
-            if isinstance(event, NewMessage):
-                self.handle_new_message(log, event)
-            elif isinstance(event, StreamStarted):
-                self.handle_stream_started(log, event)
-            elif isinstance(event, ThinkingDelta):
-                self.handle_thinking_delta(log, event)
-            elif isinstance(event, StreamDelta):
-                self.handle_stream_delta(log, event)
-            elif isinstance(event, StreamFinished):
-                self.handle_stream_finished(event)
+        with self.batch_update():
+            for event in coalesce_deltas(events):
+                if isinstance(event, NewMessage):
+                    self.handle_new_message(log, event)
+                elif isinstance(event, StreamStarted):
+                    self.handle_stream_started(log, event)
+                elif isinstance(event, ThinkingDelta):
+                    self.handle_thinking_delta(log, event)
+                elif isinstance(event, StreamDelta):
+                    self.handle_stream_delta(log, event)
+                elif isinstance(event, StreamFinished):
+                    self.handle_stream_finished(log, event)
 
-        log.scroll_if_following()
+            log.scroll_if_following()
 
-        # Update status bar to reflect scroll state
-        self.update_status_bar(log)
+            # Update status bar to reflect scroll state
+            self.update_status_bar(log)
 
     def handle_new_message(self, log: MessageLog, event: NewMessage) -> None:
         """Replace waiting/streaming/thinking/interrupted panel in-place with a finalized message."""
-        waiting_id = f"wait-{event.sender}"
-        streaming_id = f"stream-{event.sender}"
-        thinking_id = f"thinking-{event.sender}"
-        interrupted_id = f"interrupted-{event.sender}"
-        existing = (
-            list(log.query(f"#{waiting_id}"))
-            + list(log.query(f"#{streaming_id}"))
-            + list(log.query(f"#{interrupted_id}"))
-        )
+        existing = [
+            panel
+            for key in (f"wait-{event.sender}", f"stream-{event.sender}", f"interrupted-{event.sender}")
+            if (panel := log.pop_panel(key)) is not None
+        ]
 
         # Handle thinking panel persistence
-        thinking_panels = list(log.query(f"#{thinking_id}"))
-        if thinking_panels:
-            thinking_panel = thinking_panels[0]
+        thinking_key = f"thinking-{event.sender}"
+        thinking_panel = log.panel(thinking_key)
+        if thinking_panel is not None:
             if self.thinking_visibility == "auto":
                 thinking_panel.collapse()
-            thinking_panel.id = f"thinking-{event.sender}-{event.sequence}"
-
-        # Detect error/interrupted responses from thread message body
-        if event.sender != "king" and is_error_response(event.body):
-            timed_out = is_timeout_response(event.body)
-            panel = ErrorPanel(
-                sender=event.sender,
-                error=event.body,
-                timed_out=timed_out,
-                id=f"msg-{event.sequence}",
-            )
-        elif event.sender != "king" and is_interrupted_response(event.body):
-            panel = ErrorPanel(
-                sender=event.sender,
-                error=event.body,
-                timed_out=False,
-                id=f"msg-{event.sequence}",
-            )
-        else:
-            panel = MessagePanel(
-                sender=event.sender,
-                body=event.body,
-                member_names=self.member_names,
-                id=f"msg-{event.sequence}",
-            )
-
-        if existing:
-            log.mount(panel, before=existing[0])
-            for w in existing:
-                w.remove()
-        else:
-            log.mount(panel)
+            log.rekey_panel(thinking_key, f"{thinking_key}-{event.sequence}")
+
+        panel = message_panel(event.sender, event.body, event.sequence, self.member_names, log.render_cache)
+        log.add_panel(f"msg-{event.sequence}", panel, before=existing[0] if existing else None)
+        for w in existing:
+            w.remove()
 
     def handle_stream_started(self, log: MessageLog, event: StreamStarted) -> None:
         """Replace waiting panel in-place with streaming panel."""
-        waiting_id = f"wait-{event.member}"
-        streaming_id = f"stream-{event.member}"
+        key = f"stream-{event.member}"
+        existing = [panel for k in (f"wait-{event.member}", key) if (panel := log.pop_panel(k)) is not None]
 
-        existing = list(log.query(f"#{waiting_id}")) + list(log.query(f"#{streaming_id}"))
-
-        panel = StreamingPanel(sender=event.member, id=streaming_id)
-        if existing:
-            log.mount(panel, before=existing[0])
-            for w in existing:
-                w.remove()
-        else:
-            log.mount(panel)
+        log.add_panel(key, StreamingPanel(sender=event.member), before=existing[0] if existing else None)
+        for w in existing:
+            w.remove()
 
     def handle_thinking_delta(self, log: MessageLog, event: ThinkingDelta) -> None:
         """Show or update a ThinkingPanel for this member."""
         if self.thinking_visibility == "hide":
             return
 
-        panel_id = f"thinking-{event.member}"
-        existing = list(log.query(f"#{panel_id}"))
-        if existing:
-            panel = existing[0]
-            panel.update_thinking(event.full_text)
+        key = f"thinking-{event.member}"
+        existing = log.panel(key)
+        if existing is not None:
+            existing.update_thinking(event.full_text)
             return
 
-        panel = ThinkingPanel(sender=event.member, id=panel_id)
-        stream_id = f"stream-{event.member}"
-        wait_id = f"wait-{event.member}"
-        anchor = list(log.query(f"#{stream_id}")) + list(log.query(f"#{wait_id}"))
-        if anchor:
-            log.mount(panel, before=anchor[0])
-        else:
-            log.mount(panel)
+        panel = ThinkingPanel(sender=event.member)
+        anchor = log.panel(f"stream-{event.member}") or log.panel(f"wait-{event.member}")
+        log.add_panel(key, panel, before=anchor)
         panel.update_thinking(event.full_text)
 
     def handle_stream_delta(self, log: MessageLog, event: StreamDelta) -> None:
         """Update the streaming panel with new text. Auto-collapse thinking."""
         # Auto-collapse thinking panel on first answer token
         if self.thinking_visibility == "auto":
-            thinking_id = f"thinking-{event.member}"
-            panels = list(log.query(f"#{thinking_id}"))
-            if panels:
-                thinking_panel = panels[0]
+            thinking_panel = log.panel(f"thinking-{event.member}")
+            if thinking_panel is not None:
                 thinking_panel.collapse()
 
-        panel_id = f"stream-{event.member}"
-        panels = list(log.query(f"#{panel_id}"))
-        if panels:
-            panel = panels[0]
+        panel = log.panel(f"stream-{event.member}")
+        if panel is not None:
             panel.update_content(event.full_text)
 
-    def handle_stream_finished(self, event: StreamFinished) -> None:
+    def handle_stream_finished(self, log: MessageLog, event: StreamFinished) -> None:
         """Remove the streaming panel (finalized message replaces it)."""
-        panel_id = f"stream-{event.member}"
-        panels = list(self.query(f"#{panel_id}"))
-        if panels:
-            panels[0].remove()
+        log.remove_panel(f"stream-{event.member}")
@@ -58,6 +58,29 @@ class StreamFinished:
 PollEvent = NewMessage | StreamStarted | StreamDelta | ThinkingDelta | StreamFinished
 
 
+def coalesce_deltas(events: list[PollEvent]) -> list[PollEvent]:
+    """Drop stream and thinking deltas that a later delta of the same kind supersedes.
+
+    Deltas carry the accumulated text, so only the last one per member
+    matters, unless another event for that member comes in between.  Order
+    is otherwise preserved.
+    """
+    kept: list[PollEvent | None] = []
+    latest: dict[tuple[type, str], int] = {}
+    for event in events:
+        if isinstance(event, StreamDelta | ThinkingDelta):
+            key = (type(event), event.member)
+            if key in latest:
+                kept[latest[key]] = None
+            latest[key] = len(kept)
+        else:
+            member = event.sender if isinstance(event, NewMessage) else event.member
+            latest.pop((StreamDelta, member), None)
+            latest.pop((ThinkingDelta, member), None)
+        kept.append(event)
+    return [event for event in kept if event is not None]
+
+
 # ---------------------------------------------------------------------------
 # ThreadPoller
 # ---------------------------------------------------------------------------
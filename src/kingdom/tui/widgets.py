@@ -1,6 +1,7 @@
 """Chat message widgets for the TUI.
 
 MessagePanel — finalized message (king or member), rendered as Markdown.
+RenderCache — rendered message lines keyed by (sequence, width).
 StreamingPanel — in-progress response, updates as tokens arrive.
 WaitingPanel — placeholder before streaming starts.
 ErrorPanel — error or timeout display.
@@ -13,10 +14,12 @@ from __future__ import annotations
 import re
 import subprocess
 import time
+from collections import OrderedDict
 
 from rich.markdown import Markdown as RichMarkdown
 from rich.segment import Segment
 from rich.style import Style
+from rich.text import Text
 from textual.message import Message
 from textual.widgets import Static
 
@@ -169,11 +172,69 @@ class ColoredMentionMarkdown:
                     yield Segment(part, style)
 
 
+RENDER_CACHE_SIZE = 1024
+
+
+class RenderCache:
+    """LRU cache of rendered message lines keyed by ``(sequence, width)``.
+
+    Parsing and rendering Markdown is the expensive part of showing a
+    message.  Textual re-renders a panel on every resize and re-layout, and
+    panels paged back into the log render again from scratch, so the lines
+    are kept here and reused while the width is unchanged.
+    """
+
+    def __init__(self, max_entries: int = RENDER_CACHE_SIZE) -> None:
+        self.max_entries = max_entries
+        self.entries: OrderedDict[tuple[int, int], list[list[Segment]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: tuple[int, int]) -> list[list[Segment]] | None:
+        lines = self.entries.get(key)
+        if lines is not None:
+            self.entries.move_to_end(key)
+        return lines
+
+    def put(self, key: tuple[int, int], lines: list[list[Segment]]) -> None:
+        self.entries[key] = lines
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+
+class CachedRender:
+    """Rich renderable that renders *renderable* once per width via a RenderCache."""
+
+    def __init__(self, renderable, cache: RenderCache, sequence: int) -> None:
+        self.renderable = renderable
+        self.cache = cache
+        self.sequence = sequence
+
+    def __rich_console__(self, console, options):
+        key = (self.sequence, options.max_width)
+        lines = self.cache.get(key)
+        if lines is None:
+            lines = console.render_lines(self.renderable, options.update(height=None), pad=False)
+            self.cache.put(key, lines)
+        newline = Segment.line()
+        for i, line in enumerate(lines):
+            if i:
+                yield newline
+            yield from line
+
+
 class MessagePanel(Static):
     """A finalized message rendered as Markdown inside a bordered panel.
 
     Click on a council member's message to reply (prefills input with quote
     and @mention).  Shift+click copies the message to the clipboard.
+
+    With ``lazy=True`` the panel mounts showing its plain body and only
+    renders Markdown when :meth:`render_markdown` is called (MessageLog does
+    this once the panel comes near the viewport).  Panels with a
+    ``sequence`` and ``render_cache`` share rendered lines via the cache.
     """
 
     class Reply(Message):
@@ -196,11 +257,24 @@ class MessagePanel(Static):
     }
     """
 
-    def __init__(self, sender: str, body: str, member_names: list[str] | None = None, **kwargs) -> None:
+    def __init__(
+        self,
+        sender: str,
+        body: str,
+        member_names: list[str] | None = None,
+        sequence: int | None = None,
+        render_cache: RenderCache | None = None,
+        lazy: bool = False,
+        **kwargs,
+    ) -> None:
         super().__init__(**kwargs)
         self.sender = sender
         self.body = body
         self.member_names: list[str] = member_names or []
+        self.sequence = sequence
+        self.render_cache = render_cache
+        self.lazy = lazy
+        self.rendered = False
 
     def compose_text(self) -> str:
         """Format the display text (sender shown in border title, not body)."""
@@ -214,10 +288,24 @@ class MessagePanel(Static):
             self.styles.border = ("round", color)
             self.border_title = self.sender
             self.border_subtitle = "click: reply \u00b7 shift: copy"
+        if self.lazy:
+            # Plain text keeps the panel roughly the right height until it is rendered
+            self.update(Text(self.compose_text()))
+        else:
+            self.render_markdown()
+
+    def render_markdown(self) -> None:
+        """Render the body as Markdown (no-op once rendered)."""
+        if self.rendered:
+            return
+        self.rendered = True
         if self.member_names:
-            self.update(ColoredMentionMarkdown(self.compose_text(), self.member_names))
+            renderable = ColoredMentionMarkdown(self.compose_text(), self.member_names)
         else:
-            self.update(RichMarkdown(self.compose_text()))
+            renderable = RichMarkdown(self.compose_text())
+        if self.render_cache is not None and self.sequence is not None:
+            renderable = CachedRender(renderable, self.render_cache, self.sequence)
+        self.update(renderable)
 
     def on_click(self, event) -> None:
         """Handle click: reply (default) or copy (shift)."""
@@ -0,0 +1,159 @@
+"""Token and prompt-cache usage log for agent calls.
+
+Every council query and peasant iteration whose backend reports usage
+appends one record to ``.kd/usage.jsonl``::
+
+    {
+        "ts": "2026-01-01T12:00:00+00:00",
+        "source": "council",
+        "agent": "claude",
+        "input_tokens": 12,
+        "output_tokens": 350,
+        "cache_read_tokens": 14000,
+        "cache_write_tokens": 900,
+        "cost_usd": 0.0123,
+        "elapsed": 41.2
+    }
+
+Peasant records also carry ``"ticket"``.  ``kd council stats`` aggregates
+the log per source and agent to show prompt-cache hit ratios.
+
+Like the event log (:mod:`kingdom.logstore`), the file is rotated once it
+grows past ``MAX_BYTES``: it is gzipped to ``usage-<rotation time>.jsonl.gz``
+and only the newest ``KEEP_SEGMENTS`` segments are kept.  :func:`read_usage`
+reads the kept segments before the active file.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+from kingdom.agent import TokenUsage
+from kingdom.logstore import SEGMENT_TIME_FORMAT
+from kingdom.state import append_jsonl, flock, state_root
+
+MAX_BYTES = 5_000_000
+KEEP_SEGMENTS = 5
+
+
+@dataclass
+class UsageTotals:
+    """Summed usage over a group of calls."""
+
+    calls: int = 0
+    usage: TokenUsage = field(default_factory=TokenUsage)
+
+
+def usage_path(base: Path) -> Path:
+    return state_root(base) / "usage.jsonl"
+
+
+def usage_segments(path: Path) -> list[Path]:
+    """Rotated segments of the usage log at *path*, oldest first."""
+    return sorted(path.parent.glob(f"{path.stem}-*.jsonl.gz"), key=lambda p: p.name)
+
+
+def rotate_usage(path: Path, keep: int = KEEP_SEGMENTS) -> Path:
+    """Gzip *path* into a segment and prune all but the newest *keep*.
+
+    Callers must hold the log's lock.
+    """
+    stamp = datetime.now(UTC).strftime(SEGMENT_TIME_FORMAT)
+    segment = path.with_name(f"{path.stem}-{stamp}.jsonl.gz")
+    tmp = segment.with_name(f"{segment.name}.tmp")
+    with path.open("rb") as src, gzip.open(tmp, "wb") as dst:
+        dst.writelines(src)
+    os.replace(tmp, segment)
+    path.unlink()
+    if keep:
+        for old in usage_segments(path)[:-keep]:
+            old.unlink(missing_ok=True)
+    return segment
+
+
+def record_usage(
+    path: Path,
+    source: str,
+    agent: str,
+    usage: TokenUsage,
+    elapsed: float = 0.0,
+    max_bytes: int = MAX_BYTES,
+    **extra: str,
+) -> None:
+    """Append one usage record to *path*, rotating it first if it is full."""
+    record = {
+        "ts": datetime.now(UTC).isoformat(),
+        "source": source,
+        "agent": agent,
+        "input_tokens": usage.input_tokens,
+        "output_tokens": usage.output_tokens,
+        "cache_read_tokens": usage.cache_read_tokens,
+        "cache_write_tokens": usage.cache_write_tokens,
+        "cost_usd": round(usage.cost_usd, 6),
+        "elapsed": round(elapsed, 2),
+        **extra,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with flock(path.with_name(f".{path.name}.lock")):
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        if size and size > max_bytes:
+            rotate_usage(path)
+        append_jsonl(path, record)
+
+
+def read_usage(path: Path) -> list[dict]:
+    """Read all usage records, rotated segments first, skipping malformed lines."""
+    lines: list[str] = []
+    for segment in usage_segments(path):
+        try:
+            with gzip.open(segment, "rt", encoding="utf-8") as handle:
+                lines.extend(handle.read().splitlines())
+        except (OSError, EOFError):
+            continue
+    if path.exists():
+        lines.extend(path.read_text(encoding="utf-8").splitlines())
+    records = []
+    for line in lines:
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(record, dict):
+            records.append(record)
+    return records
+
+
+def record_tokens(record: dict) -> TokenUsage:
+    def number(key: str) -> int:
+        value = record.get(key, 0)
+        return value if isinstance(value, int) else 0
+
+    cost = record.get("cost_usd", 0.0)
+    return TokenUsage(
+        input_tokens=number("input_tokens"),
+        output_tokens=number("output_tokens"),
+        cache_read_tokens=number("cache_read_tokens"),
+        cache_write_tokens=number("cache_write_tokens"),
+        cost_usd=float(cost) if isinstance(cost, int | float) else 0.0,
+    )
+
+
+def summarize_usage(records: list[dict], source: str | None = None) -> dict[tuple[str, str], UsageTotals]:
+    """Sum *records* per (source, agent), optionally only for one *source*."""
+    totals: dict[tuple[str, str], UsageTotals] = {}
+    for record in records:
+        if source is not None and record.get("source") != source:
+            continue
+        key = (str(record.get("source", "")), str(record.get("agent", "")))
+        group = totals.setdefault(key, UsageTotals())
+        group.calls += 1
+        group.usage.add(record_tokens(record))
+    return dict(sorted(totals.items()))
@@ -0,0 +1,210 @@
+"""Shared verification runs for peasant work, cached by tree SHA.
+
+With ``peasant.verify_command`` set (e.g. ``"uv run pytest -q && uv run ruff check"``),
+the harness runs the command itself when a peasant reports DONE, instead of
+every council member re-running the suite on the same code.
+
+Results are keyed by the SHA of the worktree's content as ``git write-tree``
+sees it — computed through a temporary index, so the worktree's real index is
+never touched — and cached in ``.kd/verify/<tree>.json``::
+
+    {
+        "tree": "4b825d...",
+        "command": "uv run pytest -q",
+        "returncode": 0,
+        "seconds": 12.4,
+        "output": "...",
+        "finished_at": "2026-01-01T12:00:00+00:00"
+    }
+
+The same tree is never verified twice with the same command.  Kingdom state
+under ``.kd/`` is left out of the tree, so worklog and status updates in hand
+mode do not invalidate the cache.
+
+The command runs in its own process group.  On timeout the whole group gets
+SIGTERM, then SIGKILL after ``KILL_GRACE`` seconds, so nothing it started
+keeps running in the worktree while the council reviews it.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import shutil
+import signal
+import subprocess
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+from kingdom.git import git_session
+from kingdom.state import flock, read_json, state_root, write_json
+
+OUTPUT_LIMIT = 20000  # chars of combined output kept in the cache
+KILL_GRACE = 5.0  # seconds between SIGTERM and SIGKILL for a timed-out command
+
+
+@dataclass
+class VerifyResult:
+    """Outcome of one verification command on one tree."""
+
+    tree: str
+    command: str
+    returncode: int | None  # None when the command timed out
+    seconds: float
+    output: str = ""
+    cached: bool = False
+
+    @property
+    def passed(self) -> bool:
+        return self.returncode == 0
+
+
+def verify_root(base: Path) -> Path:
+    return state_root(base) / "verify"
+
+
+def verify_cache_path(base: Path, tree: str) -> Path:
+    return verify_root(base) / f"{tree}.json"
+
+
+def write_tree(worktree: Path, timeout: float = 60) -> str | None:
+    """Return the tree SHA of the worktree's current content, including uncommitted and untracked files.
+
+    Stages everything into a copy of the index (``GIT_INDEX_FILE``) and runs
+    ``git write-tree`` on it.  Returns None if git fails.
+    """
+    git = git_session(worktree)
+    try:
+        result = git.run("rev-parse", "--git-path", "index", timeout=10)
+        if result.returncode != 0:
+            return None
+        index = Path(result.stdout.strip())
+        if not index.is_absolute():
+            index = worktree / index
+
+        with tempfile.TemporaryDirectory(prefix="kd-verify-") as tmp:
+            tmp_index = Path(tmp) / "index"
+            if index.exists():
+                # Start from the real index so unchanged files keep their stat cache
+                shutil.copyfile(index, tmp_index)
+            env = {"GIT_INDEX_FILE": str(tmp_index)}
+            added = git.run("add", "-A", "--", ".", ":(exclude).kd", timeout=timeout, env=env)
+            if added.returncode != 0:
+                return None
+            tree = git.run("write-tree", timeout=timeout, env=env)
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        return None
+    if tree.returncode != 0:
+        return None
+    return tree.stdout.strip() or None
+
+
+def read_cached_result(base: Path, tree: str, command: str) -> VerifyResult | None:
+    """Return the cached result for *tree*, if it was produced by *command*."""
+    try:
+        data = read_json(verify_cache_path(base, tree))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if data.get("command") != command:
+        return None
+    return VerifyResult(
+        tree=tree,
+        command=command,
+        returncode=data.get("returncode"),
+        seconds=data.get("seconds", 0.0),
+        output=data.get("output", ""),
+        cached=True,
+    )
+
+
+def kill_process_group(proc: subprocess.Popen, grace: float = KILL_GRACE) -> tuple[str, str]:
+    """SIGTERM *proc*'s process group, SIGKILL it after *grace* seconds; returns the collected output."""
+    with contextlib.suppress(OSError):
+        os.killpg(proc.pid, signal.SIGTERM)
+    try:
+        return proc.communicate(timeout=grace)
+    except subprocess.TimeoutExpired:
+        with contextlib.suppress(OSError):
+            os.killpg(proc.pid, signal.SIGKILL)
+        return proc.communicate()
+
+
+def run_verification(base: Path, worktree: Path, command: str, timeout: int) -> VerifyResult | None:
+    """Run *command* in *worktree* once per tree SHA and return the result.
+
+    Concurrent callers on the same tree wait for the first run and reuse its
+    result.  Timed-out runs are returned but not cached.  Returns None when
+    the tree SHA cannot be computed.
+    """
+    tree = write_tree(worktree)
+    if tree is None:
+        return None
+
+    with flock(verify_root(base) / f".{tree}.lock"):
+        cached = read_cached_result(base, tree, command)
+        if cached is not None:
+            return cached
+
+        started = time.monotonic()
+        proc = subprocess.Popen(
+            command,
+            shell=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            cwd=worktree,
+            stdin=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+            returncode: int | None = proc.returncode
+            output = stdout + stderr
+        except subprocess.TimeoutExpired:
+            stdout, stderr = kill_process_group(proc)
+            returncode = None
+            output = stdout + stderr + f"\n(verification timed out after {timeout}s)"
+        seconds = time.monotonic() - started
+
+        result = VerifyResult(
+            tree=tree,
+            command=command,
+            returncode=returncode,
+            seconds=seconds,
+            output=output[-OUTPUT_LIMIT:],
+        )
+        if returncode is not None:
+            write_json(
+                verify_cache_path(base, tree),
+                {
+                    "tree": tree,
+                    "command": command,
+                    "returncode": returncode,
+                    "seconds": round(seconds, 2),
+                    "output": result.output,
+                    "finished_at": datetime.now(UTC).isoformat(),
+                },
+            )
+        return result
+
+
+def format_verification(result: VerifyResult, max_lines: int = 40) -> str:
+    """Summarize a verification result for a prompt: status line plus the output tail."""
+    if result.returncode is None:
+        status = "TIMED OUT"
+    elif result.passed:
+        status = "passed"
+    else:
+        status = f"FAILED (exit {result.returncode})"
+    summary = f"`{result.command}` {status} in {result.seconds:.1f}s on tree {result.tree[:12]}"
+    if result.cached:
+        summary += " (cached)"
+
+    tail = result.output.strip().splitlines()[-max_lines:]
+    if not tail:
+        return summary
+    return "\n".join([summary, "", "```", *tail, "```"])
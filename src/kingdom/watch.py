@@ -0,0 +1,497 @@
+"""Follow council threads, work threads and peasant logs from one event loop.
+
+``kd watch --all`` uses a single :class:`Watcher` over a branch.  The watcher
+registers one directory watch per source with a notifier:
+
+- the threads root, and each council or work thread directory in it
+- the sessions directory, for peasant status changes
+- the logs root, and each ``peasant-<ticket>/`` log directory in it
+
+It then turns the changed paths the notifier reports into events (plain
+dicts, so ``--json`` can print them as NDJSON)::
+
+    {"type": "message", "thread": "council-x1", "sequence": 4, "from": "codex", "to": "king", "body": "..."}
+    {"type": "stream", "thread": "council-x1", "member": "claude", "chars": 812, "text": "new text"}
+    {"type": "log", "peasant": "peasant-a1b2", "ticket": "a1b2", "stream": "stdout", "line": "..."}
+    {"type": "status", "peasant": "peasant-a1b2", "ticket": "a1b2", "status": "working", "pid": 4242}
+
+On Linux the notifier is inotify, called through ctypes, so there is no
+extra dependency and no polling.  Elsewhere, or when inotify is unavailable
+(e.g. the watch limit is reached), :class:`PollingNotifier` compares
+directory snapshots instead.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Protocol
+
+from rich.table import Table
+
+from kingdom.state import logs_root, read_json, sessions_root, threads_root
+from kingdom.thread import parse_message, read_thread_meta
+from kingdom.tui.poll import NewMessage, StreamDelta, StreamFinished, StreamStarted, ThreadPoller
+
+# inotify(7) constants
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_IGNORED = 0x00008000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+POLL_INTERVAL = 0.5
+READ_SIZE = 64 * 1024
+WATCHED_PATTERNS = ("council", "work")
+LOG_FILES = ("stdout.log", "stderr.log")
+
+Event = dict[str, Any]
+
+
+class Notifier(Protocol):
+    def add(self, path: Path) -> None: ...
+
+    def wait(self, timeout: float) -> set[Path]: ...
+
+    def close(self) -> None: ...
+
+
+class InotifyNotifier:
+    """Directory watches through the inotify syscalls.
+
+    :meth:`wait` returns the paths of the entries that changed in any
+    watched directory.
+    """
+
+    def __init__(self) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self.libc = libc
+        self.fd = fd
+        self.dirs: dict[int, Path] = {}
+        self.watched: set[Path] = set()
+
+    def add(self, path: Path) -> None:
+        if path in self.watched:
+            return
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err in (errno.ENOENT, errno.ENOTDIR):
+                return
+            raise OSError(err, os.strerror(err), str(path))
+        self.dirs[wd] = path
+        self.watched.add(path)
+
+    def wait(self, timeout: float) -> set[Path]:
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self.fd, READ_SIZE)
+        except BlockingIOError:
+            return set()
+
+        changed: set[Path] = set()
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+            directory = self.dirs.get(wd)
+            if directory is None:
+                continue
+            if mask & IN_IGNORED:  # directory was deleted
+                del self.dirs[wd]
+                self.watched.discard(directory)
+                continue
+            changed.add(directory / os.fsdecode(name) if name else directory)
+        return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PollingNotifier:
+    """Fallback notifier that diffs directory snapshots every *interval* seconds."""
+
+    def __init__(self, interval: float = POLL_INTERVAL) -> None:
+        self.interval = interval
+        self.dirs: set[Path] = set()
+        self.snapshot: dict[Path, tuple[int, int]] = {}
+
+    def scan(self, directory: Path) -> dict[Path, tuple[int, int]]:
+        entries: dict[Path, tuple[int, int]] = {}
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    with contextlib.suppress(OSError):
+                        st = entry.stat()
+                        entries[Path(entry.path)] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            pass
+        return entries
+
+    def add(self, path: Path) -> None:
+        if path not in self.dirs:
+            self.dirs.add(path)
+            self.snapshot.update(self.scan(path))
+
+    def wait(self, timeout: float) -> set[Path]:
+        time.sleep(min(timeout, self.interval))
+        current: dict[Path, tuple[int, int]] = {}
+        for directory in list(self.dirs):
+            current.update(self.scan(directory))
+        changed = {
+            path for path in current.keys() | self.snapshot.keys() if current.get(path) != self.snapshot.get(path)
+        }
+        self.snapshot = current
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+def open_notifier(poll: bool = False) -> Notifier:
+    """Return an inotify notifier where available, else a polling one."""
+    if not poll and sys.platform.startswith("linux"):
+        try:
+            return InotifyNotifier()
+        except (OSError, AttributeError):
+            pass
+    return PollingNotifier()
+
+
+def now_iso() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+def max_sequence(tdir: Path) -> int:
+    """Highest message sequence number in a thread directory."""
+    highest = 0
+    for path in tdir.glob("[0-9][0-9][0-9][0-9]-*.md"):
+        with contextlib.suppress(ValueError):
+            highest = max(highest, int(path.name[:4]))
+    return highest
+
+
+def message_recipient(path: Path) -> str:
+    """The ``to:`` field of a message file, or "" if it can't be read."""
+    try:
+        return parse_message(path).to
+    except (OSError, ValueError):
+        return ""
+
+
+class Watcher:
+    """Turns file changes under a branch into watch events.
+
+    *threads* limits the watcher to those thread IDs.  By default every
+    council and work thread is followed, including ones created later.
+    Only changes made after :meth:`start` are reported as messages and log
+    lines.  Streams in progress and the status of each peasant are reported
+    at start.
+    """
+
+    def __init__(
+        self,
+        base: Path,
+        branch: str,
+        threads: set[str] | None = None,
+        member_backends: dict[str, str] | None = None,
+    ) -> None:
+        self.threads_dir = threads_root(base, branch)
+        self.sessions_dir = sessions_root(base, branch)
+        self.logs_dir = logs_root(base, branch)
+        self.thread_filter = threads
+        self.member_backends = member_backends or {}
+        self.pollers: dict[str, ThreadPoller] = {}
+        self.ignored: set[str] = set()  # threads with another pattern
+        self.log_offsets: dict[Path, int] = {}
+        self.log_partial: dict[Path, str] = {}
+        self.peasants: dict[str, Event] = {}  # latest status event per peasant
+        self.stream_chars: dict[tuple[str, str], int] = {}
+        self.notifier: Notifier | None = None
+
+    # -- setup ------------------------------------------------------------
+
+    def follows(self, thread_id: str) -> bool:
+        if self.thread_filter is not None:
+            return thread_id in self.thread_filter
+        if thread_id in self.ignored:
+            return False
+        try:
+            meta = read_thread_meta(self.threads_dir / thread_id)
+        except (FileNotFoundError, KeyError, ValueError):
+            return False  # thread.json not written yet
+        if meta.pattern not in WATCHED_PATTERNS:
+            self.ignored.add(thread_id)
+            return False
+        return True
+
+    def follows_peasant(self, name: str) -> bool:
+        if not name.startswith("peasant-"):
+            return False
+        return self.thread_filter is None or f"{name.removeprefix('peasant-')}-work" in self.thread_filter
+
+    def start(self, notifier: Notifier) -> list[Event]:
+        """Register watches and return the initial status and stream events."""
+        self.notifier = notifier
+        for directory in (self.threads_dir, self.sessions_dir, self.logs_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+            notifier.add(directory)
+
+        events: list[Event] = []
+        for tdir in sorted(p for p in self.threads_dir.iterdir() if p.is_dir()):
+            if self.follows(tdir.name):
+                notifier.add(tdir)
+                events.extend(self.add_thread(tdir.name, since=max_sequence(tdir)))
+            elif self.thread_filter is None and tdir.name not in self.ignored:
+                notifier.add(tdir)  # no thread.json yet; follow once it appears
+        for path in sorted(self.sessions_dir.glob("peasant-*.json")):
+            events.extend(self.read_session(path, initial=True))
+        for log_dir in sorted(self.logs_dir.glob("peasant-*")):
+            self.add_log_dir(log_dir, from_start=False)
+        return events
+
+    def add_thread(self, thread_id: str, since: int = 0) -> list[Event]:
+        poller = ThreadPoller(thread_dir=self.threads_dir / thread_id, member_backends=self.member_backends)
+        poller.last_sequence = since
+        self.pollers[thread_id] = poller
+        return self.poll_thread(thread_id)
+
+    def add_log_dir(self, log_dir: Path, from_start: bool) -> list[Event]:
+        if not self.follows_peasant(log_dir.name) or self.notifier is None:
+            return []
+        self.notifier.add(log_dir)
+        events: list[Event] = []
+        for name in LOG_FILES:
+            path = log_dir / name
+            if path in self.log_offsets:
+                continue
+            if from_start:
+                self.log_offsets[path] = 0
+                events.extend(self.read_log(path))
+            else:
+                try:
+                    self.log_offsets[path] = path.stat().st_size
+                except OSError:
+                    self.log_offsets[path] = 0
+        return events
+
+    # -- change handling --------------------------------------------------
+
+    def handle(self, changed: set[Path]) -> list[Event]:
+        """Return the events for a batch of changed paths."""
+        events: list[Event] = []
+        dirty_threads: set[str] = set()
+        for path in sorted(changed):
+            parent = path.parent
+            if parent == self.threads_dir:
+                wanted = (
+                    path.name in self.thread_filter if self.thread_filter is not None else path.name not in self.ignored
+                )
+                if wanted and path.is_dir() and self.notifier is not None:
+                    self.notifier.add(path)
+                    dirty_threads.add(path.name)
+            elif parent.parent == self.threads_dir:
+                if parent.name not in self.ignored:
+                    dirty_threads.add(parent.name)
+            elif parent == self.sessions_dir:
+                if path.suffix == ".json" and path.name.startswith("peasant-"):
+                    events.extend(self.read_session(path))
+            elif parent == self.logs_dir:
+                if path.is_dir():
+                    events.extend(self.add_log_dir(path, from_start=True))
+            elif parent.parent == self.logs_dir and path.name in LOG_FILES:
+                if path not in self.log_offsets:
+                    events.extend(self.add_log_dir(parent, from_start=True))
+                else:
+                    events.extend(self.read_log(path))
+
+        for thread_id in sorted(dirty_threads):
+            if thread_id not in self.pollers:
+                if not self.follows(thread_id):
+                    continue
+                events.extend(self.add_thread(thread_id))
+            else:
+                events.extend(self.poll_thread(thread_id))
+        return events
+
+    def poll_thread(self, thread_id: str) -> list[Event]:
+        poller = self.pollers[thread_id]
+        events: list[Event] = []
+        for event in poller.poll():
+            if isinstance(event, NewMessage):
+                path = poller.thread_dir / f"{event.sequence:04d}-{event.sender}.md"
+                events.append(
+                    {
+                        "type": "message",
+                        "ts": now_iso(),
+                        "thread": thread_id,
+                        "sequence": event.sequence,
+                        "from": event.sender,
+                        "to": message_recipient(path),
+                        "body": event.body,
+                    }
+                )
+            elif isinstance(event, StreamStarted):
+                self.stream_chars[(thread_id, event.member)] = 0
+                events.append({"type": "stream_started", "ts": now_iso(), "thread": thread_id, "member": event.member})
+            elif isinstance(event, StreamDelta):
+                key = (thread_id, event.member)
+                seen = self.stream_chars.get(key, 0)
+                if len(event.full_text) < seen:  # stream restarted (retry)
+                    seen = 0
+                self.stream_chars[key] = len(event.full_text)
+                events.append(
+                    {
+                        "type": "stream",
+                        "ts": now_iso(),
+                        "thread": thread_id,
+                        "member": event.member,
+                        "chars": len(event.full_text),
+                        "text": event.full_text[seen:],
+                    }
+                )
+            elif isinstance(event, StreamFinished):
+                self.stream_chars.pop((thread_id, event.member), None)
+                events.append({"type": "stream_finished", "ts": now_iso(), "thread": thread_id, "member": event.member})
+        return events
+
+    def read_session(self, path: Path, initial: bool = False) -> list[Event]:
+        name = path.stem
+        if not self.follows_peasant(name):
+            return []
+        try:
+            data = read_json(path)
+        except (OSError, ValueError):
+            return []  # mid-write; the rename that completes it triggers another change
+        status = data.get("status", "idle")
+        if initial and status == "idle":
+            return []
+        previous = self.peasants.get(name)
+        if previous is not None and previous["status"] == status and previous["pid"] == data.get("pid"):
+            return []
+        event = {
+            "type": "status",
+            "ts": now_iso(),
+            "peasant": name,
+            "ticket": data.get("ticket") or name.removeprefix("peasant-"),
+            "status": status,
+            "pid": data.get("pid"),
+            "last_activity": data.get("last_activity"),
+        }
+        self.peasants[name] = event
+        return [event]
+
+    def read_log(self, path: Path) -> list[Event]:
+        offset = self.log_offsets.get(path, 0)
+        try:
+            size = path.stat().st_size
+            if size < offset:  # truncated
+                offset = 0
+                self.log_partial.pop(path, None)
+            with path.open("rb") as handle:
+                handle.seek(offset)
+                data = handle.read()
+        except OSError:
+            return []
+        self.log_offsets[path] = offset + len(data)
+        text = self.log_partial.pop(path, "") + data.decode("utf-8", errors="replace")
+        lines = text.split("\n")
+        if lines[-1]:
+            self.log_partial[path] = lines[-1]
+        peasant = path.parent.name
+        ticket = peasant.removeprefix("peasant-")
+        stream = path.stem.removesuffix(".log")
+        return [
+            {"type": "log", "ts": now_iso(), "peasant": peasant, "ticket": ticket, "stream": stream, "line": line}
+            for line in lines[:-1]
+        ]
+
+
+def run_watch(
+    watcher: Watcher,
+    notifier: Notifier,
+    emit: Callable[[list[Event]], None],
+    timeout: float | None = None,
+    tick: float = 1.0,
+) -> None:
+    """Feed notifier changes through *watcher* to *emit* until *timeout* seconds pass.
+
+    *emit* is also called with an empty list at least every *tick* seconds,
+    so a live display can refresh its clocks.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    try:
+        emit(watcher.start(notifier))
+        while True:
+            wait = tick
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                wait = min(wait, remaining)
+            emit(watcher.handle(notifier.wait(wait)))
+    finally:
+        notifier.close()
+
+
+class Dashboard:
+    """Live state for ``kd watch``: one status line per peasant and member stream."""
+
+    def __init__(self) -> None:
+        self.peasants: dict[str, dict[str, Any]] = {}
+        self.streams: dict[tuple[str, str], int] = {}
+
+    def apply(self, events: list[Event]) -> None:
+        for event in events:
+            kind = event["type"]
+            if kind == "status":
+                state = self.peasants.setdefault(event["peasant"], {"line": "", "updated": None})
+                state.update(ticket=event["ticket"], status=event["status"], pid=event["pid"])
+            elif kind == "log":
+                state = self.peasants.setdefault(
+                    event["peasant"], {"ticket": event["ticket"], "status": "?", "pid": None}
+                )
+                state.update(line=event["line"], updated=time.monotonic())
+            elif kind in ("stream_started", "stream"):
+                self.streams[(event["thread"], event["member"])] = event.get("chars", 0)
+            elif kind == "stream_finished":
+                self.streams.pop((event["thread"], event["member"]), None)
+
+    def render(self) -> Table:
+        table = Table(box=None, show_header=True, header_style="dim", pad_edge=False)
+        table.add_column("Ticket", style="cyan", no_wrap=True)
+        table.add_column("Status", style="bold", no_wrap=True)
+        table.add_column("Quiet", justify="right", no_wrap=True)
+        table.add_column("Last output", overflow="ellipsis", no_wrap=True)
+        now = time.monotonic()
+        for name in sorted(self.peasants):
+            state = self.peasants[name]
+            updated = state.get("updated")
+            quiet = f"{int(now - updated)}s" if updated is not None else ""
+            table.add_row(state.get("ticket", name), state.get("status", "?"), quiet, state.get("line", ""))
+        for (thread_id, member), chars in sorted(self.streams.items()):
+            table.add_row(thread_id, f"{member} streaming", "", f"{chars} chars")
+        return table
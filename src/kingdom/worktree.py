@@ -0,0 +1,507 @@
+"""Git worktree provisioning for peasants.
+
+Without a pool, every ticket gets its own ``.kd/worktrees/<ticket-id>`` created
+by ``git worktree add`` (plus ``init-worktree.sh``) and thrown away when the
+work is cleaned up.
+
+With ``peasant.pool_size`` set, a warm pool of pre-initialized worktrees
+(``.kd/worktrees/pool-<n>``) is kept instead.  A ticket borrows an idle
+member, which is reset onto a fresh ``ticket/<id>`` branch, and hands it back
+on accept or clean.  ``init-worktree.sh`` only re-runs in a member when the
+configured lockfiles changed since its last init.
+
+Pool bookkeeping lives in ``.kd/worktrees/pool.json``::
+
+    {
+        "pool-1": {"ticket": "a1b2", "lockfile_hash": "9f86d0..."},
+        "pool-2": {"ticket": null, "lockfile_hash": "9f86d0..."}
+    }
+
+With ``peasant.seed_dirs`` set, dependency directories such as ``.venv`` are
+cloned from the base checkout into new worktrees (reflink, hardlink tree, or
+rsync) before ``init-worktree.sh`` runs, so the init script finds dependencies
+already in place.  The lockfile hash each worktree was seeded with lives in
+``.kd/worktrees/seed.json``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import os
+import shutil
+import stat
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from kingdom.git import git_session
+from kingdom.state import locked_json_update, read_json, state_root, worktrees_root
+
+logger = logging.getLogger("kingdom.worktree")
+
+POOL_PREFIX = "pool-"
+
+
+@dataclass
+class PoolCheckout:
+    """Result of borrowing a pool member for a ticket."""
+
+    name: str
+    path: Path
+    reinit: bool = False
+    init_result: subprocess.CompletedProcess | None = None
+
+
+# ---------------------------------------------------------------------------
+# Shared helpers
+# ---------------------------------------------------------------------------
+
+
+def init_script_path(base: Path) -> Path | None:
+    """Return ``.kd/init-worktree.sh`` if it exists and is executable."""
+    init_script = state_root(base) / "init-worktree.sh"
+    if init_script.exists() and os.access(init_script, os.X_OK):
+        return init_script
+    return None
+
+
+def run_init_script(base: Path, worktree_path: Path) -> subprocess.CompletedProcess | None:
+    """Run ``.kd/init-worktree.sh`` against *worktree_path*.
+
+    Returns None when the script is missing or not executable.
+    """
+    init_script = init_script_path(base)
+    if init_script is None:
+        return None
+    return subprocess.run(
+        [str(init_script), str(worktree_path)],
+        capture_output=True,
+        text=True,
+    )
+
+
+def lockfile_hash(root: Path, lockfiles: list[str]) -> str:
+    """Hash the contents of the configured lockfiles found under *root*.
+
+    Missing lockfiles are skipped, so the hash only changes when a lockfile
+    that actually exists is added, removed, or edited.
+    """
+    digest = hashlib.sha256()
+    for name in sorted(lockfiles):
+        path = root / name
+        if not path.is_file():
+            continue
+        digest.update(name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def git(worktree: Path, *args: str) -> subprocess.CompletedProcess:
+    return git_session(worktree).run(*args)
+
+
+def sparse_checkout(worktree_path: Path, paths: list[str]) -> subprocess.CompletedProcess:
+    """Populate a ``--no-checkout`` worktree with a cone-mode sparse checkout of *paths*.
+
+    Top-level files are always included (cone mode); an empty *paths* checks
+    out only those.
+    """
+    result = git(worktree_path, "sparse-checkout", "set", "--cone", *paths)
+    if result.returncode != 0:
+        return result
+    return git(worktree_path, "checkout")
+
+
+def widen_sparse_checkout(worktree_path: Path, paths: list[str]) -> subprocess.CompletedProcess:
+    """Add *paths* to an existing sparse checkout."""
+    return git(worktree_path, "sparse-checkout", "add", *paths)
+
+
+def is_sparse_checkout(worktree_path: Path) -> bool:
+    result = git(worktree_path, "config", "--bool", "core.sparseCheckout")
+    return result.stdout.strip() == "true"
+
+
+# ---------------------------------------------------------------------------
+# Pool state
+# ---------------------------------------------------------------------------
+
+
+def pool_state_path(base: Path) -> Path:
+    return worktrees_root(base) / "pool.json"
+
+
+def pool_member_path(base: Path, name: str) -> Path:
+    return worktrees_root(base) / name
+
+
+def read_pool(base: Path) -> dict[str, dict[str, Any]]:
+    """Return the pool bookkeeping map (empty when no pool has been warmed)."""
+    try:
+        return read_json(pool_state_path(base))
+    except FileNotFoundError:
+        return {}
+
+
+def pool_member_for(base: Path, ticket_id: str) -> Path | None:
+    """Return the pool member currently assigned to *ticket_id*, if any."""
+    for name, entry in read_pool(base).items():
+        if entry.get("ticket") == ticket_id:
+            return pool_member_path(base, name)
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Pool lifecycle
+# ---------------------------------------------------------------------------
+
+
+def warm_pool(base: Path, size: int, lockfiles: list[str]) -> list[tuple[str, subprocess.CompletedProcess | None]]:
+    """Create missing pool members up to *size* and initialize them.
+
+    Members are detached checkouts of the base repo's HEAD.  Returns
+    ``(name, init_result)`` for each newly created member.
+
+    Raises:
+        RuntimeError: If ``git worktree add`` fails.
+    """
+    created: list[tuple[str, subprocess.CompletedProcess | None]] = []
+    worktrees_root(base).mkdir(parents=True, exist_ok=True)
+
+    for i in range(1, size + 1):
+        name = f"{POOL_PREFIX}{i}"
+        path = pool_member_path(base, name)
+        if path.exists():
+            continue
+
+        result = git(base, "worktree", "add", "--detach", str(path), "HEAD")
+        if result.returncode != 0:
+            raise RuntimeError(f"Error creating pool worktree {name}: {result.stderr.strip()}")
+
+        init_result = run_init_script(base, path)
+        digest = lockfile_hash(path, lockfiles)
+
+        def add_member(data: dict[str, Any], name: str = name, digest: str = digest) -> dict[str, Any]:
+            data[name] = {"ticket": None, "lockfile_hash": digest}
+            return data
+
+        locked_json_update(pool_state_path(base), add_member)
+        created.append((name, init_result))
+
+    return created
+
+
+def acquire_pool_worktree(base: Path, ticket_id: str, lockfiles: list[str]) -> PoolCheckout | None:
+    """Borrow an idle pool member and check out ``ticket/<id>`` in it.
+
+    The member is reset (``reset --hard`` + ``clean -fd``, keeping ignored
+    dependency directories) before the checkout.  An existing ticket branch is
+    reused; otherwise a new one is created from the base repo's HEAD.
+    ``init-worktree.sh`` runs only when the lockfile hash differs from the
+    one recorded at the member's last init.
+
+    A member whose reset or clean fails is dropped from the pool rather than
+    handed out dirty, and the next idle member is tried.
+
+    Returns None when no idle member exists.
+
+    Raises:
+        RuntimeError: If the checkout fails (the member is returned to the pool).
+    """
+    head = git(base, "rev-parse", "HEAD")
+    if head.returncode != 0:
+        raise RuntimeError(f"Error resolving HEAD: {head.stderr.strip()}")
+    start_point = head.stdout.strip()
+
+    claimed: list[str] = []
+
+    def claim(data: dict[str, Any]) -> dict[str, Any]:
+        for name in sorted(data):
+            entry = data[name]
+            if entry.get("ticket") is None and pool_member_path(base, name).exists():
+                entry["ticket"] = ticket_id
+                claimed.append(name)
+                break
+        return data
+
+    locked_json_update(pool_state_path(base), claim)
+    if not claimed:
+        return None
+
+    name = claimed[0]
+    path = pool_member_path(base, name)
+    branch_name = f"ticket/{ticket_id}"
+
+    for args in (("reset", "--hard"), ("clean", "-fd")):
+        reset = git(path, *args)
+        if reset.returncode != 0:
+            logger.warning("git %s failed in %s, dropping it from the pool: %s", " ".join(args), name, reset.stderr)
+            drop_pool_member(base, name)
+            return acquire_pool_worktree(base, ticket_id, lockfiles)
+
+    if git(base, "rev-parse", "--verify", branch_name).returncode == 0:
+        result = git(path, "checkout", branch_name)
+    else:
+        result = git(path, "checkout", "-b", branch_name, start_point)
+
+    if result.returncode != 0:
+
+        def unclaim(data: dict[str, Any]) -> dict[str, Any]:
+            data.get(name, {})["ticket"] = None
+            return data
+
+        locked_json_update(pool_state_path(base), unclaim)
+        raise RuntimeError(f"Error checking out {branch_name} in {name}: {result.stderr.strip()}")
+
+    digest = lockfile_hash(path, lockfiles)
+    recorded = read_pool(base).get(name, {}).get("lockfile_hash")
+    checkout = PoolCheckout(name=name, path=path)
+    if digest != recorded:
+        checkout.reinit = True
+        checkout.init_result = run_init_script(base, path)
+
+        def record_hash(data: dict[str, Any]) -> dict[str, Any]:
+            data.setdefault(name, {})["lockfile_hash"] = digest
+            return data
+
+        locked_json_update(pool_state_path(base), record_hash)
+
+    return checkout
+
+
+def drop_pool_member(base: Path, name: str) -> None:
+    """Remove pool member *name*: its worktree and its pool.json entry."""
+    git(base, "worktree", "remove", "--force", str(pool_member_path(base, name)))
+
+    def forget(data: dict[str, Any]) -> dict[str, Any]:
+        data.pop(name, None)
+        return data
+
+    locked_json_update(pool_state_path(base), forget)
+
+
+def release_pool_worktree(base: Path, ticket_id: str) -> str | None:
+    """Hand the pool member held by *ticket_id* back to the pool.
+
+    Detaches HEAD (so the ticket branch can be merged or deleted elsewhere)
+    and resets the checkout.  Returns the member name, or None if the ticket
+    did not hold a pool member.
+    """
+    path = pool_member_for(base, ticket_id)
+    if path is None:
+        return None
+
+    if path.exists():
+        git(path, "checkout", "--detach")
+        git(path, "reset", "--hard")
+        git(path, "clean", "-fd")
+
+    def free(data: dict[str, Any]) -> dict[str, Any]:
+        for entry in data.values():
+            if entry.get("ticket") == ticket_id:
+                entry["ticket"] = None
+        return data
+
+    locked_json_update(pool_state_path(base), free)
+    return path.name
+
+
+def discard_worktree(base: Path, ticket_id: str) -> None:
+    """Throw away *ticket_id*'s worktree and its ``ticket/<id>`` branch without merging.
+
+    A pool member goes back to the pool; a dedicated worktree is removed.
+    """
+    if release_pool_worktree(base, ticket_id) is None:
+        path = worktrees_root(base) / ticket_id
+        if path.exists():
+            git(base, "worktree", "remove", "--force", str(path))
+    git(base, "branch", "-D", f"ticket/{ticket_id}")
+
+
+# ---------------------------------------------------------------------------
+# Dependency seeding
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class SeedResult:
+    """Outcome of seeding one dependency directory into a worktree."""
+
+    name: str
+    method: str  # "reflink", "hardlink", "rsync", or "skipped"
+    bytes_saved: int = 0
+    seconds: float = 0.0
+    reason: str = ""
+
+
+def seed_state_path(base: Path) -> Path:
+    return worktrees_root(base) / "seed.json"
+
+
+def tree_size(root: Path) -> int:
+    """Total size of the regular files under *root* (symlinks not followed)."""
+    total = 0
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            with contextlib.suppress(OSError):
+                st = os.lstat(os.path.join(dirpath, filename))
+                if stat.S_ISREG(st.st_mode):
+                    total += st.st_size
+    return total
+
+
+def format_bytes(size: int) -> str:
+    """Human-readable byte count (``1.5 MB``)."""
+    value = float(size)
+    for unit in ("B", "KB", "MB", "GB"):
+        if value < 1024 or unit == "GB":
+            return f"{int(value)} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB"
+
+
+def copy_reflink(src: Path, dst: Path) -> bool:
+    """Clone *src* to *dst* with copy-on-write extents (btrfs, XFS, APFS)."""
+    if sys.platform == "darwin":
+        cmd = ["cp", "-ac", str(src), str(dst)]
+    else:
+        cmd = ["cp", "-a", "--reflink=always", str(src), str(dst)]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+    except OSError:
+        return False
+    return result.returncode == 0
+
+
+def copy_hardlinks(src: Path, dst: Path) -> bool:
+    """Mirror *src* as a tree of hardlinks (same filesystem only)."""
+    try:
+        shutil.copytree(src, dst, symlinks=True, copy_function=os.link)
+    except (OSError, shutil.Error):
+        return False
+    return True
+
+
+def copy_rsync(src: Path, dst: Path) -> bool:
+    """Plain copy via rsync, the last resort when nothing can be shared."""
+    if shutil.which("rsync") is None:
+        return False
+    result = subprocess.run(["rsync", "-a", f"{src}/", f"{dst}/"], capture_output=True, text=True)
+    return result.returncode == 0
+
+
+def is_virtualenv(path: Path) -> bool:
+    return (path / "pyvenv.cfg").is_file()
+
+
+def relocate_virtualenv(venv: Path, old_root: Path, new_root: Path) -> None:
+    """Rewrite absolute paths under *old_root* to *new_root* in a cloned virtualenv.
+
+    Covers ``pyvenv.cfg``, the text scripts in ``bin/`` (shebangs, activate
+    scripts) and ``site-packages/*.pth`` (editable installs of the project).
+    """
+    old, new = f"{old_root.resolve()}/", f"{new_root.resolve()}/"
+    files = [venv / "pyvenv.cfg", *(venv / "bin").glob("*"), *venv.glob("lib/python*/site-packages/*.pth")]
+    for path in files:
+        if path.is_symlink() or not path.is_file():
+            continue
+        try:
+            text = path.read_text()
+        except (OSError, UnicodeDecodeError):
+            continue  # compiled launchers
+        if old in text:
+            path.write_text(text.replace(old, new))
+
+
+def seed_dependencies(base: Path, worktree_path: Path, seed_dirs: list[str], lockfiles: list[str]) -> list[SeedResult]:
+    """Clone dependency directories (``.venv``, ``node_modules``, ...) from the base checkout.
+
+    Seeding only happens when the worktree's lockfiles hash the same as the
+    base checkout's — otherwise the base's dependencies would be wrong for
+    the worktree and ``init-worktree.sh`` has to install them.  The hash a
+    worktree was seeded with is recorded in ``.kd/worktrees/seed.json`` so
+    repeated calls (e.g. ``kd peasant sync``) are no-ops until the lockfiles
+    change.
+
+    Each directory is copied with the cheapest method that works: reflink,
+    then a hardlink tree, then rsync.  ``bytes_saved`` counts the bytes that
+    share storage with the base checkout (zero for rsync).
+
+    A Python virtualenv (a directory with ``pyvenv.cfg``) is not relocatable:
+    its scripts and ``.pth`` files hold absolute paths into the base checkout,
+    and a hardlinked copy would let a peasant's ``pip install`` rewrite the
+    base's files in place.  Virtualenvs are therefore only seeded by reflink,
+    after which :func:`relocate_virtualenv` points their paths at the worktree.
+    """
+    results: list[SeedResult] = []
+    if not seed_dirs or worktree_path.resolve() == base.resolve():
+        return results
+
+    digest = lockfile_hash(base, lockfiles)
+    if lockfile_hash(worktree_path, lockfiles) != digest:
+        return [SeedResult(name=name, method="skipped", reason="lockfiles differ from base") for name in seed_dirs]
+
+    try:
+        seeded = read_json(seed_state_path(base)).get(worktree_path.name, {})
+    except FileNotFoundError:
+        seeded = {}
+
+    for name in seed_dirs:
+        src = base / name
+        dst = worktree_path / name
+        if not src.is_dir():
+            results.append(SeedResult(name=name, method="skipped", reason="missing in base checkout"))
+            continue
+        if dst.exists() and seeded.get(name) == digest:
+            results.append(SeedResult(name=name, method="skipped", reason="up to date"))
+            continue
+
+        start = time.monotonic()
+        if dst.is_symlink() or dst.is_file():
+            dst.unlink()
+        elif dst.exists():
+            shutil.rmtree(dst)
+        dst.parent.mkdir(parents=True, exist_ok=True)
+
+        venv = is_virtualenv(src)
+        methods = [("reflink", copy_reflink)]
+        if not venv:
+            methods += [("hardlink", copy_hardlinks), ("rsync", copy_rsync)]
+        method = ""
+        for method_name, copy in methods:
+            if copy(src, dst):
+                method = method_name
+                break
+            if dst.exists():
+                shutil.rmtree(dst, ignore_errors=True)
+
+        if not method:
+            reason = "virtualenvs are only seeded by reflink" if venv else "all copy methods failed"
+            results.append(SeedResult(name=name, method="skipped", reason=reason))
+            continue
+        if venv:
+            relocate_virtualenv(dst, base, worktree_path)
+
+        results.append(
+            SeedResult(
+                name=name,
+                method=method,
+                bytes_saved=tree_size(dst) if method != "rsync" else 0,
+                seconds=time.monotonic() - start,
+            )
+        )
+
+        def record(data: dict[str, Any], name: str = name) -> dict[str, Any]:
+            data.setdefault(worktree_path.name, {})[name] = digest
+            return data
+
+        locked_json_update(seed_state_path(base), record)
+
+    return results
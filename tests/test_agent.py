@@ -7,12 +7,14 @@ import pytest
 from kingdom.agent import (
     BACKEND_DEFAULTS,
     AgentConfig,
+    TokenUsage,
     build_command,
     extract_stream_text,
     parse_claude_response,
     parse_codex_response,
     parse_cursor_response,
     parse_response,
+    parse_usage,
     resolve_agent,
     resolve_all_agents,
 )
@@ -378,6 +380,57 @@ class TestParseResponseDispatch:
         assert session_id is None
 
 
+class TestParseUsage:
+    def test_claude_single_json(self) -> None:
+        stdout = json.dumps(
+            {
+                "type": "result",
+                "result": "ok",
+                "total_cost_usd": 0.05,
+                "usage": {
+                    "input_tokens": 10,
+                    "cache_creation_input_tokens": 200,
+                    "cache_read_input_tokens": 790,
+                    "output_tokens": 42,
+                },
+            }
+        )
+        usage = parse_usage(make_config("claude"), stdout)
+
+        assert usage == TokenUsage(
+            input_tokens=10, output_tokens=42, cache_read_tokens=790, cache_write_tokens=200, cost_usd=0.05
+        )
+        assert usage.prompt_tokens == 1000
+        assert usage.cache_hit_ratio == pytest.approx(0.79)
+
+    def test_claude_stream_uses_result_event(self) -> None:
+        lines = [
+            {"type": "assistant", "message": {"content": [], "usage": {"input_tokens": 999}}},
+            {"type": "result", "result": "ok", "usage": {"input_tokens": 5, "output_tokens": 7}},
+        ]
+        usage = parse_usage(make_config("claude"), "\n".join(json.dumps(line) for line in lines))
+
+        assert usage == TokenUsage(input_tokens=5, output_tokens=7)
+
+    def test_codex_sums_turns_and_splits_cached_input(self) -> None:
+        lines = [
+            {"type": "thread.started", "thread_id": "t1"},
+            {
+                "type": "turn.completed",
+                "usage": {"input_tokens": 1000, "cached_input_tokens": 800, "output_tokens": 50},
+            },
+            {"type": "turn.completed", "usage": {"input_tokens": 500, "cached_input_tokens": 0, "output_tokens": 5}},
+        ]
+        usage = parse_usage(make_config("codex"), "\n".join(json.dumps(line) for line in lines))
+
+        assert usage == TokenUsage(input_tokens=700, output_tokens=55, cache_read_tokens=800)
+
+    def test_no_usage_reported(self) -> None:
+        assert parse_usage(make_config("claude"), '{"result": "ok"}') is None
+        assert parse_usage(make_config("codex"), "not json") is None
+        assert TokenUsage().cache_hit_ratio is None
+
+
 class TestBuildCommandStreaming:
     def test_claude_streaming_replaces_output_format(self) -> None:
         cmd = build_command(make_config("claude"), "hello", streaming=True)
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import os
+import signal
+import subprocess
+import threading
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from kingdom import cli
+from kingdom.candidates import (
+    Candidate,
+    Race,
+    candidate_ticket_path,
+    declare_winner,
+    find_candidate,
+    format_race,
+    lost_race,
+    read_race,
+    start_race,
+    win_race,
+    work_ticket_path,
+)
+from kingdom.harness import extract_worklog, record_review_outcome
+from kingdom.review_queue import ReviewRequest, claim_review, enqueue_review, reviews_root
+from kingdom.session import AgentState, get_agent_state, set_agent_state, update_agent_state
+from kingdom.state import ensure_branch_layout, set_current_run, tickets_root
+from kingdom.ticket import Ticket, read_ticket, write_ticket
+
+BRANCH = "feature/race"
+DEAD_PID = 2**22 + 1  # above the default pid_max
+
+
+def git(cwd: Path, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.chdir(tmp_path)
+    git(tmp_path, "init", "-q", "-b", "main")
+    git(tmp_path, "config", "user.email", "test@test.com")
+    git(tmp_path, "config", "user.name", "Test")
+    (tmp_path / ".gitignore").write_text(".kd/\n")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "init")
+    ensure_branch_layout(tmp_path, BRANCH)
+    set_current_run(tmp_path, BRANCH)
+    return tmp_path
+
+
+@pytest.fixture
+def ticket_path(project: Path) -> Path:
+    path = tickets_root(project, BRANCH) / "t1.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_ticket(Ticket(id="t1", status="in_progress", title="Add t", body="Do it.", created=datetime.now(UTC)), path)
+    return path
+
+
+@pytest.fixture
+def race(project: Path, ticket_path: Path) -> Race:
+    race = Race(ticket_id="t1", candidates=[])
+    for name, agent in (("c1", "claude"), ("c2", "codex")):
+        worktree = cli.create_worktree(project, f"t1-{name}")
+        race.candidates.append(Candidate(name=name, work_id=f"t1-{name}", agent=agent, worktree=str(worktree)))
+        start_sha = git(worktree, "rev-parse", "HEAD")
+        state = AgentState(name=f"peasant-t1-{name}", status="working", pid=DEAD_PID, start_sha=start_sha)
+        set_agent_state(project, BRANCH, state.name, state)
+    start_race(project, BRANCH, ticket_path, race)
+    return race
+
+
+class TestRace:
+    def test_candidates_work_on_their_own_ticket_copy(self, project: Path, ticket_path: Path, race: Race) -> None:
+        copy = candidate_ticket_path(project, BRANCH, "t1", "c2")
+
+        assert read_ticket(copy).title == "Add t"
+        assert work_ticket_path(project, BRANCH, "peasant-t1-c2", ticket_path) == copy
+        assert work_ticket_path(project, BRANCH, "peasant-t1", ticket_path) == ticket_path
+        assert find_candidate(project, BRANCH, "peasant-t1-c9") is None
+
+    def test_first_winner_takes_the_race(self, project: Path, race: Race) -> None:
+        assert declare_winner(project, BRANCH, "t1", "c2")
+        assert not declare_winner(project, BRANCH, "t1", "c1")
+        assert declare_winner(project, BRANCH, "t1", "c2")
+
+        assert lost_race(project, BRANCH, "peasant-t1-c1")
+        assert not lost_race(project, BRANCH, "peasant-t1-c2")
+
+    def test_win_stops_and_cleans_up_losers(self, project: Path, ticket_path: Path, race: Race) -> None:
+        winner_tree = Path(race.candidates[0].worktree)
+        (winner_tree / "t.txt").write_text("t\n")
+        git(winner_tree, "add", ".")
+        git(winner_tree, "commit", "-q", "-m", "add t")
+
+        assert win_race(project, BRANCH, "peasant-t1-c1")
+
+        settled = read_race(project, BRANCH, "t1")
+        assert settled is not None
+        assert settled.winner == "c1"
+        winner, loser = settled.candidates
+        assert (winner.outcome, loser.outcome) == ("won", "lost")
+        assert winner.report is not None and "1 file changed" in winner.report.diffstat
+        assert loser.report is not None and loser.report.diffstat == ""
+        assert "| c2 | codex | lost | stopped |" in format_race(settled)
+
+        assert get_agent_state(project, BRANCH, "peasant-t1-c2").status == "stopped"
+        assert not Path(loser.worktree).exists()
+        assert git(project, "branch", "--list", "ticket/t1-c2") == ""
+        assert git(project, "branch", "--list", "ticket/t1-c1") != ""
+
+        ticket = read_ticket(ticket_path)
+        assert (ticket.status, ticket.assignee) == ("in_review", "peasant-t1-c1")
+        assert "Candidate c1 (claude) won the race of 2" in extract_worklog(ticket_path)
+
+    def test_loser_in_council_review_is_stopped_before_cleanup(self, project: Path, race: Race) -> None:
+        loser = race.candidates[1]
+        proc = subprocess.Popen(["sleep", "60"], start_new_session=True)
+        reaper = threading.Thread(target=proc.wait)  # a real harness is not our child and is reaped by init
+        reaper.start()
+        update_agent_state(project, BRANCH, loser.session_name, status="awaiting_council", pid=proc.pid)
+        review = ReviewRequest(
+            ticket_id="t1",
+            session_name=loser.session_name,
+            thread_id=loser.thread_id,
+            worktree=loser.worktree,
+            agent="codex",
+        )
+        enqueue_review(project, BRANCH, review)
+
+        try:
+            assert win_race(project, BRANCH, "peasant-t1-c1")
+        finally:
+            proc.kill()
+            reaper.join(5)
+
+        assert proc.returncode == -signal.SIGTERM
+        assert not (reviews_root(project, BRANCH) / f"{loser.session_name}.json").exists()
+        assert get_agent_state(project, BRANCH, loser.session_name).status == "stopped"
+        assert not Path(loser.worktree).exists()
+
+    def test_loser_under_worker_review_keeps_worktree(self, project: Path, race: Race) -> None:
+        loser = race.candidates[1]
+        update_agent_state(project, BRANCH, loser.session_name, status="awaiting_council")
+        review = ReviewRequest(
+            ticket_id="t1",
+            session_name=loser.session_name,
+            thread_id=loser.thread_id,
+            worktree=loser.worktree,
+            agent="codex",
+        )
+        enqueue_review(project, BRANCH, review)
+        assert claim_review(project, BRANCH, os.getpid()) is not None
+
+        assert win_race(project, BRANCH, "peasant-t1-c1")
+
+        settled = read_race(project, BRANCH, "t1")
+        assert settled is not None and settled.candidates[1].outcome == "lost"
+        assert get_agent_state(project, BRANCH, loser.session_name).status == "stopped"
+        assert Path(loser.worktree).exists()
+
+    def test_losing_candidate_stops_after_review(self, project: Path, race: Race) -> None:
+        declare_winner(project, BRANCH, "t1", "c1")
+        copy = candidate_ticket_path(project, BRANCH, "t1", "c2")
+
+        status = record_review_outcome(project, BRANCH, copy, "peasant-t1-c2", "t1-c2-work", "approved", [])
+
+        assert status == "stopped"
+        assert "Another candidate already won the race" in extract_worklog(copy)
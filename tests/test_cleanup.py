@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from kingdom.cleanup import GcPolicy, collect, parse_size, scan
+from kingdom.logstore import LogStore
+from kingdom.state import branch_root, ensure_branch_layout, flock, logs_root, state_root
+from kingdom.ticket import Ticket, write_ticket
+
+BRANCH = "feature/gc-test"
+DEAD_PID = 999_999_999  # above any pid_max
+
+
+def git(cwd: Path, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+
+def age(path: Path, days: float = 0, hours: float = 0) -> Path:
+    stamp = time.time() - timedelta(days=days, hours=hours).total_seconds()
+    os.utime(path, (stamp, stamp))
+    return path
+
+
+def write(path: Path, text: str = "x", hours: float = 0) -> Path:
+    path.write_text(text)
+    return age(path, hours=hours)
+
+
+def write_session(base: Path, name: str, pid: int, days_idle: float) -> Path:
+    path = branch_root(base, BRANCH) / "sessions" / f"{name}.json"
+    last = (datetime.now(UTC) - timedelta(days=days_idle)).isoformat()
+    path.write_text(json.dumps({"name": name, "status": "done", "pid": pid, "last_activity": last}))
+    return path
+
+
+def write_ticket_file(base: Path, ticket_id: str, status: str) -> None:
+    ticket = Ticket(id=ticket_id, status=status, title="T", created=datetime.now(UTC))
+    write_ticket(ticket, branch_root(base, BRANCH) / "tickets" / f"{ticket_id}.md")
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    ensure_branch_layout(tmp_path, BRANCH)
+    return tmp_path
+
+
+def kinds(base: Path, **policy: object) -> dict[str, set[str]]:
+    """Map each scanned path (relative to .kd) to its kind, split into removable and kept."""
+    removable: set[str] = set()
+    kept: set[str] = set()
+    for candidate in scan(base, GcPolicy(**policy)):
+        rel = f"{candidate.kind}:{candidate.path.relative_to(state_root(base))}"
+        (kept if candidate.skip else removable).add(rel)
+    return {"removable": removable, "kept": kept}
+
+
+class TestParseSize:
+    def test_units(self) -> None:
+        assert parse_size("4096") == 4096
+        assert parse_size("2k") == 2048
+        assert parse_size("500MB") == 500 * 1024**2
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError, match="expected a size"):
+            parse_size("lots")
+
+
+class TestScan:
+    def test_stream_files(self, project: Path) -> None:
+        threads = branch_root(project, BRANCH) / "threads" / "t1"
+        threads.mkdir(parents=True)
+        write(threads / ".stream-claude.jsonl", hours=2)
+        write(threads / ".stream-codex.jsonl")  # still being written
+        write(threads / ".stream-cursor.jsonl", hours=2)
+        write_session(project, "cursor", os.getpid(), days_idle=0)
+
+        found = kinds(project)
+
+        assert "stream:branches/feature-gc-test/threads/t1/.stream-claude.jsonl" in found["removable"]
+        assert "stream:branches/feature-gc-test/threads/t1/.stream-codex.jsonl" in found["kept"]
+        assert "stream:branches/feature-gc-test/threads/t1/.stream-cursor.jsonl" in found["kept"]
+
+    def test_locks(self, project: Path) -> None:
+        sessions = branch_root(project, BRANCH) / "sessions"
+        (sessions / "claude.json").write_text("{}")
+        (sessions / ".claude.json.lock").touch()
+        write(sessions / ".gone.json.lock", "", hours=2)
+        write(sessions / ".new.json.lock", "")
+        held = sessions / ".busy.json.lock"
+
+        with flock(held):
+            found = kinds(project)
+
+        assert "lock:branches/feature-gc-test/sessions/.gone.json.lock" in found["removable"]
+        assert "lock:branches/feature-gc-test/sessions/.busy.json.lock" in found["kept"]
+        assert "lock:branches/feature-gc-test/sessions/.new.json.lock" in found["kept"]
+        assert not any(".claude.json.lock" in p for p in found["removable"] | found["kept"])
+
+    def test_review_and_verify_locks(self, project: Path) -> None:
+        sessions = branch_root(project, BRANCH) / "sessions"
+        (sessions / "peasant-a.json").write_text("{}")
+        write(sessions / ".peasant-a.review.lock", "", hours=2)
+        write(sessions / ".peasant-gone.review.lock", "", hours=2)
+        verify = state_root(project) / "verify"
+        verify.mkdir()
+        (verify / "done.json").write_text("{}")
+        write(verify / ".done.lock", "", hours=2)
+        write(verify / ".running.lock", "", hours=2)
+        age(write(verify / ".abandoned.lock", ""), days=30)
+
+        found = kinds(project)
+
+        assert found["removable"] == {
+            "lock:branches/feature-gc-test/sessions/.peasant-gone.review.lock",
+            "lock:verify/.done.lock",
+            "lock:verify/.abandoned.lock",
+        }
+        assert found["kept"] == set()
+
+    def test_tmp_files(self, project: Path) -> None:
+        root = state_root(project)
+        write(root / f"state.{DEAD_PID}.tmp", hours=2)
+        write(root / f"other.{os.getpid()}.tmp", hours=2)
+
+        found = kinds(project)
+
+        assert f"tmp:state.{DEAD_PID}.tmp" in found["removable"]
+        assert f"tmp:other.{os.getpid()}.tmp" in found["kept"]
+
+    def test_sessions(self, project: Path) -> None:
+        for ticket_id in ("old", "recent", "live"):
+            write_ticket_file(project, ticket_id, "closed")
+        write_session(project, "peasant-old", DEAD_PID, days_idle=30)
+        write_session(project, "peasant-recent", DEAD_PID, days_idle=1)
+        write_session(project, "peasant-live", os.getpid(), days_idle=30)
+        write_session(project, "claude", DEAD_PID, days_idle=30)
+
+        found = kinds(project)
+
+        assert "session:branches/feature-gc-test/sessions/peasant-old.json" in found["removable"]
+        assert "session:branches/feature-gc-test/sessions/claude.json" in found["removable"]
+        assert "session:branches/feature-gc-test/sessions/peasant-live.json" in found["kept"]
+        assert not any("peasant-recent" in p for p in found["removable"] | found["kept"])
+
+    def test_sessions_of_open_tickets_are_kept(self, project: Path) -> None:
+        write_ticket_file(project, "rev1", "in_review")
+        write_ticket_file(project, "done1", "closed")
+        write_session(project, "peasant-rev1", DEAD_PID, days_idle=30)
+        write_session(project, "peasant-rev1-c2", DEAD_PID, days_idle=30)
+        write_session(project, "hand-rev1", DEAD_PID, days_idle=30)
+        write_session(project, "peasant-done1-c1", DEAD_PID, days_idle=30)
+
+        found = kinds(project)
+
+        assert not any("rev1" in p for p in found["removable"] | found["kept"])
+        assert "session:branches/feature-gc-test/sessions/peasant-done1-c1.json" in found["removable"]
+
+    def test_bundles_by_age_and_budget(self, project: Path) -> None:
+        council = logs_root(project, BRANCH) / "council"
+        for name, days in (("run-new", 0), ("run-mid", 1), ("run-old", 30)):
+            (council / name).mkdir(parents=True)
+            (council / name / "claude.md").write_text("x" * 1000)
+            age(council / name, days=days)
+
+        assert {p.rsplit("/", 1)[1] for p in kinds(project)["removable"]} == {"run-old"}
+        by_budget = kinds(project, bundle_budget=1500)["removable"]
+        assert {p.rsplit("/", 1)[1] for p in by_budget} == {"run-mid", "run-old"}
+
+    def test_unreferenced_blobs(self, project: Path) -> None:
+        store = LogStore(logs_root(project, BRANCH))
+        kept = store.put_blob("referenced")
+        store.append("council", member="claude", prompt={"blobs": [kept], "chars": 10})
+        stale = store.put_blob("dropped with a rotated segment")
+        fresh = store.put_blob("record not written yet")
+        for digest in (kept, stale):
+            age(store.blobs_dir / digest[:2] / f"{digest}.gz", hours=2)
+
+        removable = kinds(project)["removable"]
+
+        assert any(stale in p for p in removable)
+        assert not any(kept in p or fresh in p for p in removable)
+
+    def test_worktree_of_closed_ticket(self, project: Path) -> None:
+        git(project, "init", "-q", "-b", "main")
+        git(project, "config", "user.email", "test@test.com")
+        git(project, "config", "user.name", "Test")
+        (project / ".gitignore").write_text(".kd/\n")
+        git(project, "add", ".")
+        git(project, "commit", "-q", "-m", "init")
+        for ticket_id, status in (("done1", "closed"), ("open1", "open"), ("dirty1", "closed")):
+            write_ticket_file(project, ticket_id, status)
+            git(project, "worktree", "add", "-q", "-b", f"ticket/{ticket_id}", f".kd/worktrees/{ticket_id}")
+        for work_id in ("done1-c2", "open1-c1"):
+            git(project, "worktree", "add", "-q", "-b", f"ticket/{work_id}", f".kd/worktrees/{work_id}")
+        (state_root(project) / "worktrees" / "dirty1" / "wip.py").write_text("x = 1\n")
+
+        report = collect(project, dry_run=False)
+
+        removed = [c.path.name for c in report.removed if c.kind == "worktree"]
+        assert removed == ["done1", "done1-c2"]
+        assert [c.skip for c in report.skipped if c.kind == "worktree"] == ["uncommitted changes"]
+        assert not (state_root(project) / "worktrees" / "done1").exists()
+        assert (state_root(project) / "worktrees" / "open1").exists()
+
+
+class TestCollect:
+    def test_dry_run_removes_nothing(self, project: Path) -> None:
+        tmp = write(state_root(project) / f"x.{DEAD_PID}.tmp", "12345", hours=2)
+
+        report = collect(project, dry_run=True)
+
+        assert [c.path for c in report.removed] == [tmp]
+        assert report.bytes_reclaimed == 5
+        assert tmp.exists()
+
+        collect(project)
+        assert not tmp.exists()
@@ -354,6 +354,36 @@ class TestSetupSkill:
             assert link.resolve() == (base / "skills" / "kingdom").resolve()
 
 
+class TestGc:
+    def test_dry_run_then_remove(self) -> None:
+        import os
+        import time
+        from pathlib import Path
+
+        with runner.isolated_filesystem():
+            runner.invoke(cli.app, ["init", "--no-git"])
+            tmp = Path(".kd") / "state.999999999.tmp"
+            tmp.write_text("x" * 2048)
+            old = time.time() - 7200
+            os.utime(tmp, (old, old))
+
+            result = runner.invoke(cli.app, ["gc", "--dry-run"])
+            assert result.exit_code == 0
+            assert "Would reclaim 2.0 KB from 1 items" in result.output
+            assert tmp.exists()
+
+            result = runner.invoke(cli.app, ["gc", "--json"])
+            data = json.loads(result.output)
+            assert [item["kind"] for item in data["removed"]] == ["tmp"]
+            assert data["bytes_reclaimed"] == 2048
+            assert not tmp.exists()
+
+    def test_invalid_policy(self) -> None:
+        with runner.isolated_filesystem():
+            result = runner.invoke(cli.app, ["gc", "--older-than", "soon"])
+            assert result.exit_code == 1
+
+
 class TestNoColor:
     def test_styled_echo_strips_color_when_no_color(self) -> None:
         """styled_echo should not pass fg when NO_COLOR is set."""
@@ -1090,6 +1090,83 @@ class TestCouncilStatus:
             assert "codex: pending" in result.output
 
 
+class TestCouncilStats:
+    def test_no_usage(self) -> None:
+        with runner.isolated_filesystem():
+            setup_project(Path.cwd())
+
+            result = runner.invoke(cli.app, ["council", "stats"])
+
+            assert result.exit_code == 0
+            assert "No token usage recorded yet." in result.output
+
+    def test_shows_cache_hit_ratio_per_agent(self) -> None:
+        from kingdom.agent import TokenUsage
+        from kingdom.usage import record_usage, usage_path
+
+        with runner.isolated_filesystem():
+            base = Path.cwd()
+            setup_project(base)
+            path = usage_path(base)
+            record_usage(path, "council", "claude", TokenUsage(input_tokens=100, cache_read_tokens=900))
+            record_usage(path, "council", "claude", TokenUsage(input_tokens=500, cache_write_tokens=500))
+            record_usage(path, "peasant", "codex", TokenUsage(input_tokens=10, output_tokens=5), ticket="kin-1")
+
+            result = runner.invoke(cli.app, ["council", "stats"])
+            assert result.exit_code == 0
+            assert "45%" in result.output
+            assert "total" in result.output
+
+            result = runner.invoke(cli.app, ["council", "stats", "--source", "council", "--json"])
+            data = json.loads(result.output)
+            assert [(row["agent"], row["calls"], row["cache_read_tokens"]) for row in data] == [("claude", 2, 900)]
+            assert data[0]["cache_hit_ratio"] == 0.45
+
+
+class TestLogs:
+    def test_no_records(self) -> None:
+        with runner.isolated_filesystem():
+            setup_project(Path.cwd())
+
+            result = runner.invoke(cli.app, ["logs"])
+
+            assert result.exit_code == 0
+            assert "No matching log records." in result.output
+
+    def test_filters_and_full_output(self) -> None:
+        from kingdom.logstore import LogStore
+        from kingdom.state import logs_root
+
+        with runner.isolated_filesystem():
+            base = Path.cwd()
+            setup_project(base)
+            store = LogStore(logs_root(base, BRANCH))
+            store.append("council", member="claude", elapsed=3.0, prompt="Q?", response="claude answer")
+            store.append("council", member="codex", elapsed=1.0, error="boom", prompt="Q?", response="")
+            store.append("peasant", member="claude", ticket="kin-042", iteration=2, returncode=0, stdout="{}")
+
+            result = runner.invoke(cli.app, ["logs", "--member", "codex"])
+            assert result.exit_code == 0
+            assert "error: boom" in result.output
+            assert "claude" not in result.output
+
+            result = runner.invoke(cli.app, ["logs", "--ticket", "042", "--full"])
+            assert "kin-042#2" in result.output
+            assert "--- stdout ---" in result.output
+
+            result = runner.invoke(cli.app, ["logs", "--kind", "council", "--full", "--json"])
+            records = [json.loads(line) for line in result.output.splitlines()]
+            assert [r["response"] for r in records] == ["claude answer", ""]
+
+    def test_invalid_since(self) -> None:
+        with runner.isolated_filesystem():
+            setup_project(Path.cwd())
+
+            result = runner.invoke(cli.app, ["logs", "--since", "yesterday"])
+
+            assert result.exit_code == 1
+
+
 class TestCouncilReset:
     def test_reset_clears_sessions(self) -> None:
         with runner.isolated_filesystem():
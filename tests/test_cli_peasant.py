@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 import signal
+import subprocess
 from datetime import UTC, datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -245,6 +246,46 @@ class TestPeasantStatus:
             assert "working" in result.output
             assert "claude" in result.output
 
+    def test_status_shows_candidate_branch_head(self) -> None:
+        with runner.isolated_filesystem():
+            base = Path.cwd()
+            subprocess.run(["git", "init", "-q"], check=True)
+            subprocess.run(["git", "config", "user.email", "test@test.com"], check=True)
+            subprocess.run(["git", "config", "user.name", "Test"], check=True)
+            subprocess.run(["git", "commit", "-q", "--allow-empty", "-m", "init"], check=True)
+            subprocess.run(["git", "branch", "ticket/kin-042-c2"], check=True)
+            head = subprocess.run(["git", "rev-parse", "HEAD"], check=True, capture_output=True, text=True).stdout
+            setup_project(base)
+            state = AgentState(name="peasant-kin-042-c2", status="blocked", ticket="kin-042", agent_backend="codex")
+            set_agent_state(base, BRANCH, state.name, state)
+
+            result = runner.invoke(cli.app, ["peasant", "status"], env={"COLUMNS": "200"})
+
+            assert result.exit_code == 0
+            assert "kin-042-c2" in result.output
+            assert head[:7] in result.output
+
+    def test_status_shows_budget_totals(self) -> None:
+        with runner.isolated_filesystem():
+            base = Path.cwd()
+            setup_project(base)
+            (base / ".kd" / "config.json").write_text('{"peasant": {"max_cost_usd": 5}}')
+            state = AgentState(
+                name="peasant-kin-042",
+                status="budget_exhausted",
+                ticket="kin-042",
+                spent_seconds=600,
+                spent_output_tokens=1500,
+                spent_cost_usd=5.1,
+            )
+            set_agent_state(base, BRANCH, "peasant-kin-042", state)
+
+            result = runner.invoke(cli.app, ["peasant", "status"], env={"COLUMNS": "200"})
+
+            assert result.exit_code == 0
+            assert "budget_exhausted" in result.output
+            assert "10m 1.5k tok $5.10/$5.00" in result.output
+
     def test_status_ignores_non_peasant_sessions(self) -> None:
         with runner.isolated_filesystem():
             base = Path.cwd()
@@ -872,6 +913,28 @@ class TestPeasantReview:
             assert "needs_king_review" in result.output
             assert "--accept" in result.output
 
+    def test_review_full_review_sets_flag(self) -> None:
+        with runner.isolated_filesystem():
+            base = Path.cwd()
+            setup_project(base)
+            create_test_ticket(base, status="in_progress")
+
+            result = runner.invoke(cli.app, ["peasant", "review", "kin-test", "--full-review"])
+
+            assert result.exit_code == 0, result.output
+            assert "full diff" in result.output
+            assert get_agent_state(base, BRANCH, "peasant-kin-test").full_review
+
+    def test_review_full_review_rejects_accept(self) -> None:
+        with runner.isolated_filesystem():
+            base = Path.cwd()
+            setup_project(base)
+            create_test_ticket(base, status="in_review")
+
+            result = runner.invoke(cli.app, ["peasant", "review", "kin-test", "--accept", "--full-review"])
+
+            assert result.exit_code == 1
+
     def test_review_accept_closes_ticket(self) -> None:
         with runner.isolated_filesystem():
             base = Path.cwd()
@@ -1526,3 +1589,209 @@ class TestPeasantNoResultsMessages:
             assert result.exit_code == 0
             assert "No messages from" in result.output
             assert "may still be working" in result.output
+
+
+class TestPeasantPool:
+    def init_repo(self, base: Path) -> None:
+        subprocess.run(["git", "init", "-q"], check=True)
+        subprocess.run(["git", "config", "user.email", "test@test.com"], check=True)
+        subprocess.run(["git", "config", "user.name", "Test"], check=True)
+        (base / ".gitignore").write_text(".kd/\n")
+        subprocess.run(["git", "add", "."], check=True)
+        subprocess.run(["git", "commit", "-q", "-m", "init"], check=True)
+
+    def test_create_worktree_uses_pool_and_clean_returns_it(self) -> None:
+        with runner.isolated_filesystem():
+            base = Path.cwd()
+            self.init_repo(base)
+            setup_project(base)
+            create_test_ticket(base)
+            (base / ".kd" / "config.json").write_text('{"peasant": {"pool_size": 1}}')
+
+            path = cli.create_worktree(base, "kin-test")
+
+            assert path == base / ".kd" / "worktrees" / "pool-1"
+            assert cli.worktree_path_for(base, "kin-test") == path
+
+            result = runner.invoke(cli.app, ["peasant", "clean", "kin-test"])
+
+            assert result.exit_code == 0
+            assert path.exists()
+            assert cli.worktree_path_for(base, "kin-test") == base / ".kd" / "worktrees" / "kin-test"
+
+    def test_create_worktree_falls_back_when_pool_busy(self) -> None:
+        with runner.isolated_filesystem():
+            base = Path.cwd()
+            self.init_repo(base)
+            setup_project(base)
+            (base / ".kd" / "config.json").write_text('{"peasant": {"pool_size": 1}}')
+
+            cli.create_worktree(base, "kin-aaaa")
+            path = cli.create_worktree(base, "kin-bbbb")
+
+            assert path == base / ".kd" / "worktrees" / "kin-bbbb"
+
+    def test_pool_status_lists_members(self) -> None:
+        with runner.isolated_filesystem():
+            base = Path.cwd()
+            self.init_repo(base)
+            setup_project(base)
+
+            result = runner.invoke(cli.app, ["peasant", "pool", "warm", "--size", "2"])
+            assert result.exit_code == 0
+            assert "2 member(s)" in result.output
+
+            result = runner.invoke(cli.app, ["peasant", "pool", "status"])
+            assert result.exit_code == 0
+            assert "pool-1" in result.output
+            assert "pool-2" in result.output
+
+    def test_pool_warm_disabled(self) -> None:
+        with runner.isolated_filesystem():
+            base = Path.cwd()
+            setup_project(base)
+
+            result = runner.invoke(cli.app, ["peasant", "pool", "warm"])
+
+            assert result.exit_code == 1
+            assert "disabled" in result.output
+
+
+class TestPeasantWiden:
+    def init_repo(self, base: Path) -> None:
+        subprocess.run(["git", "init", "-q"], check=True)
+        subprocess.run(["git", "config", "user.email", "test@test.com"], check=True)
+        subprocess.run(["git", "config", "user.name", "Test"], check=True)
+        (base / ".gitignore").write_text(".kd/\n")
+        for name in ("src", "docs"):
+            (base / name).mkdir()
+            (base / name / "file.txt").write_text(name)
+        subprocess.run(["git", "add", "."], check=True)
+        subprocess.run(["git", "commit", "-q", "-m", "init"], check=True)
+
+    def test_sparse_worktree_widened(self) -> None:
+        with runner.isolated_filesystem():
+            base = Path.cwd()
+            self.init_repo(base)
+            setup_project(base)
+            ticket_path = create_test_ticket(base)
+            ticket = read_ticket(ticket_path)
+            ticket.paths = ["src"]
+            write_ticket(ticket, ticket_path)
+            (base / ".kd" / "config.json").write_text('{"peasant": {"sparse": true}}')
+
+            path = cli.create_worktree(base, "kin-test", ticket.paths)
+            assert (path / "src" / "file.txt").exists()
+            assert not (path / "docs").exists()
+
+            result = runner.invoke(cli.app, ["peasant", "widen", "kin-test", "docs"])
+
+            assert result.exit_code == 0, result.output
+            assert (path / "docs" / "file.txt").exists()
+            assert read_ticket(ticket_path).paths == ["src", "docs"]
+
+    def test_widen_full_checkout_fails(self) -> None:
+        with runner.isolated_filesystem():
+            base = Path.cwd()
+            self.init_repo(base)
+            setup_project(base)
+            create_test_ticket(base)
+            cli.create_worktree(base, "kin-test")
+
+            result = runner.invoke(cli.app, ["peasant", "widen", "kin-test", "docs"])
+
+            assert result.exit_code == 1
+            assert "full checkout" in result.output
+
+
+class TestPeasantCandidates:
+    def test_start_races_candidates_on_mixed_agents(self) -> None:
+        from kingdom.candidates import candidate_ticket_path, read_race
+
+        with runner.isolated_filesystem():
+            base = Path.cwd()
+            setup_project(base)
+            create_test_ticket(base)
+            mock_proc = MagicMock()
+            mock_proc.pid = 12345
+
+            with (
+                patch("kingdom.cli.create_worktree", side_effect=lambda b, work_id, paths: b / ".kd" / work_id),
+                patch("subprocess.Popen", return_value=mock_proc),
+            ):
+                result = runner.invoke(
+                    cli.app,
+                    ["peasant", "start", "kin-test", "--candidates", "3", "--agent", "claude", "--agent", "codex"],
+                )
+
+            assert result.exit_code == 0, result.output
+            assert "Racing 3 candidates on kin-test" in result.output
+            race = read_race(base, BRANCH, "kin-test")
+            assert race is not None
+            assert [(c.name, c.agent) for c in race.candidates] == [("c1", "claude"), ("c2", "codex"), ("c3", "claude")]
+            for c in race.candidates:
+                state = get_agent_state(base, BRANCH, c.session_name)
+                assert (state.status, state.ticket, state.thread) == ("working", "kin-test", c.thread_id)
+                assert candidate_ticket_path(base, BRANCH, "kin-test", c.name).exists()
+                assert "Do the thing." in list_messages(base, BRANCH, c.thread_id)[0].body
+            assert "ticket/kin-test-c2" in result.output
+
+    def test_start_candidates_rejects_hand_mode(self) -> None:
+        with runner.isolated_filesystem():
+            setup_project(Path.cwd())
+            create_test_ticket(Path.cwd())
+
+            result = runner.invoke(cli.app, ["peasant", "start", "kin-test", "--candidates", "2", "--hand"])
+
+            assert result.exit_code == 1
+            assert "--hand" in result.output
+
+    def start_race(self, base: Path, winner: str | None) -> None:
+        from kingdom.candidates import Candidate, Race, start_race
+
+        ticket_path = create_test_ticket(base, status="in_review" if winner else "in_progress")
+        race = Race(
+            ticket_id="kin-test",
+            candidates=[Candidate(name=n, work_id=f"kin-test-{n}", agent="claude", worktree="") for n in ("c1", "c2")],
+            winner=winner,
+        )
+        start_race(base, BRANCH, ticket_path, race)
+
+    def test_review_undecided_race_needs_candidate(self) -> None:
+        with runner.isolated_filesystem():
+            base = Path.cwd()
+            setup_project(base)
+            self.start_race(base, winner=None)
+
+            result = runner.invoke(cli.app, ["peasant", "review", "kin-test"])
+
+            assert result.exit_code == 1
+            assert "No candidate has won the race" in result.output
+
+    def test_accept_merges_winning_branch(self) -> None:
+        with runner.isolated_filesystem():
+            base = Path.cwd()
+            setup_project(base)
+            self.start_race(base, winner="c2")
+            set_agent_state(
+                base, BRANCH, "peasant-kin-test-c2", AgentState(name="peasant-kin-test-c2", status="needs_king_review")
+            )
+            calls: list[list[str]] = []
+
+            def mock_run(cmd, **kwargs):
+                calls.append(cmd)
+                result = MagicMock(returncode=0, stdout="", stderr="")
+                if "--abbrev-ref" in cmd:
+                    result.stdout = f"{BRANCH}\n"
+                return result
+
+            with patch("kingdom.cli.subprocess.run", side_effect=mock_run):
+                lost = runner.invoke(cli.app, ["peasant", "review", "kin-test", "--candidate", "c1", "--accept"])
+                result = runner.invoke(cli.app, ["peasant", "review", "kin-test", "--accept"])
+
+            assert lost.exit_code == 1
+            assert "lost the race" in lost.output
+            assert result.exit_code == 0, result.output
+            assert "Integrated ticket/kin-test-c2" in result.output
+            assert ["git", "merge", "ticket/kin-test-c2", "--no-edit"] in calls
+            assert get_agent_state(base, BRANCH, "peasant-kin-test-c2").status == "done"
@@ -168,6 +168,68 @@ class TestTicketCreate:
             assert Path(lines[1]).exists()
 
 
+class TestTicketCreateBatch:
+    def test_yaml_batch(self) -> None:
+        with runner.isolated_filesystem():
+            base = Path.cwd()
+            setup_project(base)
+            existing = create_ticket_in(base / ".kd" / "branches" / "feature-ticket-test" / "tickets")
+            Path("tickets.yaml").write_text(
+                "- ref: db\n  title: Schema\n  priority: 1\n"
+                "- ref: api\n  title: API\n  deps: [db, kin-t001]\n  acceptance:\n    - Serves users\n"
+            )
+
+            result = runner.invoke(cli.app, ["tk", "create", "--batch", "tickets.yaml"])
+
+            assert result.exit_code == 0, result.output
+            lines = result.output.strip().splitlines()
+            assert lines[-1].startswith("Created 2 tickets: ")
+            db_id = lines[0].split(" -> ")[1].split(":")[0]
+            api_id = lines[1].split(" -> ")[1].split(":")[0]
+            api, _ = find_ticket(base, api_id)
+            assert api.deps == [db_id, read_ticket(existing).id]
+            assert "- [ ] Serves users" in api.body
+
+    def test_jsonl_from_stdin_to_backlog(self) -> None:
+        with runner.isolated_filesystem():
+            setup_project(Path.cwd())
+            specs = '{"ref": "a", "title": "First"}\n{"title": "Second", "deps": ["a"], "priority": 3}\n'
+
+            result = runner.invoke(cli.app, ["tk", "create", "--batch", "-", "--backlog"], input=specs)
+
+            assert result.exit_code == 0, result.output
+            assert "Created 2 tickets in backlog" in result.output
+
+    def test_cycle_writes_nothing(self) -> None:
+        with runner.isolated_filesystem():
+            base = Path.cwd()
+            setup_project(base)
+            specs = '{"ref": "a", "title": "A", "deps": ["b"]}\n{"ref": "b", "title": "B", "deps": ["a"]}\n'
+
+            result = runner.invoke(cli.app, ["tk", "create", "--batch", "-"], input=specs)
+
+            assert result.exit_code == 1
+            assert "dependency cycle" in result.output
+            assert not list((base / ".kd" / "branches" / "feature-ticket-test" / "tickets").glob("*.md"))
+
+    def test_batch_rejects_title(self) -> None:
+        with runner.isolated_filesystem():
+            setup_project(Path.cwd())
+
+            result = runner.invoke(cli.app, ["tk", "create", "Title", "--batch", "-"], input="")
+
+            assert result.exit_code == 1
+
+    def test_missing_title(self) -> None:
+        with runner.isolated_filesystem():
+            setup_project(Path.cwd())
+
+            result = runner.invoke(cli.app, ["tk", "create"])
+
+            assert result.exit_code == 1
+            assert "Missing ticket title" in result.output
+
+
 class TestTicketCloseArchive:
     def test_close_backlog_ticket_archives(self) -> None:
         with runner.isolated_filesystem():
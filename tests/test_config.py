@@ -307,6 +307,96 @@ class TestValidateConfigErrors:
         with pytest.raises(ValueError, match="must be positive"):
             validate_config({"peasant": {"max_iterations": 0}})
 
+    def test_peasant_pool_size_must_not_be_negative(self) -> None:
+        with pytest.raises(ValueError, match="pool_size must be 0"):
+            validate_config({"peasant": {"pool_size": -1}})
+
+    def test_peasant_pool_size_and_lockfiles(self) -> None:
+        cfg = validate_config({"peasant": {"pool_size": 3, "lockfiles": ["uv.lock"]}})
+        assert cfg.peasant.pool_size == 3
+        assert cfg.peasant.lockfiles == ["uv.lock"]
+
+    def test_peasant_resource_limits(self) -> None:
+        cfg = validate_config({"peasant": {"nice": 10, "max_memory_mb": 4096, "max_load": 1.5}})
+        assert (cfg.peasant.nice, cfg.peasant.max_memory_mb, cfg.peasant.max_load) == (10, 4096, 1.5)
+        assert cfg.peasant.wall_clock_minutes == 0
+        assert cfg.peasant.max_idle_iterations == 5
+
+    def test_peasant_nice_range(self) -> None:
+        with pytest.raises(ValueError, match="nice must be between 0 and 19"):
+            validate_config({"peasant": {"nice": -5}})
+
+    def test_peasant_limits_must_not_be_negative(self) -> None:
+        with pytest.raises(ValueError, match="wall_clock_minutes must be 0"):
+            validate_config({"peasant": {"wall_clock_minutes": -1}})
+        with pytest.raises(ValueError, match="max_load must be a number"):
+            validate_config({"peasant": {"max_load": "high"}})
+        with pytest.raises(ValueError, match="max_idle_iterations must be 0"):
+            validate_config({"peasant": {"max_idle_iterations": -1}})
+
+    def test_peasant_lockfiles_must_be_strings(self) -> None:
+        with pytest.raises(ValueError, match="lockfiles"):
+            validate_config({"peasant": {"lockfiles": ["uv.lock", 3]}})
+
+    def test_peasant_seed_dirs_must_stay_inside_repo(self) -> None:
+        with pytest.raises(ValueError, match="relative path inside the repo"):
+            validate_config({"peasant": {"seed_dirs": ["../elsewhere"]}})
+
+    def test_peasant_sparse_must_be_boolean(self) -> None:
+        with pytest.raises(ValueError, match="must be a boolean"):
+            validate_config({"peasant": {"sparse": "yes"}})
+
+    def test_peasant_verify_command(self) -> None:
+        assert validate_config({"peasant": {"verify_command": " make check "}}).peasant.verify_command == "make check"
+        with pytest.raises(ValueError, match="verify_command must be a string"):
+            validate_config({"peasant": {"verify_command": ["make"]}})
+
+    def test_peasant_worklog_keep(self) -> None:
+        assert validate_config({}).peasant.worklog_keep == 10
+        assert validate_config({"peasant": {"worklog_keep": 0}}).peasant.worklog_keep == 0
+        with pytest.raises(ValueError, match="worklog_keep must be 0"):
+            validate_config({"peasant": {"worklog_keep": -2}})
+
+    def test_council_review_compaction_defaults_and_overrides(self) -> None:
+        assert "*.lock" in validate_config({}).council.review_ignore
+        cfg = validate_config({"council": {"review_ignore": [], "review_huge_file_chars": 0}})
+        assert cfg.council.review_ignore == []
+        assert cfg.council.review_huge_file_chars == 0
+        assert cfg.council.review_collapse  # defaults kept
+
+    def test_council_review_globs_must_be_strings(self) -> None:
+        with pytest.raises(ValueError, match=r"council.review_collapse\[0\] must be a string"):
+            validate_config({"council": {"review_collapse": [1]}})
+
+    def test_council_chat_history_budget(self) -> None:
+        cfg = validate_config({"council": {"chat_history_tokens": 0, "chat_history_keep": 4}})
+        assert cfg.council.chat_history_tokens == 0
+        assert cfg.council.chat_history_keep == 4
+        assert validate_config({}).council.chat_history_tokens == 32000
+        with pytest.raises(ValueError, match="chat_history_tokens must be 0 \\(unlimited\\) or positive"):
+            validate_config({"council": {"chat_history_tokens": -1}})
+        with pytest.raises(ValueError, match="chat_history_keep must be an integer"):
+            validate_config({"council": {"chat_history_keep": "8"}})
+
+    def test_council_review_workers(self) -> None:
+        assert validate_config({}).council.review_workers == 0
+        assert validate_config({"council": {"review_workers": 2}}).council.review_workers == 2
+        with pytest.raises(ValueError, match="review_workers must be 0 \\(review inline\\) or positive"):
+            validate_config({"council": {"review_workers": -1}})
+
+    def test_council_review_policy(self) -> None:
+        assert validate_config({}).council.review_policy == "all"
+        cfg = validate_config({"council": {"review_policy": "first_blocking"}})
+        assert cfg.council.review_policy == "first_blocking"
+        with pytest.raises(ValueError, match="review_policy must be one of all, first_blocking"):
+            validate_config({"council": {"review_policy": "fastest"}})
+
+    def test_council_chat_resume(self) -> None:
+        assert validate_config({}).council.chat_resume is True
+        assert validate_config({"council": {"chat_resume": False}}).council.chat_resume is False
+        with pytest.raises(ValueError, match="chat_resume must be a boolean"):
+            validate_config({"council": {"chat_resume": "no"}})
+
 
 class TestLoadConfig:
     def test_no_file_returns_defaults(self, tmp_path: Path) -> None:
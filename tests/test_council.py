@@ -164,6 +164,37 @@ class TestCouncilMemberQuery:
             assert response.error is None
             assert response.elapsed > 0
 
+    def test_query_records_token_usage(self, tmp_path: Path) -> None:
+        from kingdom.usage import read_usage
+
+        member = make_member("claude")
+        member.usage_path = tmp_path / "usage.jsonl"
+        stdout = '{"result": "hi", "usage": {"input_tokens": 3, "cache_read_input_tokens": 97, "output_tokens": 4}}\n'
+        proc = mock_popen(stdout=stdout)
+
+        with patch("kingdom.council.base.subprocess.Popen", return_value=proc):
+            response = member.query("test prompt", timeout=30)
+
+        assert response.usage is not None
+        assert response.usage.cache_read_tokens == 97
+        [record] = read_usage(member.usage_path)
+        assert (record["source"], record["agent"], record["input_tokens"]) == ("council", "claude", 3)
+
+    def test_query_writes_event_log(self, tmp_path: Path) -> None:
+        from kingdom.logstore import LogStore
+
+        member = make_member("claude")
+        member.log_store = LogStore(tmp_path)
+        proc = mock_popen(stdout='{"result": "hello"}\n')
+
+        with patch("kingdom.council.base.subprocess.Popen", return_value=proc):
+            member.query("test prompt", timeout=30)
+
+        [record] = member.log_store.query(member="claude")
+        assert record["kind"] == "council"
+        assert record["response"] == "hello"
+        assert "test prompt" in member.log_store.unpack(record["prompt"])
+
     def test_query_updates_session_id(self) -> None:
         """Query should update member's session_id from response."""
         member = make_member("claude")
@@ -753,6 +784,27 @@ class TestQueryToThread:
         assert len(messages) == 2
 
 
+class TestQueryAssignments:
+    """Tests for Council.query_assignments()."""
+
+    def test_returns_responses_in_assignment_order(self, project: Path) -> None:
+        council = Council.create(base=project)
+        council.members[0].session_id = "resume-me"
+
+        with patch("kingdom.council.base.subprocess.Popen") as mock_cls:
+            mock_cls.side_effect = lambda *a, **kw: mock_popen(stdout='{"result": "ok"}\n')
+            responses = council.query_assignments(
+                [("claude", "shard 1"), ("codex", "shard 2"), ("claude", "shard 3"), ("nobody", "shard 4")]
+            )
+
+        assert [r.name for r in responses] == ["claude", "codex", "claude", "nobody"]
+        assert responses[3].error == "Unknown member: nobody"
+        # Workers never resume the member's session, and never overwrite it
+        for call in mock_cls.call_args_list:
+            assert "resume-me" not in call.args[0]
+        assert council.members[0].session_id == "resume-me"
+
+
 _has_worker = importlib.util.find_spec("kingdom.council.worker") is not None
 
 
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+from kingdom.diff import CompactOptions, compact_diff, estimate_tokens, reduce_context, shard_diff, split_diff
+
+
+def file_diff(path: str, hunks: int = 1, width: int = 10) -> str:
+    lines = [f"diff --git a/{path} b/{path}", "index 1111111..2222222 100644", f"--- a/{path}", f"+++ b/{path}"]
+    for i in range(hunks):
+        lines.extend([f"@@ -{i * 10 + 1} +{i * 10 + 1} @@", f"-{'o' * width}", f"+{'n' * width}"])
+    return "\n".join(lines)
+
+
+class TestSplitDiff:
+    def test_splits_files_and_hunks(self) -> None:
+        diff = "\n".join([file_diff("a.py", hunks=2), file_diff("b.py")])
+
+        files = split_diff(diff)
+
+        assert [f.path for f in files] == ["a.py", "b.py"]
+        assert files[0].header.startswith("diff --git a/a.py b/a.py")
+        assert len(files[0].hunks) == 2
+        assert files[0].text == file_diff("a.py", hunks=2)
+
+    def test_empty_diff(self) -> None:
+        assert split_diff("") == []
+
+    def test_binary_file_has_no_hunks(self) -> None:
+        diff = "diff --git a/img.png b/img.png\nBinary files a/img.png and b/img.png differ"
+        files = split_diff(diff)
+        assert files[0].path == "img.png"
+        assert files[0].hunks == []
+
+
+class TestShardDiff:
+    def test_small_diff_is_one_shard(self) -> None:
+        diff = "\n".join([file_diff("a.py"), file_diff("b.py")])
+
+        shards = shard_diff(diff, max_tokens=10_000)
+
+        assert len(shards) == 1
+        assert shards[0].paths == ["a.py", "b.py"]
+        assert shards[0].text == diff
+
+    def test_packs_files_within_budget(self) -> None:
+        diff = "\n".join(file_diff(name, width=100) for name in ("a.py", "b.py", "c.py"))
+        budget = estimate_tokens(file_diff("a.py", width=100)) + 10
+
+        shards = shard_diff(diff, max_tokens=budget)
+
+        assert [s.paths for s in shards] == [["a.py"], ["b.py"], ["c.py"]]
+        assert all(estimate_tokens(s.text) <= budget for s in shards)
+
+    def test_oversized_file_split_by_hunks_with_header(self) -> None:
+        diff = file_diff("big.py", hunks=6, width=100)
+        budget = estimate_tokens(file_diff("big.py", hunks=2, width=100)) + 5
+
+        shards = shard_diff(diff, max_tokens=budget)
+
+        assert len(shards) == 3
+        for shard in shards:
+            assert shard.paths == ["big.py"]
+            assert shard.text.startswith("diff --git a/big.py b/big.py")
+        assert sum(s.text.count("@@ -") for s in shards) == 6
+
+    def test_huge_hunk_is_truncated(self) -> None:
+        diff = file_diff("big.py", width=5000)
+
+        shards = shard_diff(diff, max_tokens=200)
+
+        assert len(shards) == 1
+        assert "hunk truncated" in shards[0].text
+        assert len(shards[0].text) <= 200 * 4
+
+
+def compact(diff: str, **options: object) -> tuple[str, object]:
+    return compact_diff(iter(diff.splitlines(keepends=True)), CompactOptions(**options))
+
+
+class TestCompactDiff:
+    def test_unchanged_diff_passes_through(self) -> None:
+        diff = "\n".join([file_diff("a.py"), file_diff("b.py")])
+
+        text, stats = compact(diff)
+
+        assert text == diff
+        assert stats.files == 2
+        assert not stats.changed
+
+    def test_ignored_files_are_dropped_and_listed(self) -> None:
+        diff = "\n".join([file_diff("a.py"), file_diff("uv.lock", width=500)])
+
+        text, stats = compact(diff, ignore=["*.lock"])
+
+        assert "+" + "n" * 500 not in text
+        assert text.startswith(file_diff("a.py"))
+        assert text.endswith("(ignored for review: uv.lock)")
+        assert stats.ignored == ["uv.lock"]
+
+    def test_generated_and_binary_files_collapse_to_stat_line(self) -> None:
+        binary = "diff --git a/img.png b/img.png\nindex 1..2 100644\nBinary files a/img.png and b/img.png differ"
+        diff = "\n".join([file_diff("api_pb2.py", hunks=3), binary])
+
+        text, stats = compact(diff, collapse=["*_pb2.py"])
+
+        assert "diff --git a/api_pb2.py b/api_pb2.py\n(generated file: +3 -3 lines, diff omitted)" in text
+        assert "diff --git a/img.png b/img.png\n(binary file: binary, diff omitted)" in text
+        assert stats.collapsed == ["api_pb2.py", "img.png"]
+
+    def test_whitespace_only_hunks_are_dropped(self) -> None:
+        diff = "\n".join(
+            [
+                "diff --git a/a.py b/a.py",
+                "--- a/a.py",
+                "+++ b/a.py",
+                "@@ -1,2 +1,3 @@",
+                "-def f(x):  ",
+                "+def f(x):",
+                "+",
+                "@@ -10 +10 @@",
+                "-    return  x",
+                "+    return x + 1",
+            ]
+        )
+
+        text, stats = compact(diff, drop_whitespace=True)
+
+        assert "def f" not in text
+        assert "+    return x + 1" in text
+        assert stats.whitespace_hunks == 1
+
+    def test_indentation_and_inline_whitespace_are_kept(self) -> None:
+        diff = "\n".join(
+            [
+                "diff --git a/a.py b/a.py",
+                "--- a/a.py",
+                "+++ b/a.py",
+                "@@ -5 +5 @@",
+                "-    return x",
+                "+        return x",
+                "@@ -9 +9 @@",
+                "-    return x",
+                "+    returnx",
+            ]
+        )
+
+        text, stats = compact(diff, drop_whitespace=True)
+
+        assert "+        return x" in text
+        assert "+    returnx" in text
+        assert stats.whitespace_hunks == 0
+
+    def test_whitespace_hunks_kept_by_default(self) -> None:
+        diff = "diff --git a/a.py b/a.py\n--- a/a.py\n+++ b/a.py\n@@ -1 +1 @@\n-x = 1 \n+x = 1"
+
+        text, stats = compact(diff)
+
+        assert text == diff
+        assert stats.whitespace_hunks == 0
+
+    def test_file_with_only_whitespace_changes_keeps_header(self) -> None:
+        diff = "diff --git a/a.py b/a.py\n--- a/a.py\n+++ b/a.py\n@@ -1 +1 @@\n-x = 1 \n+x = 1"
+
+        text, _ = compact(diff, drop_whitespace=True)
+
+        assert text == "diff --git a/a.py b/a.py\n--- a/a.py\n+++ b/a.py\n(whitespace-only changes omitted)"
+
+    def test_huge_files_get_reduced_context(self) -> None:
+        body = [f" line {i}" for i in range(1, 11)] + ["-old", "+new"] + [f" line {i}" for i in range(12, 22)]
+        diff = "\n".join(["diff --git a/a.py b/a.py", "--- a/a.py", "+++ b/a.py", "@@ -1,21 +1,21 @@", *body])
+
+        text, stats = compact(diff, huge_file_chars=50, huge_file_context=1)
+
+        assert "@@ -10,3 +10,3 @@\n line 10\n-old\n+new\n line 12" in text
+        assert "line 9" not in text
+        assert stats.reduced_context == ["a.py"]
+
+    def test_output_budget_truncates(self) -> None:
+        diff = "\n".join(file_diff(f"f{i}.py", width=100) for i in range(10))
+
+        text, stats = compact(diff, max_chars=1000)
+
+        assert stats.truncated
+        assert stats.files == 10
+        assert text.endswith("... (diff truncated at 1k chars)")
+        assert len(text) < 1100
+        assert "truncated" in stats.summary()
+
+
+class TestReduceContext:
+    def test_splits_distant_changes_into_hunks(self) -> None:
+        body = ["-a", "+A", " 1", " 2", " 3", " 4", " 5", "-b", "+B", " 6"]
+        hunk = "\n".join(["@@ -1,8 +1,8 @@ def f():", *body])
+
+        hunks = reduce_context(hunk, 1)
+
+        assert hunks == ["@@ -1,2 +1,2 @@ def f():\n-a\n+A\n 1", "@@ -6,3 +6,3 @@ def f():\n 5\n-b\n+B\n 6"]
+
+    def test_pure_addition_header(self) -> None:
+        hunk = "@@ -3,2 +3,3 @@\n x\n+new\n y"
+
+        assert reduce_context(hunk, 0) == ["@@ -3,0 +4,1 @@\n+new"]
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import subprocess
+import threading
+from pathlib import Path
+
+import pytest
+
+from kingdom.git import GitSession, close_sessions, format_git_stats, git_session, git_stats, parse_status
+
+
+def git(cwd: Path, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    git(tmp_path, "init", "-q", "-b", "main")
+    git(tmp_path, "config", "user.email", "test@test.com")
+    git(tmp_path, "config", "user.name", "Test")
+    (tmp_path / "a.txt").write_text("a\n")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "init")
+    return tmp_path
+
+
+class TestParseStatus:
+    def test_branch_headers(self) -> None:
+        status = parse_status(
+            "# branch.oid abc123\n# branch.head main\n# branch.upstream origin/main\n# branch.ab +2 -1\n"
+        )
+        assert status.head_sha == "abc123"
+        assert status.branch == "main"
+        assert status.upstream == "origin/main"
+        assert (status.ahead, status.behind) == (2, 1)
+        assert not status.dirty
+
+    def test_detached_and_unborn(self) -> None:
+        status = parse_status("# branch.oid (initial)\n# branch.head (detached)\n")
+        assert status.head_sha is None
+        assert status.branch is None
+
+    def test_entries_make_it_dirty(self) -> None:
+        status = parse_status("# branch.oid abc123\n? new.txt\n")
+        assert status.dirty
+        assert status.entries == ["? new.txt"]
+
+
+class TestGitSession:
+    def test_resolve_batches_refs(self, repo: Path) -> None:
+        session = GitSession(repo)
+        head = git(repo, "rev-parse", "HEAD")
+
+        resolved = session.resolve("HEAD", "refs/heads/main", "refs/heads/missing")
+
+        assert resolved == {"HEAD": head, "refs/heads/main": head, "refs/heads/missing": None}
+        assert session.stats["cat-file"].calls == 1
+        session.close()
+
+    def test_batch_process_is_reused(self, repo: Path) -> None:
+        session = GitSession(repo)
+        session.resolve("HEAD")
+        proc = session._batch
+        session.resolve("refs/heads/main")
+        assert session._batch is proc
+        session.close()
+        assert session._batch is None
+
+    def test_resolve_outside_repo_returns_none(self, tmp_path: Path) -> None:
+        session = GitSession(tmp_path)
+        assert session.resolve("HEAD") == {"HEAD": None}
+        session.close()
+
+    def test_status_reports_head_and_changes(self, repo: Path) -> None:
+        session = GitSession(repo)
+        assert session.status().head_sha == git(repo, "rev-parse", "HEAD")
+        assert not session.status().dirty
+
+        (repo / "b.txt").write_text("b\n")
+
+        assert session.status().dirty
+        assert not session.status(untracked=False).dirty
+        assert session.stats["status"].calls == 4
+
+    def test_stream_reads_lines_and_sets_returncode(self, repo: Path) -> None:
+        session = GitSession(repo)
+
+        with session.stream("log", "--format=%s") as proc:
+            lines = list(proc.stdout)
+
+        assert lines == ["init\n"]
+        assert proc.returncode == 0
+        assert session.stats["log"].calls == 1
+
+    def test_stream_stopped_early(self, repo: Path) -> None:
+        for i in range(3):
+            (repo / "a.txt").write_text(f"{i}\n")
+            git(repo, "commit", "-q", "-am", f"c{i}")
+
+        with GitSession(repo).stream("log", "--format=%s") as proc:
+            first = proc.stdout.readline()
+
+        assert first == "c2\n"
+        assert proc.returncode is not None
+
+    def test_status_raises_outside_repo(self, tmp_path: Path) -> None:
+        with pytest.raises(RuntimeError, match="git status failed"):
+            GitSession(tmp_path).status()
+
+
+class TestSessionRegistry:
+    def test_sessions_cached_per_worktree(self, repo: Path) -> None:
+        assert git_session(repo) is git_session(repo / ".")
+        close_sessions()
+
+    def test_stats_aggregate_across_sessions(self, repo: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+        close_sessions()
+        git_session(repo).run("rev-parse", "HEAD")
+        git_session(tmp_path_factory.mktemp("other")).run("rev-parse", "HEAD")
+
+        assert git_stats()["rev-parse"].calls == 2
+        assert "rev-parse 2x" in format_git_stats()
+        close_sessions()
+        assert format_git_stats() == "no git calls"
+
+    def test_stats_count_calls_from_threads(self, repo: Path) -> None:
+        close_sessions()
+        session = git_session(repo)
+        threads = [threading.Thread(target=lambda: session.run("rev-parse", "HEAD")) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert git_stats()["rev-parse"].calls == 8
+        close_sessions()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+import subprocess
 from datetime import UTC, datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -23,7 +24,11 @@ from kingdom.harness import (
     parse_verdict,
     run_agent_loop,
     run_council_review,
+    split_worklog_entries,
+    window_worklog,
+    worklog_summary_path,
 )
+from kingdom.review_queue import queued_reviews
 from kingdom.session import AgentState, get_agent_state, set_agent_state
 from kingdom.state import ensure_branch_layout, set_current_run
 from kingdom.thread import add_message, create_thread, list_messages
@@ -62,6 +67,16 @@ def ticket_path(project: Path) -> Path:
 
 
 class TestBuildPrompt:
+    def test_volatile_content_last(self) -> None:
+        ticket_path = Path("/project/tickets/kin-001.md")
+        first = build_prompt(ticket_path, "- [12:00] Did A", [], 1, 50, "Phase prompt")
+        later = build_prompt(ticket_path, "- [12:00] Did A\n- [12:05] Did B", ["Use pytest"], 7, 50, "Phase prompt")
+
+        prefix = first.split("## Current Worklog")[0]
+        assert later.startswith(prefix)
+        assert "STATUS: CONTINUE" in prefix
+        assert later.rstrip().endswith("This is iteration 7 of 50.")
+
     def test_basic_prompt(self) -> None:
         ticket_path = Path("/project/tickets/kin-001.md")
         prompt = build_prompt(ticket_path, "", [], 1, 50)
@@ -246,6 +261,37 @@ class TestFormatWorklogTimestamp:
         assert re.match(r"^\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}\]$", old_result)
 
 
+class TestWindowWorklog:
+    def worklog(self, count: int) -> str:
+        detail = "Ran the suite and fixed lint. " * 4
+        return "\n".join(f"- [12:{i:02d}] — Step {i} done. {detail}".rstrip() for i in range(1, count + 1))
+
+    def test_split_keeps_continuation_lines(self) -> None:
+        assert split_worklog_entries("- a\n  more\n\n- b") == ["- a\n  more", "- b"]
+
+    def test_short_worklog_unchanged(self, project: Path, ticket_path: Path) -> None:
+        worklog = self.worklog(15)
+        assert window_worklog(project, "kin-test", ticket_path, worklog, keep=10) == worklog
+        assert window_worklog(project, "kin-test", ticket_path, self.worklog(40), keep=0) == self.worklog(40)
+
+    def test_older_entries_summarized_in_blocks(self, project: Path, ticket_path: Path) -> None:
+        result = window_worklog(project, "kin-test", ticket_path, self.worklog(34), keep=10)
+
+        assert result.startswith(f"(Entries 1-20 are summarized; the full worklog is in {ticket_path})")
+        assert "- [12:01] — Step 1 done." in result
+        summary = result.split("Latest entries:")[0]
+        assert summary.count("fixed lint") < 20 * 4
+        latest = result.split("Latest entries:\n")[1].splitlines()
+        assert latest[0].startswith("- [12:21]") and len(latest) == 14
+        assert worklog_summary_path(project, "kin-test", 11, 20).exists()
+
+    def test_summary_prefix_stable_until_block_fills(self, project: Path, ticket_path: Path) -> None:
+        first = window_worklog(project, "kin-test", ticket_path, self.worklog(21), keep=10)
+        later = window_worklog(project, "kin-test", ticket_path, self.worklog(29), keep=10)
+
+        assert first.split("Latest entries:")[0] == later.split("Latest entries:")[0]
+
+
 class TestExtractWorklog:
     def test_no_worklog(self, ticket_path: Path) -> None:
         assert extract_worklog(ticket_path) == ""
@@ -401,6 +447,169 @@ class TestRunAgentLoop:
         ticket = read_ticket(ticket_path)
         assert "no code changes detected" in ticket.body.lower()
 
+    def test_loop_rejects_done_when_verification_fails(self, project: Path, ticket_path: Path) -> None:
+        """Failed verification bounces DONE back; the passing result goes to the council."""
+        from kingdom.verify import VerifyResult
+
+        thread_id, session_name = self.setup_for_loop(project, ticket_path)
+        (project / ".kd" / "config.json").write_text('{"peasant": {"verify_command": "make check"}}')
+
+        mock_result = MagicMock()
+        mock_result.stdout = '{"result": "All done.\\n\\nSTATUS: DONE", "session_id": "s1"}'
+        mock_result.stderr = ""
+        mock_result.returncode = 0
+        results = [
+            VerifyResult(tree="t1", command="make check", returncode=2, seconds=1.0, output="E   assert 1 == 2"),
+            VerifyResult(tree="t2", command="make check", returncode=0, seconds=1.0),
+        ]
+
+        with (
+            patch("kingdom.harness.subprocess.run", return_value=mock_result) as mock_run,
+            patch("kingdom.harness.has_code_changes", return_value=True),
+            patch("kingdom.harness.run_verification", side_effect=results),
+            patch("kingdom.harness.run_council_review", return_value=COUNCIL_APPROVED) as mock_review,
+        ):
+            status = run_agent_loop(
+                base=project,
+                branch=BRANCH,
+                agent_name="claude",
+                ticket_id="kin-test",
+                worktree=project,
+                thread_id=thread_id,
+                session_name=session_name,
+            )
+
+        assert status == "needs_king_review"
+        assert sum(1 for c in mock_run.call_args_list if c.args[0][0] != "git") == 2
+        assert "verification failed" in read_ticket(ticket_path).body.lower()
+        feedback = [m for m in list_messages(project, BRANCH, thread_id) if "Verification Failed" in m.body]
+        assert "assert 1 == 2" in feedback[0].body
+        mock_review.assert_called_once()
+        assert mock_review.call_args.kwargs["verification"].startswith("`make check` passed")
+
+    def test_loop_waits_in_queue_and_applies_limits(self, project: Path, ticket_path: Path) -> None:
+        thread_id, session_name = self.setup_for_loop(project, ticket_path)
+        (project / ".kd" / "config.json").write_text(
+            '{"peasant": {"max_load": 2, "nice": 5, "wall_clock_minutes": 1, "timeout": 900}}'
+        )
+
+        mock_result = MagicMock()
+        mock_result.stdout = '{"result": "All done.\\n\\nSTATUS: DONE", "session_id": "s1"}'
+        mock_result.stderr = ""
+        mock_result.returncode = 0
+        statuses: list[str] = []
+
+        def record_sleep(seconds: float) -> None:
+            statuses.append(get_agent_state(project, BRANCH, session_name).status)
+
+        with (
+            patch("kingdom.harness.admission_wait_reason", side_effect=["load 3.00 per CPU", None]),
+            patch("kingdom.harness.time.sleep", side_effect=record_sleep),
+            patch("kingdom.harness.subprocess.run", return_value=mock_result) as mock_run,
+            patch("kingdom.harness.run_council_review", return_value=COUNCIL_APPROVED),
+            patch("kingdom.harness.ResourceLimits.apply", autospec=True) as mock_apply,
+        ):
+            status = run_agent_loop(
+                base=project,
+                branch=BRANCH,
+                agent_name="claude",
+                ticket_id="kin-test",
+                worktree=project,
+                thread_id=thread_id,
+                session_name=session_name,
+            )
+
+        assert status == "needs_king_review"
+        assert statuses == ["queued"]
+        backend_call = next(c for c in mock_run.call_args_list if "env" in c.kwargs)
+        assert backend_call.kwargs["timeout"] <= 60  # capped by the wall-clock budget
+        assert "preexec_fn" not in backend_call.kwargs
+        [(limits,)] = [c.args for c in mock_apply.call_args_list]
+        assert limits.nice == 5
+
+    def test_loop_blocks_after_idle_iterations(self, project: Path, ticket_path: Path) -> None:
+        thread_id, session_name = self.setup_for_loop(project, ticket_path)
+        (project / ".kd" / "config.json").write_text('{"peasant": {"max_idle_iterations": 2}}')
+
+        mock_result = MagicMock()
+        mock_result.stdout = '{"result": "Looking into it.\\n\\nSTATUS: CONTINUE", "session_id": "s1"}'
+        mock_result.stderr = ""
+        mock_result.returncode = 0
+
+        with patch("kingdom.harness.subprocess.run", return_value=mock_result) as mock_run:
+            status = run_agent_loop(
+                base=project,
+                branch=BRANCH,
+                agent_name="claude",
+                ticket_id="kin-test",
+                worktree=project,
+                thread_id=thread_id,
+                session_name=session_name,
+            )
+
+        assert status == "blocked"
+        # The first CONTINUE sets the baseline; the next two repeat it with no commits or diff changes
+        assert sum(1 for c in mock_run.call_args_list if "env" in c.kwargs) == 3
+        assert "No progress in 2 iterations" in read_ticket(ticket_path).body
+        assert get_agent_state(project, BRANCH, session_name).status == "blocked"
+
+    def test_loop_stops_when_wall_clock_budget_runs_out(self, project: Path, ticket_path: Path) -> None:
+        thread_id, session_name = self.setup_for_loop(project, ticket_path)
+        (project / ".kd" / "config.json").write_text('{"peasant": {"wall_clock_minutes": 1}}')
+
+        with (
+            patch("kingdom.harness.subprocess.run", side_effect=subprocess.TimeoutExpired("claude", 60)),
+            patch("kingdom.harness.run_council_review", return_value=COUNCIL_APPROVED),
+        ):
+            status = run_agent_loop(
+                base=project,
+                branch=BRANCH,
+                agent_name="claude",
+                ticket_id="kin-test",
+                worktree=project,
+                thread_id=thread_id,
+                session_name=session_name,
+            )
+
+        assert status == "budget_exhausted"
+        assert "Budget exhausted: wall-clock budget of 1 min used up" in read_ticket(ticket_path).body
+        assert get_agent_state(project, BRANCH, session_name).status == "budget_exhausted"
+
+    def test_loop_stops_when_token_budget_runs_out(self, project: Path, ticket_path: Path) -> None:
+        """Usage totals accumulate across iterations and runs; the ticket's budget overrides config."""
+        thread_id, session_name = self.setup_for_loop(project, ticket_path)
+        (project / ".kd" / "config.json").write_text('{"peasant": {"max_output_tokens": 100000}}')
+        ticket = read_ticket(ticket_path)
+        ticket.budget_output_tokens = 1000
+        write_ticket(ticket, ticket_path)
+        set_agent_state(project, BRANCH, session_name, AgentState(name=session_name, spent_output_tokens=200))
+
+        mock_result = MagicMock()
+        mock_result.stdout = (
+            '{"type": "result", "result": "Progress.\\n\\nSTATUS: CONTINUE", "session_id": "s1",'
+            ' "total_cost_usd": 0.25, "usage": {"output_tokens": 500}}'
+        )
+        mock_result.stderr = ""
+        mock_result.returncode = 0
+
+        with patch("kingdom.harness.subprocess.run", return_value=mock_result) as mock_run:
+            status = run_agent_loop(
+                base=project,
+                branch=BRANCH,
+                agent_name="claude",
+                ticket_id="kin-test",
+                worktree=project,
+                thread_id=thread_id,
+                session_name=session_name,
+            )
+
+        assert status == "budget_exhausted"
+        assert sum(1 for c in mock_run.call_args_list if "env" in c.kwargs) == 2
+        state = get_agent_state(project, BRANCH, session_name)
+        assert (state.spent_output_tokens, state.spent_cost_usd) == (1200, 0.5)
+        assert state.spent_seconds >= 0
+        assert "output-token budget of 1,000 used up (1,200 tokens)" in read_ticket(ticket_path).body
+
     def test_loop_passes_peasant_identity_env(self, project: Path, ticket_path: Path, monkeypatch) -> None:
         """Backend subprocess should receive peasant identity env vars."""
         thread_id, session_name = self.setup_for_loop(project, ticket_path)
@@ -679,6 +888,43 @@ class TestRunAgentLoop:
         assert "Agent stderr" in log_text
         assert "some debug info from agent" in log_text
 
+    def test_agent_output_in_event_log(self, project: Path, ticket_path: Path) -> None:
+        """The full agent output goes to the event log; only its tail is echoed."""
+        from kingdom.logstore import LogStore
+        from kingdom.state import logs_root
+
+        thread_id, session_name = self.setup_for_loop(project, ticket_path)
+
+        mock_result = MagicMock()
+        mock_result.stdout = '{"result": "Edited foo.py\\n\\nSTATUS: DONE", "session_id": "s1"}'
+        mock_result.stderr = "\n".join(f"debug line {i}" for i in range(100))
+        mock_result.returncode = 0
+
+        with (
+            patch("kingdom.harness.subprocess.run", return_value=mock_result),
+            patch("kingdom.harness.run_council_review", return_value=COUNCIL_APPROVED),
+            patch("kingdom.harness.logger") as mock_logger,
+        ):
+            run_agent_loop(
+                base=project,
+                branch=BRANCH,
+                agent_name="claude",
+                ticket_id="kin-test",
+                worktree=project,
+                thread_id=thread_id,
+                session_name=session_name,
+            )
+
+        log_text = "\n".join(str(call) for call in mock_logger.info.call_args_list)
+        assert "debug line 99" in log_text
+        assert "debug line 0\\n" not in log_text
+
+        store = LogStore(logs_root(project, BRANCH))
+        [record] = store.query(kind="peasant", ticket="kin-test")
+        assert (record["member"], record["session"], record["iteration"]) == ("claude", session_name, 1)
+        assert store.unpack(record["stderr"]) == mock_result.stderr
+        assert "kin-test" in store.unpack(record["prompt"])
+
     def test_loop_stopped_by_signal_after_backend(self, project: Path, ticket_path: Path) -> None:
         """SIGTERM during backend call should stop after it returns."""
         thread_id, session_name = self.setup_for_loop(project, ticket_path)
@@ -889,6 +1135,15 @@ class TestBuildReviewPrompt:
         assert "VERDICT: APPROVED" in prompt
         assert "VERDICT: BLOCKING" in prompt
 
+    def test_stable_prefix_before_diff(self) -> None:
+        first = build_review_prompt("Title", "Body", "diff one", "- step 1", scope="Shard 1 of 2")
+        second = build_review_prompt("Title", "Body", "diff two", "- step 2", verification="`make` passed")
+
+        prefix = first.split("### Review Scope")[0]
+        assert second.startswith(prefix)
+        assert "VERDICT: BLOCKING" in prefix
+        assert "diff one" not in prefix
+
 
 class TestHasCodeChanges:
     def test_detects_uncommitted_changes(self, tmp_path: Path) -> None:
@@ -929,6 +1184,13 @@ class TestHasCodeChanges:
             mock_run.return_value = MagicMock(returncode=0, stdout="")
             assert has_code_changes(tmp_path, None) is True
 
+    def test_head_at_start_sha_skips_log(self, tmp_path: Path) -> None:
+        """When status reports HEAD == start_sha, no history walk is needed."""
+        with patch("kingdom.harness.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="# branch.oid abc123\n# branch.head main\n")
+            assert has_code_changes(tmp_path, "abc123") is False
+            mock_run.assert_called_once()
+
     def test_returns_true_on_error(self, tmp_path: Path) -> None:
         """On git failure, assume changes exist to avoid false rejections."""
         with patch("kingdom.harness.subprocess.run", side_effect=FileNotFoundError):
@@ -971,6 +1233,38 @@ class TestGetDiff:
             diff = get_diff(tmp_path, "abc123")
             assert diff == "(could not generate diff)"
 
+    def test_compaction_streams_real_diff(self, tmp_path: Path) -> None:
+        from kingdom.diff import CompactOptions
+
+        for args in (["init", "-q", "-b", "main"], ["config", "user.email", "t@t.com"], ["config", "user.name", "T"]):
+            subprocess.run(["git", *args], cwd=tmp_path, check=True)
+        subprocess.run(["git", "commit", "-q", "--allow-empty", "-m", "init"], cwd=tmp_path, check=True)
+        start = subprocess.run(["git", "rev-parse", "HEAD"], cwd=tmp_path, capture_output=True, text=True).stdout
+        (tmp_path / "app.py").write_text("x = 1\n")
+        (tmp_path / "uv.lock").write_text("pinned\n" * 100)
+        subprocess.run(["git", "add", "."], cwd=tmp_path, check=True)
+        subprocess.run(["git", "commit", "-q", "-m", "work"], cwd=tmp_path, check=True)
+
+        diff = get_diff(tmp_path, start.strip(), compaction=CompactOptions(ignore=["*.lock"]))
+
+        assert "+x = 1" in diff
+        assert "pinned" not in diff
+        assert "(ignored for review: uv.lock)" in diff
+        assert "review diff compacted — 2 files: 1 ignored" in diff
+
+    def test_compaction_timeout_is_not_an_empty_diff(self, tmp_path: Path) -> None:
+        from kingdom.diff import CompactOptions
+
+        killed = MagicMock(returncode=-9, stdout=iter(["diff --git a/x.py b/x.py\n"]))
+        stream = MagicMock()
+        stream.return_value.__enter__.return_value = killed
+
+        with patch("kingdom.git.GitSession.stream", stream):
+            diff = get_diff(tmp_path, "abc123", compaction=CompactOptions())
+
+        assert diff == "(could not generate diff)"
+        stream.assert_called_once()
+
 
 class TestRunCouncilReview:
     def test_no_council_members(self, project: Path, ticket_path: Path) -> None:
@@ -1053,6 +1347,94 @@ class TestRunCouncilReview:
         assert "codex" in feedback[0]
         assert "Missing tests" in feedback[0]
 
+    def test_verdicts_counted_once_when_streamed(self, project: Path, ticket_path: Path) -> None:
+        """Responses seen by the callback are not counted again from the returned dict."""
+        from kingdom.council.base import AgentResponse
+
+        thread_id = "review-streamed"
+        create_thread(project, BRANCH, thread_id, ["king", "claude", "codex"], "council")
+        responses = {
+            "claude": AgentResponse(name="claude", text="Looks fine.\n\nVERDICT: APPROVED"),
+            "codex": AgentResponse(name="codex", text="Missing tests.\n\nVERDICT: BLOCKING"),
+        }
+
+        def query_to_thread(**kwargs):
+            for name, response in responses.items():
+                kwargs["callback"](name, response)
+            return responses
+
+        mock_council = MagicMock()
+        mock_council.members = [MagicMock(name="claude"), MagicMock(name="codex")]
+        mock_council.review_policy = "all"
+        mock_council.query_to_thread.side_effect = query_to_thread
+
+        with patch("kingdom.council.council.Council.create", return_value=mock_council):
+            outcome, feedback = run_council_review(
+                project, BRANCH, project, ticket_path, "peasant-test", thread_id, "abc123", 600
+            )
+
+        assert outcome == "blocking"
+        assert len(feedback) == 1
+
+    def test_first_blocking_bounces_before_slow_reviewers(self, project: Path, ticket_path: Path) -> None:
+        """With review_policy first_blocking, the round ends on the first BLOCKING; later ones follow up."""
+        import threading
+
+        from kingdom.council.base import AgentResponse
+
+        thread_id = "review-early"
+        create_thread(project, BRANCH, thread_id, ["king", "claude", "codex", "peasant-test"], "work")
+        release = threading.Event()
+        done = threading.Event()
+
+        def query_to_thread(**kwargs):
+            callback = kwargs["callback"]
+            fast = AgentResponse(name="codex", text="Off by one.\n\nVERDICT: BLOCKING", session_id="s-codex")
+            callback("codex", fast)
+            release.wait(5)
+            slow = AgentResponse(name="claude", text="Also no tests.\n\nVERDICT: BLOCKING", session_id="s-claude")
+            callback("claude", slow)
+            done.set()
+            return {"codex": fast, "claude": slow}
+
+        mock_council = MagicMock()
+        mock_council.members = [MagicMock(name="claude"), MagicMock(name="codex")]
+        mock_council.review_policy = "first_blocking"
+        mock_council.query_to_thread.side_effect = query_to_thread
+
+        with patch("kingdom.council.council.Council.create", return_value=mock_council):
+            outcome, feedback = run_council_review(
+                project, BRANCH, project, ticket_path, "peasant-test", thread_id, "abc123", 600
+            )
+            assert not done.is_set()
+            assert get_agent_state(project, BRANCH, "peasant-test").review_sessions is None
+
+            # The next round waits until the slow reviewer is done with its session
+            next_round = threading.Thread(
+                target=run_council_review,
+                args=(project, BRANCH, project, ticket_path, "peasant-test", thread_id, "abc123", 600),
+            )
+            next_round.start()
+            next_round.join(0.5)
+            assert next_round.is_alive()
+            assert mock_council.query_to_thread.call_count == 1
+            release.set()
+            assert done.wait(5)
+            next_round.join(5)
+            for thread in threading.enumerate():
+                if thread.name == "council-review-peasant-test":
+                    thread.join(5)
+
+        assert outcome == "blocking"
+        assert [entry.split("]")[0] for entry in feedback] == ["[codex"]
+        follow_ups = [m for m in list_messages(project, BRANCH, thread_id) if "follow-up" in m.body]
+        assert [(m.from_, m.to) for m in follow_ups] == [("king", "peasant-test")]
+        assert "Also no tests" in follow_ups[0].body
+        assert mock_council.query_to_thread.call_count == 2
+        state = get_agent_state(project, BRANCH, "peasant-test")
+        assert state.review_sessions == {"codex": "s-codex", "claude": "s-claude"}
+        assert [entry.split("]")[0] for entry in state.review_feedback] == ["[codex", "[claude"]
+
     def test_error_response_skipped(self, project: Path, ticket_path: Path) -> None:
         """Errored council responses should be skipped, not block."""
         from kingdom.council.base import AgentResponse
@@ -1081,6 +1463,150 @@ class TestRunCouncilReview:
         assert outcome == "approved"
         assert feedback == []
 
+    def test_chunked_review_fans_out_shards(self, project: Path, ticket_path: Path) -> None:
+        """Chunked mode splits a large diff across members and reduces verdicts."""
+        from kingdom.council.base import AgentResponse
+
+        thread_id = "review-thread4"
+        create_thread(project, BRANCH, thread_id, ["king", "claude", "codex"], "council")
+
+        claude, codex = MagicMock(), MagicMock()
+        claude.name, codex.name = "claude", "codex"
+        mock_council = MagicMock()
+        mock_council.members = [claude, codex]
+        mock_council.review_mode = "chunked"
+        mock_council.review_shard_tokens = 50
+        mock_council.query_assignments.return_value = [
+            AgentResponse(name="claude", text="Fine.\n\nVERDICT: APPROVED"),
+            AgentResponse(name="codex", text="Off by one.\n\nVERDICT: BLOCKING"),
+        ]
+        diff = "\n".join(
+            f"diff --git a/{name} b/{name}\n--- a/{name}\n+++ b/{name}\n@@ -1 +1 @@\n-{'x' * 60}\n+{'y' * 60}"
+            for name in ("a.py", "b.py")
+        )
+
+        with (
+            patch("kingdom.council.council.Council.create", return_value=mock_council),
+            patch("kingdom.harness.get_diff", return_value=diff) as mock_get_diff,
+        ):
+            outcome, feedback = run_council_review(
+                base=project,
+                branch=BRANCH,
+                worktree=project,
+                ticket_path=ticket_path,
+                session_name="peasant-test",
+                thread_id=thread_id,
+                start_sha="abc123",
+                council_timeout=600,
+            )
+
+        assert mock_get_diff.call_args.kwargs["max_chars"] is None
+        assignments = mock_council.query_assignments.call_args[0][0]
+        assert [name for name, _ in assignments] == ["claude", "codex"]
+        assert "a.py" in assignments[0][1] and "b.py" not in assignments[0][1]
+        assert "shard 2/2" in assignments[1][1]
+        mock_council.query_to_thread.assert_not_called()
+        assert outcome == "blocking"
+        assert feedback == ["[codex · shard 2/2] Off by one.\n\nVERDICT: BLOCKING"]
+
+    def init_repo(self, project: Path) -> str:
+        for args in (["init", "-q", "-b", "main"], ["config", "user.email", "t@t.com"], ["config", "user.name", "T"]):
+            subprocess.run(["git", *args], cwd=project, check=True)
+        (project / "app.py").write_text("x = 1\n")
+        subprocess.run(["git", "add", "app.py"], cwd=project, check=True)
+        subprocess.run(["git", "commit", "-q", "-m", "init"], cwd=project, check=True)
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=project, capture_output=True, text=True).stdout.strip()
+
+    def delta_council(self) -> MagicMock:
+        from kingdom.council.base import AgentResponse
+
+        claude, codex = MagicMock(), MagicMock()
+        claude.name, codex.name = "claude", "codex"
+        council = MagicMock()
+        council.members = [claude, codex]
+        council.query_to_thread.return_value = {
+            "claude": AgentResponse(name="claude", text="Fixed.\n\nVERDICT: APPROVED", session_id="s1"),
+            "codex": AgentResponse(name="codex", text="Fixed.\n\nVERDICT: APPROVED", session_id="s2"),
+        }
+        return council
+
+    def test_blocking_round_records_review_state(self, project: Path, ticket_path: Path) -> None:
+        from kingdom.council.base import AgentResponse
+
+        head = self.init_repo(project)
+        create_thread(project, BRANCH, "review-rec", ["king", "claude", "codex"], "council")
+        mock_council = self.delta_council()
+        mock_council.query_to_thread.return_value = {
+            "claude": AgentResponse(name="claude", text="Fine.\n\nVERDICT: APPROVED", session_id="s1"),
+            "codex": AgentResponse(name="codex", text="Bug.\n\nVERDICT: BLOCKING", session_id="s2"),
+        }
+
+        with patch("kingdom.council.council.Council.create", return_value=mock_council):
+            run_council_review(project, BRANCH, project, ticket_path, "peasant-test", "review-rec", head, 600)
+
+        state = get_agent_state(project, BRANCH, "peasant-test")
+        assert state.reviewed_sha == head
+        assert state.review_feedback == ["[codex] Bug.\n\nVERDICT: BLOCKING"]
+        assert state.review_sessions == {"claude": "s1", "codex": "s2"}
+
+    def test_bounce_back_sends_only_delta(self, project: Path, ticket_path: Path) -> None:
+        reviewed = self.init_repo(project)
+        (project / "app.py").write_text("x = 2\n")
+        subprocess.run(["git", "commit", "-q", "-am", "fix"], cwd=project, check=True)
+        set_agent_state(
+            project,
+            BRANCH,
+            "peasant-test",
+            AgentState(
+                name="peasant-test",
+                reviewed_sha=reviewed,
+                review_feedback=["[codex] x should be 2"],
+                review_sessions={"claude": "s1", "codex": "s2"},
+            ),
+        )
+        create_thread(project, BRANCH, "review-delta", ["king", "claude", "codex"], "council")
+        mock_council = self.delta_council()
+
+        with patch("kingdom.council.council.Council.create", return_value=mock_council):
+            outcome, _ = run_council_review(
+                project, BRANCH, project, ticket_path, "peasant-test", "review-delta", reviewed, 600
+            )
+
+        prompt = mock_council.query_to_thread.call_args.kwargs["prompt"]
+        assert prompt.startswith("## Follow-up Code Review Request")
+        assert "[codex] x should be 2" in prompt
+        assert "+x = 2" in prompt
+        assert "Implement the thing" not in prompt
+        assert [m.session_id for m in mock_council.members] == ["s1", "s2"]
+        assert outcome == "approved"
+        state = get_agent_state(project, BRANCH, "peasant-test")
+        assert state.review_feedback is None
+        assert state.reviewed_sha != reviewed
+
+    def test_full_review_flag_forces_full_diff(self, project: Path, ticket_path: Path) -> None:
+        reviewed = self.init_repo(project)
+        set_agent_state(
+            project,
+            BRANCH,
+            "peasant-test",
+            AgentState(
+                name="peasant-test",
+                reviewed_sha=reviewed,
+                review_feedback=["[codex] x should be 2"],
+                review_sessions={"claude": "s1", "codex": "s2"},
+                full_review=True,
+            ),
+        )
+        create_thread(project, BRANCH, "review-full", ["king", "claude", "codex"], "council")
+        mock_council = self.delta_council()
+
+        with patch("kingdom.council.council.Council.create", return_value=mock_council):
+            run_council_review(project, BRANCH, project, ticket_path, "peasant-test", "review-full", reviewed, 600)
+
+        prompt = mock_council.query_to_thread.call_args.kwargs["prompt"]
+        assert prompt.startswith("## Code Review Request")
+        assert not get_agent_state(project, BRANCH, "peasant-test").full_review
+
 
 class TestCouncilReviewInLoop:
     """Integration tests for council review within the harness loop."""
@@ -1124,6 +1650,44 @@ class TestCouncilReviewInLoop:
         ticket = read_ticket(ticket_path)
         assert ticket.status == "in_review"
 
+    def test_review_workers_queue_the_review(self, project: Path, ticket_path: Path) -> None:
+        """With council.review_workers, DONE queues the review and releases the peasant."""
+        thread_id, session_name = self.setup_for_loop(project, ticket_path)
+        (project / ".kd" / "config.json").write_text('{"council": {"review_workers": 2}}')
+
+        mock_result = MagicMock()
+        mock_result.stdout = '{"result": "Done.\\n\\nSTATUS: DONE", "session_id": "s1"}'
+        mock_result.stderr = ""
+        mock_result.returncode = 0
+
+        def check_state(base: Path, branch: str, limit: int) -> int:
+            # The final session update happens before any worker can pick the request up
+            assert get_agent_state(base, branch, session_name).status == "awaiting_council"
+            assert limit == 2
+            return 1
+
+        with (
+            patch("kingdom.harness.subprocess.run", return_value=mock_result),
+            patch("kingdom.harness.run_council_review") as mock_review,
+            patch("kingdom.harness.ensure_review_workers", side_effect=check_state) as mock_workers,
+        ):
+            status = run_agent_loop(
+                base=project,
+                branch=BRANCH,
+                agent_name="claude",
+                ticket_id="kin-test",
+                worktree=project,
+                thread_id=thread_id,
+                session_name=session_name,
+            )
+
+        assert status == "awaiting_council"
+        mock_review.assert_not_called()
+        mock_workers.assert_called_once()
+        [(_, request)] = queued_reviews(project, BRANCH)
+        assert (request.ticket_id, request.session_name, request.agent) == ("kin-test", session_name, "claude")
+        assert read_ticket(ticket_path).status == "in_review"
+
     def test_council_blocking_bounces_back(self, project: Path, ticket_path: Path) -> None:
         """When council blocks, peasant should return to working and then complete."""
         thread_id, session_name = self.setup_for_loop(project, ticket_path)
@@ -35,6 +35,21 @@ def test_ensure_base_layout_idempotent(tmp_path: Path) -> None:
     assert (tmp_path / ".kd").is_dir()
 
 
+def test_gitignore_covers_runtime_files(tmp_path: Path) -> None:
+    """Race candidate ticket copies and review worker markers are not tracked."""
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    ensure_base_layout(tmp_path)
+    paths = [
+        ".kd/branches/feature-x/candidates/kin-1/c1.md",
+        ".kd/branches/feature-x/reviews/workers/123.json",
+        ".kd/config.json",
+    ]
+
+    result = subprocess.run(["git", "check-ignore", *paths], cwd=tmp_path, capture_output=True, text=True, check=False)
+
+    assert result.stdout.splitlines() == paths[:2]
+
+
 def test_ensure_base_layout_skips_gitignore_when_requested(tmp_path: Path) -> None:
     """ensure_base_layout respects create_gitignore=False."""
     paths = ensure_base_layout(tmp_path, create_gitignore=False)
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from kingdom.config import PeasantConfig
+from kingdom.limits import (
+    Budget,
+    ResourceLimits,
+    admission_wait_reason,
+    available_memory_mb,
+    format_spent,
+    machine_busy,
+    queued_ahead,
+)
+from kingdom.session import AgentState, set_agent_state
+from kingdom.state import ensure_branch_layout
+from kingdom.ticket import Ticket
+
+BRANCH = "feature/limits-test"
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    ensure_branch_layout(tmp_path, BRANCH)
+    return tmp_path
+
+
+def meminfo(tmp_path: Path, available_kb: int) -> Path:
+    path = tmp_path / "meminfo"
+    path.write_text(f"MemTotal:       16000000 kB\nMemAvailable:   {available_kb} kB\n")
+    return path
+
+
+class TestResourceLimits:
+    def test_no_limits_no_preexec(self) -> None:
+        assert ResourceLimits().preexec_fn() is None
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="RLIMIT_AS is Linux-specific")
+    def test_applied_to_child(self) -> None:
+        limits = ResourceLimits(nice=7, max_memory_mb=2048, max_processes=4096)
+        script = (
+            "import os, resource; "
+            "print(os.getpriority(os.PRIO_PROCESS, 0), "
+            "resource.getrlimit(resource.RLIMIT_AS)[0], resource.getrlimit(resource.RLIMIT_NPROC)[0])"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, preexec_fn=limits.preexec_fn(), check=True
+        )
+        nice, address_space, nproc = (int(v) for v in result.stdout.split())
+        assert nice >= 7
+        assert address_space == 2048 * 1024 * 1024
+        assert 0 < nproc <= 4096
+
+    def test_from_config(self) -> None:
+        limits = ResourceLimits.from_config(PeasantConfig(nice=3, max_memory_mb=512))
+        assert limits == ResourceLimits(nice=3, max_memory_mb=512, max_processes=0)
+
+
+class TestAdmission:
+    def test_available_memory(self, tmp_path: Path) -> None:
+        assert available_memory_mb(meminfo(tmp_path, 2048 * 1024)) == 2048
+        assert available_memory_mb(tmp_path / "missing") is None
+
+    def test_machine_busy(self, tmp_path: Path) -> None:
+        cfg = PeasantConfig(max_load=1.0, min_free_memory_mb=1024)
+        with patch("kingdom.limits.load_per_cpu", return_value=0.5):
+            assert machine_busy(cfg, meminfo(tmp_path, 4096 * 1024)) is None
+            assert "below peasant.min_free_memory_mb" in machine_busy(cfg, meminfo(tmp_path, 512 * 1024))
+        with patch("kingdom.limits.load_per_cpu", return_value=1.8):
+            assert "above peasant.max_load" in machine_busy(cfg, meminfo(tmp_path, 4096 * 1024))
+
+    def test_queue_order(self, project: Path) -> None:
+        for name, started in (("peasant-b", "2026-01-01T00:00:02"), ("peasant-a", "2026-01-01T00:00:01")):
+            state = AgentState(name=name, status="queued", pid=os.getpid(), started_at=started)
+            set_agent_state(project, BRANCH, name, state)
+        dead = AgentState(name="peasant-c", status="queued", pid=999_999_999, started_at="2026-01-01T00:00:00")
+        set_agent_state(project, BRANCH, "peasant-c", dead)
+
+        assert queued_ahead(project, BRANCH, "peasant-a") == 0
+        assert queued_ahead(project, BRANCH, "peasant-b") == 1
+        assert queued_ahead(project, BRANCH, "peasant-new") == 2
+
+    def test_disabled_by_default(self, project: Path) -> None:
+        set_agent_state(project, BRANCH, "peasant-a", AgentState(name="", status="queued", pid=os.getpid()))
+        assert admission_wait_reason(project, BRANCH, "peasant-new", PeasantConfig()) is None
+
+    def test_waits_behind_queue(self, project: Path) -> None:
+        set_agent_state(project, BRANCH, "peasant-a", AgentState(name="", status="queued", pid=os.getpid()))
+        cfg = PeasantConfig(max_load=1000.0)
+        assert admission_wait_reason(project, BRANCH, "peasant-new", cfg) == "1 queued peasant(s) ahead"
+        assert admission_wait_reason(project, BRANCH, "peasant-a", cfg) is None
+
+
+class TestBudget:
+    def test_ticket_overrides_config(self) -> None:
+        cfg = PeasantConfig(wall_clock_minutes=60, max_output_tokens=5000, max_cost_usd=2.0)
+        ticket = Ticket(id="a1", status="open", budget_minutes=0, budget_cost_usd=0.5)
+
+        assert Budget.for_ticket(cfg) == Budget(minutes=60, output_tokens=5000, cost_usd=2.0)
+        assert Budget.for_ticket(cfg, ticket) == Budget(minutes=0, output_tokens=5000, cost_usd=0.5)
+
+    def test_exhausted(self) -> None:
+        budget = Budget(minutes=10, output_tokens=1000, cost_usd=1.0)
+
+        assert budget.exhausted(599, 999, 0.99) is None
+        assert budget.exhausted(600, 0, 0) == "wall-clock budget of 10 min used up"
+        assert budget.exhausted(0, 1000, 0) == "output-token budget of 1,000 used up (1,000 tokens)"
+        assert budget.exhausted(0, 0, 1.5) == "cost budget of $1.00 used up ($1.50)"
+        assert Budget().exhausted(10**6, 10**9, 1000.0) is None
+
+    def test_remaining_seconds(self) -> None:
+        assert Budget(minutes=2).remaining_seconds(30) == 90
+        assert Budget().remaining_seconds(30) is None
+
+    def test_format_spent(self) -> None:
+        state = AgentState(name="p", spent_seconds=754, spent_output_tokens=18250, spent_cost_usd=1.2)
+
+        assert format_spent(state, Budget()) == "12m 18.2k tok $1.20"
+        assert (
+            format_spent(state, Budget(minutes=120, output_tokens=50000, cost_usd=5))
+            == "12m/120m 18.2k/50.0k tok $1.20/$5.00"
+        )
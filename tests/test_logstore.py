@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import gzip
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from kingdom.logstore import INLINE_CHARS, LogStore, parse_since, segment_time, split_blocks
+
+
+class TestSplitBlocks:
+    @pytest.mark.parametrize("text", ["", "a", "a\n\nb", "x" * 10 + "\n\n", "\n\n\n\n", "ab\n\n\n\ncd\n\nef"])
+    def test_round_trips(self, text: str) -> None:
+        for size in (1, 3, 100):
+            assert "".join(split_blocks(text, size)) == text
+
+    def test_shared_prefix_gives_shared_blocks(self) -> None:
+        prefix = "\n\n".join(f"paragraph {i} " * 20 for i in range(10))
+        first = split_blocks(prefix + "\n\nturn one", 500)
+        second = split_blocks(prefix + "\n\nturn two, longer", 500)
+
+        assert first[:-1] == second[:-1]
+
+
+class TestLogStore:
+    def test_short_text_inline_long_text_in_blobs(self, tmp_path: Path) -> None:
+        store = LogStore(tmp_path)
+        long_text = "word " * INLINE_CHARS
+
+        assert store.pack("short") == "short"
+        packed = store.pack(long_text)
+        assert isinstance(packed, dict)
+        assert packed["chars"] == len(long_text)
+        assert store.unpack(packed) == long_text
+
+    def test_repeated_prompts_are_stored_once(self, tmp_path: Path) -> None:
+        store = LogStore(tmp_path)
+        history = "\n\n".join(f"message {i}: " + "x" * 500 for i in range(40))
+
+        store.append("council", member="claude", prompt=store.pack(history + "\n\nfirst", blocks=True))
+        blobs_after_first = len(list(store.blobs_dir.rglob("*.gz")))
+        record = store.append("council", member="claude", prompt=store.pack(history + "\n\nsecond", blocks=True))
+
+        assert len(list(store.blobs_dir.rglob("*.gz"))) == blobs_after_first + 1
+        assert store.unpack(record["prompt"]).endswith("second")
+
+    def test_query_filters(self, tmp_path: Path) -> None:
+        store = LogStore(tmp_path)
+        store.append("council", member="claude", response="a")
+        store.append("council", member="codex", response="b")
+        store.append("peasant", member="claude", ticket="kin-042", iteration=1)
+
+        assert [r["response"] for r in store.query(kind="council")] == ["a", "b"]
+        assert [r["kind"] for r in store.query(member="claude")] == ["council", "peasant"]
+        assert [r["iteration"] for r in store.query(ticket="042")] == [1]
+        assert [r["response"] for r in store.query(kind="council", limit=1)] == ["b"]
+
+    def test_rotation_compresses_and_prunes(self, tmp_path: Path) -> None:
+        store = LogStore(tmp_path, max_bytes=400, keep=2)
+        for i in range(20):
+            store.append("council", member="claude", response=f"{i:02d} " + "x" * 100)
+
+        segments = store.segments()
+        assert len(segments) == 2
+        assert all(segment_time(path) for path in segments)
+        assert gzip.decompress(segments[0].read_bytes()).startswith(b"{")
+        responses = [r["response"][:2] for r in store.query()]
+        assert responses[-1] == "19"
+        assert responses == sorted(responses)
+
+    def test_limit_stops_at_older_segments(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        store = LogStore(tmp_path, max_bytes=300, keep=0)
+        for i in range(10):
+            store.append("council", member="claude", response=f"{i} " + "x" * 100)
+        read: list[str] = []
+        original = store.read_segment
+        monkeypatch.setattr(store, "read_segment", lambda path: read.append(path.name) or original(path))
+
+        assert [r["response"][0] for r in store.query(limit=2)] == ["8", "9"]
+        assert len(read) < len(store.segments()) + 1
+
+    def test_since_skips_rotated_segments(self, tmp_path: Path) -> None:
+        store = LogStore(tmp_path, max_bytes=300, keep=0)
+        for i in range(6):
+            store.append("council", member="claude", response=f"{i} " + "x" * 100)
+
+        assert store.query(since=datetime.now(UTC) + timedelta(minutes=1)) == []
+        assert len(store.query(since=datetime.now(UTC) - timedelta(minutes=1))) == 6
+
+    def test_missing_blob(self, tmp_path: Path) -> None:
+        assert LogStore(tmp_path).unpack({"blobs": ["ab" * 32]}).startswith("[missing blob")
+
+
+class TestParseSince:
+    def test_relative(self) -> None:
+        now = datetime(2026, 1, 2, tzinfo=UTC)
+        assert parse_since("2h", now) == now - timedelta(hours=2)
+        assert parse_since("1d", now) == now - timedelta(days=1)
+
+    def test_iso(self) -> None:
+        assert parse_since("2026-01-01T12:00:00+00:00") == datetime(2026, 1, 1, 12, tzinfo=UTC)
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError, match="expected an age"):
+            parse_since("yesterday")
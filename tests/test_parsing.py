@@ -5,7 +5,7 @@ from __future__ import annotations
 import pytest
 
 try:
-    from kingdom.parsing import parse_frontmatter, parse_yaml_value, serialize_yaml_value
+    from kingdom.parsing import parse_frontmatter, parse_yaml_list, parse_yaml_value, serialize_yaml_value
 except ImportError:
     # When run from the parent worktree's venv, kingdom.parsing may not
     # exist yet.  Skip the entire module in that case.
@@ -205,3 +205,41 @@ class TestParseFrontmatter:
         content = '---\nname: "John Doe"\n---\n'
         fm, _ = parse_frontmatter(content)
         assert fm["name"] == "John Doe"
+
+
+class TestParseYamlList:
+    def test_items_with_block_scalars_and_lists(self) -> None:
+        text = """# specs
+- ref: db
+  title: "Schema: users"
+  priority: 1
+  description: |
+    Line one.
+
+    Line two.
+  acceptance:
+    - Migration runs
+    - Rollback works
+-
+  title: API
+  deps: [db]
+"""
+        assert parse_yaml_list(text) == [
+            {
+                "ref": "db",
+                "title": "Schema: users",
+                "priority": 1,
+                "description": "Line one.\n\nLine two.",
+                "acceptance": ["Migration runs", "Rollback works"],
+            },
+            {"title": "API", "deps": ["db"]},
+        ]
+
+    def test_empty(self) -> None:
+        assert parse_yaml_list("\n# nothing\n") == []
+
+    def test_rejects_content_outside_items(self) -> None:
+        with pytest.raises(ValueError, match="line 1"):
+            parse_yaml_list("title: not a list\n")
+        with pytest.raises(ValueError, match="line 2: expected 'key: value'"):
+            parse_yaml_list("- title: A\n  just text\n")
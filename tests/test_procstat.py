@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import os
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from kingdom import cli
+from kingdom.procstat import CLK_TCK, PAGE_SIZE, descendants, process_table, read_stat, sample_tree, usage
+from kingdom.session import AgentState, set_agent_state
+from kingdom.state import ensure_branch_layout, set_current_run
+
+BRANCH = "feature/top-test"
+
+runner = CliRunner()
+
+
+def fake_process(
+    proc: Path, pid: int, ppid: int, comm: str, ticks: int = 0, rss_pages: int = 0, io: dict | None = None
+) -> None:
+    """Write a /proc/<pid>/stat (and io) with the fields procstat reads."""
+    directory = proc / str(pid)
+    directory.mkdir(parents=True)
+    # fields 3..24: state ppid pgrp session tty tpgid flags minflt cminflt majflt cmajflt
+    # utime stime cutime cstime priority nice threads itrealvalue starttime vsize rss
+    fields = ["S", str(ppid), *["0"] * 9, str(ticks), "0", "0", "0", "20", "0", "1", "0", "1000", "0", str(rss_pages)]
+    (directory / "stat").write_text(f"{pid} ({comm}) {' '.join(fields)}\n")
+    if io is not None:
+        (directory / "io").write_text("".join(f"{name}: {value}\n" for name, value in io.items()))
+
+
+@pytest.fixture
+def proc(tmp_path: Path) -> Path:
+    root = tmp_path / "proc"
+    fake_process(root, 100, 1, "python3", ticks=50, rss_pages=10, io={"rchar": 1000, "read_bytes": 4096})
+    fake_process(root, 101, 100, "claude", ticks=200, rss_pages=100, io={"write_bytes": 8192})
+    fake_process(root, 102, 101, "pytest (worker)", ticks=30, rss_pages=20)
+    fake_process(root, 200, 1, "unrelated", ticks=999, rss_pages=999)
+    return root
+
+
+class TestReadStat:
+    def test_comm_with_spaces(self, proc: Path) -> None:
+        stat = read_stat(102, proc)
+        assert stat is not None
+        assert (stat.comm, stat.ppid, stat.ticks, stat.rss) == ("pytest (worker)", 101, 30, 20 * PAGE_SIZE)
+
+    def test_missing(self, proc: Path) -> None:
+        assert read_stat(999, proc) is None
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="needs /proc")
+    def test_real_process(self) -> None:
+        stat = read_stat(os.getpid())
+        assert stat is not None
+        assert stat.ppid == os.getppid()
+        assert stat.rss > 0
+
+
+class TestSampleTree:
+    def test_sums_descendants(self, proc: Path) -> None:
+        table = process_table(proc)
+        assert descendants(100, table) == [100, 101, 102]
+
+        sample = sample_tree(100, table, proc)
+
+        assert sample is not None
+        assert sample.processes == 3
+        assert sample.ticks == 280
+        assert sample.rss == 130 * PAGE_SIZE
+        assert (sample.read_bytes, sample.write_bytes, sample.stream_chars) == (4096, 8192, 1000)
+        assert sample.commands == ["python3", "claude", "pytest (worker)"]
+
+    def test_gone(self, proc: Path) -> None:
+        assert sample_tree(999, process_table(proc), proc) is None
+
+    def test_usage_rates(self, proc: Path) -> None:
+        before = sample_tree(100, process_table(proc), proc)
+        assert before is not None
+        after = sample_tree(100, process_table(proc), proc)
+        assert after is not None
+        after.taken = before.taken + 2
+        after.ticks += CLK_TCK  # one CPU-second over two seconds
+        after.write_bytes += 2000
+        after.stream_chars += 500
+
+        rates = usage(before, after)
+
+        assert rates.cpu_percent == pytest.approx(50)
+        assert rates.io_rate == pytest.approx(1000)
+        assert rates.stream_rate == pytest.approx(250)
+        assert rates.children == 2
+
+    def test_usage_ignores_reused_pid(self, proc: Path) -> None:
+        before = sample_tree(100, process_table(proc), proc)
+        after = sample_tree(100, process_table(proc), proc)
+        assert before is not None and after is not None
+        after.start += 1
+        after.ticks += 1000
+
+        assert usage(before, after).cpu_percent == 0
+        assert usage(None, after).cpu_percent == 0
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="needs /proc")
+class TestPeasantTop:
+    def test_once(self) -> None:
+        with runner.isolated_filesystem():
+            base = Path.cwd()
+            ensure_branch_layout(base, BRANCH)
+            set_current_run(base, BRANCH)
+            started = datetime.now(UTC).isoformat()
+            state = AgentState(
+                name="", status="working", ticket="a1", pid=os.getpid(), iteration=3, iteration_started_at=started
+            )
+            set_agent_state(base, BRANCH, "peasant-a1", state)
+            set_agent_state(base, BRANCH, "peasant-b2", AgentState(name="", status="done", ticket="b2", pid=1))
+
+            result = runner.invoke(cli.app, ["peasant", "top", "--once", "--interval", "0.1"], env={"COLUMNS": "200"})
+
+            assert result.exit_code == 0, result.output
+            assert "a1" in result.output
+            assert "b2" not in result.output
+            assert str(os.getpid()) in result.output
+            assert "3 (0m00s)" in result.output
+            assert "Children" in result.output
+
+    def test_rejects_unknown_sort(self) -> None:
+        result = runner.invoke(cli.app, ["peasant", "top", "--sort", "name"])
+        assert result.exit_code == 1
+        assert "Unknown sort" in result.output
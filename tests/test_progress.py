@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from kingdom.progress import NEAR_DUPLICATE_BITS, ProgressTracker, WorkSnapshot, hamming, simhash, take_snapshot
+
+
+def git(cwd: Path, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    git(tmp_path, "init", "-q", "-b", "main")
+    git(tmp_path, "config", "user.email", "test@test.com")
+    git(tmp_path, "config", "user.name", "Test")
+    (tmp_path / "a.txt").write_text("a\n")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "init")
+    return tmp_path
+
+
+class TestSimhash:
+    def test_near_duplicates_are_close(self) -> None:
+        first = simhash("Investigated the failing parser test in tests/test_parser.py, still looking into it")
+        second = simhash("Investigated the failing parser test in tests/test_parser.py, still looking at it")
+        unrelated = simhash("Added a retry with backoff to the HTTP client and documented the new option")
+
+        assert hamming(first, second) <= NEAR_DUPLICATE_BITS
+        assert hamming(first, unrelated) > NEAR_DUPLICATE_BITS
+
+    def test_empty(self) -> None:
+        assert simhash("") == 0
+
+
+class TestTakeSnapshot:
+    def test_tracks_head_and_uncommitted_changes(self, repo: Path) -> None:
+        clean = take_snapshot(repo)
+        assert clean.head == git(repo, "rev-parse", "HEAD")
+        assert clean.diffstat == ""
+
+        (repo / "a.txt").write_text("a\nb\n")
+        (repo / "new.txt").write_text("new\n")
+        dirty = take_snapshot(repo)
+        assert dirty.head == clean.head
+        assert dirty.diffstat.splitlines() == ["1\t0\ta.txt", "new.txt"]
+        assert dirty.changed_files == 2
+
+        git(repo, "commit", "-qam", "more")
+        assert take_snapshot(repo).head != clean.head
+
+    def test_not_a_repository(self, tmp_path: Path) -> None:
+        assert take_snapshot(tmp_path / "missing") == WorkSnapshot(head=None, diffstat="")
+
+
+class TestProgressTracker:
+    def test_stalls_after_limit_idle_iterations(self) -> None:
+        snapshot = WorkSnapshot(head="abc", diffstat="")
+        tracker = ProgressTracker(2, ["- 12:00 — Still reading the parser code"])
+        assert tracker.observe(snapshot, "Still reading the parser code").made_progress  # baseline
+
+        step = tracker.observe(snapshot, "Still reading the parser code")
+        assert not step.made_progress
+        assert not tracker.stalled
+        tracker.observe(WorkSnapshot(head="abc", diffstat=""), "")
+
+        assert tracker.stalled
+        assert tracker.summary().startswith("No progress in 2 iterations: no new commits (HEAD abc)")
+        assert tracker.summary().endswith("worklog empty or repeating earlier entries")
+
+    def test_summary_reports_why_the_worklog_stalled(self) -> None:
+        snapshot = WorkSnapshot(head="abc", diffstat="")
+        empty = ProgressTracker(1)
+        empty.observe(snapshot, "")
+        empty.observe(snapshot, "")
+        repeating = ProgressTracker(1, ["- 12:00 — Still reading the parser code"])
+        repeating.observe(snapshot, "Wrote the tokenizer")
+        repeating.observe(snapshot, "Wrote the tokenizer")
+
+        assert empty.summary().endswith("(0 file(s)), no worklog entries")
+        assert repeating.summary().endswith("(0 file(s)), worklog repeating earlier entries")
+
+    def test_reworded_entry_is_not_progress(self) -> None:
+        snapshot = WorkSnapshot(head="abc", diffstat="")
+        first = "Investigated the failing parser test in tests/test_parser.py, still looking into it"
+        reworded = "Still looking into the failing parser test in tests/test_parser.py that I investigated"
+        tracker = ProgressTracker(1, [f"- 12:00 — {first}"])
+        tracker.observe(snapshot, first)
+
+        assert hamming(simhash(first), simhash(reworded)) > NEAR_DUPLICATE_BITS
+        assert not tracker.observe(snapshot, reworded).novel_worklog
+        assert tracker.stalled
+        assert tracker.observe(snapshot, "Wrote the parser").novel_worklog
+
+    def test_each_signal_counts_as_progress(self) -> None:
+        tracker = ProgressTracker(1)
+        tracker.observe(WorkSnapshot(head="abc", diffstat=""), "")
+
+        assert tracker.observe(WorkSnapshot(head="def", diffstat=""), "").commits
+        assert tracker.observe(WorkSnapshot(head="def", diffstat="1\t0\ta.txt"), "").diff_changed
+        assert tracker.observe(WorkSnapshot(head="def", diffstat="1\t0\ta.txt"), "Wrote the tokenizer").novel_worklog
+        assert not tracker.stalled
+        tracker.observe(WorkSnapshot(head="def", diffstat="1\t0\ta.txt"), "Wrote the tokenizer")
+        assert tracker.stalled
+
+        tracker.reset()
+        assert not tracker.stalled
+
+    def test_disabled(self) -> None:
+        snapshot = WorkSnapshot(head=None, diffstat="")
+        tracker = ProgressTracker(0)
+        for _ in range(10):
+            tracker.observe(snapshot, "")
+        assert not tracker.stalled
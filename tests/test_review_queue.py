@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import os
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from kingdom import cli
+from kingdom.review_queue import (
+    ReviewRequest,
+    claim_review,
+    enqueue_review,
+    ensure_review_workers,
+    live_workers,
+    process_review,
+    queued_reviews,
+    requeue_orphans,
+    reviews_root,
+    run_review_worker,
+)
+from kingdom.session import AgentState, get_agent_state, set_agent_state
+from kingdom.state import ensure_branch_layout, set_current_run, tickets_root
+from kingdom.thread import create_thread, list_messages
+from kingdom.ticket import Ticket, read_ticket, write_ticket
+
+BRANCH = "feature/review-queue"
+DEAD_PID = 2**22 + 1  # above the default pid_max
+
+
+def request(session: str, queued_at: str = "2026-01-01T00:00:00") -> ReviewRequest:
+    ticket = session.removeprefix("peasant-")
+    return ReviewRequest(
+        ticket_id=ticket,
+        session_name=session,
+        thread_id=f"{ticket}-work",
+        worktree="/tmp/worktree",
+        agent="claude",
+        queued_at=queued_at,
+    )
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    ensure_branch_layout(tmp_path, BRANCH)
+    set_current_run(tmp_path, BRANCH)
+    return tmp_path
+
+
+class TestQueue:
+    def test_claims_oldest_first(self, project: Path) -> None:
+        enqueue_review(project, BRANCH, request("peasant-b2", "2026-01-01T00:00:02"))
+        enqueue_review(project, BRANCH, request("peasant-a1", "2026-01-01T00:00:01"))
+
+        first = claim_review(project, BRANCH, 100)
+        second = claim_review(project, BRANCH, 100)
+
+        assert first is not None and second is not None
+        assert [first[1].session_name, second[1].session_name] == ["peasant-a1", "peasant-b2"]
+        assert first[0] == reviews_root(project, BRANCH) / "active" / "100-peasant-a1.json"
+        assert claim_review(project, BRANCH, 100) is None
+
+    def test_orphaned_claims_are_requeued(self, project: Path) -> None:
+        enqueue_review(project, BRANCH, request("peasant-a1"))
+        enqueue_review(project, BRANCH, request("peasant-b2"))
+        claim_review(project, BRANCH, DEAD_PID)
+        claim_review(project, BRANCH, os.getpid())
+
+        assert requeue_orphans(project, BRANCH) == 1
+        assert [r.session_name for _, r in queued_reviews(project, BRANCH)] == ["peasant-a1"]
+
+    def test_ensure_workers_respects_limit_and_queue(self, project: Path) -> None:
+        workers = reviews_root(project, BRANCH) / "workers"
+        workers.mkdir(parents=True)
+        (workers / f"{os.getpid()}.json").touch()
+        (workers / f"{DEAD_PID}.json").touch()
+        for name in ("peasant-a1", "peasant-b2", "peasant-c3"):
+            enqueue_review(project, BRANCH, request(name))
+        launched: list[str] = []
+
+        started = ensure_review_workers(project, BRANCH, 2, launch=lambda base, branch: launched.append(branch) or 1)
+
+        assert started == 1
+        assert launched == [BRANCH]
+        assert live_workers(project, BRANCH) == [os.getpid()]
+        assert not (workers / f"{DEAD_PID}.json").exists()
+
+    def test_worker_drains_queue_and_deregisters(self, project: Path) -> None:
+        enqueue_review(project, BRANCH, request("peasant-a1"))
+        enqueue_review(project, BRANCH, request("peasant-b2"))
+        seen: list[str] = []
+
+        def review(base: Path, branch: str, req: ReviewRequest, relaunch) -> str:
+            assert live_workers(base, branch) == [os.getpid()]
+            seen.append(req.session_name)
+            return "needs_king_review"
+
+        processed = run_review_worker(project, BRANCH, relaunch=lambda req: 0, review=review)
+
+        assert processed == 2
+        assert seen == ["peasant-a1", "peasant-b2"]
+        assert live_workers(project, BRANCH) == []
+        assert not list((reviews_root(project, BRANCH) / "active").iterdir())
+
+
+class TestProcessReview:
+    @pytest.fixture
+    def ticket_path(self, project: Path) -> Path:
+        path = tickets_root(project, BRANCH) / "a1.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_ticket(Ticket(id="a1", status="in_review", title="Add a", body="Do it.", created=datetime.now(UTC)), path)
+        create_thread(project, BRANCH, "a1-work", ["peasant-a1", "king"], "work")
+        set_agent_state(project, BRANCH, "peasant-a1", AgentState(name="peasant-a1", status="awaiting_council"))
+        return path
+
+    def test_blocking_bounces_and_relaunches(self, project: Path, ticket_path: Path) -> None:
+        relaunched: list[ReviewRequest] = []
+
+        def relaunch(req: ReviewRequest) -> int:
+            relaunched.append(req)
+            return 4242
+
+        with patch("kingdom.harness.run_council_review", return_value=("blocking", ["[codex] x is wrong"])):
+            status = process_review(project, BRANCH, request("peasant-a1"), relaunch)
+
+        assert status == "working"
+        assert [r.ticket_id for r in relaunched] == ["a1"]
+        state = get_agent_state(project, BRANCH, "peasant-a1")
+        assert (state.status, state.pid, state.review_bounce_count) == ("working", 4242, 1)
+        assert read_ticket(ticket_path).status == "in_progress"
+        [feedback] = list_messages(project, BRANCH, "a1-work")
+        assert "x is wrong" in feedback.body
+
+    def test_approved(self, project: Path, ticket_path: Path) -> None:
+        with patch("kingdom.harness.run_council_review", return_value=("approved", [])):
+            status = process_review(project, BRANCH, request("peasant-a1"), relaunch=lambda req: 0)
+
+        assert status == "needs_king_review"
+        assert get_agent_state(project, BRANCH, "peasant-a1").status == "needs_king_review"
+        assert "APPROVED" in read_ticket(ticket_path).body
+
+    def test_skips_peasant_no_longer_awaiting_review(self, project: Path, ticket_path: Path) -> None:
+        set_agent_state(project, BRANCH, "peasant-a1", AgentState(name="peasant-a1", status="stopped"))
+
+        with patch("kingdom.harness.run_council_review") as mock_review:
+            status = process_review(project, BRANCH, request("peasant-a1"), relaunch=lambda req: 0)
+
+        assert status == "stopped"
+        mock_review.assert_not_called()
+
+
+def test_review_worker_command_with_empty_queue() -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        ensure_branch_layout(Path.cwd(), BRANCH)
+        set_current_run(Path.cwd(), BRANCH)
+
+        result = runner.invoke(cli.app, ["review-worker"])
+
+        assert result.exit_code == 0, result.output
+        assert "0 review(s)" in result.output
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from kingdom.summary import cached_summary, gist, summarize_entries
+
+
+class TestGist:
+    def test_short_text_flattened(self) -> None:
+        assert gist("## Plan\n\n- first step\n- second step") == "Plan first step second step"
+
+    def test_code_blocks_elided(self) -> None:
+        assert gist("Run this:\n```bash\nmake test\n```\nthen report.") == "Run this: [code] then report."
+
+    def test_cut_at_sentence_boundary(self) -> None:
+        text = "The parser is fine. " + "The tokenizer needs work because of many reasons. " * 5
+        result = gist(text, max_chars=80)
+
+        assert result.endswith(".")
+        assert len(result) <= 80
+
+    def test_cut_mid_sentence_adds_ellipsis(self) -> None:
+        assert gist("word " * 100, max_chars=20).endswith("…")
+
+
+class TestCachedSummary:
+    def test_summary_lines(self) -> None:
+        assert summarize_entries([("king", "Hi."), ("claude", "Hello.")]) == "- king: Hi.\n- claude: Hello."
+
+    def test_reuses_cache_until_entries_change(self, tmp_path: Path) -> None:
+        cache = tmp_path / "summaries" / "0001-0002.json"
+        entries = [("king", "Should we cache?"), ("claude", "Yes.")]
+
+        first = cached_summary(cache, entries)
+        data = cache.read_text()
+        assert cached_summary(cache, entries) == first
+        assert cache.read_text() == data
+
+        changed = cached_summary(cache, [*entries, ("codex", "No.")])
+        assert changed.endswith("- codex: No.")
+        assert '"entries": 3' in cache.read_text()
+
+    def test_corrupt_cache_is_rebuilt(self, tmp_path: Path) -> None:
+        cache = tmp_path / "summary.json"
+        cache.write_text("{not json")
+
+        assert cached_summary(cache, [("king", "Hi.")]) == "- king: Hi."
+
+    def test_entries_without_speaker(self) -> None:
+        assert summarize_entries([("", "- [12:00] — Did it.")]) == "- [12:00] — Did it."
@@ -11,11 +11,16 @@ from kingdom.thread import (
     Message,
     ThreadMeta,
     add_message,
+    clear_member_session,
     create_thread,
+    format_thread_delta,
     format_thread_history,
     get_thread,
     list_messages,
     list_threads,
+    member_sessions_path,
+    read_member_session,
+    record_member_session,
     thread_dir,
     threads_root,
 )
@@ -367,6 +372,125 @@ class TestFormatThreadHistory:
 
         assert "Line one\n\nLine two\n\n## Heading" in result
 
+    def test_budget_not_exceeded_returns_full_history(self, project: Path) -> None:
+        create_thread(project, BRANCH, "small", ["king", "claude"], "council")
+        for i in range(12):
+            add_message(project, BRANCH, "small", from_="king", to="all", body=f"Message {i}")
+        tdir = thread_dir(project, BRANCH, "small")
+
+        assert format_thread_history(tdir, "claude", max_tokens=10_000, keep_last=2) == format_thread_history(
+            tdir, "claude"
+        )
+        assert not (tdir / ".summaries").exists()
+
+    def test_over_budget_summarizes_older_messages(self, project: Path) -> None:
+        create_thread(project, BRANCH, "long", ["king", "claude"], "council")
+        for i in range(1, 16):
+            body = f"Point {i} is important. " + "Supporting detail. " * 40
+            add_message(project, BRANCH, "long", from_="claude", to="king", body=body)
+        tdir = thread_dir(project, BRANCH, "long")
+
+        result = format_thread_history(tdir, "claude", max_tokens=2000, keep_last=3)
+
+        assert result.startswith("[Summary of earlier conversation]")
+        assert "Messages 1-10:\n- claude: Point 1 is important." in result
+        assert "Messages 11-12:" in result
+        recent = result[result.index("[Recent conversation]") :]
+        assert "Point 12" not in recent
+        assert "claude: Point 13 is important. Supporting detail." in recent
+        assert result.endswith("---\nYou are claude. Continue the discussion.")
+        assert (tdir / ".summaries" / "0001-0010.json").exists()
+        assert (tdir / ".summaries" / "0011-0012.json").exists()
+
+    def test_superseded_partial_block_cache_is_removed(self, project: Path) -> None:
+        create_thread(project, BRANCH, "grow", ["king", "claude"], "council")
+        for i in range(1, 15):
+            add_message(project, BRANCH, "grow", from_="king", to="all", body=f"Topic {i}. " + "word " * 200)
+        tdir = thread_dir(project, BRANCH, "grow")
+
+        format_thread_history(tdir, "claude", max_tokens=1000, keep_last=2)
+        add_message(project, BRANCH, "grow", from_="claude", to="king", body="Reply. " + "word " * 200)
+        format_thread_history(tdir, "claude", max_tokens=1000, keep_last=2)
+
+        names = {p.name for p in (tdir / ".summaries").iterdir()}
+        assert {n for n in names if not n.startswith(".")} == {"0001-0010.json", "0011-0013.json"}
+        assert ".0011-0012.json.lock" not in names
+
+    def test_summaries_reused_across_members(self, project: Path) -> None:
+        create_thread(project, BRANCH, "reuse", ["king", "claude", "codex"], "council")
+        for i in range(1, 13):
+            add_message(project, BRANCH, "reuse", from_="king", to="all", body=f"Topic {i}. " + "word " * 200)
+        tdir = thread_dir(project, BRANCH, "reuse")
+
+        format_thread_history(tdir, "claude", max_tokens=1000, keep_last=2)
+        cache = tdir / ".summaries" / "0001-0010.json"
+        mtime = cache.stat().st_mtime_ns
+        result = format_thread_history(tdir, "codex", max_tokens=1000, keep_last=2)
+
+        assert cache.stat().st_mtime_ns == mtime
+        assert "You are codex." in result
+
+    def test_oldest_summaries_dropped_when_still_over_budget(self, project: Path) -> None:
+        create_thread(project, BRANCH, "huge", ["king", "claude"], "council")
+        for i in range(1, 32):
+            add_message(project, BRANCH, "huge", from_="king", to="all", body=f"Question {i}? " + "x" * 400)
+        tdir = thread_dir(project, BRANCH, "huge")
+
+        result = format_thread_history(tdir, "claude", max_tokens=400, keep_last=1)
+
+        assert "(Messages up to" in result
+        assert f"full thread in {tdir}" in result
+        assert "Messages 1-10:" not in result
+        assert "king: Question 31?" in result
+
+
+class TestFormatThreadDelta:
+    def test_only_unseen_messages_excluding_own_reply(self, project: Path) -> None:
+        create_thread(project, BRANCH, "delta", ["king", "claude", "codex"], "council")
+        add_message(project, BRANCH, "delta", from_="king", to="all", body="Question")
+        add_message(project, BRANCH, "delta", from_="claude", to="king", body="Claude answer")
+        add_message(project, BRANCH, "delta", from_="codex", to="king", body="Codex answer")
+        add_message(project, BRANCH, "delta", from_="king", to="codex", body="Follow-up")
+        tdir = thread_dir(project, BRANCH, "delta")
+
+        result = format_thread_delta(tdir, "claude", seen=1, reply=2)
+
+        assert result == (
+            "[New messages since your last reply]\n\n"
+            "codex: Codex answer\n\n"
+            "king (to codex): Follow-up\n\n"
+            "---\nYou are claude. Continue the discussion."
+        )
+
+    def test_nothing_new(self, project: Path) -> None:
+        create_thread(project, BRANCH, "delta-empty", ["king", "claude"], "council")
+        add_message(project, BRANCH, "delta-empty", from_="king", to="all", body="Question")
+        tdir = thread_dir(project, BRANCH, "delta-empty")
+
+        assert format_thread_delta(tdir, "claude", seen=1) == "---\nYou are claude. Continue the discussion."
+
+
+class TestMemberSessions:
+    def test_record_read_clear(self, project: Path) -> None:
+        create_thread(project, BRANCH, "sessions", ["king", "claude", "codex"], "council")
+        tdir = thread_dir(project, BRANCH, "sessions")
+
+        assert read_member_session(tdir, "claude") is None
+        record_member_session(tdir, "claude", "abc", seen=3, reply=4)
+        record_member_session(tdir, "codex", "def", seen=3, reply=5)
+
+        assert read_member_session(tdir, "claude") == {"session_id": "abc", "seen": 3, "reply": 4}
+        clear_member_session(tdir, "claude")
+        assert read_member_session(tdir, "claude") is None
+        assert read_member_session(tdir, "codex") is not None
+
+    def test_corrupt_map_ignored(self, project: Path) -> None:
+        create_thread(project, BRANCH, "sessions-bad", ["king", "claude"], "council")
+        tdir = thread_dir(project, BRANCH, "sessions-bad")
+        member_sessions_path(tdir).write_text("{oops")
+
+        assert read_member_session(tdir, "claude") is None
+
 
 class TestThreadResponseStatus:
     """Tests for thread_response_status() with rich per-member states."""
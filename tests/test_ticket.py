@@ -12,6 +12,7 @@ from kingdom.ticket import (
     Ticket,
     append_worklog_entry,
     coerce_to_str_list,
+    find_dependency_cycle,
     find_newly_unblocked,
     find_ticket,
     generate_ticket_id,
@@ -19,6 +20,8 @@ from kingdom.ticket import (
     list_tickets,
     move_ticket,
     parse_ticket,
+    parse_ticket_specs,
+    plan_ticket_batch,
     read_ticket,
     serialize_ticket,
     write_ticket,
@@ -125,6 +128,10 @@ class TestGenerateTicketId:
         ticket_id = generate_ticket_id(tickets_dir)
         assert not (tickets_dir / f"{ticket_id}.md").exists()
 
+    def test_avoids_taken_ids(self) -> None:
+        taken = {f"{i:04x}" for i in range(0x10000) if i % 7}
+        assert all(generate_ticket_id(taken=taken) not in taken for _ in range(20))
+
 
 class TestParseTicket:
     """Tests for parse_ticket function."""
@@ -451,6 +458,34 @@ class TestSerializeTicket:
         content = serialize_ticket(ticket)
         assert "tags: [mvp, urgent]" in content
 
+    def test_ticket_with_paths_round_trips(self) -> None:
+        """Sparse-checkout paths survive serialize + parse."""
+        ticket = Ticket(
+            id="kin-test",
+            status="open",
+            paths=["src/kingdom", "tests"],
+            created=datetime(2026, 2, 4, 16, 0, 0, tzinfo=UTC),
+            title="Test",
+        )
+        content = serialize_ticket(ticket)
+        assert "paths: [src/kingdom, tests]" in content
+        assert parse_ticket(content).paths == ["src/kingdom", "tests"]
+
+    def test_budgets_round_trip(self) -> None:
+        ticket = Ticket(
+            id="kin-test",
+            status="open",
+            created=datetime(2026, 2, 4, 16, 0, 0, tzinfo=UTC),
+            title="Test",
+            budget_minutes=90,
+            budget_cost_usd=2.5,
+        )
+        content = serialize_ticket(ticket)
+        assert "budget-minutes: 90" in content
+        assert "budget-cost-usd: 2.5" in content
+        parsed = parse_ticket(content)
+        assert (parsed.budget_minutes, parsed.budget_output_tokens, parsed.budget_cost_usd) == (90, None, 2.5)
+
     def test_optional_fields_omitted_when_empty(self) -> None:
         """Optional fields are not included when None/empty."""
         ticket = Ticket(
@@ -464,6 +499,8 @@ class TestSerializeTicket:
         assert "external-ref:" not in content
         assert "parent:" not in content
         assert "tags:" not in content
+        assert "paths:" not in content
+        assert "budget-" not in content
 
 
 class TestRoundTrip:
@@ -1238,3 +1275,61 @@ Some notes here.
 
         # Entry should contain a timestamp within the test window
         assert before.strftime("%Y-%m-%d %H:%M") in entry or after.strftime("%Y-%m-%d %H:%M") in entry
+
+
+class TestTicketBatch:
+    def test_parse_jsonl_and_yaml(self) -> None:
+        jsonl = '{"ref": "a", "title": "A"}\n\n{"title": "B", "deps": ["a"]}\n'
+        assert parse_ticket_specs(jsonl) == [{"ref": "a", "title": "A"}, {"title": "B", "deps": ["a"]}]
+        assert parse_ticket_specs('[{"title": "A"}]') == [{"title": "A"}]
+        assert parse_ticket_specs("- title: A\n") == [{"title": "A"}]
+
+    def test_parse_reports_bad_json_line(self) -> None:
+        with pytest.raises(ValueError, match="line 2: invalid JSON"):
+            parse_ticket_specs('{"title": "A"}\n{oops\n', "jsonl")
+
+    def test_plan_resolves_refs_and_existing_tickets(self) -> None:
+        specs = [
+            {"ref": "db", "title": "Schema", "priority": 1, "acceptance": ["Table exists", "[ ] Indexed"]},
+            {"ref": "api", "title": "API", "deps": ["db", "old1"], "description": "Expose it."},
+            {"title": "Docs", "deps": "api", "type": "feature"},
+        ]
+
+        planned = plan_ticket_batch(specs, {"dead"}, {"old1": "old1"}.get)
+
+        assert [ref for ref, _ in planned] == ["db", "api", "T3"]
+        ids = {ref: ticket.id for ref, ticket in planned}
+        assert len(set(ids.values())) == 3 and "dead" not in ids.values()
+        db, api, docs = (ticket for _, ticket in planned)
+        assert db.priority == 1
+        assert db.body == "## Acceptance Criteria\n\n- [ ] Table exists\n- [ ] Indexed"
+        assert api.deps == [ids["db"], "old1"]
+        assert api.body == "Expose it."
+        assert (docs.deps, docs.type, docs.priority) == ([ids["api"]], "feature", 2)
+
+    @pytest.mark.parametrize(
+        ("specs", "message"),
+        [
+            ([], "no ticket specs"),
+            ([{"title": ""}], "ticket 1: title is required"),
+            ([{"title": "A", "owner": "x"}], "unknown field"),
+            ([{"title": "A", "priority": 5}], "priority must be 1, 2 or 3"),
+            ([{"ref": "a", "title": "A"}, {"ref": "a", "title": "B"}], "duplicate ref 'a'"),
+            ([{"title": "A", "deps": ["nope"]}], "unknown dependency 'nope'"),
+            (
+                [
+                    {"ref": "a", "title": "A", "deps": ["c"]},
+                    {"ref": "b", "title": "B", "deps": ["a"]},
+                    {"ref": "c", "title": "C", "deps": ["b"]},
+                ],
+                "dependency cycle: a -> c -> b -> a",
+            ),
+        ],
+    )
+    def test_plan_rejects(self, specs: list[dict], message: str) -> None:
+        with pytest.raises(ValueError, match=message):
+            plan_ticket_batch(specs, set(), lambda _: None)
+
+    def test_find_dependency_cycle(self) -> None:
+        assert find_dependency_cycle({"a": ["b"], "b": ["ext"]}) is None
+        assert find_dependency_cycle({"a": ["a"]}) == ["a", "a"]
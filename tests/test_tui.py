@@ -1159,27 +1159,18 @@ class TestEscapeInterrupt:
         def fake_query_one(selector, *args, **kwargs):
             if selector == "#input-area":
                 return input_mock
-            if selector == "#message-log":
-                return log_mock
-            # Simulate: wait-claude and stream-claude both found, thinking-claude not found
-            if selector == "#wait-claude":
-                return wait_panel
-            if selector == "#stream-claude":
-                return stream_panel
-            from textual.css.query import QueryError
-
-            raise QueryError("")
-
-        log_mock.query_one = fake_query_one
+            return log_mock
+
+        # Simulate: wait-claude and stream-claude both registered, thinking-claude not
+        log_mock.panel.side_effect = {"wait-claude": wait_panel, "stream-claude": stream_panel}.get
         app_instance.query_one = fake_query_one
 
         app_instance.action_interrupt()
 
         # Only one interrupted panel should be mounted (not two)
-        assert log_mock.mount.call_count == 1
+        assert log_mock.add_panel.call_count == 1
         # Both stale panels should be removed
-        wait_panel.remove.assert_called_once()
-        stream_panel.remove.assert_called_once()
+        assert [c.args[0] for c in log_mock.remove_panel.call_args_list] == ["wait-claude", "stream-claude"]
 
     def test_second_escape_after_interrupt_exits(self, project: Path) -> None:
         """Second Escape after interrupt should force quit."""
@@ -1829,6 +1820,142 @@ class TestChatSessionIsolation:
         assert session_ids_used[1] is None, f"Second query should use session_id=None, got {session_ids_used[1]!r}"
 
 
+class ResumingMember:
+    """Fake member that reports a backend session and records each call."""
+
+    def __init__(self, name: str = "claude", errors: list[str | None] | None = None) -> None:
+        self.name = name
+        self.session_id: str | None = None
+        self.process = None
+        self.calls: list[tuple[str, str | None]] = []
+        self.errors = errors or []
+
+    def query(self, prompt, timeout, stream_path=None, max_retries=0):
+        from kingdom.council.base import AgentResponse
+
+        self.calls.append((prompt, self.session_id))
+        error = self.errors.pop(0) if self.errors else None
+        if error:
+            return AgentResponse(name=self.name, text="", error=error)
+        return AgentResponse(name=self.name, text=f"reply {len(self.calls)}", session_id=f"sess-{len(self.calls)}")
+
+
+class TestChatSessionResume:
+    """Chat members resume their own per-thread session and get only new messages."""
+
+    def make_app(self, project: Path, tid: str):
+        from kingdom.tui.app import ChatApp
+
+        create_thread(project, BRANCH, tid, ["king", "claude", "codex"], "council")
+        app_instance = ChatApp(base=project, branch=BRANCH, thread_id=tid)
+        list(app_instance.compose())
+        return app_instance
+
+    def test_second_turn_resumes_with_new_messages_only(self, project: Path) -> None:
+        import asyncio
+
+        from kingdom.thread import add_message, read_member_session, thread_dir
+
+        tid = "council-resume1"
+        app_instance = self.make_app(project, tid)
+        tdir = thread_dir(project, BRANCH, tid)
+        member = ResumingMember()
+
+        add_message(project, BRANCH, tid, from_="king", to="all", body="First question")
+        asyncio.run(app_instance.run_query(member, tdir / ".stream-claude.jsonl"))
+        add_message(project, BRANCH, tid, from_="codex", to="king", body="Codex answer")
+        add_message(project, BRANCH, tid, from_="king", to="all", body="Second question")
+        asyncio.run(app_instance.run_query(member, tdir / ".stream-claude.jsonl"))
+
+        (first_prompt, first_session), (second_prompt, second_session) = member.calls
+        assert first_session is None
+        assert "[Previous conversation]" in first_prompt
+        assert second_session == "sess-1"
+        assert second_prompt.startswith("[New messages since your last reply]")
+        assert "First question" not in second_prompt
+        assert "reply 1" not in second_prompt
+        assert "codex: Codex answer" in second_prompt
+        assert "king: Second question" in second_prompt
+        assert read_member_session(tdir, "claude") == {"session_id": "sess-2", "seen": 4, "reply": 5}
+        assert member.session_id is None
+
+    def test_lost_session_falls_back_to_full_history(self, project: Path) -> None:
+        import asyncio
+
+        from kingdom.thread import add_message, list_messages, read_member_session, record_member_session, thread_dir
+
+        tid = "council-resume2"
+        app_instance = self.make_app(project, tid)
+        tdir = thread_dir(project, BRANCH, tid)
+        add_message(project, BRANCH, tid, from_="king", to="all", body="Question")
+        record_member_session(tdir, "claude", "expired", seen=1, reply=None)
+        member = ResumingMember(errors=["No conversation found with session ID: expired"])
+
+        asyncio.run(app_instance.run_query(member, tdir / ".stream-claude.jsonl"))
+
+        assert [session for _, session in member.calls] == ["expired", None]
+        assert "[Previous conversation]" in member.calls[1][0]
+        assert list_messages(project, BRANCH, tid)[-1].body == "reply 2"
+        assert read_member_session(tdir, "claude")["session_id"] == "sess-2"
+
+    def test_timeout_does_not_retry_and_clears_session(self, project: Path) -> None:
+        import asyncio
+
+        from kingdom.thread import add_message, read_member_session, record_member_session, thread_dir
+
+        tid = "council-resume3"
+        app_instance = self.make_app(project, tid)
+        tdir = thread_dir(project, BRANCH, tid)
+        add_message(project, BRANCH, tid, from_="king", to="all", body="Question")
+        record_member_session(tdir, "claude", "slow", seen=1, reply=None)
+        member = ResumingMember(errors=["Timeout after 600s"])
+
+        asyncio.run(app_instance.run_query(member, tdir / ".stream-claude.jsonl"))
+
+        assert len(member.calls) == 1
+        assert read_member_session(tdir, "claude") is None
+
+    def test_resume_disabled_always_sends_full_history(self, project: Path) -> None:
+        import asyncio
+
+        from kingdom.thread import add_message, member_sessions_path, thread_dir
+
+        tid = "council-resume4"
+        app_instance = self.make_app(project, tid)
+        app_instance.resume_sessions = False
+        tdir = thread_dir(project, BRANCH, tid)
+        member = ResumingMember()
+
+        add_message(project, BRANCH, tid, from_="king", to="all", body="First")
+        asyncio.run(app_instance.run_query(member, tdir / ".stream-claude.jsonl"))
+        add_message(project, BRANCH, tid, from_="king", to="all", body="Second")
+        asyncio.run(app_instance.run_query(member, tdir / ".stream-claude.jsonl"))
+
+        assert [session for _, session in member.calls] == [None, None]
+        assert "king: First" in member.calls[1][0]
+        assert not member_sessions_path(tdir).exists()
+
+    def test_stale_response_clears_session(self, project: Path) -> None:
+        import asyncio
+
+        from kingdom.thread import add_message, read_member_session, record_member_session, thread_dir
+
+        tid = "council-resume5"
+        app_instance = self.make_app(project, tid)
+        tdir = thread_dir(project, BRANCH, tid)
+        add_message(project, BRANCH, tid, from_="king", to="all", body="Question")
+        record_member_session(tdir, "claude", "sess-0", seen=1, reply=None)
+
+        class BumpingMember(ResumingMember):
+            def query(self, prompt, timeout, stream_path=None, max_retries=0):
+                app_instance.generation += 1
+                return super().query(prompt, timeout, stream_path, max_retries)
+
+        asyncio.run(app_instance.run_query(BumpingMember(), tdir / ".stream-claude.jsonl", generation=0))
+
+        assert read_member_session(tdir, "claude") is None
+
+
 class TestCouncilCreateNewFields:
     """Test that Council.create() passes auto_messages and mode from config."""
 
@@ -2219,13 +2346,8 @@ class TestRemoveMemberPanels:
         list(app_instance.compose())
 
         mock_log = MagicMock(spec=MessageLog)
-        thinking_panel = MagicMock(name="thinking-claude")
-        mock_log.query.side_effect = lambda sel: [thinking_panel] if sel == "#thinking-claude" else []
-
         app_instance.remove_member_panels(mock_log, "claude")
 
-        # Should have queried for thinking panels
-        queried_selectors = [call.args[0] for call in mock_log.query.call_args_list]
-        assert "#thinking-claude" in queried_selectors
-        # The thinking panel should have been removed
-        thinking_panel.remove.assert_called_once()
+        # Thinking panels should be removed too
+        removed = [call.args[0] for call in mock_log.remove_panel.call_args_list]
+        assert "thinking-claude" in removed
@@ -24,6 +24,7 @@ from kingdom.council.base import AgentResponse
 from kingdom.state import ensure_branch_layout
 from kingdom.thread import add_message, create_thread, thread_dir
 from kingdom.tui.app import ChatApp, InputArea, MessageLog
+from kingdom.tui.poll import NewMessage, StreamDelta, StreamFinished, StreamStarted, ThinkingDelta
 from kingdom.tui.widgets import ErrorPanel, MessagePanel, WaitingPanel
 
 pytestmark = pytest.mark.textual_integration
@@ -557,8 +558,8 @@ class TestEscapeInterrupt:
             async with app.run_test(size=(120, 40)) as pilot:
                 # Mount waiting panels to simulate in-flight queries
                 log = app.query_one("#message-log", MessageLog)
-                log.mount(WaitingPanel(sender="claude", id="wait-claude"))
-                log.mount(WaitingPanel(sender="codex", id="wait-codex"))
+                log.add_panel("wait-claude", WaitingPanel(sender="claude"))
+                log.add_panel("wait-codex", WaitingPanel(sender="codex"))
                 await pilot.pause(delay=0.1)
 
                 # First Escape — should interrupt, not exit
@@ -594,7 +595,7 @@ class TestEscapeInterrupt:
         with patch.object(Council, "create", return_value=council):
             async with app.run_test(size=(120, 40)) as pilot:
                 log = app.query_one("#message-log", MessageLog)
-                log.mount(WaitingPanel(sender="claude", id="wait-claude"))
+                log.add_panel("wait-claude", WaitingPanel(sender="claude"))
                 await pilot.pause(delay=0.1)
 
                 # First Escape — interrupt
@@ -780,3 +781,148 @@ class TestSpeakerLabelSanitization:
                     # Should not contain "name: name:" pattern
                     for name in ["claude", "codex"]:
                         assert f"{name}: {name}:" not in content
+
+
+# ---------------------------------------------------------------------------
+# Scenario 13: Long threads — paged history and lazy Markdown
+# ---------------------------------------------------------------------------
+
+
+class TestLongHistory:
+    def write_history(self, project: Path, thread_id: str, count: int) -> None:
+        tdir = thread_dir(project, BRANCH, thread_id)
+        for i in range(1, count + 1):
+            sender = "claude" if i % 2 else "king"
+            (tdir / f"{i:04d}-{sender}.md").write_text(
+                f"---\nfrom: {sender}\nto: all\ntimestamp: 2026-01-01T00:00:00Z\n---\n\nMessage **{i}**\n"
+                + "\n- point" * 4
+                + "\n"
+            )
+
+    async def test_mounts_only_newest_page(self, project, thread_id, fake_council) -> None:
+        self.write_history(project, thread_id, 300)
+
+        app = make_app(project, thread_id)
+        with patch.object(Council, "create", return_value=fake_council):
+            async with app.run_test(size=(120, 40)) as pilot:
+                log = app.query_one("#message-log", MessageLog)
+                await pilot.pause()
+                panels = list(log.query(MessagePanel))
+                assert len(panels) == MessageLog.HISTORY_PAGE
+                assert panels[-1].id == "msg-300"
+                assert len(log.pending) == 300 - MessageLog.HISTORY_PAGE
+                assert panels[-1].rendered
+                assert not panels[0].rendered
+                assert app.poller.last_sequence == 300
+
+    async def test_scrolling_to_top_loads_previous_page(self, project, thread_id, fake_council) -> None:
+        self.write_history(project, thread_id, 300)
+
+        app = make_app(project, thread_id)
+        with patch.object(Council, "create", return_value=fake_council):
+            async with app.run_test(size=(120, 40)) as pilot:
+                log = app.query_one("#message-log", MessageLog)
+                await pilot.pause()
+                first = log.query_one("#msg-251", MessagePanel)
+
+                log.scroll_home(animate=False)
+                await wait_until(pilot, lambda: len(log.query(MessagePanel)) == 2 * MessageLog.HISTORY_PAGE)
+
+                assert log.children[0].id == "msg-201"
+                # The view stays on the message that was at the top
+                await wait_until(pilot, lambda: log.scroll_y >= first.virtual_region.y - 1)
+                assert first.rendered
+
+    async def test_rendered_lines_are_cached_per_width(self, project, thread_id, fake_council) -> None:
+        self.write_history(project, thread_id, 5)
+
+        app = make_app(project, thread_id)
+        with patch.object(Council, "create", return_value=fake_council):
+            async with app.run_test(size=(120, 40)) as pilot:
+                log = app.query_one("#message-log", MessageLog)
+                await wait_until(pilot, lambda: all(p.rendered for p in log.query(MessagePanel)))
+                await pilot.pause()
+                sequences = [sequence for sequence, _width in log.render_cache.entries]
+                assert sorted(sequences) == [1, 2, 3, 4, 5]
+
+                panel = log.query_one("#msg-1", MessagePanel)
+                panel.refresh(layout=True)
+                await pilot.pause()
+                assert len(log.render_cache) == 5
+
+                await pilot.resize_terminal(100, 40)
+                await pilot.pause()
+                assert len(log.render_cache) == 10
+
+
+# ---------------------------------------------------------------------------
+# Scenario 14: Poll throughput — thousands of synthetic events
+# ---------------------------------------------------------------------------
+
+
+class ScriptedPoller:
+    """Stands in for ThreadPoller, returning one prepared batch per poll."""
+
+    def __init__(self, batches: list[list]) -> None:
+        self.batches = batches
+        self.last_sequence = 0
+
+    def poll(self) -> list:
+        return self.batches.pop(0) if self.batches else []
+
+
+def synthetic_events(rounds: int, members: list[str], deltas: int) -> list:
+    """Events for *rounds* exchanges, each streaming *deltas* chunks per member."""
+    events: list = []
+    sequence = 0
+    for _ in range(rounds):
+        sequence += 1
+        events.append(NewMessage(sequence=sequence, sender="king", body="next?"))
+        for member in members:
+            events.append(StreamStarted(member=member))
+        for i in range(deltas):
+            for member in members:
+                events.append(ThinkingDelta(member=member, full_text="hmm " * (i + 1)))
+                events.append(StreamDelta(member=member, full_text="word " * (i + 1)))
+        for member in members:
+            sequence += 1
+            events.append(NewMessage(sequence=sequence, sender=member, body=f"answer {sequence} from @{member}"))
+            events.append(StreamFinished(member=member))
+    return events
+
+
+class TestPollThroughput:
+    async def test_thousands_of_events_without_css_queries(self, project, thread_id, fake_council) -> None:
+        import time
+
+        rounds, members = 20, ["claude", "codex"]
+        events = synthetic_events(rounds, members, deltas=40)
+        assert len(events) > 3000
+        batches = [events[i : i + 50] for i in range(0, len(events), 50)]
+        batch_count = len(batches)
+
+        app = make_app(project, thread_id)
+        with patch.object(Council, "create", return_value=fake_council):
+            async with app.run_test(size=(120, 40)) as pilot:
+                app.poller = ScriptedPoller(batches)
+                log = app.query_one("#message-log", MessageLog)
+
+                handling = 0.0
+                started = time.perf_counter()
+                with patch.object(MessageLog, "query", side_effect=AssertionError("CSS query in poll handler")):
+                    while app.poller.batches:
+                        tick = time.perf_counter()
+                        app.poll_updates()
+                        handling += time.perf_counter() - tick
+                        await pilot.pause()
+                elapsed = time.perf_counter() - started
+
+                print(
+                    f"\n{len(events)} events in {batch_count} polls: "
+                    f"{handling * 1e6 / len(events):.0f}us/event in handlers, {elapsed:.2f}s with repaints"
+                )
+                assert len(log.query(MessagePanel)) == rounds * (1 + len(members))
+                assert log.panel("stream-claude") is None
+                assert log.panel(f"msg-{rounds * 3}") is not None
+                assert log.panel(f"thinking-codex-{rounds * 3}") is not None
+                assert handling < 5.0
@@ -14,6 +14,7 @@ from kingdom.tui.poll import (
     StreamStarted,
     ThinkingDelta,
     ThreadPoller,
+    coalesce_deltas,
     read_message_body,
     tail_stream_file,
 )
@@ -1169,3 +1170,31 @@ class TestRealCursorLongResponseWithToolCalls:
         thinking = [e for e in events if isinstance(e, ThinkingDelta)]
         assert len(thinking) == 1
         assert "**Planning**" in thinking[0].full_text
+
+
+class TestCoalesceDeltas:
+    def test_keeps_last_delta_per_member_and_kind(self) -> None:
+        events = [
+            ThinkingDelta(member="claude", full_text="t1"),
+            StreamDelta(member="claude", full_text="a"),
+            StreamDelta(member="codex", full_text="x"),
+            ThinkingDelta(member="claude", full_text="t1t2"),
+            StreamDelta(member="claude", full_text="ab"),
+        ]
+
+        assert coalesce_deltas(events) == [
+            StreamDelta(member="codex", full_text="x"),
+            ThinkingDelta(member="claude", full_text="t1t2"),
+            StreamDelta(member="claude", full_text="ab"),
+        ]
+
+    def test_other_events_for_member_are_barriers(self) -> None:
+        events = [
+            StreamDelta(member="claude", full_text="first"),
+            NewMessage(sequence=3, sender="claude", body="first"),
+            StreamFinished(member="claude"),
+            StreamStarted(member="claude"),
+            StreamDelta(member="claude", full_text="second"),
+        ]
+
+        assert coalesce_deltas(events) == events
@@ -19,23 +19,10 @@ class TestThinkingPersistence:
         thinking_panel = MagicMock(spec=ThinkingPanel)
         streaming_panel = MagicMock(spec=StreamingPanel)
 
-        # Mock query results
-        def query_side_effect(selector):
-            if "thinking-claude" in selector:
-                return [thinking_panel]
-            if "stream-claude" in selector:
-                return [streaming_panel]
-            return []
-
-        log.query.side_effect = query_side_effect
-
-        # Mock query_one for finding specific panels
-        def query_one_side_effect(selector, type_):
-            if "thinking-claude" in selector:
-                return thinking_panel
-            raise Exception("Not found")
-
-        log.query_one.side_effect = query_one_side_effect
+        # Mock registry lookups
+        registry = {"thinking-claude": thinking_panel, "stream-claude": streaming_panel}
+        log.panel.side_effect = registry.get
+        log.pop_panel.side_effect = registry.get
 
         event = NewMessage(sender="claude", body="Final answer", sequence=1)
 
@@ -47,17 +34,18 @@ class TestThinkingPersistence:
         # Verify ThinkingPanel was collapsed
         thinking_panel.collapse.assert_called_once()
 
-        # Verify ThinkingPanel was renamed (archived)
-        assert thinking_panel.id == "thinking-claude-1"
+        # Verify ThinkingPanel was re-registered (archived) under the message sequence
+        log.rekey_panel.assert_called_once_with("thinking-claude", "thinking-claude-1")
 
         # Verify StreamingPanel WAS removed
         streaming_panel.remove.assert_called_once()
 
         # Verify MessagePanel was mounted before StreamingPanel (which is correct)
-        # log.mount(panel, before=existing[0]) where existing[0] is StreamingPanel
-        assert log.mount.call_count == 1
-        args, kwargs = log.mount.call_args
-        assert isinstance(args[0], MessagePanel)
+        # log.add_panel(key, panel, before=existing[0]) where existing[0] is StreamingPanel
+        assert log.add_panel.call_count == 1
+        args, kwargs = log.add_panel.call_args
+        assert args[0] == "msg-1"
+        assert isinstance(args[1], MessagePanel)
         assert kwargs["before"] == streaming_panel
 
     def test_handle_new_message_mounts_at_end_if_no_streaming(self) -> None:
@@ -70,19 +58,8 @@ class TestThinkingPersistence:
         thinking_panel = MagicMock(spec=ThinkingPanel)
 
         # Only ThinkingPanel exists
-        def query_side_effect(selector):
-            if "thinking-claude" in selector:
-                return [thinking_panel]
-            return []
-
-        log.query.side_effect = query_side_effect
-
-        def query_one_side_effect(selector, type_):
-            if "thinking-claude" in selector:
-                return thinking_panel
-            raise Exception("Not found")
-
-        log.query_one.side_effect = query_one_side_effect
+        log.panel.side_effect = {"thinking-claude": thinking_panel}.get
+        log.pop_panel.return_value = None
 
         event = NewMessage(sender="claude", body="Final answer", sequence=1)
 
@@ -92,11 +69,11 @@ class TestThinkingPersistence:
         thinking_panel.remove.assert_not_called()
         thinking_panel.collapse.assert_called_once()
 
-        # Verify MessagePanel mounted at end (no 'before' arg)
-        assert log.mount.call_count == 1
-        args, kwargs = log.mount.call_args
-        assert isinstance(args[0], MessagePanel)
-        assert "before" not in kwargs
+        # Verify MessagePanel mounted at end (no 'before' panel)
+        assert log.add_panel.call_count == 1
+        args, kwargs = log.add_panel.call_args
+        assert isinstance(args[1], MessagePanel)
+        assert kwargs["before"] is None
 
     def test_handle_new_message_respects_visibility_hide(self) -> None:
         """If visibility is hide, ThinkingPanel shouldn't exist anyway, but logic holds."""
@@ -106,15 +83,8 @@ class TestThinkingPersistence:
         log = MagicMock()
         streaming_panel = MagicMock(spec=StreamingPanel)
 
-        def query_side_effect(selector):
-            if "stream-claude" in selector:
-                return [streaming_panel]
-            return []
-
-        log.query.side_effect = query_side_effect
-
-        # query_one for thinking will fail
-        log.query_one.side_effect = Exception("Not found")
+        log.panel.side_effect = {"stream-claude": streaming_panel}.get
+        log.pop_panel.side_effect = {"stream-claude": streaming_panel}.get
 
         event = NewMessage(sender="claude", body="Final answer", sequence=1)
 
@@ -122,7 +92,7 @@ class TestThinkingPersistence:
 
         streaming_panel.remove.assert_called_once()
         # Should mount before streaming panel
-        _args, kwargs = log.mount.call_args
+        _args, kwargs = log.add_panel.call_args
         assert kwargs["before"] == streaming_panel
 
     def test_handle_new_message_respects_visibility_show(self) -> None:
@@ -134,21 +104,9 @@ class TestThinkingPersistence:
         thinking_panel = MagicMock(spec=ThinkingPanel)
         streaming_panel = MagicMock(spec=StreamingPanel)
 
-        def query_side_effect(selector):
-            if "thinking-claude" in selector:
-                return [thinking_panel]
-            if "stream-claude" in selector:
-                return [streaming_panel]
-            return []
-
-        log.query.side_effect = query_side_effect
-
-        def query_one_side_effect(selector, type_):
-            if "thinking-claude" in selector:
-                return thinking_panel
-            raise Exception("Not found")
-
-        log.query_one.side_effect = query_one_side_effect
+        registry = {"thinking-claude": thinking_panel, "stream-claude": streaming_panel}
+        log.panel.side_effect = registry.get
+        log.pop_panel.side_effect = registry.get
 
         event = NewMessage(sender="claude", body="Final answer", sequence=1)
 
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import io
+
 import pytest
 
 from kingdom.tui.widgets import (
+    CachedRender,
     CommandHintBar,
     ErrorPanel,
     MessagePanel,
+    RenderCache,
     StreamingPanel,
     ThinkingPanel,
     WaitingPanel,
@@ -136,6 +140,11 @@ class TestMessagePanel:
         panel = MessagePanel(sender="king", body="Question?")
         assert panel.sender == "king"
 
+    def test_lazy_panel_starts_unrendered(self) -> None:
+        panel = MessagePanel(sender="claude", body="Hello", sequence=3, render_cache=RenderCache(), lazy=True)
+        assert panel.lazy
+        assert not panel.rendered
+
     def test_click_stops_event(self) -> None:
         from unittest.mock import MagicMock
 
@@ -145,6 +154,44 @@ class TestMessagePanel:
         event.stop.assert_called_once()
 
 
+class TestRenderCache:
+    def test_evicts_least_recently_used(self) -> None:
+        cache = RenderCache(max_entries=2)
+        cache.put((1, 80), [])
+        cache.put((2, 80), [])
+        cache.get((1, 80))
+        cache.put((3, 80), [])
+
+        assert cache.get((2, 80)) is None
+        assert cache.get((1, 80)) == []
+        assert len(cache) == 2
+
+    def test_renders_once_per_width(self) -> None:
+        from rich.console import Console
+        from rich.markdown import Markdown as RichMarkdown
+
+        class CountingMarkdown(RichMarkdown):
+            renders = 0
+
+            def __rich_console__(self, console, options):
+                CountingMarkdown.renders += 1
+                yield from super().__rich_console__(console, options)
+
+        cache = RenderCache()
+        renderable = CachedRender(CountingMarkdown("Some **bold** text"), cache, sequence=7)
+        console = Console(width=80, no_color=True, record=True, file=io.StringIO())
+
+        console.print(renderable)
+        console.print(renderable)
+        assert CountingMarkdown.renders == 1
+        console.width = 40
+        console.print(renderable)
+
+        assert CountingMarkdown.renders == 2
+        assert console.export_text().count("Some bold text") == 3
+        assert list(cache.entries) == [(7, 80), (7, 40)]
+
+
 class TestStreamingPanel:
     def test_initial_state(self) -> None:
         panel = StreamingPanel(sender="claude")
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from kingdom.agent import TokenUsage
+from kingdom.usage import read_usage, record_usage, summarize_usage, usage_segments
+
+
+class TestUsageLog:
+    def test_record_and_read(self, tmp_path: Path) -> None:
+        path = tmp_path / "usage.jsonl"
+        record_usage(path, "peasant", "claude", TokenUsage(input_tokens=5, cost_usd=0.01), 2.5, ticket="kin-1")
+
+        [record] = read_usage(path)
+        assert record["ticket"] == "kin-1"
+        assert record["input_tokens"] == 5
+        assert record["elapsed"] == 2.5
+
+    def test_missing_file_and_bad_lines(self, tmp_path: Path) -> None:
+        path = tmp_path / "usage.jsonl"
+        assert read_usage(path) == []
+
+        path.write_text('{"agent": "claude", "input_tokens": 1}\nnot json\n')
+        assert len(read_usage(path)) == 1
+
+    def test_rotates_and_keeps_newest_segments(self, tmp_path: Path) -> None:
+        path = tmp_path / "usage.jsonl"
+        for i in range(8):
+            record_usage(path, "council", "claude", TokenUsage(input_tokens=i), max_bytes=100)
+
+        segments = usage_segments(path)
+        assert len(segments) == 5
+        assert [r["input_tokens"] for r in read_usage(path)] == [2, 3, 4, 5, 6, 7]
+
+    def test_summarize_groups_by_source_and_agent(self) -> None:
+        records = [
+            {"source": "council", "agent": "codex", "input_tokens": 10, "cache_read_tokens": 30},
+            {"source": "council", "agent": "codex", "input_tokens": 20, "cache_read_tokens": 40, "cost_usd": 0.5},
+            {"source": "peasant", "agent": "claude", "output_tokens": 7},
+        ]
+
+        totals = summarize_usage(records)
+
+        assert list(totals) == [("council", "codex"), ("peasant", "claude")]
+        codex = totals[("council", "codex")]
+        assert codex.calls == 2
+        assert codex.usage == TokenUsage(input_tokens=30, cache_read_tokens=70, cost_usd=0.5)
+        assert list(summarize_usage(records, source="peasant")) == [("peasant", "claude")]
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from kingdom.verify import VerifyResult, format_verification, run_verification, verify_cache_path, write_tree
+
+
+def git(cwd: Path, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+
+def running(pid: int) -> bool:
+    """True if *pid* exists and is not a zombie waiting to be reaped."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    try:
+        return Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()[0] != "Z"
+    except OSError:
+        return True
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    git(tmp_path, "init", "-q", "-b", "main")
+    git(tmp_path, "config", "user.email", "test@test.com")
+    git(tmp_path, "config", "user.name", "Test")
+    (tmp_path / "a.txt").write_text("a\n")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "init")
+    return tmp_path
+
+
+class TestWriteTree:
+    def test_matches_head_tree_when_clean(self, repo: Path) -> None:
+        assert write_tree(repo) == git(repo, "rev-parse", "HEAD^{tree}")
+
+    def test_includes_uncommitted_changes_without_touching_index(self, repo: Path) -> None:
+        clean = write_tree(repo)
+        (repo / "b.txt").write_text("b\n")
+
+        assert write_tree(repo) != clean
+        assert git(repo, "status", "--porcelain") == "?? b.txt"
+
+    def test_ignores_kingdom_state(self, repo: Path) -> None:
+        clean = write_tree(repo)
+        (repo / ".kd").mkdir()
+        (repo / ".kd" / "ticket.md").write_text("worklog\n")
+
+        assert write_tree(repo) == clean
+
+    def test_outside_repo(self, tmp_path: Path) -> None:
+        assert write_tree(tmp_path) is None
+
+
+class TestRunVerification:
+    def test_runs_once_per_tree(self, repo: Path) -> None:
+        command = "echo ran >> ../runs.txt; echo ok"
+        runs = repo.parent / "runs.txt"
+
+        first = run_verification(repo, repo, command, timeout=30)
+        second = run_verification(repo, repo, command, timeout=30)
+
+        assert first is not None and second is not None
+        assert first.passed and not first.cached
+        assert second.cached and second.output.strip() == "ok"
+        assert runs.read_text().count("ran") == 1
+        assert verify_cache_path(repo, first.tree).exists()
+
+        (repo / "a.txt").write_text("changed\n")
+        third = run_verification(repo, repo, command, timeout=30)
+        assert third is not None and not third.cached
+        assert runs.read_text().count("ran") == 2
+
+    def test_command_change_reruns(self, repo: Path) -> None:
+        run_verification(repo, repo, "true", timeout=30)
+        result = run_verification(repo, repo, "exit 3", timeout=30)
+
+        assert result is not None
+        assert result.returncode == 3
+        assert not result.cached
+
+    def test_timeout_is_not_cached(self, repo: Path) -> None:
+        result = run_verification(repo, repo, "sleep 5", timeout=1)
+
+        assert result is not None
+        assert result.returncode is None
+        assert not verify_cache_path(repo, result.tree).exists()
+
+    def test_timeout_kills_the_whole_command(self, repo: Path) -> None:
+        pid_file = repo / "child.pid"
+
+        result = run_verification(repo, repo, f"sleep 30 & echo $! > {pid_file}; wait", timeout=1)
+
+        assert result is not None and result.returncode is None
+        assert not running(int(pid_file.read_text()))
+
+
+class TestFormatVerification:
+    def test_failure_includes_output_tail(self) -> None:
+        result = VerifyResult(
+            tree="a" * 40, command="pytest", returncode=1, seconds=2.0, output="\n".join(f"l{i}" for i in range(50))
+        )
+
+        summary = format_verification(result, max_lines=3)
+
+        assert summary.startswith("`pytest` FAILED (exit 1) in 2.0s on tree aaaaaaaaaaaa")
+        assert "l49" in summary and "l46" not in summary
+
+    def test_cached_pass_without_output(self) -> None:
+        result = VerifyResult(tree="b" * 40, command="make check", returncode=0, seconds=1.0, cached=True)
+
+        assert format_verification(result) == "`make check` passed in 1.0s on tree bbbbbbbbbbbb (cached)"
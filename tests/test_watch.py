@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from kingdom import cli
+from kingdom.session import AgentState, set_agent_state
+from kingdom.state import ensure_branch_layout, logs_root, set_current_run
+from kingdom.thread import add_message, create_thread, thread_dir
+from kingdom.watch import Dashboard, InotifyNotifier, PollingNotifier, Watcher
+
+BRANCH = "feature/watch-test"
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    ensure_branch_layout(tmp_path, BRANCH)
+    return tmp_path
+
+
+def pump(watcher: Watcher, notifier: InotifyNotifier | PollingNotifier, timeout: float = 1.0) -> list[dict]:
+    """Collect events until the notifier has nothing more to report."""
+    events: list[dict] = []
+    while True:
+        changed = notifier.wait(timeout)
+        if not changed:
+            return events
+        events.extend(watcher.handle(changed))
+        timeout = 0.2
+
+
+def notifiers() -> list:
+    params = [pytest.param(lambda: PollingNotifier(interval=0.05), id="polling")]
+    if sys.platform.startswith("linux"):
+        params.append(pytest.param(InotifyNotifier, id="inotify"))
+    return params
+
+
+class TestNotifier:
+    @pytest.mark.parametrize("make", notifiers())
+    def test_reports_changed_entries(self, tmp_path: Path, make) -> None:
+        notifier = make()
+        notifier.add(tmp_path)
+        notifier.add(tmp_path / "missing")
+
+        (tmp_path / "a.log").write_text("x")
+        changed = notifier.wait(1.0)
+        notifier.close()
+
+        assert tmp_path / "a.log" in changed
+
+    @pytest.mark.parametrize("make", notifiers())
+    def test_quiet_directory(self, tmp_path: Path, make) -> None:
+        notifier = make()
+        notifier.add(tmp_path)
+        assert notifier.wait(0.1) == set()
+        notifier.close()
+
+
+@pytest.mark.parametrize("make", notifiers())
+class TestWatcher:
+    def test_threads_and_peasants(self, project: Path, make) -> None:
+        create_thread(project, BRANCH, "council-x1", ["king", "claude"], "council")
+        create_thread(project, BRANCH, "direct-x2", ["king", "claude"], "direct")
+        add_message(project, BRANCH, "council-x1", from_="king", to="all", body="Old question")
+        set_agent_state(project, BRANCH, "peasant-a1", AgentState(name="", status="working", ticket="a1", pid=42))
+        log_dir = logs_root(project, BRANCH) / "peasant-a1"
+        log_dir.mkdir(parents=True)
+        (log_dir / "stdout.log").write_text("old line\n")
+
+        watcher = Watcher(project, BRANCH)
+        notifier = make()
+        initial = watcher.start(notifier)
+        assert [(e["type"], e["status"]) for e in initial] == [("status", "working")]
+
+        add_message(project, BRANCH, "council-x1", from_="claude", to="king", body="New answer")
+        add_message(project, BRANCH, "direct-x2", from_="claude", to="king", body="Not followed")
+        with (log_dir / "stdout.log").open("a") as handle:
+            handle.write("iteration 2\npartial")
+        set_agent_state(project, BRANCH, "peasant-a1", AgentState(name="", status="done", ticket="a1", pid=42))
+        events = pump(watcher, notifier)
+
+        messages = [e for e in events if e["type"] == "message"]
+        assert [(e["thread"], e["from"], e["to"], e["body"]) for e in messages] == [
+            ("council-x1", "claude", "king", "New answer")
+        ]
+        assert [e["line"] for e in events if e["type"] == "log"] == ["iteration 2"]
+        assert [e["status"] for e in events if e["type"] == "status"] == ["done"]
+
+        with (log_dir / "stdout.log").open("a") as handle:
+            handle.write(" done\n")
+        events = pump(watcher, notifier)
+        notifier.close()
+        assert [e["line"] for e in events if e["type"] == "log"] == ["partial done"]
+
+    def test_new_thread_and_peasant(self, project: Path, make) -> None:
+        watcher = Watcher(project, BRANCH)
+        notifier = make()
+        watcher.start(notifier)
+
+        create_thread(project, BRANCH, "b2-work", ["king", "peasant-b2"], "work")
+        pump(watcher, notifier)
+        add_message(project, BRANCH, "b2-work", from_="king", to="peasant-b2", body="Start here")
+        stream = thread_dir(project, BRANCH, "b2-work") / ".stream-peasant-b2.jsonl"
+        stream.write_text(json.dumps({"type": "assistant", "message": {"content": [{"type": "text", "text": "hi"}]}}))
+        log_dir = logs_root(project, BRANCH) / "peasant-b2"
+        log_dir.mkdir(parents=True)
+        (log_dir / "stderr.log").write_text("boom\n")
+        events = pump(watcher, notifier)
+        notifier.close()
+
+        assert ("b2-work", "Start here") in [(e["thread"], e["body"]) for e in events if e["type"] == "message"]
+        assert ("peasant-b2", "stderr", "boom") in [
+            (e["peasant"], e["stream"], e["line"]) for e in events if e["type"] == "log"
+        ]
+        assert any(e["type"] == "stream_started" and e["member"] == "peasant-b2" for e in events)
+
+    def test_thread_filter(self, project: Path, make) -> None:
+        create_thread(project, BRANCH, "a1-work", ["king", "peasant-a1"], "work")
+        create_thread(project, BRANCH, "c3-work", ["king", "peasant-c3"], "work")
+        for name in ("peasant-a1", "peasant-c3"):
+            (logs_root(project, BRANCH) / name).mkdir(parents=True)
+
+        watcher = Watcher(project, BRANCH, threads={"a1-work"})
+        notifier = make()
+        watcher.start(notifier)
+        for name in ("a1", "c3"):
+            add_message(project, BRANCH, f"{name}-work", from_="king", to=f"peasant-{name}", body=name)
+            (logs_root(project, BRANCH) / f"peasant-{name}" / "stdout.log").write_text(f"{name} log\n")
+        events = pump(watcher, notifier)
+        notifier.close()
+
+        assert [e["body"] for e in events if e["type"] == "message"] == ["a1"]
+        assert [e["line"] for e in events if e["type"] == "log"] == ["a1 log"]
+
+
+class TestDashboard:
+    def test_tracks_peasants_and_streams(self) -> None:
+        dashboard = Dashboard()
+        dashboard.apply(
+            [
+                {"type": "status", "peasant": "peasant-a1", "ticket": "a1", "status": "working", "pid": 1},
+                {"type": "log", "peasant": "peasant-a1", "ticket": "a1", "stream": "stdout", "line": "step"},
+                {"type": "stream", "thread": "council-x", "member": "claude", "chars": 12, "text": "x"},
+            ]
+        )
+        assert dashboard.peasants["peasant-a1"]["line"] == "step"
+        assert dashboard.peasants["peasant-a1"]["status"] == "working"
+        assert dashboard.streams == {("council-x", "claude"): 12}
+        assert dashboard.render().row_count == 2
+
+        dashboard.apply([{"type": "stream_finished", "thread": "council-x", "member": "claude"}])
+        assert dashboard.streams == {}
+
+
+class TestWatchCommand:
+    def test_requires_threads_or_all(self) -> None:
+        with runner.isolated_filesystem():
+            base = Path.cwd()
+            ensure_branch_layout(base, BRANCH)
+            set_current_run(base, BRANCH)
+
+            result = runner.invoke(cli.app, ["watch"])
+
+            assert result.exit_code == 1
+            assert "--all" in result.output
+
+    def test_json_output(self) -> None:
+        with runner.isolated_filesystem():
+            base = Path.cwd()
+            ensure_branch_layout(base, BRANCH)
+            set_current_run(base, BRANCH)
+            set_agent_state(base, BRANCH, "peasant-a1", AgentState(name="", status="working", ticket="a1"))
+
+            result = runner.invoke(cli.app, ["watch", "--all", "--json", "--poll", "--timeout", "1"])
+
+            assert result.exit_code == 0
+            events = [json.loads(line) for line in result.output.splitlines()]
+            assert [(e["type"], e["ticket"], e["status"]) for e in events] == [("status", "a1", "working")]
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from kingdom import worktree
+from kingdom.worktree import (
+    acquire_pool_worktree,
+    is_sparse_checkout,
+    lockfile_hash,
+    pool_member_for,
+    read_pool,
+    release_pool_worktree,
+    seed_dependencies,
+    sparse_checkout,
+    warm_pool,
+    widen_sparse_checkout,
+)
+
+
+def git(cwd: Path, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    git(tmp_path, "init", "-q", "-b", "main")
+    git(tmp_path, "config", "user.email", "test@test.com")
+    git(tmp_path, "config", "user.name", "Test")
+    (tmp_path / ".gitignore").write_text(".kd/\n.venv/\n")
+    (tmp_path / "uv.lock").write_text("v1\n")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "init")
+    (tmp_path / ".kd").mkdir()
+    return tmp_path
+
+
+def write_init_script(repo: Path) -> Path:
+    """Install an init script that counts how many times it ran."""
+    marker = repo / ".kd" / "init-count"
+    script = repo / ".kd" / "init-worktree.sh"
+    script.write_text(f'#!/bin/sh\necho x >> "{marker}"\nmkdir -p "$1/.venv"\n')
+    script.chmod(0o755)
+    return marker
+
+
+class TestLockfileHash:
+    def test_ignores_missing_lockfiles(self, tmp_path: Path) -> None:
+        (tmp_path / "uv.lock").write_text("a")
+        assert lockfile_hash(tmp_path, ["uv.lock"]) == lockfile_hash(tmp_path, ["uv.lock", "Cargo.lock"])
+
+    def test_changes_with_content(self, tmp_path: Path) -> None:
+        (tmp_path / "uv.lock").write_text("a")
+        before = lockfile_hash(tmp_path, ["uv.lock"])
+        (tmp_path / "uv.lock").write_text("b")
+        assert lockfile_hash(tmp_path, ["uv.lock"]) != before
+
+
+class TestPool:
+    def test_warm_creates_members_once(self, repo: Path) -> None:
+        marker = write_init_script(repo)
+
+        created = warm_pool(repo, 2, ["uv.lock"])
+        assert [name for name, _ in created] == ["pool-1", "pool-2"]
+        assert warm_pool(repo, 2, ["uv.lock"]) == []
+        assert set(read_pool(repo)) == {"pool-1", "pool-2"}
+        assert len(marker.read_text().splitlines()) == 2
+
+    def test_acquire_checks_out_ticket_branch_without_reinit(self, repo: Path) -> None:
+        marker = write_init_script(repo)
+        warm_pool(repo, 1, ["uv.lock"])
+
+        checkout = acquire_pool_worktree(repo, "a1b2", ["uv.lock"])
+
+        assert checkout is not None
+        assert checkout.name == "pool-1"
+        assert not checkout.reinit
+        assert git(checkout.path, "rev-parse", "--abbrev-ref", "HEAD") == "ticket/a1b2"
+        assert pool_member_for(repo, "a1b2") == checkout.path
+        assert len(marker.read_text().splitlines()) == 1
+
+    def test_acquire_returns_none_when_pool_busy(self, repo: Path) -> None:
+        warm_pool(repo, 1, ["uv.lock"])
+        assert acquire_pool_worktree(repo, "a1b2", ["uv.lock"]) is not None
+        assert acquire_pool_worktree(repo, "c3d4", ["uv.lock"]) is None
+
+    def test_reinit_when_lockfile_changes(self, repo: Path) -> None:
+        marker = write_init_script(repo)
+        warm_pool(repo, 1, ["uv.lock"])
+
+        (repo / "uv.lock").write_text("v2\n")
+        git(repo, "commit", "-q", "-am", "bump deps")
+        checkout = acquire_pool_worktree(repo, "a1b2", ["uv.lock"])
+
+        assert checkout is not None
+        assert checkout.reinit
+        assert len(marker.read_text().splitlines()) == 2
+
+    def test_acquire_drops_member_that_fails_to_reset(self, repo: Path) -> None:
+        warm_pool(repo, 2, ["uv.lock"])
+        real_git = worktree.git
+
+        def failing_reset(path: Path, *args: str) -> subprocess.CompletedProcess:
+            if path.name == "pool-1" and args[0] == "reset":
+                return subprocess.CompletedProcess(args, 1, "", "index.lock exists")
+            return real_git(path, *args)
+
+        with patch("kingdom.worktree.git", side_effect=failing_reset):
+            checkout = acquire_pool_worktree(repo, "a1b2", ["uv.lock"])
+
+        assert checkout is not None
+        assert checkout.name == "pool-2"
+        assert set(read_pool(repo)) == {"pool-2"}
+        assert not (repo / ".kd" / "worktrees" / "pool-1").exists()
+
+    def test_release_resets_and_keeps_ignored_deps(self, repo: Path) -> None:
+        write_init_script(repo)
+        warm_pool(repo, 1, ["uv.lock"])
+        checkout = acquire_pool_worktree(repo, "a1b2", ["uv.lock"])
+        assert checkout is not None
+        (checkout.path / "scratch.txt").write_text("leftover")
+
+        assert release_pool_worktree(repo, "a1b2") == "pool-1"
+
+        assert not (checkout.path / "scratch.txt").exists()
+        assert (checkout.path / ".venv").is_dir()
+        assert read_pool(repo)["pool-1"]["ticket"] is None
+        # Branch is free again, so the next ticket can reuse the member
+        assert git(repo, "rev-parse", "--verify", "ticket/a1b2")
+        second = acquire_pool_worktree(repo, "c3d4", ["uv.lock"])
+        assert second is not None
+        assert second.name == "pool-1"
+
+    def test_release_without_pool_member(self, repo: Path) -> None:
+        assert release_pool_worktree(repo, "a1b2") is None
+
+
+class TestSeedDependencies:
+    def make_worktree(self, repo: Path) -> Path:
+        path = repo / ".kd" / "worktrees" / "kin-test"
+        git(repo, "worktree", "add", "-q", "-b", "ticket/kin-test", str(path))
+        return path
+
+    def test_seeds_from_base_and_records_hash(self, repo: Path) -> None:
+        (repo / ".venv" / "lib").mkdir(parents=True)
+        (repo / ".venv" / "lib" / "pkg.py").write_text("x" * 100)
+        worktree = self.make_worktree(repo)
+
+        results = seed_dependencies(repo, worktree, [".venv"], ["uv.lock"])
+
+        assert [r.method for r in results] in (["reflink"], ["hardlink"], ["rsync"])
+        assert (worktree / ".venv" / "lib" / "pkg.py").read_text() == "x" * 100
+        if results[0].method != "rsync":
+            assert results[0].bytes_saved == 100
+
+        again = seed_dependencies(repo, worktree, [".venv"], ["uv.lock"])
+        assert again[0].method == "skipped"
+        assert again[0].reason == "up to date"
+
+    def test_skips_when_lockfiles_differ(self, repo: Path) -> None:
+        (repo / ".venv").mkdir()
+        worktree = self.make_worktree(repo)
+        (worktree / "uv.lock").write_text("v2\n")
+
+        results = seed_dependencies(repo, worktree, [".venv"], ["uv.lock"])
+
+        assert results[0].method == "skipped"
+        assert not (worktree / ".venv").exists()
+
+    def test_skips_missing_base_dir(self, repo: Path) -> None:
+        worktree = self.make_worktree(repo)
+
+        results = seed_dependencies(repo, worktree, ["node_modules"], ["uv.lock"])
+
+        assert results[0].reason == "missing in base checkout"
+
+    def test_falls_back_to_hardlinks(self, repo: Path) -> None:
+        (repo / ".venv").mkdir()
+        (repo / ".venv" / "pkg.py").write_text("x")
+        worktree = self.make_worktree(repo)
+
+        with patch("kingdom.worktree.copy_reflink", return_value=False):
+            results = seed_dependencies(repo, worktree, [".venv"], ["uv.lock"])
+
+        assert results[0].method == "hardlink"
+        assert (worktree / ".venv" / "pkg.py").stat().st_ino == (repo / ".venv" / "pkg.py").stat().st_ino
+
+    def make_venv(self, repo: Path) -> Path:
+        venv = repo / ".venv"
+        (venv / "bin").mkdir(parents=True)
+        site = venv / "lib" / "python3.12" / "site-packages"
+        site.mkdir(parents=True)
+        (venv / "pyvenv.cfg").write_text(f"home = /usr/bin\ncommand = /usr/bin/python3 -m venv {venv.resolve()}\n")
+        (venv / "bin" / "pytest").write_text(f"#!{venv.resolve()}/bin/python\nimport pytest\n")
+        (site / "_editable.pth").write_text(f"{repo.resolve()}/src\n")
+        return venv
+
+    def test_virtualenv_is_reflinked_and_relocated(self, repo: Path) -> None:
+        self.make_venv(repo)
+        worktree = self.make_worktree(repo).resolve()
+
+        with patch("kingdom.worktree.copy_reflink", side_effect=lambda src, dst: bool(shutil.copytree(src, dst))):
+            results = seed_dependencies(repo, worktree, [".venv"], ["uv.lock"])
+
+        assert results[0].method == "reflink"
+        assert (worktree / ".venv" / "bin" / "pytest").read_text().startswith(f"#!{worktree}/.venv/bin/python")
+        assert f"-m venv {worktree}/.venv" in (worktree / ".venv" / "pyvenv.cfg").read_text()
+        pth = worktree / ".venv" / "lib" / "python3.12" / "site-packages" / "_editable.pth"
+        assert pth.read_text() == f"{worktree}/src\n"
+        assert str(repo.resolve()) + "/.venv" in (repo / ".venv" / "bin" / "pytest").read_text()
+
+    def test_virtualenv_is_never_hardlinked(self, repo: Path) -> None:
+        self.make_venv(repo)
+        worktree = self.make_worktree(repo)
+
+        with patch("kingdom.worktree.copy_reflink", return_value=False):
+            results = seed_dependencies(repo, worktree, [".venv"], ["uv.lock"])
+
+        assert results[0].method == "skipped"
+        assert results[0].reason == "virtualenvs are only seeded by reflink"
+        assert not (worktree / ".venv").exists()
+
+
+class TestSparseCheckout:
+    def test_checkout_then_widen(self, repo: Path) -> None:
+        for name in ("src", "docs"):
+            (repo / name).mkdir()
+            (repo / name / "file.txt").write_text(name)
+        git(repo, "add", ".")
+        git(repo, "commit", "-q", "-m", "dirs")
+        worktree = repo / ".kd" / "worktrees" / "kin-test"
+        git(repo, "worktree", "add", "-q", "--no-checkout", "-b", "ticket/kin-test", str(worktree))
+
+        assert sparse_checkout(worktree, ["src"]).returncode == 0
+
+        assert is_sparse_checkout(worktree)
+        assert (worktree / "src" / "file.txt").exists()
+        assert (worktree / "uv.lock").exists()
+        assert not (worktree / "docs").exists()
+        assert git(worktree, "status", "--porcelain") == ""
+
+        assert widen_sparse_checkout(worktree, ["docs"]).returncode == 0
+        assert (worktree / "docs" / "file.txt").exists()
+
+    def test_full_checkout_is_not_sparse(self, repo: Path) -> None:
+        assert not is_sparse_checkout(repo)